@@ -0,0 +1,54 @@
+"""
+Benchmarks simultaneous coloring of a large, sparse, banded total jacobian pattern.
+"""
+from time import time
+import unittest
+
+import numpy as np
+from scipy.sparse import diags
+
+from openmdao.utils.coloring import _compute_coloring
+
+# half bandwidth of the jacobian pattern
+BANDWIDTH = 5
+
+
+def _banded(size):
+    offsets = list(range(-BANDWIDTH, BANDWIDTH + 1))
+    return diags([np.ones(size - abs(k)) for k in offsets], offsets, format='csc').astype(bool)
+
+
+def _time_coloring(size, mode):
+    J = _banded(size)
+
+    t0 = time()
+    coloring = _compute_coloring(J, mode)
+    elapsed = time() - t0
+
+    # uncolored entries each need their own solve
+    ncolors = sum(len(coloring[d][0][0]) + len(coloring[d][0]) - 1
+                  for d in ('fwd', 'rev') if d in coloring)
+    print('%s coloring, %d x %d: %d colors in %g sec' % (mode, size, size, ncolors, elapsed))
+
+
+class BenchColoring(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_auto_1K(self):
+        _time_coloring(1000, 'auto')
+
+    def benchmark_fwd_1K(self):
+        _time_coloring(1000, 'fwd')
+
+    def benchmark_auto_10K(self):
+        _time_coloring(10000, 'auto')
+
+    def benchmark_fwd_10K(self):
+        _time_coloring(10000, 'fwd')
+
+
+if __name__ == '__main__':
+    for size in (1000, 10000):
+        for mode in ('fwd', 'auto'):
+            _time_coloring(size, mode)
@@ -0,0 +1,100 @@
+"""
+Benchmarks a parallel DOE under MPI, with randomized case durations, using a static split of the
+cases vs. load balancing.
+
+Run with, for example:
+
+    mpirun -n 5 python benchmark_doe_lb.py
+"""
+import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExplicitComponent, DOEDriver, PETScVector
+from openmdao.utils.mpi import MPI
+
+# number of DOE cases
+NCASES = 40
+
+# most cases are quick, but some take much longer
+SHORT_DELAY = 0.01
+LONG_DELAY = 0.5
+LONG_FRACTION = 0.2
+
+
+class RandomDelayParaboloid(ExplicitComponent):
+    """
+    A paraboloid f = (x - 3)**2 + x*y + (y + 4)**2 - 3 whose run time is given by an input.
+    """
+
+    def setup(self):
+        self.add_input('x', 0.)
+        self.add_input('y', 0.)
+        self.add_input('delay', 0.)
+        self.add_output('f', 0.)
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        y = inputs['y']
+        outputs['f'] = (x - 3.0) ** 2 + x * y + (y + 4.0) ** 2 - 3.0
+        time.sleep(inputs['delay'][0])
+
+
+def _time_doe(load_balance):
+    prob = Problem()
+    model = prob.model
+    indeps = model.add_subsystem('p', IndepVarComp(), promotes=['*'])
+    indeps.add_output('x', 0.)
+    indeps.add_output('y', 0.)
+    indeps.add_output('delay', 0.)
+    model.add_subsystem('comp', RandomDelayParaboloid(), promotes=['*'])
+
+    model.add_design_var('x', lower=-10., upper=10.)
+    model.add_design_var('y', lower=-10., upper=10.)
+    model.add_design_var('delay', lower=0., upper=LONG_DELAY)
+    model.add_objective('f')
+
+    # the same cases on all procs
+    rand = np.random.RandomState(11)
+    delays = np.where(rand.uniform(size=NCASES) < LONG_FRACTION, LONG_DELAY, SHORT_DELAY)
+    cases = [[('x', x), ('y', y), ('delay', d)] for x, y, d in
+             zip(rand.uniform(-10., 10., NCASES), rand.uniform(-10., 10., NCASES), delays)]
+
+    prob.driver = DOEDriver(cases, run_parallel=True, load_balance=load_balance)
+
+    prob.setup(check=False)
+    prob.final_setup()
+
+    if MPI:
+        prob.comm.Barrier()
+    t0 = time.time()
+    prob.run_driver()
+    if MPI:
+        prob.comm.Barrier()
+    elapsed = time.time() - t0
+
+    if prob.comm.rank == 0:
+        print('load_balance=%s, %d procs: %d cases in %g sec (%g sec of work)' %
+              (load_balance, prob.comm.size, NCASES, elapsed, np.sum(delays)))
+
+    return elapsed
+
+
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class BenchDOELoadBalance(unittest.TestCase):
+
+    N_PROCS = 5
+
+    def benchmark_static(self):
+        _time_doe(False)
+
+    def benchmark_load_balanced(self):
+        _time_doe(True)
+
+
+if __name__ == '__main__':
+    static = _time_doe(False)
+    balanced = _time_doe(True)
+    if MPI is None or MPI.COMM_WORLD.rank == 0:
+        print('speedup: %g' % (static / balanced))
@@ -0,0 +1,92 @@
+"""
+Benchmarks a DOE of a model with uneven run times, run serially vs. in a local pool of worker
+processes (parallel_backend='processes').
+"""
+import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExplicitComponent, DOEDriver
+
+# number of DOE cases
+NCASES = 64
+
+# artificial cost of each evaluation of the model, in seconds, drawn between these bounds
+MIN_DELAY = 0.01
+MAX_DELAY = 0.2
+
+
+class UnevenParaboloid(ExplicitComponent):
+    """
+    A paraboloid f = (x - 3)**2 + x*y + (y + 4)**2 - 3 whose run time depends on the point.
+    """
+
+    def setup(self):
+        self.add_input('x', 0.)
+        self.add_input('y', 0.)
+        self.add_input('delay', 0.)
+        self.add_output('f', 0.)
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        y = inputs['y']
+        outputs['f'] = (x - 3.0) ** 2 + x * y + (y + 4.0) ** 2 - 3.0
+        time.sleep(inputs['delay'][0])
+
+
+def _time_doe(num_workers):
+    prob = Problem()
+    model = prob.model
+    indeps = model.add_subsystem('p', IndepVarComp(), promotes=['*'])
+    indeps.add_output('x', 0.)
+    indeps.add_output('y', 0.)
+    indeps.add_output('delay', 0.)
+    model.add_subsystem('comp', UnevenParaboloid(), promotes=['*'])
+
+    model.add_design_var('x', lower=-10., upper=10.)
+    model.add_design_var('y', lower=-10., upper=10.)
+    model.add_design_var('delay', lower=0., upper=MAX_DELAY)
+    model.add_objective('f')
+
+    rand = np.random.RandomState(11)
+    cases = [[('x', x), ('y', y), ('delay', d)] for x, y, d in
+             zip(rand.uniform(-10., 10., NCASES), rand.uniform(-10., 10., NCASES),
+                 rand.uniform(MIN_DELAY, MAX_DELAY, NCASES))]
+
+    if num_workers == 1:
+        prob.driver = DOEDriver(cases)
+    else:
+        prob.driver = DOEDriver(cases, run_parallel=True, parallel_backend='processes',
+                                num_workers=num_workers)
+
+    prob.setup(check=False)
+    prob.final_setup()
+
+    t0 = time.time()
+    prob.run_driver()
+    elapsed = time.time() - t0
+
+    print('num_workers=%d: %d cases in %g sec' % (num_workers, NCASES, elapsed))
+
+    return elapsed
+
+
+class BenchDOEProcesses(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_serial(self):
+        _time_doe(1)
+
+    def benchmark_processes_4(self):
+        _time_doe(4)
+
+    def benchmark_processes_8(self):
+        _time_doe(8)
+
+
+if __name__ == '__main__':
+    serial = _time_doe(1)
+    for num_workers in (2, 4, 8):
+        print('speedup: %g' % (serial / _time_doe(num_workers)))
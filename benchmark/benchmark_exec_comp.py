@@ -0,0 +1,71 @@
+"""
+Benchmarks the time to compute the partials of ExecComps as the size of their arrays grows, for
+an element-wise expression, a banded one, and one whose sparsity depends on the input values, so
+every element is still perturbed separately.
+"""
+from time import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, ExecComp
+
+# sizes of the arrays
+SIZES = (10, 100, 1000, 2000)
+
+# number of linearizations timed
+NREPEAT = 5
+
+EXPRS = {
+    'elementwise': ('y = 2.0*x**2 + sin(x)*z', {}),
+    'banded': ('y = x[1:] - x[:-1]', {'y': -1}),
+    'value-dependent': ('y = maximum(x, z)', {}),
+}
+
+
+def _time_linearize(kind, size):
+    expr, size_deltas = EXPRS[kind]
+    kwargs = {name: np.ones(size + size_deltas.get(name, 0)) for name in ('x', 'y', 'z')
+              if name in expr}
+
+    prob = Problem()
+    t0 = time()
+    comp = prob.model.add_subsystem('comp', ExecComp(expr, **kwargs))
+    prob.setup(check=False)
+    prob.final_setup()
+    t_setup = time() - t0
+
+    prob.run_model()
+
+    t0 = time()
+    for i in range(NREPEAT):
+        comp.run_linearize()
+    t_lin = (time() - t0) / NREPEAT
+
+    if comp._cs_groups is None:
+        nevals = sum(comp._inputs[name].size for name in comp._var_rel_names['input'])
+    else:
+        nevals = sum(len(groups) for groups in comp._cs_groups.values())
+
+    print('%s, size %d: %d evaluations, %g sec per linearize, %g sec setup' %
+          (kind, size, nevals, t_lin, t_setup))
+
+
+class BenchExecComp(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_elementwise_2000(self):
+        _time_linearize('elementwise', 2000)
+
+    def benchmark_banded_2000(self):
+        _time_linearize('banded', 2000)
+
+    def benchmark_value_dependent_2000(self):
+        _time_linearize('value-dependent', 2000)
+
+
+if __name__ == '__main__':
+    for kind in EXPRS:
+        for size in SIZES:
+            _time_linearize(kind, size)
@@ -0,0 +1,91 @@
+"""
+Benchmarks the cost of the linear iterations of a deep model with an assembled jacobian, without
+scaling, with ref/ref0/res_ref set on every output, and with that scaling folded into the jacobian.
+"""
+from time import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, Group, IndepVarComp, ExecComp, ScipyKrylov
+from openmdao.utils.general_utils import ContainsAll
+
+# number of nested groups
+DEPTH = 5
+
+# number of components in each group
+NCOMPS = 10
+
+# size of each variable
+SIZE = 1000
+
+# number of matrix-vector products timed
+NREPEAT = 100
+
+
+def _build_group(depth, scaled):
+    group = Group()
+    kwargs = {'x': np.ones(SIZE), 'y': np.ones(SIZE)}
+    if scaled:
+        kwargs['y'] = {'value': np.ones(SIZE), 'ref': 10., 'ref0': 1., 'res_ref': 5.}
+
+    prev = None
+    for i in range(NCOMPS):
+        name = 'c%d' % i
+        group.add_subsystem(name, ExecComp('y = 0.5 * x', vectorize=True, **kwargs),
+                            promotes_inputs=[] if prev else [('x', 'x')])
+        if prev:
+            group.connect(prev, name + '.x')
+        prev = name + '.y'
+
+    if depth > 1:
+        group.add_subsystem('sub', _build_group(depth - 1, scaled))
+        group.connect(prev, 'sub.x')
+
+    return group
+
+
+def _time_iterations(scaled, fold_scaling):
+    prob = Problem()
+    model = prob.model
+    model.add_subsystem('p', IndepVarComp('x', np.ones(SIZE)))
+    model.add_subsystem('g', _build_group(DEPTH, scaled))
+    model.connect('p.x', 'g.x')
+
+    model.options['fold_scaling'] = fold_scaling
+    model.linear_solver = ScipyKrylov(assemble_jac=True)
+
+    prob.set_solver_print(level=0)
+    prob.setup(check=False, mode='fwd')
+    prob.run_model()
+    model.run_linearize()
+
+    # time the matrix-vector products that make up each iteration of a linear solve
+    for mode in ('fwd', 'rev'):
+        t0 = time()
+        for i in range(NREPEAT):
+            model._apply_linear(None, ['linear'], ContainsAll(), mode)
+        t_apply = (time() - t0) / NREPEAT
+
+        print('scaled=%s, fold_scaling=%s: %s %g sec per iteration' %
+              (scaled, fold_scaling, mode, t_apply))
+
+
+class BenchFoldScaling(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_unscaled(self):
+        _time_iterations(False, False)
+
+    def benchmark_scaled(self):
+        _time_iterations(True, False)
+
+    def benchmark_scaled_folded(self):
+        _time_iterations(True, True)
+
+
+if __name__ == '__main__':
+    _time_iterations(False, False)
+    _time_iterations(True, False)
+    _time_iterations(True, True)
@@ -0,0 +1,49 @@
+"""
+Benchmarks training of a KrigingSurrogate on a large set of points with each factorization method.
+"""
+from time import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import KrigingSurrogate
+
+# number of training points
+NTRAIN = 1000
+
+# number of input dimensions
+NDIMS = 4
+
+
+def _time_training(**kwargs):
+    rand = np.random.RandomState(0)
+    x = rand.uniform(size=(NTRAIN, NDIMS))
+    y = np.sin(3. * x).sum(axis=1).reshape(-1, 1)
+
+    surrogate = KrigingSurrogate(nugget=1e-6, **kwargs)
+
+    t0 = time()
+    surrogate.train(x, y)
+    t_train = time() - t0
+
+    print('%s: trained on %d points in %g sec' % (kwargs, NTRAIN, t_train))
+
+
+class BenchKrigingTrain(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_svd(self):
+        _time_training(method='svd')
+
+    def benchmark_cholesky(self):
+        _time_training(method='cholesky')
+
+    def benchmark_cholesky_multistart(self):
+        _time_training(method='cholesky', num_starts=4, num_workers=4)
+
+
+if __name__ == '__main__':
+    _time_training(method='svd')
+    _time_training(method='cholesky')
+    _time_training(method='cholesky', num_starts=4, num_workers=4)
@@ -0,0 +1,78 @@
+"""
+Benchmarks compute and linearize of a MetaModelUnStructuredComp with a large vec_size, as in a
+trajectory with one surrogate evaluation per node, for each of the built-in surrogates.
+"""
+from time import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, MetaModelUnStructuredComp, FloatKrigingSurrogate, \
+    ResponseSurface, NearestNeighbor
+
+# number of points evaluated by the component
+VEC_SIZE = 5000
+
+# number of training points
+NTRAIN = 50
+
+# number of times compute and linearize are repeated
+NREPEAT = 5
+
+
+def _time_metamodel(surrogate):
+    mm = MetaModelUnStructuredComp(vec_size=VEC_SIZE, default_surrogate=surrogate)
+    mm.add_input('x', np.zeros(VEC_SIZE))
+    mm.add_input('y', np.zeros(VEC_SIZE))
+    mm.add_output('f', np.zeros(VEC_SIZE))
+
+    prob = Problem()
+    prob.model.add_subsystem('mm', mm)
+    prob.setup(check=False)
+
+    rand = np.random.RandomState(11)
+    train = rand.uniform(size=(NTRAIN, 2))
+    mm.options['train:x'] = train[:, 0]
+    mm.options['train:y'] = train[:, 1]
+    mm.options['train:f'] = np.sin(train[:, 0]) * np.cos(train[:, 1])
+
+    prob['mm.x'] = rand.uniform(size=VEC_SIZE)
+    prob['mm.y'] = rand.uniform(size=VEC_SIZE)
+
+    # train the surrogate
+    prob.run_model()
+
+    t0 = time()
+    for i in range(NREPEAT):
+        prob.run_model()
+    t_compute = (time() - t0) / NREPEAT
+
+    t0 = time()
+    for i in range(NREPEAT):
+        prob.model.run_linearize()
+    t_linearize = (time() - t0) / NREPEAT
+
+    print('%s: compute %g sec, linearize %g sec for %d points' %
+          (type(surrogate).__name__, t_compute, t_linearize, VEC_SIZE))
+
+
+class BenchMetaModelVectorized(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_kriging(self):
+        _time_metamodel(FloatKrigingSurrogate())
+
+    def benchmark_response_surface(self):
+        _time_metamodel(ResponseSurface())
+
+    def benchmark_nearest_neighbor(self):
+        _time_metamodel(NearestNeighbor(interpolant_type='rbf'))
+
+
+if __name__ == '__main__':
+    for surrogate in (FloatKrigingSurrogate(), ResponseSurface(),
+                      NearestNeighbor(interpolant_type='linear'),
+                      NearestNeighbor(interpolant_type='weighted'),
+                      NearestNeighbor(interpolant_type='rbf')):
+        _time_metamodel(surrogate)
@@ -0,0 +1,92 @@
+"""
+Benchmarks finite difference of an expensive component run serially vs. in a local pool of
+worker processes (par_fd_backend='processes').
+"""
+import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExplicitComponent
+
+# size of the design vector, i.e. the number of FD points
+SIZE = 16
+
+# artificial cost of each evaluation of the component, in seconds
+DELAY = 0.05
+
+# number of linearizations timed
+NREPEAT = 3
+
+
+class SlowParaboloid(ExplicitComponent):
+    """
+    A vector paraboloid f = sum((x - 3)**2 + x*y + (y + 4)**2 - 3) that sleeps on every compute.
+    """
+
+    def initialize(self):
+        self.options.declare('delay', types=float, default=DELAY)
+
+    def setup(self):
+        self.add_input('x', np.zeros(SIZE))
+        self.add_input('y', np.zeros(SIZE))
+        self.add_output('f', np.zeros(SIZE))
+
+        self.declare_partials('f', ['x', 'y'], method='fd')
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        y = inputs['y']
+        outputs['f'] = (x - 3.0) ** 2 + x * y + (y + 4.0) ** 2 - 3.0
+        time.sleep(self.options['delay'])
+
+
+def _time_fd(num_par_fd, backend):
+    prob = Problem()
+    model = prob.model
+    model.add_subsystem('px', IndepVarComp('x', np.linspace(-1., 1., SIZE)))
+    model.add_subsystem('py', IndepVarComp('y', np.linspace(1., 2., SIZE)))
+    model.add_subsystem('comp', SlowParaboloid(num_par_fd=num_par_fd, par_fd_backend=backend))
+    model.connect('px.x', 'comp.x')
+    model.connect('py.y', 'comp.y')
+
+    prob.setup(mode='fwd', check=False)
+    prob.run_model()
+
+    # the first linearization starts the worker pool
+    t0 = time.time()
+    prob.model.comp._linearize()
+    startup = time.time() - t0
+
+    t0 = time.time()
+    for i in range(NREPEAT):
+        prob.model.comp._linearize()
+    elapsed = (time.time() - t0) / NREPEAT
+
+    print('%s, num_par_fd=%d: first %g sec, then %g sec per linearization' %
+          (backend, num_par_fd, startup, elapsed))
+
+    return elapsed
+
+
+class BenchParFDProcesses(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_serial(self):
+        _time_fd(1, 'mpi')
+
+    def benchmark_processes_2(self):
+        _time_fd(2, 'processes')
+
+    def benchmark_processes_4(self):
+        _time_fd(4, 'processes')
+
+    def benchmark_processes_8(self):
+        _time_fd(8, 'processes')
+
+
+if __name__ == '__main__':
+    serial = _time_fd(1, 'mpi')
+    for num_par_fd in (2, 4, 8):
+        print('speedup: %g' % (serial / _time_fd(num_par_fd, 'processes')))
@@ -1,9 +1,12 @@
 """
-Benchmarks the parallel scaling for the GA driver.
+Benchmarks the parallel scaling for the GA driver, and serial vs. vectorized evaluation of
+each generation.
 """
 from time import time
 import unittest
 
+import numpy as np
+
 from openmdao.api import Problem, SimpleGADriver, IndepVarComp, Group
 from openmdao.test_suite.components.exec_comp_for_test import ExecComp4Test
 
@@ -31,6 +34,59 @@ class GAGroup(Group):
         self.add_objective('comp.f')
 
 
+class VectorizedGAGroup(Group):
+    """
+    GAGroup with one row per point, so a whole generation runs in a single evaluation.
+    """
+
+    def setup(self):
+        shape = (POPSIZE, )
+
+        self.add_subsystem('p1', IndepVarComp('x', np.ones(shape)))
+        self.add_subsystem('p2', IndepVarComp('y', np.ones(shape)))
+        self.add_subsystem('p3', IndepVarComp('z', np.ones(shape)))
+
+        self.add_subsystem('comp', ExecComp4Test(['f = x + y + z'], nl_delay=DELAY,
+                                                 vectorize=True, x=np.ones(shape),
+                                                 y=np.ones(shape), z=np.ones(shape),
+                                                 f=np.ones(shape)))
+
+        self.add_design_var('p1.x', lower=-100, upper=100)
+        self.add_design_var('p2.y', lower=-100, upper=100)
+        self.add_design_var('p3.z', lower=-100, upper=100)
+        self.add_objective('comp.f')
+
+
+def _run_ga(vectorized):
+    prob = Problem()
+    prob.model = VectorizedGAGroup() if vectorized else GAGroup()
+
+    driver = prob.driver = SimpleGADriver()
+    driver.options['max_gen'] = MAXGEN
+    driver.options['pop_size'] = POPSIZE
+    driver.options['vectorized_model'] = vectorized
+
+    prob.setup()
+
+    t0 = time()
+    prob.run_driver()
+    elapsed = time() - t0
+    print('vectorized=%s: Elapsed Time' % vectorized, elapsed)
+
+    return elapsed
+
+
+class BenchVectorizedGA(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_genetic_serial(self):
+        _run_ga(False)
+
+    def benchmark_genetic_vectorized(self):
+        _run_ga(True)
+
+
 class BenchParGA1(unittest.TestCase):
 
     N_PROCS = 1
@@ -92,3 +148,8 @@ class BenchParGA4(unittest.TestCase):
         t0 = time()
         prob.run_driver()
         print('Elapsed Time', time() - t0)
+
+
+if __name__ == '__main__':
+    serial = _run_ga(False)
+    print('speedup: %g' % (serial / _run_ga(True)))
@@ -0,0 +1,84 @@
+"""
+Benchmarks the driver overhead of getting the values of constraints that live on other procs,
+gathered in a single collective vs. broadcast one at a time, as the number of constraints grows.
+
+Run with, for example:
+
+    mpirun -n 4 python benchmark_remote_vois.py
+"""
+import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp, ParallelGroup, PETScVector
+from openmdao.utils.mpi import MPI
+
+# numbers of constraints
+NVOIS = (10, 100, 300)
+
+# size of each constraint
+SIZE = 10
+
+# number of driver iterations timed
+NREPEAT = 20
+
+
+def _time_get_constraints(nvois):
+    prob = Problem()
+    model = prob.model
+    model.add_subsystem('p', IndepVarComp('x', np.ones(SIZE)))
+    par = model.add_subsystem('par', ParallelGroup())
+    for i in range(nvois):
+        name = 'c%d' % i
+        par.add_subsystem(name, ExecComp('y = 2.0 * x', x=np.ones(SIZE), y=np.ones(SIZE)))
+        model.connect('p.x', 'par.%s.x' % name)
+        model.add_constraint('par.%s.y' % name, upper=0.)
+
+    model.add_design_var('p.x')
+    model.add_objective('p.x', index=0)
+
+    prob.setup(check=False)
+    prob.run_model()
+
+    driver = prob.driver
+    cons = driver._cons
+
+    if MPI:
+        prob.comm.Barrier()
+    t0 = time.time()
+    for i in range(NREPEAT):
+        driver.get_constraint_values()
+    t_gather = (time.time() - t0) / NREPEAT
+
+    if MPI:
+        prob.comm.Barrier()
+    t0 = time.time()
+    for i in range(NREPEAT):
+        for name, meta in cons.items():
+            driver._get_voi_val(name, meta, driver._remote_cons)
+    t_bcast = (time.time() - t0) / NREPEAT
+
+    if prob.comm.rank == 0:
+        print('%d constraints on %d procs: %g sec per iteration gathered, %g sec broadcast '
+              'one at a time' % (nvois, prob.comm.size, t_gather, t_bcast))
+
+
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class BenchRemoteVOIs(unittest.TestCase):
+
+    N_PROCS = 4
+
+    def benchmark_10_vois(self):
+        _time_get_constraints(10)
+
+    def benchmark_100_vois(self):
+        _time_get_constraints(100)
+
+    def benchmark_300_vois(self):
+        _time_get_constraints(300)
+
+
+if __name__ == '__main__':
+    for nvois in NVOIS:
+        _time_get_constraints(nvois)
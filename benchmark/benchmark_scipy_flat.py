@@ -0,0 +1,78 @@
+"""
+Benchmarks the driver overhead of passing the optimizer's flat array of design variables to the
+model and packing the constraints into a flat array, with one fancy-indexed operation each vs.
+one variable at a time, as the number of design variables and constraints grows.
+"""
+from time import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp
+
+# numbers of design variables and of constraints
+NVOIS = (10, 100, 1000)
+
+# number of driver iterations timed
+NREPEAT = 100
+
+
+def _time_flat_vois(nvois):
+    prob = Problem()
+    model = prob.model
+    ivc = model.add_subsystem('p', IndepVarComp())
+    for i in range(nvois):
+        ivc.add_output('x%d' % i, np.ones(3))
+        model.add_subsystem('c%d' % i, ExecComp('y = 2.0 * x', x=np.ones(3), y=np.ones(3)))
+        model.connect('p.x%d' % i, 'c%d.x' % i)
+        model.add_design_var('p.x%d' % i, indices=[0, 2], ref=2.0)
+        model.add_constraint('c%d.y' % i, indices=[0, 1], lower=0.0, upper=10.0,
+                             ref0=1.0, ref=11.0)
+    model.add_subsystem('obj', ExecComp('f = sum(x)', x=np.ones(3)))
+    model.connect('p.x0', 'obj.x')
+    model.add_objective('obj.f')
+
+    prob.setup(check=False)
+    prob.final_setup()
+
+    driver = prob.driver
+    driver._setup_flat_vois()
+    x = np.ones(2 * nvois)
+
+    t0 = time()
+    for i in range(NREPEAT):
+        start = 0
+        for name, meta in driver._designvars.items():
+            driver.set_design_var(name, x[start:start + meta['size']])
+            start += meta['size']
+        cons = driver.get_constraint_values()
+        np.concatenate(list(cons.values()))
+    t_loop = (time() - t0) / NREPEAT
+
+    t0 = time()
+    for i in range(NREPEAT):
+        driver._set_flat_design_vars(x)
+        driver._get_flat_constraint_values()
+    t_flat = (time() - t0) / NREPEAT
+
+    print('%d design vars and constraints: %g sec per iteration one at a time, %g sec flat' %
+          (nvois, t_loop, t_flat))
+
+
+class BenchScipyFlat(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_10_vois(self):
+        _time_flat_vois(10)
+
+    def benchmark_100_vois(self):
+        _time_flat_vois(100)
+
+    def benchmark_1000_vois(self):
+        _time_flat_vois(1000)
+
+
+if __name__ == '__main__':
+    for nvois in NVOIS:
+        _time_flat_vois(nvois)
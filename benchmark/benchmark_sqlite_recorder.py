@@ -0,0 +1,63 @@
+"""
+Benchmarks the case throughput of the SqliteRecorder, with and without buffering.
+"""
+import os
+import unittest
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import time
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp, SqliteRecorder
+
+# number of cases to record
+NCASES = 500
+
+# size of each of the recorded variables
+SIZE = 1000
+
+
+def _record_cases(buffer_size):
+    tmpdir = mkdtemp()
+    try:
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('px', IndepVarComp('x', np.ones(SIZE)))
+        model.add_subsystem('comp', ExecComp('y = 2.0*x', x=np.ones(SIZE), y=np.ones(SIZE)))
+        model.connect('px.x', 'comp.x')
+
+        recorder = SqliteRecorder(os.path.join(tmpdir, 'cases.sql'), buffer_size=buffer_size)
+        model.comp.add_recorder(recorder)
+
+        prob.setup(check=False)
+        prob.final_setup()
+
+        t0 = time()
+        for i in range(NCASES):
+            prob.run_model()
+        prob.cleanup()
+        elapsed = time() - t0
+
+        print('buffer_size=%d: %g cases/sec' % (buffer_size, NCASES / elapsed))
+    finally:
+        rmtree(tmpdir)
+
+
+class BenchSqliteRecorder(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_unbuffered(self):
+        _record_cases(0)
+
+    def benchmark_buffered_10(self):
+        _record_cases(10)
+
+    def benchmark_buffered_100(self):
+        _record_cases(100)
+
+
+if __name__ == '__main__':
+    for buffer_size in (0, 10, 100):
+        _record_cases(buffer_size)
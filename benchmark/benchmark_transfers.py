@@ -0,0 +1,90 @@
+"""
+Benchmarks fwd and rev throughput of the DefaultTransfer for a fan-out connection pattern,
+where every output entry feeds several input entries (so rev transfers must accumulate).
+"""
+from time import time
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, ExplicitComponent, IndepVarComp
+
+# number of times each transfer is repeated
+NREPEAT = 20
+
+# number of inputs connected to each output entry
+FAN_OUT = 4
+
+
+class Sink(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('size', types=int)
+
+    def setup(self):
+        size = self.options['size']
+        self.add_input('x', np.zeros(size))
+        self.add_output('y', np.zeros(size))
+
+
+def _build_model(size):
+    prob = Problem()
+    model = prob.model
+
+    nsrc = size // FAN_OUT
+    model.add_subsystem('px', IndepVarComp('x', np.ones(nsrc)))
+    model.add_subsystem('sink', Sink(size=size))
+
+    # every source entry appears FAN_OUT times, interleaved
+    model.connect('px.x', 'sink.x', src_indices=np.tile(np.arange(nsrc), FAN_OUT))
+
+    prob.setup(mode='rev', check=False)
+    prob.final_setup()
+
+    return prob
+
+
+def _time_transfer(size, mode):
+    prob = _build_model(size)
+    model = prob.model
+
+    xfer = model._transfers['linear'][mode, None]
+    d_inputs = model._vectors['input']['linear']
+    d_outputs = model._vectors['output']['linear']
+    d_inputs.set_const(1.0)
+
+    t0 = time()
+    for i in range(NREPEAT):
+        xfer.transfer(d_inputs, d_outputs, mode)
+    elapsed = time() - t0
+
+    print('%s transfer, %d entries: %g entries/sec' % (mode, size, NREPEAT * size / elapsed))
+
+
+class BenchTransfers(unittest.TestCase):
+
+    N_PROCS = 1
+
+    def benchmark_fwd_10K(self):
+        _time_transfer(10000, 'fwd')
+
+    def benchmark_rev_10K(self):
+        _time_transfer(10000, 'rev')
+
+    def benchmark_fwd_100K(self):
+        _time_transfer(100000, 'fwd')
+
+    def benchmark_rev_100K(self):
+        _time_transfer(100000, 'rev')
+
+    def benchmark_fwd_1M(self):
+        _time_transfer(1000000, 'fwd')
+
+    def benchmark_rev_1M(self):
+        _time_transfer(1000000, 'rev')
+
+
+if __name__ == '__main__':
+    for size in (10000, 100000, 1000000):
+        for mode in ('fwd', 'rev'):
+            _time_transfer(size, mode)
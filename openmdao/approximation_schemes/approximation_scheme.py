@@ -2,6 +2,16 @@
 from __future__ import print_function, division
 
 from collections import defaultdict
+from uuid import uuid4
+import weakref
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from six import PY2
+from six.moves import cPickle as pickle
+
+from openmdao.utils.coloring import _get_full_disjoint_cols
+from openmdao.utils.system_pickle import _pickle_system, _unpickle_system
 
 
 class ApproximationScheme(object):
@@ -15,6 +25,10 @@ class ApproximationScheme(object):
     _approx_groups_cached_under_cs : bool
         Flag indicates whether approx_groups was generated under complex step from higher in the
         model hieararchy.
+    _pool : tuple or None
+        (executor, key, pickled system, options signature, finalizer) of the local worker pool
+        used when the system's par_fd_backend is 'processes', created on first use and shut down
+        whenever the approximations are initialized again or the options of the system change.
     """
 
     def __init__(self):
@@ -23,6 +37,29 @@ class ApproximationScheme(object):
         """
         self._approx_groups = None
         self._approx_groups_cached_under_cs = False
+        self._pool = None
+
+    def __getstate__(self):
+        """
+        Return state as a dict, leaving the worker pool behind.
+
+        Returns
+        -------
+        dict
+            State to get.
+        """
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        return state
+
+    def _shutdown_pool(self):
+        """
+        Shut down the worker pool, if it was started.
+        """
+        if self._pool is not None:
+            finalizer = self._pool[4]
+            self._pool = None
+            finalizer()
 
     def _get_approx_groups(self, system, under_cs=False):
         """
@@ -41,7 +78,7 @@ class ApproximationScheme(object):
         Returns
         -------
         Tuple
-            Contains wrt, deltas, coeffs, current_coeff, in_idx, in_size, outputs.
+            Contains wrt, deltas, coeffs, current_coeff, in_idx, in_size, outputs, coloring.
         """
         if self._approx_groups is None or under_cs != self._approx_groups_cached_under_cs:
             self._init_approximations(system)
@@ -86,7 +123,239 @@ class ApproximationScheme(object):
         system : System
             The system having its derivs approximated.
         """
-        pass
+        # the workers' copies of the system may be out of date after a new setup
+        self._shutdown_pool()
+
+    def _use_pool(self, system):
+        """
+        Return True if the perturbed points are to be run in a local pool of worker processes.
+
+        Parameters
+        ----------
+        system : System
+            The system having its derivs approximated.
+
+        Returns
+        -------
+        bool
+            True if the points are run in the worker pool.
+        """
+        return (system._num_par_fd > 1 and system._par_fd_backend == 'processes' and
+                system.comm.size == 1)
+
+    def _run_points_in_pool(self, system, points, total, cs=False):
+        """
+        Run the perturbed points in the worker pool, each worker holding its own system copy.
+
+        The copies are made when the pool is started and are kept between linearizations; only
+        the current values of the system's vectors are sent along with the points.
+
+        Parameters
+        ----------
+        system : System
+            The system having its derivs approximated.
+        points : list of (str, int or ndarray, ndarray)
+            (wrt, idxs, deltas) of each point, where all of the deltas are run for the point.
+        total : bool
+            If True total derivatives are being approximated, else partials.
+        cs : bool
+            If True, the points are run under complex step.
+
+        Returns
+        -------
+        list of ndarray
+            For each point, an array of the resulting outputs (total) or residuals (partials),
+            with one row per delta.
+        """
+        # the workers' copies of the system are stale if any options were changed since
+        signature = _get_options_signature(system)
+        if self._pool is not None and self._pool[3] != signature:
+            self._shutdown_pool()
+
+        if self._pool is None:
+            if PY2:
+                raise RuntimeError("'%s': par_fd_backend='processes' requires Python 3." %
+                                   system.pathname)
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(system._num_par_fd)
+            finalizer = weakref.finalize(self, executor.shutdown, False)
+            self._pool = (executor, uuid4().hex, _pickle_system(system), signature, finalizer)
+
+        executor, key, system_pickle = self._pool[:3]
+
+        state = (system._inputs._data.copy(), system._outputs._data.copy(),
+                 system._residuals._data.copy())
+
+        futures = []
+        for chunk in np.array_split(np.arange(len(points)), system._num_par_fd):
+            if chunk.size > 0:
+                futures.append(executor.submit(_run_points_in_worker, key, system_pickle, state,
+                                               [points[i] for i in chunk], total, cs))
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+        return results
+
+
+def _get_column_coloring(sparsity, in_idx):
+    """
+    Group the columns of the sub-Jacobians of one variable into structurally orthogonal colors.
+
+    Parameters
+    ----------
+    sparsity : list of (ndarray, ndarray, int) or None
+        Declared (rows, cols, number of rows) of each sub-Jacobian, or None if it is dense.
+    in_idx : ndarray or range
+        Indices of the entries of the variable, one per column.
+
+    Returns
+    -------
+    list or None
+        List of (idxs, nonzeros) for each color, where idxs are the entries of the variable to
+        perturb together and nonzeros holds the (rows, cols) of each sub-Jacobian in the columns
+        of that color. None if the columns can't be split into fewer colors than columns.
+    """
+    ncols = len(in_idx)
+    if ncols < 2 or not sparsity or any(s is None for s in sparsity):
+        return None
+
+    # stack the sub-Jacobians of all of the 'of's
+    all_rows = []
+    all_cols = []
+    offset = 0
+    for rows, cols, nrows in sparsity:
+        all_rows.append(rows + offset)
+        all_cols.append(cols)
+        offset += nrows
+    all_rows = np.concatenate(all_rows)
+    all_cols = np.concatenate(all_cols)
+
+    J = coo_matrix((np.ones(all_rows.size, dtype=int), (all_rows, all_cols)),
+                   shape=(offset, ncols)).tocsc()
+
+    # two columns are adjacent if they have a nonzero in the same row
+    col_groups = _get_full_disjoint_cols(J)
+    if len(col_groups) == ncols:
+        return None
+
+    colors = np.empty(ncols, dtype=int)
+    for color, cols in enumerate(col_groups):
+        colors[cols] = color
+
+    in_idx = np.asarray(in_idx)
+    coloring = []
+    for color, cols in enumerate(col_groups):
+        nonzeros = []
+        for rows, sub_cols, _ in sparsity:
+            mask = colors[sub_cols] == color
+            nonzeros.append((rows[mask], sub_cols[mask]))
+        coloring.append((in_idx[np.sort(cols)], nonzeros))
+
+    return coloring
+
+
+# copies of the systems held by this process when it is a pool worker, keyed by pool
+_worker_systems = {}
+
+
+def _get_options_signature(system):
+    """
+    Return the pickled values of the options of a system, its subsystems and their solvers.
+
+    Parameters
+    ----------
+    system : System
+        The system having its derivs approximated.
+
+    Returns
+    -------
+    bytes or object
+        The pickled option values or, if they can't be pickled, a new object that doesn't
+        compare equal to any other signature, so that the pool is always restarted.
+    """
+    values = []
+    for s in system.system_iter(include_self=True, recurse=True):
+        for obj in (s, s.nonlinear_solver, s.linear_solver):
+            if obj is not None:
+                values.append([(name, meta['value'])
+                               for name, meta in sorted(obj.options._dict.items())])
+    try:
+        return pickle.dumps(values, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return object()
+
+
+def _run_points_in_worker(key, system_pickle, state, points, total, cs):
+    """
+    Run perturbed points in a pool worker, on the copy of the system held by the worker.
+
+    Parameters
+    ----------
+    key : str
+        Key of the pool.
+    system_pickle : bytes
+        The pickled system, only unpickled the first time this worker sees the pool key.
+    state : tuple of ndarray
+        Values of the inputs, outputs and residuals of the system at the current point.
+    points : list of (str, int or ndarray, ndarray)
+        (wrt, idxs, deltas) of each point.
+    total : bool
+        If True, run the solve and return the outputs, else run apply and return the residuals.
+    cs : bool
+        If True, the points are run under complex step.
+
+    Returns
+    -------
+    list of ndarray
+        For each point, an array of the results with one row per delta.
+    """
+    try:
+        system = _worker_systems[key]
+    except KeyError:
+        system = _worker_systems[key] = _unpickle_system(system_pickle)
+
+    if cs:
+        system._set_complex_step_mode(True)
+
+    inputs = system._inputs
+    outputs = system._outputs
+    if total:
+        run_model = system.run_solve_nonlinear
+        results_vec = outputs
+    else:
+        run_model = system.run_apply_nonlinear
+        results_vec = system._residuals
+
+    results = []
+    for wrt, idxs, deltas in points:
+        if wrt in outputs._views_flat:
+            vec = outputs
+        elif wrt in inputs._views_flat:
+            vec = inputs
+        else:
+            vec = None
+
+        result = np.empty((len(deltas), results_vec._data.size), dtype=results_vec._data.dtype)
+        for i, delta in enumerate(deltas):
+            for vec_data, data in zip((inputs._data, outputs._data, system._residuals._data),
+                                      state):
+                vec_data[:] = data
+            if vec is not None:
+                vec._views_flat[wrt][idxs] += delta
+
+            run_model()
+
+            result[i] = results_vec._data
+
+        results.append(result)
+
+    if cs:
+        system._set_complex_step_mode(False)
+
+    return results
 
 
 def _gather_jac_results(comm, results):
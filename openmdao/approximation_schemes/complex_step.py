@@ -8,7 +8,7 @@ from collections import defaultdict
 import numpy as np
 
 from openmdao.approximation_schemes.approximation_scheme import ApproximationScheme, \
-    _gather_jac_results
+    _gather_jac_results, _get_column_coloring
 from openmdao.utils.general_utils import simple_warning
 from openmdao.utils.name_maps import abs_key2rel_key
 from openmdao.vectors.vector import Vector
@@ -100,6 +100,8 @@ class ComplexStep(ApproximationScheme):
         """
         global _full_slice
 
+        super(ComplexStep, self)._init_approximations(system)
+
         # itertools.groupby works like `uniq` rather than the SQL query, meaning that it will only
         # group adjacent items with identical keys.
         self._exec_list.sort(key=self._key_fun)
@@ -127,10 +129,10 @@ class ComplexStep(ApproximationScheme):
                 in_idx = range(in_size)
 
             outputs = []
+            sparsity = []
 
             for approx_tuple in approx:
                 of = approx_tuple[0]
-                # TODO: Sparse derivatives
                 if of in system._owns_approx_of_idx:
                     out_idx = system._owns_approx_of_idx[of]
                     out_size = len(out_idx)
@@ -138,9 +140,21 @@ class ComplexStep(ApproximationScheme):
                     out_size = system._var_allprocs_abs2meta[of]['size']
                     out_idx = _full_slice
 
-                outputs.append((of, np.zeros((out_size, in_size)), out_idx))
+                # declared sparsity of the sub-Jacobian, if any
+                rows = approx_tuple[2].get('rows')
+                if rows is None or out_idx is not _full_slice:
+                    rows_cols = None
+                    sparsity.append(None)
+                else:
+                    rows_cols = (rows, approx_tuple[2]['cols'])
+                    sparsity.append((rows, approx_tuple[2]['cols'], out_size))
+
+                outputs.append((of, np.zeros((out_size, in_size)), out_idx, rows_cols))
+
+            # structurally orthogonal columns are perturbed together
+            coloring = _get_column_coloring(sparsity, in_idx)
 
-            self._approx_groups[i] = (wrt, delta, fact, in_idx, in_size, outputs)
+            self._approx_groups[i] = (wrt, delta, fact, in_idx, in_size, outputs, coloring)
 
     def compute_approximations(self, system, jac, total=False):
         """
@@ -166,7 +180,10 @@ class ComplexStep(ApproximationScheme):
 
                 fd = self._fd = FiniteDifference()
                 for item in self._exec_list:
-                    fd.add_approximation(item[0:2], {})
+                    # keep the declared sparsity, but use the default FD options
+                    options = dict((name, item[2][name]) for name in ('rows', 'cols')
+                                   if name in item[2])
+                    fd.add_approximation(item[0:2], options)
 
             self._fd.compute_approximations(system, jac, total=total)
             return
@@ -182,6 +199,18 @@ class ComplexStep(ApproximationScheme):
         # Clean vector for results
         results_clone = current_vec._clone(True)
 
+        approx_groups = self._get_approx_groups(system)
+
+        # the points can also be run all at once in a local pool of worker processes, which
+        # turn on complex step in their own copies of the system
+        pool_results = None
+        if self._use_pool(system):
+            pool_points = []
+            for wrt, delta, _, in_idx, _, _, coloring in approx_groups:
+                idxs = in_idx if coloring is None else [idx for idx, _ in coloring]
+                pool_points.extend((wrt, idx, [delta]) for idx in idxs)
+            pool_results = self._run_points_in_pool(system, pool_points, total, cs=True)
+
         # Turn on complex step.
         system._set_complex_step_mode(True)
         results_clone.set_complex_step_mode(True)
@@ -202,37 +231,56 @@ class ComplexStep(ApproximationScheme):
         mycomm = system._full_comm if use_parallel_fd else system.comm
 
         fd_count = 0
-        approx_groups = self._get_approx_groups(system)
         for tup in approx_groups:
-            wrt, delta, fact, in_idx, in_size, outputs = tup
-            for i_count, idx in enumerate(in_idx):
+            wrt, delta, fact, in_idx, in_size, outputs, coloring = tup
+
+            if coloring is None:
+                points = ((idx, i_count) for i_count, idx in enumerate(in_idx))
+            else:
+                points = coloring
+
+            for idx, target in points:
                 if fd_count % num_par_fd == system._par_fd_id:
                     # Run the Finite Difference
-                    result = self._run_point_complex(system, wrt, idx, delta, results_clone, total)
-
-                    if is_parallel:
-                        for of, _, out_idx in outputs:
-                            if owns[of] == iproc:
-                                results[(of, wrt)].append(
-                                    (i_count, result._views_flat[of][out_idx].imag.copy()))
+                    if pool_results is None:
+                        result = self._run_point_complex(system, wrt, idx, delta, results_clone,
+                                                         total)
                     else:
-                        for of, subjac, out_idx in outputs:
-                            subjac[:, i_count] = result._views_flat[of][out_idx].imag
+                        result = results_clone
+                        result._data[:] = pool_results[fd_count][0]
+
+                    for i, (of, subjac, out_idx, _) in enumerate(outputs):
+                        if coloring is None:
+                            loc = (_full_slice, target)
+                            vals = result._views_flat[of][out_idx].imag
+                        else:
+                            # the nonzeros of this sub-Jacobian in all of the colored columns
+                            loc = target[i]
+                            vals = result._views_flat[of][loc[0]].imag
+
+                        if is_parallel:
+                            if owns[of] == iproc:
+                                results[(of, wrt)].append((loc, vals.copy()))
+                        else:
+                            subjac[loc] = vals
 
                 fd_count += 1
 
         if is_parallel:
             results = _gather_jac_results(mycomm, results)
 
-        for wrt, _, fact, _, _, outputs in approx_groups:
-            for of, subjac, _ in outputs:
+        for wrt, _, fact, _, _, outputs, _ in approx_groups:
+            for of, subjac, _, rows_cols in outputs:
                 key = (of, wrt)
                 if is_parallel:
-                    for i, result in results[key]:
-                        subjac[:, i] = result
+                    for loc, result in results[key]:
+                        subjac[loc] = result
 
                 subjac *= fact
-                if uses_src_indices:
+                if rows_cols is not None:
+                    # only the declared nonzeros are stored
+                    jac[key] = subjac[rows_cols]
+                elif uses_src_indices:
                     jac._override_checks = True
                     jac[key] = subjac
                     jac._override_checks = False
@@ -8,7 +8,7 @@ from six.moves import range, zip
 import numpy as np
 
 from openmdao.approximation_schemes.approximation_scheme import ApproximationScheme, \
-    _gather_jac_results
+    _gather_jac_results, _get_column_coloring
 from openmdao.utils.name_maps import abs_key2rel_key
 
 
@@ -148,6 +148,8 @@ class FiniteDifference(ApproximationScheme):
         system : System
             The system having its derivs approximated.
         """
+        super(FiniteDifference, self)._init_approximations(system)
+
         # itertools.groupby works like `uniq` rather than the SQL query, meaning that it will only
         # group adjacent items with identical keys.
         self._exec_list.sort(key=self._key_fun)
@@ -193,10 +195,10 @@ class FiniteDifference(ApproximationScheme):
                 in_idx = range(in_size)
 
             outputs = []
+            sparsity = []
 
             for approx_tuple in approximations:
                 of = approx_tuple[0]
-                # TODO: Sparse derivatives
                 if of in system._owns_approx_of_idx:
                     out_idx = system._owns_approx_of_idx[of]
                     out_size = len(out_idx)
@@ -204,9 +206,23 @@ class FiniteDifference(ApproximationScheme):
                     out_size = system._var_allprocs_abs2meta[of]['size']
                     out_idx = _full_slice
 
-                outputs.append((of, np.zeros((out_size, in_size), dtype=dtype), out_idx))
+                # declared sparsity of the sub-Jacobian, if any
+                rows = approx_tuple[2].get('rows')
+                if rows is None or out_idx is not _full_slice:
+                    rows_cols = None
+                    sparsity.append(None)
+                else:
+                    rows_cols = (rows, approx_tuple[2]['cols'])
+                    sparsity.append((rows, approx_tuple[2]['cols'], out_size))
+
+                outputs.append((of, np.zeros((out_size, in_size), dtype=dtype), out_idx,
+                                rows_cols))
 
-            self._approx_groups[i] = (wrt, deltas, coeffs, current_coeff, in_idx, in_size, outputs)
+            # structurally orthogonal columns are perturbed together
+            coloring = _get_column_coloring(sparsity, in_idx)
+
+            self._approx_groups[i] = (wrt, deltas, coeffs, current_coeff, in_idx, in_size, outputs,
+                                      coloring)
 
     def compute_approximations(self, system, jac=None, total=False):
         """
@@ -258,11 +274,37 @@ class FiniteDifference(ApproximationScheme):
         owns = system._owning_rank
         mycomm = system._full_comm if use_parallel_fd else system.comm
 
-        fd_count = 0
+        # components that can evaluate several points in one call get their columns in batches
+        batched = (not total and not cs_active and not is_parallel and
+                   getattr(system, '_has_compute_multi', False) and
+                   not (system._discrete_inputs or system._discrete_outputs))
+
         approx_groups = self._get_approx_groups(system, under_cs=cs_active)
-        for wrt, deltas, coeffs, current_coeff, in_idx, in_size, outputs in approx_groups:
 
-            for i_count, idx in enumerate(in_idx):
+        # the points can also be run all at once in a local pool of worker processes
+        pool_results = None
+        if not batched and not cs_active and self._use_pool(system):
+            pool_points = []
+            for wrt, deltas, _, _, in_idx, _, _, coloring in approx_groups:
+                idxs = in_idx if coloring is None else [idx for idx, _ in coloring]
+                pool_points.extend((wrt, idx, deltas) for idx in idxs)
+            pool_results = self._run_points_in_pool(system, pool_points, total)
+
+        fd_count = 0
+        for tup in approx_groups:
+            wrt, deltas, coeffs, current_coeff, in_idx, in_size, outputs, coloring = tup
+
+            if batched and wrt in system._inputs._views_flat:
+                self._compute_batched(system, wrt, deltas, coeffs, current_coeff, in_idx,
+                                      outputs, coloring, current_vec)
+                continue
+
+            if coloring is None:
+                points = ((idx, i_count) for i_count, idx in enumerate(in_idx))
+            else:
+                points = coloring
+
+            for idx, target in points:
                 if fd_count % num_par_fd == system._par_fd_id:
                     if current_coeff:
                         result._data[:] = current_vec._data
@@ -271,40 +313,111 @@ class FiniteDifference(ApproximationScheme):
                         result._data[:] = 0.
 
                     # Run the Finite Difference
-                    for delta, coeff in zip(deltas, coeffs):
-                        self._run_point(system, wrt, idx, delta, out_tmp, in_tmp, result_array,
-                                        total)
+                    for i_delta, (delta, coeff) in enumerate(zip(deltas, coeffs)):
+                        if pool_results is None:
+                            self._run_point(system, wrt, idx, delta, out_tmp, in_tmp,
+                                            result_array, total)
+                        else:
+                            result_array[:] = pool_results[fd_count][i_delta]
                         result_array *= coeff
                         result._data += result_array
 
-                    if is_parallel:
-                        for of, _, out_idx in outputs:
+                    for i, (of, subjac, out_idx, _) in enumerate(outputs):
+                        if coloring is None:
+                            loc = (_full_slice, target)
+                            vals = result._views_flat[of][out_idx]
+                        else:
+                            # the nonzeros of this sub-Jacobian in all of the colored columns
+                            loc = target[i]
+                            vals = result._views_flat[of][loc[0]]
+
+                        if is_parallel:
                             if owns[of] == iproc:
-                                results[(of, wrt)].append(
-                                    (i_count, result._views_flat[of][out_idx].copy()))
-                    else:
-                        for of, subjac, out_idx in outputs:
-                            subjac[:, i_count] = result._views_flat[of][out_idx]
+                                results[(of, wrt)].append((loc, vals.copy()))
+                        else:
+                            subjac[loc] = vals
 
                 fd_count += 1
 
         if is_parallel:
             results = _gather_jac_results(mycomm, results)
 
-        for wrt, _, _, _, _, _, outputs in approx_groups:
-            for of, subjac, _ in outputs:
+        for wrt, _, _, _, _, _, outputs, _ in approx_groups:
+            for of, subjac, _, rows_cols in outputs:
                 key = (of, wrt)
                 if is_parallel:
-                    for i, result in results[key]:
-                        subjac[:, i] = result
+                    for loc, result in results[key]:
+                        subjac[loc] = result
 
-                if uses_src_indices:
+                if rows_cols is not None:
+                    # only the declared nonzeros are stored
+                    jac[key] = subjac[rows_cols]
+                elif uses_src_indices:
                     jac._override_checks = True
                     jac[key] = subjac
                     jac._override_checks = False
                 else:
                     jac[key] = subjac
 
+    def _compute_batched(self, system, wrt, deltas, coeffs, current_coeff, in_idx, outputs,
+                         coloring, current_vec):
+        """
+        Compute the sub-Jacobian columns for one input, evaluating several points per call.
+
+        Parameters
+        ----------
+        system : ExplicitComponent
+            The component having its partials approximated.
+        wrt : str
+            Absolute name of the input.
+        deltas : ndarray
+            Perturbations of the FD form, scaled by the step size.
+        coeffs : ndarray
+            Coefficients of the FD form, scaled by the step size.
+        current_coeff : float
+            Coefficient of the current point, scaled by the step size.
+        in_idx : ndarray or range
+            Indices of the input entries to perturb.
+        outputs : list
+            List of (of, subjac, out_idx, rows_cols) receiving the approximated columns.
+        coloring : list or None
+            List of (idxs, nonzeros) for each group of columns perturbed together, or None if
+            each column is perturbed on its own.
+        current_vec : Vector
+            The residuals at the current point.
+        """
+        batch_size = system.options['fd_batch_size']
+
+        if coloring is None:
+            in_idx = np.asarray(in_idx)
+            npoints = len(in_idx)
+        else:
+            npoints = len(coloring)
+
+        for start in range(0, npoints, batch_size):
+            if coloring is None:
+                idxs = in_idx[start:start + batch_size]
+                cols = slice(start, start + len(idxs))
+                for of, subjac, out_idx, _ in outputs:
+                    subjac[:, cols] = current_coeff * current_vec._views_flat[of][out_idx, None]
+            else:
+                batch = coloring[start:start + batch_size]
+                idxs = [idx for idx, _ in batch]
+                for i, (of, subjac, _, _) in enumerate(outputs):
+                    for _, nonzeros in batch:
+                        rows, cols = nonzeros[i]
+                        subjac[rows, cols] = current_coeff * current_vec._views_flat[of][rows]
+
+            for delta, coeff in zip(deltas, coeffs):
+                residuals = system._apply_nonlinear_multi(wrt, idxs, delta)
+                for i, (of, subjac, out_idx, _) in enumerate(outputs):
+                    if coloring is None:
+                        subjac[:, cols] += coeff * residuals[of][:, out_idx].T
+                    else:
+                        for k, (_, nonzeros) in enumerate(batch):
+                            rows, cols = nonzeros[i]
+                            subjac[rows, cols] += coeff * residuals[of][k, rows]
+
     def _run_point(self, system, in_name, idxs, delta, out_tmp, in_tmp, result_array, total=False):
         """
         Alter the specified inputs by the given deltas, runs the system, and returns the results.
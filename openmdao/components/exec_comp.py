@@ -1,14 +1,16 @@
 """Define the ExecComp class, a component that evaluates an expression."""
+import ast
 import re
 from itertools import product
 
 import numpy as np
 from numpy import ndarray, imag, complex as npcomplex
 
-from six import string_types
+from six import iteritems, itervalues, string_types
 from six.moves import range
 
 from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.utils.coloring import _get_full_disjoint_cols
 
 # regex to check for variable names.
 VAR_RGX = re.compile('([.]*[_a-zA-Z]\w*[ ]*\(?)')
@@ -49,7 +51,13 @@ class ExecComp(ExplicitComponent):
         All arrays with size > 1 must have the same flattened size or an exception will be raised.
     complex_stepsize : double
         Step size used for complex step which is used for derivatives.
-
+    _cs_groups : dict or None
+        Maps each input to a list of (cols, dests), where cols are elements of the input that
+        are perturbed together in one complex step evaluation, and dests lists
+        (output, rows, idxs) to copy rows of the output derivative to idxs of the partial.
+        None if the partials are dense and every element is perturbed separately.
+    _cs_data : dict
+        Arrays holding the values of the declared partials, keyed by (output, input).
     """
 
     def __init__(self, exprs, vectorize=False, **kwargs):
@@ -61,7 +69,12 @@ class ExecComp(ExplicitComponent):
         appearing on the left-hand side of an assignment are outputs,
         and the rest are inputs.  Each variable is assumed to be of
         type float unless the initial value for that variable is supplied
-        in \*\*kwargs.  Derivatives are calculated using complex step.
+        in \*\*kwargs.  Derivatives are calculated using complex step.  Unless vectorize is
+        True, the sparsity of the partials of expressions that only use arithmetic, indexing
+        and smooth functions such as exp or sin is detected during setup, so that element-wise
+        partials are declared diagonal and input elements that don't affect the same outputs
+        are perturbed together.  Partials of expressions with comparisons or functions like
+        abs, maximum or the builtin max are declared dense.
 
         The following functions are available for use in expressions:
 
@@ -176,6 +189,8 @@ class ExecComp(ExplicitComponent):
         self._codes = None
         self._kwargs = kwargs
         self._vectorize = vectorize
+        self._cs_groups = None
+        self._cs_data = {}
 
     def setup(self):
         """
@@ -229,6 +244,10 @@ class ExecComp(ExplicitComponent):
             else:
                 self.add_input(var, val, **meta)
 
+        self._codes = self._compile_exprs(self._exprs)
+        self._cs_groups = None
+        self._cs_data = {}
+
         if self._vectorize:
             # check that sizes of any input/output vars match or one of them is size 1
             osorted = sorted(self._var_rel_names['output'])
@@ -247,11 +266,171 @@ class ExecComp(ExplicitComponent):
                     else:
                         inds = None
                     self.declare_partials(of=out, wrt=inp, rows=inds, cols=inds)
-        else:
+        elif not self._setup_sparse_partials():
             # All derivatives are defined as dense
             self.declare_partials(of='*', wrt='*')
 
-        self._codes = self._compile_exprs(self._exprs)
+    def _setup_sparse_partials(self):
+        """
+        Detect the sparsity of the partials, and declare them.
+
+        The partials are found by complex step at a random point near the initial values.
+        Partials that are element-wise are found with a number of evaluations that grows with
+        the log of the input size.  For the others, each element is perturbed separately once,
+        and the resulting sparsity is used to group the elements that can be perturbed together
+        when computing the partials.
+
+        Returns
+        -------
+        bool
+            True if the partials were declared, False if the sparsity couldn't be found and the
+            partials should be declared dense.
+        """
+        # the sparsity found at one point can only be trusted if it can't change with the values
+        # of the inputs
+        if not all(_has_fixed_sparsity(expr) for expr in self._exprs):
+            return False
+
+        meta = self._var_rel2meta
+        outs = sorted(self._var_rel_names['output'])
+        ins = sorted(self._var_rel_names['input'])
+
+        rand = np.random.RandomState(0)
+        base = {}
+        for name in ins + outs:
+            val = np.asarray(meta[name]['value'], dtype=float).reshape(meta[name]['shape'])
+            base[name] = val * (1.0 + 0.1 * rand.uniform(-1.0, 1.0, val.shape)) + \
+                0.1 * rand.uniform(-1.0, 1.0, val.shape)
+
+        osizes = [base[out].size for out in outs]
+        ooffsets = np.cumsum([0] + osizes)
+
+        groups = {}
+        patterns = {}
+        try:
+            for param in ins:
+                n = base[param].size
+                cols = np.arange(n)
+
+                # Perturbing the elements whose index has a given bit set, then those whose index
+                # has it cleared, for every bit, shows any dependence of an output element on an
+                # input element with a different index.
+                affected = np.zeros(ooffsets[-1], dtype=bool)
+                diag = n > 1
+                for bit in range(max(1, int(np.ceil(np.log2(n))))):
+                    bitset = (cols >> bit) & 1 == 1
+                    for in_group in (bitset, ~bitset):
+                        if not np.any(in_group):
+                            continue
+                        nz = self._cs_nonzeros(base, outs, param, cols[in_group])
+                        affected |= nz
+                        if diag:
+                            for out, start, size in zip(outs, ooffsets[:-1], osizes):
+                                if np.any(nz[start:start + size]) and \
+                                        (size != n or np.any(nz[start:start + size][~in_group])):
+                                    diag = False
+                                    break
+
+                if diag:
+                    J = np.zeros((ooffsets[-1], n), dtype=bool)
+                    for out, start, size in zip(outs, ooffsets[:-1], osizes):
+                        if np.any(affected[start:start + size]):
+                            J[start + cols, cols] = True
+                else:
+                    J = np.empty((ooffsets[-1], n), dtype=bool)
+                    for col in cols:
+                        J[:, col] = self._cs_nonzeros(base, outs, param, [col])
+
+                patterns[param] = J
+        except Exception:
+            return False
+
+        # Inputs connected to the same source share a sub-jacobian of an assembled jacobian, so
+        # their nonzero partials must be declared with the same sparsity.  Which inputs share a
+        # source isn't known yet, so the nonzero partials of an output with respect to inputs of
+        # the same size, which may be connected to the same source, get the union of their
+        # patterns.
+        by_size = {}
+        for param in ins:
+            by_size.setdefault(base[param].size, []).append(param)
+        for params in itervalues(by_size):
+            if len(params) == 1:
+                continue
+            for start, size in zip(ooffsets[:-1], osizes):
+                subs = [patterns[param][start:start + size] for param in params]
+                nonzero = [sub for sub in subs if np.any(sub)]
+                if len(nonzero) > 1:
+                    union = np.any(nonzero, axis=0)
+                    for sub in nonzero:
+                        sub[:] = union
+
+        for param, J in iteritems(patterns):
+            n = J.shape[1]
+
+            # each group of columns doesn't share any rows, so they are perturbed together
+            if np.any(J.sum(axis=1) == n):
+                col_groups = [[col] for col in range(n)]
+            else:
+                col_groups = _get_full_disjoint_cols(J)
+            colors = np.empty(n, dtype=int)
+            for color, col_group in enumerate(col_groups):
+                colors[col_group] = color
+
+            groups[param] = [(np.array(col_group), []) for col_group in col_groups]
+
+            for out, start, size in zip(outs, ooffsets[:-1], osizes):
+                sub = J[start:start + size]
+                if not np.any(sub):
+                    continue
+
+                if np.all(sub):
+                    self.declare_partials(of=out, wrt=param)
+                    rows, cols = np.nonzero(sub)
+                    idxs = rows * n + cols
+                    self._cs_data[out, param] = np.zeros(size * n)
+                else:
+                    rows, cols = np.nonzero(sub)
+                    self.declare_partials(of=out, wrt=param, rows=rows, cols=cols)
+                    idxs = np.arange(rows.size)
+                    self._cs_data[out, param] = np.zeros(rows.size)
+
+                col_colors = colors[cols]
+                for color, (col_group, dests) in enumerate(groups[param]):
+                    in_color = col_colors == color
+                    if np.any(in_color):
+                        dests.append((out, rows[in_color], idxs[in_color]))
+
+        self._cs_groups = groups
+        return True
+
+    def _cs_nonzeros(self, base, outs, param, cols):
+        """
+        Return which output elements change when the given input elements are perturbed.
+
+        Parameters
+        ----------
+        base : dict
+            Values of all variables, keyed by name.
+        outs : list of str
+            Names of the outputs, in order.
+        param : str
+            Name of the perturbed input.
+        cols : ndarray of int
+            Elements of the input that are perturbed.
+
+        Returns
+        -------
+        ndarray of bool
+            True for each element of the outputs, concatenated, whose derivative is nonzero.
+        """
+        scope = {name: np.array(val, dtype=npcomplex) for name, val in iteritems(base)}
+        scope[param].reshape(-1)[cols] += self.complex_stepsize * 1j
+
+        for expr in self._codes:
+            exec(expr, _expr_dict, scope)
+
+        nz = [imag(np.broadcast_to(scope[out], base[out].shape)).ravel() != 0. for out in outs]
+        return np.concatenate(nz)
 
     def _compile_exprs(self, exprs):
         compiled = []
@@ -344,6 +523,34 @@ class ExecComp(ExplicitComponent):
         out_names = self._var_allprocs_prom2abs_list['output']
         inv_stepsize = 1.0 / self.complex_stepsize
 
+        if self._cs_groups is not None:
+            data = self._cs_data
+            for param, groups in iteritems(self._cs_groups):
+                pwrap = _TmpDict(inputs)
+                pwrap[param] = np.array(inputs[param], npcomplex)
+                pflat = pwrap[param].reshape(-1)
+
+                for cols, dests in groups:
+                    # set a complex param value for all the elements of this group
+                    pflat[cols] += step
+
+                    uwrap = _TmpDict(self._outputs, return_complex=True)
+
+                    # solve with complex param value
+                    self._residuals.set_const(0.0)
+                    self.compute(pwrap, uwrap)
+
+                    for u, rows, idxs in dests:
+                        uval = np.broadcast_to(uwrap[u], self._outputs[u].shape).ravel()
+                        data[u, param][idxs] = imag(uval[rows] * inv_stepsize)
+
+                    # restore old param value
+                    pflat[cols] -= step
+
+            for key, val in iteritems(data):
+                partials[key] = val
+            return
+
         for param in inputs:
 
             pwrap = _TmpDict(inputs)
@@ -558,3 +765,45 @@ def _cs_abs(x):
 
 
 _expr_dict['abs'] = _cs_abs
+
+# functions whose partials are nonzero wherever they are at a random point, so the sparsity of
+# an expression that only calls these doesn't depend on the values of the inputs
+_fixed_sparsity_funcs = {'arange', 'ones', 'zeros', 'linspace',
+                         'log', 'log10', 'log1p', 'power', 'exp', 'expm1',
+                         'sum', 'dot', 'prod', 'tensordot', 'matmul', 'outer', 'inner', 'kron',
+                         'sin', 'cos', 'tan', 'arcsin', 'asin', 'arccos', 'acos', 'arctan',
+                         'atan', 'sinh', 'cosh', 'tanh', 'arcsinh', 'asinh', 'arccosh', 'acosh',
+                         'erf', 'erfc'}
+
+# syntax allowed in those expressions: no comparisons, boolean or conditional expressions,
+# attributes or other constructs whose partials can switch on and off with the input values
+_fixed_sparsity_nodes = tuple(getattr(ast, name) for name in
+                              ('Module', 'Assign', 'Expr', 'Name', 'Load', 'Store', 'Num',
+                               'Constant', 'BinOp', 'UnaryOp', 'Add', 'Sub', 'Mult', 'Div',
+                               'MatMult', 'Pow', 'UAdd', 'USub', 'Call', 'keyword',
+                               'Subscript', 'Index', 'Slice', 'ExtSlice', 'Tuple', 'List')
+                              if hasattr(ast, name))
+
+
+def _has_fixed_sparsity(expr):
+    """
+    Return True if the sparsity of the partials of the expression can't depend on input values.
+
+    Parameters
+    ----------
+    expr : str
+        An ExecComp expression.
+
+    Returns
+    -------
+    bool
+        True if the expression only uses arithmetic, indexing and calls to the functions in
+        _fixed_sparsity_funcs.
+    """
+    for node in ast.walk(ast.parse(expr)):
+        if not isinstance(node, _fixed_sparsity_nodes):
+            return False
+        if isinstance(node, ast.Call) and not (isinstance(node.func, ast.Name) and
+                                               node.func.id in _fixed_sparsity_funcs):
+            return False
+    return True
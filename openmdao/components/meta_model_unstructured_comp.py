@@ -328,12 +328,11 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
             elif overrides_method('vectorized_predict', surrogate, SurrogateModel):
                 # Vectorized; surrogate provides vectorized computation.
-                # TODO: This code is untested because no surrogates provide this option.
-                predicted = surrogate.vectorized_predict(flat_inputs.flat)
+                predicted = surrogate.vectorized_predict(flat_inputs)
                 if isinstance(predicted, tuple):  # rmse option
                     self._metadata(name)['rmse'] = predicted[1]
                     predicted = predicted[0]
-                outputs[name] = np.reshape(predicted, shape)
+                outputs[name] = np.reshape(predicted, outputs[name].shape)
 
             else:
                 # Vectorized; must call surrogate multiple times.
@@ -400,15 +399,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         arr = np.zeros((vec_size, self._input_size))
 
-        for row in range(vec_size):
-            idx = 0
-            for name, sz in self._surrogate_input_names:
-                val = vec[name]
-                if array_real and np.issubdtype(val.dtype, np.complexfloating):
-                    array_real = False
-                    arr = arr.astype(np.complexfloating)
-                arr[row][idx:idx + sz] = val[row].flat
-                idx += sz
+        idx = 0
+        for name, sz in self._surrogate_input_names:
+            val = vec[name]
+            if array_real and np.issubdtype(val.dtype, np.complexfloating):
+                array_real = False
+                arr = arr.astype(np.complexfloating)
+            arr[:, idx:idx + sz] = val.reshape((vec_size, sz))
+            idx += sz
 
         return arr
 
@@ -483,6 +481,15 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         for out_name, out_shape in self._surrogate_output_names:
             surrogate = self._metadata(out_name).get('surrogate')
             if vec_size > 1:
+                if overrides_method('vectorized_linearize', surrogate, SurrogateModel):
+                    # jacobians at all points at once, with shape (vec_size, out_size, n_inputs)
+                    derivs = surrogate.vectorized_linearize(flat_inputs)
+                    idx = 0
+                    for in_name, sz in self._surrogate_input_names:
+                        partials[out_name, in_name] = derivs[:, :, idx:idx + sz].flatten()
+                        idx += sz
+                    continue
+
                 out_size = np.prod(out_shape)
                 for j in range(vec_size):
                     flat_input = flat_inputs[j]
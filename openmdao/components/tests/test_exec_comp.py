@@ -11,9 +11,10 @@ import scipy
 
 from parameterized import parameterized
 
-from openmdao.api import IndepVarComp, Group, Problem, ExecComp
+from openmdao.api import IndepVarComp, Group, Problem, ExecComp, DirectSolver
 from openmdao.components.exec_comp import _expr_dict
-from openmdao.utils.assert_utils import assert_rel_error
+from openmdao.utils.assert_utils import assert_rel_error, assert_check_partials, \
+    assert_equal_arrays
 
 _ufunc_test_data = {'abs': {'str': 'f=abs(x)',
                             'check_func': np.abs,
@@ -542,6 +543,101 @@ class TestExecComp(unittest.TestCase):
         self.assertEqual(str(context.exception),
                          "comp: vectorize is True but partial(y, A) is not square (shape=(3, 15)).")
 
+    def test_sparse_partials(self):
+        p = Problem()
+        model = p.model
+        ivc = model.add_subsystem('p', IndepVarComp())
+        ivc.add_output('x', np.arange(5.) + 1.0)
+        ivc.add_output('z', np.arange(5.) * 0.5)
+        comp = model.add_subsystem('comp', ExecComp(['y = 2.0*x**2 + z', 'd = x[1:] - x[:-1]',
+                                                     's = sum(z)'],
+                                                    x=np.ones(5), z=np.ones(5), y=np.ones(5),
+                                                    d=np.ones(4)))
+        model.connect('p.x', 'comp.x')
+        model.connect('p.z', 'comp.z')
+        p.setup(check=False)
+        p.run_model()
+
+        # element-wise partials are diagonal, others have the sparsity of the expression
+        info = comp._subjacs_info
+        assert_equal_arrays(info['comp.y', 'comp.x']['rows'], np.arange(5))
+        assert_equal_arrays(info['comp.y', 'comp.x']['cols'], np.arange(5))
+        assert_equal_arrays(info['comp.d', 'comp.x']['rows'], np.array([0, 0, 1, 1, 2, 2, 3, 3]))
+        assert_equal_arrays(info['comp.d', 'comp.x']['cols'], np.array([0, 1, 1, 2, 2, 3, 3, 4]))
+        self.assertIsNone(info['comp.s', 'comp.z']['rows'])
+        self.assertNotIn(('comp.d', 'comp.z'), info)
+        self.assertNotIn(('comp.s', 'comp.x'), info)
+
+        # elements that don't affect the same outputs are perturbed together
+        self.assertEqual(len(comp._cs_groups['x']), 2)
+        self.assertEqual(len(comp._cs_groups['z']), 5)
+
+        assert_check_partials(p.check_partials(out_stream=None), atol=1e-5)
+
+        J = p.compute_totals(of=['comp.y', 'comp.d'], wrt=['p.x'], return_format='array')
+        expected = np.zeros((9, 5))
+        expected[:5] = np.diag(4.0 * p['comp.x'])
+        expected[5:, :4] -= np.eye(4)
+        expected[5:, 1:] += np.eye(4)
+        assert_rel_error(self, J, expected, 1e-12)
+
+    def test_sparse_partials_shared_source(self):
+        # inputs connected to the same source share a sub-jacobian of an assembled jacobian
+        p = Problem()
+        model = p.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(3.) + 1.0))
+        comp = model.add_subsystem('c', ExecComp('y = a + b[::-1]', a=np.ones(3), b=np.ones(3),
+                                                 y=np.ones(3)))
+        model.connect('p.x', ['c.a', 'c.b'])
+        model.linear_solver = DirectSolver(assemble_jac=True)
+        p.setup(check=False)
+        p.run_model()
+
+        info = comp._subjacs_info
+        assert_equal_arrays(info['c.y', 'c.a']['rows'], info['c.y', 'c.b']['rows'])
+        assert_equal_arrays(info['c.y', 'c.a']['cols'], info['c.y', 'c.b']['cols'])
+
+        J = p.compute_totals(of=['c.y'], wrt=['p.x'], return_format='array')
+        assert_rel_error(self, J, np.eye(3) + np.eye(3)[::-1], 1e-12)
+
+    def test_sparse_partials_value_dependent(self):
+        # the sparsity of abs, maximum, etc. can change with the inputs, so it isn't detected
+        p = Problem()
+        comp = p.model.add_subsystem('comp', ExecComp('y = maximum(x, z[::-1])', x=np.ones(3),
+                                                      z=np.ones(3), y=np.ones(3)))
+        p.setup(check=False)
+        p['comp.x'] = np.array([1.0, 2.0, 3.0])
+        p['comp.z'] = np.array([0.5, 0.5, 5.0])
+        p.run_model()
+
+        self.assertIsNone(comp._cs_groups)
+        self.assertIsNone(comp._subjacs_info['comp.y', 'comp.z']['rows'])
+        assert_check_partials(p.check_partials(out_stream=None))
+
+    def test_sparse_partials_builtin_and_compare(self):
+        # partials that are zero at the initial values but not at others are still declared
+        for expr, kwargs, inputs, expected in [
+                ('y = max(x, z)', {'x': 1.0, 'z': 2.0}, {'x': 3.0, 'z': 2.0}, [[1.0, 0.0]]),
+                ('y = x*(x > 0.5)', {'x': 0.2}, {'x': 1.0}, [[1.0]])]:
+            p = Problem()
+            model = p.model
+            ivc = model.add_subsystem('p', IndepVarComp())
+            for name, val in sorted(kwargs.items()):
+                ivc.add_output(name, val)
+                model.connect('p.%s' % name, 'comp.%s' % name)
+            comp = model.add_subsystem('comp', ExecComp(expr, **kwargs))
+
+            p.setup(check=False)
+            for name, val in inputs.items():
+                p['p.%s' % name] = val
+            p.run_model()
+
+            self.assertIsNone(comp._cs_groups)
+
+            J = p.compute_totals(of=['comp.y'], wrt=['p.%s' % name for name in sorted(kwargs)],
+                                 return_format='array')
+            assert_rel_error(self, J, np.array(expected), 1e-12)
+
     def test_feature_vectorize(self):
         p = Problem()
         model = p.model
@@ -7,7 +7,7 @@ import unittest
 import warnings
 
 from openmdao.api import Group, Problem, MetaModelUnStructuredComp, IndepVarComp, ResponseSurface, \
-    FloatKrigingSurrogate, KrigingSurrogate, ScipyOptimizeDriver, SurrogateModel
+    FloatKrigingSurrogate, KrigingSurrogate, ScipyOptimizeDriver, SurrogateModel, NearestNeighbor
 
 from openmdao.utils.assert_utils import assert_rel_error
 from openmdao.utils.logger_utils import TestLogger
@@ -625,6 +625,60 @@ class MetaModelTestCase(unittest.TestCase):
             abs_error = float(match)
             self.assertTrue(abs_error < 1.e-5)
 
+    def test_vectorized_surrogates(self):
+        # the vectorized predictions and derivatives of the built-in surrogates match
+        # those at each point on its own
+        vec_size = 6
+
+        np.random.seed(11)
+        train_x = np.random.uniform(0., 2., 40)
+        train_xx = np.random.uniform(0., 2., (40, 2))
+        train_y = np.column_stack([np.sin(train_x) + train_xx[:, 0] * train_xx[:, 1],
+                                   np.cos(train_x) * train_xx[:, 1]]).reshape((40, 1, 2))
+
+        x = np.random.uniform(.5, 1.5, vec_size)
+        xx = np.random.uniform(.5, 1.5, (vec_size, 2))
+
+        def run(surrogate, vec_size, x, xx):
+            mm = MetaModelUnStructuredComp(vec_size=vec_size, default_surrogate=surrogate)
+            if vec_size > 1:
+                mm.add_input('x', np.zeros(vec_size))
+                mm.add_input('xx', np.zeros((vec_size, 2)))
+                mm.add_output('y', np.zeros((vec_size, 1, 2)))
+            else:
+                mm.add_input('x', 0.)
+                mm.add_input('xx', np.zeros(2))
+                mm.add_output('y', np.zeros((1, 2)))
+
+            prob = Problem()
+            prob.model.add_subsystem('mm', mm)
+            prob.setup(check=False)
+
+            mm.options['train:x'] = train_x
+            mm.options['train:xx'] = train_xx
+            mm.options['train:y'] = train_y
+
+            prob['mm.x'] = x
+            prob['mm.xx'] = xx
+            prob.run_model()
+
+            data = prob.check_partials(out_stream=None)['mm']
+            return prob['mm.y'].copy(), data[('y', 'x')]['J_fwd'], data[('y', 'xx')]['J_fwd']
+
+        for surrogate in (FloatKrigingSurrogate(), ResponseSurface(),
+                          NearestNeighbor(interpolant_type='linear'),
+                          NearestNeighbor(interpolant_type='weighted'),
+                          NearestNeighbor(interpolant_type='rbf')):
+            y, dy_dx, dy_dxx = run(surrogate, vec_size, x, xx)
+
+            for i in range(vec_size):
+                y_i, dy_dx_i, dy_dxx_i = run(surrogate, 1, x[i], xx[i])
+                assert_rel_error(self, y[i], y_i, 1e-10)
+
+                rows = slice(2 * i, 2 * i + 2)
+                assert_rel_error(self, dy_dx[rows, i:i + 1], dy_dx_i, 1e-10)
+                assert_rel_error(self, dy_dxx[rows, 2 * i:2 * i + 2], dy_dxx_i, 1e-10)
+
     def test_metamodel_feature_vector(self):
         # Like simple sine example, but with input of length n instead of scalar
         # The expected behavior is that the output is also of length n, with
@@ -178,7 +178,7 @@ class Component(System):
         self.pathname = pathname
 
         orig_comm = comm
-        if self._num_par_fd > 1:
+        if self._num_par_fd > 1 and self._par_fd_backend == 'mpi':
             if comm.size > 1:
                 comm = self._setup_par_fd_procs(comm)
             elif not MPI:
@@ -765,7 +765,8 @@ class Component(System):
             matter because the space for a dense subjac will always be
             allocated for every pair.
         rows : ndarray of int or None
-            Row indices for each nonzero entry.  For sparse subjacobians only.
+            Row indices for each nonzero entry.  For sparse subjacobians only. When the
+            subjacobian is approximated, the sparsity is used to color its columns.
         cols : ndarray of int or None
             Column indices for each nonzero entry.  For sparse subjacobians only.
         val : float or ndarray of float or scipy.sparse
@@ -792,13 +793,12 @@ class Component(System):
             msg = 'Method "{}" is not supported, method must be one of {}'
             raise ValueError(msg.format(method, _supported_methods.keys()))
 
+        # If only one of rows/cols is specified
+        if (rows is None) ^ (cols is None):
+            raise ValueError('If one of rows/cols is specified, then both must be specified')
+
         # Analytic Derivative for this Jacobian pair
         if method_func is None:  # exact
-
-            # If only one of rows/cols is specified
-            if (rows is None) ^ (cols is None):
-                raise ValueError('If one of rows/cols is specified, then both must be specified')
-
             self._declared_partials.append((of, wrt, dependent, rows, cols, val))
 
         # Approximation of the derivative, former API call approx_partials.
@@ -807,11 +807,8 @@ class Component(System):
             if method not in self._approx_schemes:
                 self._approx_schemes[method] = method_func()
 
-            # If rows/cols is specified
-            if rows is not None or cols is not None:
-                raise ValueError('Sparse FD specification not supported yet.')
-
-            # Need to declare the Jacobian element too.
+            # Need to declare the Jacobian element too. If rows/cols are given, the approximation
+            # perturbs structurally independent columns together.
             self._declared_partials.append((of, wrt, True, rows, cols, val))
 
             kwargs = {}
@@ -17,6 +17,7 @@ from openmdao.recorders.recording_manager import RecordingManager
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.utils.record_util import create_local_meta, check_path
 from openmdao.utils.general_utils import simple_warning
+from openmdao.utils.eval_cache import EvalCache
 from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
 import openmdao.utils.coloring as coloring_mod
@@ -86,6 +87,18 @@ class Driver(object):
         Dict of sparse subjacobians for use with certain optimizers, e.g. pyOptSparseDriver.
     _total_jac : _TotalJacInfo or None
         Cached total jacobian handling object.
+    _eval_cache : <EvalCache> or None
+        Cache of responses at previously evaluated design points, if enabled.
+    _remote_gathers : dict
+        Maps 'dvs', 'cons', 'objs' and 'responses' to the layout used to gather the values of
+        the remote VOIs of that kind in a single collective, or None if there are none.
+    _flat_dvs : tuple or None
+        (x_idxs, out_idxs, scaler, adder) mapping a flat array of all design variable values to
+        the local model outputs, computed by _setup_flat_vois.
+    _flat_cons : tuple or None
+        (out_idxs, scaler, adder, values) mapping the local model outputs to a preallocated flat
+        array of all constraint values, computed by _setup_flat_vois. out_idxs is None if some
+        constraints are remote.
     """
 
     def __init__(self, **kwargs):
@@ -111,6 +124,9 @@ class Driver(object):
         self._cons = None
         self._objs = None
         self._responses = None
+        self._remote_gathers = {}
+        self._flat_dvs = None
+        self._flat_cons = None
 
         # Driver options
         self.options = OptionsDictionary()
@@ -120,6 +136,18 @@ class Driver(object):
                                   "iteration. Valid items in list are 'desvars', 'ln_cons', "
                                   "'nl_cons', 'objs', 'totals'",
                              default=[])
+        self.options.declare('eval_cache_size', types=int, default=0, lower=0,
+                             desc='Maximum number of design points whose objective and '
+                                  'constraint values are kept, so that the model is not run '
+                                  'again if the driver revisits one of them. This assumes that '
+                                  'the responses depend only on the design variables. Only used '
+                                  'by drivers that support it. Design points found in the '
+                                  'cache are not recorded again. Set to 0 to disable the cache.')
+        self.options.declare('eval_cache_file', types=string_types, default=None,
+                             allow_none=True,
+                             desc='Name of a case recording file whose driver cases are loaded '
+                                  'into the evaluation cache during setup. Design points found '
+                                  'in it are not run or recorded in the current run.')
 
         # Case recording options
         self.recording_options = OptionsDictionary()
@@ -175,6 +203,7 @@ class Driver(object):
         self._total_jac_sparsity = None
         self._res_jacs = {}
         self._total_jac = None
+        self._eval_cache = None
 
         self.fail = False
 
@@ -283,14 +312,233 @@ class Driver(object):
         self._remote_responses = self._remote_cons.copy()
         self._remote_responses.update(self._remote_objs)
 
+        self._remote_gathers = {
+            'dvs': self._setup_remote_gather(self._remote_dvs),
+            'cons': self._setup_remote_gather(self._remote_cons),
+            'objs': self._setup_remote_gather(self._remote_objs),
+            'responses': self._setup_remote_gather(self._remote_responses),
+        }
+
         # set up case recording
         self._setup_recording()
 
+        self._setup_eval_cache()
+
         # set up simultaneous deriv coloring
         if (coloring_mod._use_sparsity and self._simul_coloring_info and
                 self.supports['simultaneous_derivatives']):
             self._setup_simul_coloring()
 
+    def _setup_remote_gather(self, remote_vois):
+        """
+        Compute the layout used to gather the values of remote VOIs in a single collective.
+
+        The values owned by each rank are packed one after the other, in the order of the
+        model outputs, into a buffer on every rank. The values of each VOI are returned as
+        views into that buffer.
+
+        Parameters
+        ----------
+        remote_vois : dict
+            Dict containing (owning_rank, size) for all remote vois of a particular
+            type (design var, constraint, or objective).
+
+        Returns
+        -------
+        tuple or None
+            (local_names, sendbuf, recvbuf, sizes, offsets, views), or None if there are no
+            remote vois.
+        """
+        if not remote_vois:
+            return None
+
+        model = self._problem.model
+        comm = model.comm
+        names = [n for n in model._var_allprocs_abs_names['output'] if n in remote_vois]
+
+        sizes = np.zeros(comm.size, dtype=int)
+        for name in names:
+            owner, size = remote_vois[name]
+            sizes[owner] += size
+
+        offsets = np.zeros(comm.size, dtype=int)
+        offsets[1:] = np.cumsum(sizes)[:-1]
+
+        recvbuf = np.zeros(np.sum(sizes))
+        starts = offsets.copy()
+        local_names = []
+        views = {}
+        for name in names:
+            owner, size = remote_vois[name]
+            views[name] = recvbuf[starts[owner]:starts[owner] + size]
+            starts[owner] += size
+            if owner == comm.rank:
+                local_names.append(name)
+
+        sendbuf = np.zeros(sizes[comm.rank])
+
+        return local_names, sendbuf, recvbuf, sizes, offsets, views
+
+    def _gather_remote_vois(self, kind):
+        """
+        Gather the full values of all remote VOIs of the given kind onto every rank.
+
+        This is a collective operation, so it must be called on all ranks.
+
+        Parameters
+        ----------
+        kind : str
+            'dvs', 'cons', 'objs' or 'responses'.
+
+        Returns
+        -------
+        dict or None
+            Views of the gathered values keyed by VOI name, or None if there are no remote vois.
+            The views are overwritten by the next gather.
+        """
+        gather = self._remote_gathers.get(kind)
+        if gather is None:
+            return None
+
+        local_names, sendbuf, recvbuf, sizes, offsets, views = gather
+        vec = self._problem.model._outputs._views_flat
+
+        start = 0
+        for name in local_names:
+            val = vec[name]
+            sendbuf[start:start + val.size] = val
+            start += val.size
+
+        self._problem.model.comm.Allgatherv(sendbuf, [recvbuf, sizes, offsets, MPI.DOUBLE])
+
+        return views
+
+    def _get_flat_voi_map(self, names, vois):
+        """
+        Compute the positions of the given VOIs in the local model output array.
+
+        Parameters
+        ----------
+        names : list of str
+            Names of local VOIs, in the order of the flat array.
+        vois : dict
+            Metadata of the VOIs.
+
+        Returns
+        -------
+        tuple of (ndarray, ndarray or None, ndarray or None)
+            Indices into the output array, and the scaler and adder of each entry, or None if
+            none of the VOIs is scaled.
+        """
+        model = self._problem.model
+        iproc = model.comm.rank
+        abs2idx = model._var_allprocs_abs2idx['nonlinear']
+        sizes = model._var_sizes['nonlinear']['output']
+
+        out_idxs = []
+        scalers = []
+        adders = []
+        for name in names:
+            meta = vois[name]
+            ivar = abs2idx[name]
+            offset = np.sum(sizes[iproc, :ivar])
+            idxs = np.arange(sizes[iproc, ivar])
+            if meta['indices'] is not None:
+                idxs = idxs[meta['indices']]
+            out_idxs.append(idxs + offset)
+
+            scaler = meta['scaler']
+            scalers.append(np.broadcast_to(1.0 if scaler is None else scaler, idxs.shape))
+            adder = meta['adder']
+            adders.append(np.broadcast_to(0.0 if adder is None else adder, idxs.shape))
+
+        out_idxs = np.concatenate(out_idxs) if out_idxs else np.zeros(0, dtype=int)
+
+        scaler = adder = None
+        if self._has_scaling and names:
+            if any(vois[n]['scaler'] is not None for n in names):
+                scaler = np.concatenate(scalers)
+            if any(vois[n]['adder'] is not None for n in names):
+                adder = np.concatenate(adders)
+
+        return out_idxs, scaler, adder
+
+    def _setup_flat_vois(self):
+        """
+        Compute the mappings between the model outputs and flat arrays of all VOI values.
+
+        This lets drivers that work with flat arrays set all design variables, and get all
+        constraints, with a single fancy-indexed operation each.
+        """
+        model = self._problem.model
+        rank = model.comm.rank
+
+        # design variables that are remote and owned by another rank aren't set here
+        x_idxs = []
+        local_dvs = []
+        start = 0
+        for name, meta in iteritems(self._designvars):
+            size = meta['size']
+            if name not in self._remote_dvs or self._remote_dvs[name][0] == rank:
+                x_idxs.append(np.arange(start, start + size))
+                local_dvs.append(name)
+            start += size
+
+        x_idxs = np.concatenate(x_idxs) if x_idxs else np.zeros(0, dtype=int)
+        self._flat_dvs = (x_idxs,) + self._get_flat_voi_map(local_dvs, self._designvars)
+
+        # constraint values are needed on all ranks, so remote ones are gathered instead
+        size = sum(meta['size'] for meta in itervalues(self._cons))
+        values = np.zeros(size)
+        if any(name in self._remote_cons or name in self._remote_dvs for name in self._cons):
+            self._flat_cons = (None, None, None, values)
+        else:
+            self._flat_cons = self._get_flat_voi_map(list(self._cons), self._cons) + (values,)
+
+    def _set_flat_design_vars(self, x):
+        """
+        Set the values of all design variables from a flat array.
+
+        Parameters
+        ----------
+        x : ndarray
+            Scaled values of all design variables, in the order of the design variables.
+        """
+        x_idxs, out_idxs, scaler, adder = self._flat_dvs
+        val = x[x_idxs]
+        if scaler is not None:
+            val /= scaler
+        if adder is not None:
+            val -= adder
+
+        self._problem.model._outputs._data[out_idxs] = val
+
+    def _get_flat_constraint_values(self):
+        """
+        Return the values of all constraints in a flat array.
+
+        Returns
+        -------
+        ndarray
+            Scaled values of all constraints, in the order of the constraints. The array is
+            preallocated and overwritten by the next call.
+        """
+        out_idxs, scaler, adder, values = self._flat_cons
+
+        if out_idxs is None:
+            start = 0
+            for name, val in iteritems(self.get_constraint_values()):
+                values[start:start + val.size] = val
+                start += val.size
+        else:
+            np.take(self._problem.model._outputs._data, out_idxs, out=values)
+            if adder is not None:
+                values += adder
+            if scaler is not None:
+                values *= scaler
+
+        return values
+
     def _setup_recording(self):
         """
         Set up case recording.
@@ -402,11 +650,111 @@ class Driver(object):
             for sub in model.system_iter(recurse=True, include_self=True):
                 self._rec_mgr.record_metadata(sub)
 
-    def _get_voi_val(self, name, meta, remote_vois, unscaled=False, ignore_indices=False):
+    def _setup_eval_cache(self):
+        """
+        Create the evaluation cache if requested, and fill it from the cache file if given.
+
+        The cache is recreated every time the driver is set up, so it only holds design points
+        evaluated during the current run (or read from the cache file).
+        """
+        size = self.options['eval_cache_size']
+        if size == 0:
+            self._eval_cache = None
+            return
+
+        self._eval_cache = cache = EvalCache(size)
+
+        fname = self.options['eval_cache_file']
+        if fname is not None:
+            cache.load_cases(fname, list(self._designvars), list(self._objs) + list(self._cons))
+
+    def _get_eval_cache_key(self):
+        """
+        Return the evaluation cache key of the current, unscaled design variable values.
+
+        Returns
+        -------
+        bytes
+            The cache key.
+        """
+        remote_vals = self._gather_remote_vois('dvs')
+        return EvalCache.make_key([self._get_voi_val(name, meta, self._remote_dvs, unscaled=True,
+                                                     ignore_indices=True, remote_vals=remote_vals)
+                                   for name, meta in iteritems(self._designvars)])
+
+    def _load_cached_point(self):
+        """
+        Restore the objectives and constraints of the current design point from the cache.
+
+        On a hit, the cached values are written to the model outputs, so the usual methods
+        for getting objective and constraint values return them.
+
+        Returns
+        -------
+        tuple or None
+            (success, msg) of the cached evaluation, or None if the design point is not
+            cached or the cache is disabled.
+        """
+        if self._eval_cache is None:
+            return None
+
+        entry = self._eval_cache.get(self._get_eval_cache_key())
+        if entry is None:
+            return None
+
+        values, success, msg = entry
+        views = self._problem.model._outputs._views_flat
+        for name, val in iteritems(values):
+            if name in views:
+                views[name][:] = val
+
+        return success, msg
+
+    def _save_cached_point(self, success=True, msg=''):
+        """
+        Store the objectives and constraints of the current design point in the cache.
+
+        Parameters
+        ----------
+        success : bool
+            Success flag of the model evaluation.
+        msg : str
+            Message associated with the model evaluation.
+        """
+        if self._eval_cache is None:
+            return
+
+        values = {}
+        for vois, remote_vois, kind in ((self._objs, self._remote_objs, 'objs'),
+                                        (self._cons, self._remote_cons, 'cons')):
+            remote_vals = self._gather_remote_vois(kind)
+            for name, meta in iteritems(vois):
+                values[name] = self._get_voi_val(name, meta, remote_vois, unscaled=True,
+                                                 ignore_indices=True, remote_vals=remote_vals)
+
+        self._eval_cache.add(self._get_eval_cache_key(), values, success, msg)
+
+    def get_eval_cache_stats(self):
+        """
+        Return the usage statistics of the evaluation cache.
+
+        Returns
+        -------
+        dict or None
+            Number of 'hits', 'misses' and cached design points ('size'), and the 'hit_rate',
+            or None if the cache is disabled.
+        """
+        if self._eval_cache is None:
+            return None
+        return self._eval_cache.get_stats()
+
+    def _get_voi_val(self, name, meta, remote_vois, unscaled=False, ignore_indices=False,
+                     remote_vals=None):
         """
         Get the value of a variable of interest (objective, constraint, or design var).
 
-        This will retrieve the value if the VOI is remote.
+        This will retrieve the value if the VOI is remote. That takes a collective operation
+        for each remote VOI, unless its value was already gathered by _gather_remote_vois.
 
         Parameters
         ----------
@@ -421,6 +769,8 @@ class Driver(object):
             Set to True if unscaled (physical) design variables are desired.
         ignore_indices : bool
             Set to True if the full array is desired, not just those indicated by indices.
+        remote_vals : dict or None
+            Values of the remote VOIs returned by _gather_remote_vois.
 
         Returns
         -------
@@ -432,7 +782,12 @@ class Driver(object):
         vec = model._outputs._views_flat
         indices = meta['indices']
 
-        if name in remote_vois:
+        if remote_vals is not None and name in remote_vals:
+            if indices is None or ignore_indices:
+                val = remote_vals[name].copy()
+            else:
+                val = remote_vals[name][indices]
+        elif name in remote_vois:
             owner, size = remote_vois[name]
             if owner == comm.rank:
                 if indices is None or ignore_indices:
@@ -489,8 +844,10 @@ class Driver(object):
             # use all the designvars
             dvs = self._designvars
 
+        remote_vals = self._gather_remote_vois('dvs')
         return {n: self._get_voi_val(n, self._designvars[n], self._remote_dvs, unscaled=unscaled,
-                                     ignore_indices=ignore_indices) for n in dvs}
+                                     ignore_indices=ignore_indices, remote_vals=remote_vals)
+                for n in dvs}
 
     def set_design_var(self, name, value):
         """
@@ -546,7 +903,9 @@ class Driver(object):
         else:
             resps = self._responses
 
-        return {n: self._get_voi_val(n, self._responses[n], self._remote_objs) for n in resps}
+        remote_vals = self._gather_remote_vois('responses')
+        return {n: self._get_voi_val(n, self._responses[n], self._remote_responses,
+                                     remote_vals=remote_vals) for n in resps}
 
     def get_objective_values(self, unscaled=False, filter=None, ignore_indices=False):
         """
@@ -571,8 +930,9 @@ class Driver(object):
         else:
             objs = self._objs
 
+        remote_vals = self._gather_remote_vois('objs')
         return {n: self._get_voi_val(n, self._objs[n], self._remote_objs, unscaled=unscaled,
-                                     ignore_indices=ignore_indices)
+                                     ignore_indices=ignore_indices, remote_vals=remote_vals)
                 for n in objs}
 
     def get_constraint_values(self, ctype='all', lintype='all', unscaled=False, filter=None,
@@ -605,6 +965,8 @@ class Driver(object):
         else:
             cons = self._cons
 
+        remote_vals = self._gather_remote_vois('cons')
+
         con_dict = {}
         for name in cons:
             meta = self._cons[name]
@@ -622,7 +984,8 @@ class Driver(object):
                 continue
 
             con_dict[name] = self._get_voi_val(name, meta, self._remote_cons, unscaled=unscaled,
-                                               ignore_indices=ignore_indices)
+                                               ignore_indices=ignore_indices,
+                                               remote_vals=remote_vals)
 
         return con_dict
 
@@ -24,6 +24,9 @@ class ExplicitComponent(Component):
         Dictionary of names mapped to bound methods.
     _has_compute_partials : bool
         If True, the instance overrides compute_partials.
+    _has_compute_multi : bool
+        If True, the instance overrides compute_multi, so finite difference can evaluate several
+        perturbed points in a single call.
     """
 
     def __init__(self, **kwargs):
@@ -39,6 +42,18 @@ class ExplicitComponent(Component):
 
         self._inst_functs = {name: getattr(self, name, None) for name in _inst_functs}
         self._has_compute_partials = overrides_method('compute_partials', self, ExplicitComponent)
+        self._has_compute_multi = overrides_method('compute_multi', self, ExplicitComponent)
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super(ExplicitComponent, self)._declare_options()
+
+        self.options.declare('fd_batch_size', types=int, default=100, lower=1,
+                             desc='Maximum number of perturbed points passed to compute_multi '
+                                  'in a single call when approximating partials by finite '
+                                  'difference.')
 
     def _configure(self):
         """
@@ -400,6 +415,72 @@ class ExplicitComponent(Component):
         """
         pass
 
+    def compute_multi(self, inputs, outputs):
+        """
+        Compute outputs for several sets of inputs at once.
+
+        This is optional. If it is overridden, finite difference approximation of the partials
+        evaluates the perturbed points in batches, instead of calling compute once per column.
+
+        Parameters
+        ----------
+        inputs : dict
+            Input values keyed by variable name, each with shape (n,) + variable shape.
+        outputs : dict
+            Output values keyed by variable name, each with shape (n,) + variable shape, to be
+            filled in for each of the n points.
+        """
+        pass
+
+    def _apply_nonlinear_multi(self, wrt, idxs, delta):
+        """
+        Compute the residuals at several points, each perturbing some entries of one input.
+
+        The model is assumed to be in an unscaled state.
+
+        Parameters
+        ----------
+        wrt : str
+            Absolute name of the perturbed input.
+        idxs : ndarray of int or list of ndarray of int
+            Flat index of the perturbed entry of the input for each of the points, or the flat
+            indices of all of the entries perturbed together at each point.
+        delta : float
+            Perturbation added to the perturbed entries.
+
+        Returns
+        -------
+        dict
+            Residuals of each output, keyed by absolute name, with shape (len(idxs), size).
+        """
+        npts = len(idxs)
+        abs2prom = self._var_abs2prom
+
+        inputs = {}
+        for abs_name, val in iteritems(self._inputs._views):
+            inputs[abs2prom['input'][abs_name]] = np.repeat(val[np.newaxis], npts, axis=0)
+
+        outputs = {}
+        for abs_name, val in iteritems(self._outputs._views):
+            outputs[abs2prom['output'][abs_name]] = np.repeat(val[np.newaxis], npts, axis=0)
+
+        if isinstance(idxs, np.ndarray):
+            pts = np.arange(npts)
+        else:
+            pts = np.repeat(np.arange(npts), [len(idx) for idx in idxs])
+            idxs = np.concatenate(idxs)
+
+        perturbed = inputs[abs2prom['input'][wrt]].reshape((npts, -1))
+        perturbed[pts, idxs] += delta
+
+        self.compute_multi(inputs, outputs)
+
+        residuals = {}
+        for abs_name, val in iteritems(self._outputs._views_flat):
+            residuals[abs_name] = outputs[abs2prom['output'][abs_name]].reshape((npts, -1)) - val
+
+        return residuals
+
     def compute_partials(self, inputs, partials):
         """
         Compute sub-jacobian parts. The model is assumed to be in an unscaled state.
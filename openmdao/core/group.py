@@ -311,7 +311,7 @@ class Group(System):
         """
         self.pathname = pathname
 
-        if self._num_par_fd > 1:
+        if self._num_par_fd > 1 and self._par_fd_backend == 'mpi':
             if comm.size > 1:
                 if self._owns_approx_jac:
                     comm = self._setup_par_fd_procs(comm)
@@ -34,6 +34,19 @@ _asm_jac_types = {
 }
 
 
+# The defaults of the defaultdicts below are module level functions rather than lambdas, so that
+# a system that has been set up can be pickled.
+def _empty_io_names():
+    return {'input': [], 'output': []}
+
+
+def _unconnected_scale_factors():
+    return {
+        ('input', 'phys'): (0.0, 1.0),
+        ('input', 'norm'): (0.0, 1.0)
+    }
+
+
 class System(object):
     """
     Base class for all systems in OpenMDAO.
@@ -239,11 +252,13 @@ class System(object):
         concurrent FD solves.
     _par_fd_id : int
         ID used to determine which columns in the jacobian will be computed when using parallel FD.
+    _par_fd_backend : str
+        How the concurrent FD solves are run when _num_par_fd > 1, either 'mpi' or 'processes'.
     _use_derivatives : bool
         If True, perform any memory allocations necessary for derivative computation.
     """
 
-    def __init__(self, num_par_fd=1, **kwargs):
+    def __init__(self, num_par_fd=1, par_fd_backend='mpi', **kwargs):
         """
         Initialize all attributes.
 
@@ -251,6 +266,10 @@ class System(object):
         ----------
         num_par_fd : int
             If FD is active, number of concurrent FD solves.
+        par_fd_backend : str
+            If 'mpi', the concurrent FD solves are distributed over the processes of the
+            communicator. If 'processes', they are run in a local pool of num_par_fd worker
+            processes, each holding a copy of this system.
         **kwargs : dict of keyword arguments
             Keyword arguments that will be mapped into the System options.
         """
@@ -264,6 +283,11 @@ class System(object):
         self.options.declare('assembled_jac_type', values=['csc', 'dense'], default='csc',
                              desc='Linear solver(s) in this group, if using an assembled '
                                   'jacobian, will use this type.')
+        self.options.declare('fold_scaling', types=bool, default=False,
+                             desc='If True, the assembled jacobian of this system holds the '
+                                  'derivatives of the scaled outputs and residuals, so that the '
+                                  'linear vectors are not unscaled and rescaled around every '
+                                  'product and solve with it.')
 
         # Case recording options
         self.recording_options = OptionsDictionary()
@@ -363,6 +387,10 @@ class System(object):
         self._scope_cache = {}
 
         self._num_par_fd = num_par_fd
+        if par_fd_backend not in ('mpi', 'processes'):
+            raise ValueError("par_fd_backend must be 'mpi' or 'processes', but '%s' was given." %
+                             par_fd_backend)
+        self._par_fd_backend = par_fd_backend
 
         self._declare_options()
         self.initialize()
@@ -1032,8 +1060,8 @@ class System(object):
         else:
             self._relevant = relevant
 
-        self._var_allprocs_relevant_names = defaultdict(lambda: {'input': [], 'output': []})
-        self._var_relevant_names = defaultdict(lambda: {'input': [], 'output': []})
+        self._var_allprocs_relevant_names = defaultdict(_empty_io_names)
+        self._var_relevant_names = defaultdict(_empty_io_names)
 
         use_derivs = self._use_derivatives
 
@@ -1184,10 +1212,7 @@ class System(object):
             Mapping of each absoute var name to its corresponding scaling factor tuple.
         """
         # make this a defaultdict to handle the case of access using unconnected inputs
-        scale_factors = defaultdict(lambda: {
-            ('input', 'phys'): (0.0, 1.0),
-            ('input', 'norm'): (0.0, 1.0)
-        })
+        scale_factors = defaultdict(_unconnected_scale_factors)
 
         allprocs_meta_out = self._var_allprocs_abs2meta
 
@@ -1645,6 +1645,181 @@ class TestComponentComplexStep(unittest.TestCase):
         prob.compute_totals(of=['comp.y'], wrt=['px.x'])
 
 
+class UnvectorizedComp(ExplicitComponent):
+    """
+    Component whose computation could be vectorized over a leading dimension.
+    """
+
+    def setup(self):
+        self.add_input('x', np.ones(5))
+        self.add_input('a', np.ones((2, 2)))
+        self.add_output('y', np.ones(5))
+        self.add_output('z', 1.0)
+
+        self.declare_partials('*', '*', method='fd', form='central')
+        self.num_computes = 0
+
+    def _compute(self, x, a, y, z):
+        y[...] = np.sin(x) * np.sum(a, axis=(-2, -1))[..., np.newaxis]
+        z[...] = np.sum(x ** 2, axis=-1, keepdims=True) + 3.0 * a[..., 0, 1:]
+        self.num_computes += 1
+
+    def compute(self, inputs, outputs):
+        self._compute(inputs['x'], inputs['a'], outputs['y'], outputs['z'])
+
+
+class VectorizedComp(UnvectorizedComp):
+
+    def compute_multi(self, inputs, outputs):
+        self._compute(inputs['x'], inputs['a'], outputs['y'], outputs['z'])
+
+
+class TestComponentBatchedFD(unittest.TestCase):
+
+    def _run(self, comp_class, **options):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('px', IndepVarComp('x', np.linspace(0.1, 1.0, 5)))
+        model.add_subsystem('pa', IndepVarComp('a', np.array([[1., 2.], [3., 4.]])))
+        comp = model.add_subsystem('comp', comp_class(**options))
+        model.connect('px.x', 'comp.x')
+        model.connect('pa.a', 'comp.a')
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        J = prob.compute_totals(of=['comp.y', 'comp.z'], wrt=['px.x', 'pa.a'])
+        return J, comp.num_computes
+
+    def test_batched_fd(self):
+        J, num_computes = self._run(VectorizedComp)
+        J_ref, num_ref_computes = self._run(UnvectorizedComp)
+
+        # one call per wrt and per delta of the central form
+        self.assertEqual(num_computes, 2 * 2)
+        self.assertEqual(num_ref_computes, 2 * (5 + 4))
+
+        x = np.linspace(0.1, 1.0, 5)
+        assert_rel_error(self, J['comp.y', 'px.x'], 10. * np.diag(np.cos(x)), 1e-8)
+        assert_rel_error(self, J['comp.y', 'pa.a'], np.outer(np.sin(x), np.ones(4)), 1e-8)
+        assert_rel_error(self, J['comp.z', 'px.x'], 2. * x[np.newaxis], 1e-8)
+        assert_rel_error(self, J['comp.z', 'pa.a'], [[0., 3., 0., 0.]], 1e-8)
+
+        for key in J_ref:
+            assert_rel_error(self, J[key], J_ref[key], 1e-10)
+
+    def test_batch_size(self):
+        J, num_computes = self._run(VectorizedComp, fd_batch_size=2)
+        J_ref, _ = self._run(VectorizedComp)
+
+        # the 5 columns of x take 3 batches, the 4 columns of a take 2
+        self.assertEqual(num_computes, 2 * (3 + 2))
+
+        for key in J_ref:
+            assert_rel_error(self, J[key], J_ref[key], 1e-10)
+
+
+class SparseNodeComp(ExplicitComponent):
+    """
+    Component computed node by node, with sparse partials.
+    """
+
+    def initialize(self):
+        self.options.declare('n', types=int, default=6)
+        self.options.declare('method', default='fd')
+
+    def setup(self):
+        n = self.options['n']
+        method = self.options['method']
+
+        self.add_input('x', np.ones(n))
+        self.add_input('y', np.ones(n))
+        self.add_output('f', np.ones(n))
+        self.add_output('g', np.ones(n - 1))
+
+        ar = np.arange(n)
+        self.declare_partials('f', ['x', 'y'], rows=ar, cols=ar, method=method)
+        self.declare_partials('g', 'x', rows=np.repeat(ar[:-1], 2),
+                              cols=np.stack([ar[:-1], ar[1:]], axis=1).ravel(), method=method)
+        self.num_computes = 0
+
+    def _compute(self, x, y, f, g):
+        f[...] = x ** 2 * y
+        g[...] = x[..., :-1] + 2.0 * x[..., 1:]
+        self.num_computes += 1
+
+    def compute(self, inputs, outputs):
+        self._compute(inputs['x'], inputs['y'], outputs['f'], outputs['g'])
+
+
+class VectorizedSparseNodeComp(SparseNodeComp):
+
+    def compute_multi(self, inputs, outputs):
+        self._compute(inputs['x'], inputs['y'], outputs['f'], outputs['g'])
+
+
+class TestComponentColoredApprox(unittest.TestCase):
+
+    def _run(self, comp, mode='fwd'):
+        n = comp.options['n']
+
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('px', IndepVarComp('x', np.linspace(1.0, 2.0, n)))
+        model.add_subsystem('py', IndepVarComp('y', np.linspace(3.0, 4.0, n)))
+        model.add_subsystem('comp', comp)
+        model.connect('px.x', 'comp.x')
+        model.connect('py.y', 'comp.y')
+        model.linear_solver = DirectSolver()
+
+        prob.setup(check=False, mode=mode, force_alloc_complex=True)
+        prob.run_model()
+
+        comp.num_computes = 0
+        J = prob.compute_totals(of=['comp.f', 'comp.g'], wrt=['px.x', 'py.y'])
+
+        x = np.linspace(1.0, 2.0, n)
+        y = np.linspace(3.0, 4.0, n)
+        assert_rel_error(self, J['comp.f', 'px.x'], np.diag(2.0 * x * y), 1e-5)
+        assert_rel_error(self, J['comp.f', 'py.y'], np.diag(x ** 2), 1e-5)
+        assert_rel_error(self, J['comp.g', 'px.x'],
+                         np.eye(n - 1, n) + 2.0 * np.eye(n - 1, n, 1), 1e-5)
+        assert_rel_error(self, J['comp.g', 'py.y'], np.zeros((n - 1, n)), 1e-15)
+
+        return comp.num_computes
+
+    def test_colored_fd(self):
+        # x takes two colors, since the columns of g overlap, and y takes one
+        self.assertEqual(self._run(SparseNodeComp(method='fd')), 3)
+        self.assertEqual(self._run(SparseNodeComp(method='fd'), mode='rev'), 3)
+
+    def test_colored_cs(self):
+        self.assertEqual(self._run(SparseNodeComp(method='cs')), 3)
+
+    def test_colored_batched_fd(self):
+        # all colors of an input are evaluated in a single call
+        self.assertEqual(self._run(VectorizedSparseNodeComp(method='fd')), 2)
+
+    def test_dense_not_colored(self):
+        class DenseNodeComp(SparseNodeComp):
+            def setup(self):
+                super(DenseNodeComp, self).setup()
+                self.declare_partials('f', 'x', method='fd')
+
+        # a dense sub-Jacobian makes every column of x depend on the others
+        self.assertEqual(self._run(DenseNodeComp(n=4)), 4 + 1)
+
+    def test_rows_without_cols(self):
+        comp = ExplicitComponent()
+        comp.add_input('x', np.ones(3))
+        comp.add_output('y', np.ones(3))
+        with self.assertRaises(ValueError) as cm:
+            comp.declare_partials('y', 'x', rows=np.arange(3), method='fd')
+        self.assertEqual(str(cm.exception),
+                         'If one of rows/cols is specified, then both must be specified')
+
+
 class ApproxTotalsFeature(unittest.TestCase):
 
     def test_basic(self):
@@ -1,6 +1,7 @@
 from __future__ import print_function
 
 import os
+import sys
 import shutil
 import tempfile
 import warnings
@@ -16,13 +17,16 @@ try:
     from scipy.sparse import load_npz
 except ImportError:
     load_npz = None
+from scipy.sparse import csc_matrix
+from six.moves import cStringIO as StringIO
 
 from openmdao.api import Problem, IndepVarComp, ExecComp, DirectSolver,\
     ExplicitComponent, LinearRunOnce, ScipyOptimizeDriver, ParallelGroup, Group
 from openmdao.utils.assert_utils import assert_rel_error
 
 from openmdao.utils.general_utils import set_pyoptsparse_opt
-from openmdao.utils.coloring import get_simul_meta, _solves_info
+from openmdao.utils.coloring import get_simul_meta, get_sparsity, _solves_info, \
+    _verify_structural_jac, _get_bool_jac
 from openmdao.utils.mpi import MPI
 from openmdao.test_suite.tot_jac_builder import TotJacBuilder
 import openmdao.test_suite
@@ -642,6 +646,55 @@ class SimulColoringScipyTestCase(unittest.TestCase):
         self.assertEqual((p.model._solve_count - 21) / 21,
                          (p_color.model._solve_count - 21 * 4) / 5)
 
+    def test_dynamic_simul_coloring_structural(self):
+
+        # first, run w/o coloring
+        p = run_opt(ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False)
+        p_color = run_opt(ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                          dynamic_simul_derivs=True, dynamic_derivs_method='structural')
+
+        assert_almost_equal(p['circle.area'], np.pi, decimal=7)
+        assert_almost_equal(p_color['circle.area'], np.pi, decimal=7)
+
+        # same as the randomized dynamic case, except that no solves are needed to find the
+        # sparsity, so N is just 21 for both cases.
+        self.assertEqual((p.model._solve_count - 21) / 21,
+                         (p_color.model._solve_count - 21) / 5)
+
+    def test_dynamic_simul_coloring_cache(self):
+        startdir = os.getcwd()
+        tempdir = tempfile.mkdtemp(prefix='ColoringCacheTestCase-')
+        os.chdir(tempdir)
+        try:
+            cache_dir = os.path.join(tempdir, 'cache')
+
+            p_color = run_opt(ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                              dynamic_simul_derivs=True, dynamic_derivs_cache=cache_dir)
+            cached = os.listdir(cache_dir)
+            self.assertEqual(len(cached), 1)
+            self.assertTrue(cached[0].startswith('coloring_'))
+
+            # the second run finds the coloring in the cache, so the 21 * 3 solves needed to
+            # compute the sparsity are skipped
+            p_cached = run_opt(ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                               dynamic_simul_derivs=True, dynamic_derivs_cache=cache_dir)
+
+            assert_almost_equal(p_cached['circle.area'], np.pi, decimal=7)
+            self.assertEqual(p_color.model._solve_count - 21 * 3, p_cached.model._solve_count)
+            self.assertEqual(os.listdir(cache_dir), cached)
+
+            # a different structure gets its own cache entry
+            run_opt(ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    dynamic_simul_derivs=True, dynamic_derivs_cache=cache_dir,
+                    dynamic_derivs_method='structural')
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+        finally:
+            os.chdir(startdir)
+            try:
+                shutil.rmtree(tempdir)
+            except OSError:
+                pass
+
     def test_simul_coloring_example(self):
 
         from openmdao.api import Problem, IndepVarComp, ExecComp, ScipyOptimizeDriver
@@ -920,6 +973,68 @@ class SparsityTestCase(unittest.TestCase):
         assert_almost_equal(p_dynamic['circle.area'], np.pi, decimal=7)
         assert_almost_equal(p_sparsity['circle.area'], np.pi, decimal=7)
 
+    def test_structural_sparsity(self):
+        p = run_opt(ScipyOptimizeDriver, 'fwd', optimizer='SLSQP', disp=False)
+
+        # verify=True also checks the pattern against a randomized total jacobian
+        sparsity = get_sparsity(p, method='structural', verify=True, stream=None)
+        randomized = get_sparsity(p, stream=None)
+
+        self.assertEqual(sparsity, randomized)
+        for res, subs in self.sparsity.items():
+            for dv, (rows, cols, shape) in subs.items():
+                self.assertEqual(sparsity[res][dv], (rows, cols, tuple(shape)))
+
+    def test_bool_jac_report(self):
+        p = Problem()
+        p.model.add_subsystem('px', IndepVarComp('x', np.ones(4)))
+        p.model.add_subsystem('comp', ExecComp('y = 2.0*x', x=np.ones(4), y=np.ones(4),
+                                               vectorize=True))
+        p.model.add_subsystem('obj', ExecComp('f = sum(x)', x=np.ones(4)))
+        p.model.connect('px.x', ['comp.x', 'obj.x'])
+        p.model.add_design_var('px.x')
+        p.model.add_objective('obj.f')
+        p.model.add_constraint('comp.y', lower=0.0)
+
+        p.setup(mode='fwd', check=False)
+        p.run_model()
+
+        stdout = sys.stdout
+        strout = StringIO()
+        sys.stdout = strout
+        try:
+            J = _get_bool_jac(p)
+        finally:
+            sys.stdout = stdout
+
+        # the report counts all entries of the (5, 4) total jacobian, not just its nonzeros
+        self.assertEqual(J.shape, (5, 4))
+        self.assertIn("Most common number of zero entries (12 of 20)", strout.getvalue())
+
+    def test_structural_sparsity_verify(self):
+        p = Problem()
+        p.model.add_subsystem('px', IndepVarComp('x', np.ones(3)))
+        p.model.add_subsystem('comp', ExecComp('y = 2.0*x', x=np.ones(3), y=np.ones(3),
+                                               vectorize=True))
+        p.model.connect('px.x', 'comp.x')
+        p.model.add_design_var('px.x')
+        p.model.add_objective('comp.y', index=0)
+
+        p.setup(mode='fwd', check=False)
+        p.run_model()
+
+        sparsity = get_sparsity(p, method='structural', stream=None)
+        self.assertEqual(sparsity['comp.y']['px.x'], ([0], [0], (1, 3)))
+
+        # a structural pattern that misses a nonzero, e.g. because a component's linear
+        # solve couples outputs that it declared no partials for
+        with self.assertRaises(RuntimeError) as cm:
+            _verify_structural_jac(p, csc_matrix((1, 3), dtype=bool))
+        self.assertEqual(str(cm.exception),
+                         "Structural sparsity is missing 1 nonzero total derivative entries, "
+                         "probably due to undeclared partials. Affected total derivatives: "
+                         "('comp.y', 'px.x')")
+
 
 class BidirectionalTestCase(unittest.TestCase):
     def test_eisenstat(self):
@@ -988,6 +1103,32 @@ class BidirectionalTestCase(unittest.TestCase):
 
         self.assertEqual(tot_colors, 105)
 
+    @unittest.skipIf(LooseVersion(scipy.__version__) < LooseVersion("0.19.1"), "scipy version too old")
+    def test_can_715_sparse(self):
+        # a sparse bool_jac should give exactly the same coloring as the equivalent dense one
+        matdir = os.path.join(os.path.dirname(openmdao.test_suite.__file__), 'matrices')
+        mat = load_npz(os.path.join(matdir, 'can_715.npz'))
+
+        for mode in ('auto', 'fwd', 'rev'):
+            dense = get_simul_meta(None, mode, include_sparsity=False, setup=False,
+                                   run_model=False, bool_jac=np.asarray(mat.toarray(), dtype=bool),
+                                   stream=None)
+            sparse = get_simul_meta(None, mode, include_sparsity=False, setup=False,
+                                    run_model=False, bool_jac=mat.tocsc().astype(bool),
+                                    stream=None)
+
+            for direction in ('fwd', 'rev'):
+                self.assertEqual(direction in dense, direction in sparse)
+                if direction in dense:
+                    dense_lists, dense_maps = dense[direction]
+                    sparse_lists, sparse_maps = sparse[direction]
+                    self.assertEqual(dense_lists, sparse_lists)
+                    for dmap, smap in zip(dense_maps, sparse_maps):
+                        if dmap is None:
+                            self.assertIsNone(smap)
+                        else:
+                            self.assertEqual(list(dmap), list(smap))
+
 
 def _get_mat(rows, cols):
     if MPI:
@@ -570,6 +570,123 @@ class ParFDFeatureTestCase(unittest.TestCase):
         # J and mat should be the same
         self.assertLess(np.linalg.norm(J - mat), 1.e-7)
 
+
+class ScaleComp(ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('a', default=2.0)
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x', method='fd')
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = self.options['a'] * inputs['x']
+
+
+class ParFDProcessesTestCase(unittest.TestCase):
+
+    def test_stale_workers(self):
+        p = Problem()
+        model = p.model
+        model.add_subsystem('indep', IndepVarComp('x', val=np.ones(3)))
+        comp = model.add_subsystem('comp', ScaleComp(num_par_fd=3, par_fd_backend='processes'))
+        model.connect('indep.x', 'comp.x')
+
+        p.setup()
+        p.run_model()
+        J = p.compute_totals(of=['comp.y'], wrt=['indep.x'], return_format='array')
+        assert_rel_error(self, J, np.eye(3) * 2.0, 1e-6)
+        executor = comp._approx_schemes['fd']._pool[0]
+
+        # the workers are restarted when an option changes
+        comp.options['a'] = 5.0
+        p.run_model()
+        J = p.compute_totals(of=['comp.y'], wrt=['indep.x'], return_format='array')
+        assert_rel_error(self, J, np.eye(3) * 5.0, 1e-6)
+        self.assertIsNot(comp._approx_schemes['fd']._pool[0], executor)
+        self.assertTrue(executor._shutdown_thread)
+        executor = comp._approx_schemes['fd']._pool[0]
+
+        # and after a new setup
+        p.setup()
+        p['indep.x'] = np.arange(3.)
+        p.run_model()
+        J = p.compute_totals(of=['comp.y'], wrt=['indep.x'], return_format='array')
+        assert_rel_error(self, J, np.eye(3) * 5.0, 1e-6)
+        self.assertTrue(executor._shutdown_thread)
+
+        comp._approx_schemes['fd']._shutdown_pool()
+        self.assertIsNone(comp._approx_schemes['fd']._pool)
+
+    def test_partials(self):
+        mat = np.arange(30, dtype=float).reshape(5, 6)
+
+        for method in ('fd', 'cs'):
+            p = Problem()
+            model = p.model
+            model.add_subsystem('indep', IndepVarComp('x', val=np.ones(mat.shape[1])))
+            comp = model.add_subsystem('comp', MatMultComp(mat, approx_method=method, sleep_time=0.,
+                                                           num_par_fd=3,
+                                                           par_fd_backend='processes'))
+            model.connect('indep.x', 'comp.x')
+
+            p.setup(mode='fwd', force_alloc_complex=(method == 'cs'))
+            p.run_model()
+
+            pre_count = comp.num_computes
+            J = p.compute_totals(of=['comp.y'], wrt=['indep.x'], return_format='array')
+
+            # all of the perturbed points were run by the workers
+            self.assertEqual(comp.num_computes, pre_count)
+            assert_rel_error(self, J, mat, 1e-6)
+
+    def test_totals(self):
+        for method in ('fd', 'cs'):
+            p = Problem(model=Group(num_par_fd=3, par_fd_backend='processes'))
+            model = p.model
+            model.approx_totals(method=method)
+            model.add_subsystem('P1', IndepVarComp('x', np.arange(4, dtype=float)))
+            model.add_subsystem('C1', ExecComp('y=x**2', x=np.zeros(4), y=np.zeros(4)))
+            model.add_subsystem('C2', ExecComp('y=3.0*x', x=np.zeros(4), y=np.zeros(4)))
+            model.connect('P1.x', 'C1.x')
+            model.connect('C1.y', 'C2.x')
+
+            p.setup(mode='fwd', force_alloc_complex=(method == 'cs'))
+            p.run_model()
+
+            J = p.compute_totals(of=['C2.y'], wrt=['P1.x'], return_format='array')
+            assert_rel_error(self, J, np.diag(6. * p['P1.x']), 1e-6)
+
+            # the workers keep their copies of the model, but see the new point
+            p['P1.x'] = np.arange(4, dtype=float) + 10.
+            p.run_model()
+
+            J = p.compute_totals(of=['C2.y'], wrt=['P1.x'], return_format='array')
+            assert_rel_error(self, J, np.diag(6. * p['P1.x']), 1e-6)
+
+    def test_no_warning(self):
+        mat = np.arange(30, dtype=float).reshape(5, 6)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            p = Problem(model=Group(num_par_fd=3, par_fd_backend='processes'))
+            p.model.approx_totals()
+            p.model.add_subsystem('indep', IndepVarComp('x', val=np.ones(mat.shape[1])))
+            p.model.add_subsystem('comp', MatMultComp(mat, sleep_time=0.))
+            p.model.connect('indep.x', 'comp.x')
+            p.setup()
+
+        self.assertEqual([str(m.message) for m in w if 'num_par_fd' in str(m.message)], [])
+
+    def test_bad_backend(self):
+        with self.assertRaises(ValueError) as ctx:
+            Group(num_par_fd=3, par_fd_backend='threads')
+
+        self.assertEqual(str(ctx.exception),
+                         "par_fd_backend must be 'mpi' or 'processes', but 'threads' was given.")
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -71,6 +71,51 @@ class RemoteVOITestCase(unittest.TestCase):
         assert_rel_error(self, J['par.G2.c', 'par.G2.x'], np.array([[1.0]]), 1e-6)
 
 
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class RemoteVOIGatherTestCase(unittest.TestCase):
+
+    N_PROCS = 2
+
+    def test_gathered_values(self):
+        prob = Problem()
+        model = prob.model
+
+        par = model.add_subsystem('par', ParallelGroup())
+        for i in range(4):
+            sub = par.add_subsystem('G%d' % i, Group())
+            sub.add_subsystem('p', IndepVarComp('x', np.array([1., 2., 3.]) + i), promotes=['*'])
+            sub.add_subsystem('c', ExecComp('y = x * %d.' % (i + 1), x=np.ones(3), y=np.ones(3)),
+                              promotes=['*'])
+            model.add_design_var('par.G%d.x' % i, indices=[0, 2], scaler=2.)
+            model.add_constraint('par.G%d.y' % i, upper=0., adder=1.)
+
+        model.add_objective('par.G3.x', index=1)
+
+        prob.setup(check=False)
+
+        prob.run_model()
+
+        driver = prob.driver
+
+        # every rank gets the values of all the remote variables
+        dvs = driver.get_design_var_values()
+        cons = driver.get_constraint_values()
+        objs = driver.get_objective_values()
+        resps = driver.get_response_values()
+        for i in range(4):
+            x = np.array([1., 2., 3.]) + i
+            assert_rel_error(self, dvs['par.G%d.p.x' % i], x[[0, 2]] * 2.)
+            assert_rel_error(self, cons['par.G%d.c.y' % i], x * (i + 1) + 1.)
+            assert_rel_error(self, resps['par.G%d.c.y' % i], x * (i + 1) + 1.)
+
+        assert_rel_error(self, objs['par.G3.p.x'], np.array([5.]))
+
+        # same values as the one-at-a-time broadcast
+        for name, meta in driver._cons.items():
+            assert_rel_error(self, cons[name],
+                             driver._get_voi_val(name, meta, driver._remote_cons))
+
+
 if __name__ == "__main__":
     from openmdao.utils.mpi import mpirun_tests
     mpirun_tests()
@@ -6,7 +6,8 @@ from six import assertRaisesRegex
 
 import numpy as np
 
-from openmdao.api import Problem, Group, ExplicitComponent, ImplicitComponent, IndepVarComp
+from openmdao.api import Problem, Group, ExplicitComponent, ImplicitComponent, IndepVarComp, \
+    ExecComp
 from openmdao.api import NewtonSolver, ScipyKrylov, NonlinearBlockGS, DirectSolver
 
 from openmdao.utils.assert_utils import assert_rel_error
@@ -876,6 +877,69 @@ class TestScaling(unittest.TestCase):
 
         assert_rel_error(self, prob['comp.y'], 2.0)
 
+    def test_fold_scaling(self):
+
+        class QuadComp(ImplicitComponent):
+
+            def setup(self):
+                self.add_input('a', np.ones(3))
+                self.add_input('b', np.ones(3))
+                self.add_output('x', np.ones(3), ref=np.array([10., 3., .5]),
+                                ref0=np.array([1., 0., -.3]), res_ref=np.array([100., 2., .01]))
+
+                ar = np.arange(3)
+                self.declare_partials('x', 'a', rows=ar, cols=ar)
+                self.declare_partials('x', 'b')
+                self.declare_partials('x', 'x', rows=ar, cols=ar)
+
+            def apply_nonlinear(self, inputs, outputs, residuals):
+                residuals['x'] = (inputs['a'] * outputs['x'] ** 2 +
+                                  np.sum(inputs['b']) * outputs['x'] - 2.)
+
+            def linearize(self, inputs, outputs, jacobian):
+                jacobian['x', 'a'] = outputs['x'] ** 2
+                jacobian['x', 'b'] = np.outer(outputs['x'], np.ones(3))
+                jacobian['x', 'x'] = 2. * inputs['a'] * outputs['x'] + np.sum(inputs['b'])
+
+        def compute_totals(fold_scaling, jac_type, linear_solver, mode):
+            prob = Problem()
+            model = prob.model
+            model.options['assembled_jac_type'] = jac_type
+            model.options['fold_scaling'] = fold_scaling
+
+            model.add_subsystem('p', IndepVarComp('a', np.array([1., 2., 3.])))
+            model.add_subsystem('c1', ExecComp('b = 3*a**2', a=np.ones(3), b=np.ones(3)))
+            model.add_subsystem('q', QuadComp())
+            model.add_subsystem('c2', ExecComp('y = sum(x*b)', x=np.ones(3), b=np.ones(3)))
+            model.connect('p.a', ['c1.a', 'q.a'])
+            model.connect('c1.b', ['q.b', 'c2.b'])
+            model.connect('q.x', 'c2.x')
+
+            model.nonlinear_solver = NewtonSolver(atol=1e-12, rtol=1e-12)
+            model.linear_solver = linear_solver
+
+            model.add_design_var('p.a')
+            model.add_objective('c2.y')
+
+            prob.set_solver_print(level=0)
+            prob.setup(check=False, mode=mode)
+            prob.run_model()
+
+            return prob.compute_totals()[('c2.y', 'p.a')]
+
+        expected = compute_totals(False, 'dense', DirectSolver(), 'fwd')
+
+        for jac_type in ('dense', 'csc'):
+            for mode in ('fwd', 'rev'):
+                for fold_scaling in (False, True):
+                    totals = compute_totals(fold_scaling, jac_type,
+                                            DirectSolver(assemble_jac=True), mode)
+                    assert_rel_error(self, totals, expected, 1e-10)
+
+                    totals = compute_totals(fold_scaling, jac_type,
+                                            ScipyKrylov(assemble_jac=True, atol=1e-14), mode)
+                    assert_rel_error(self, totals, expected, 1e-10)
+
     def test_feature1(self):
         from openmdao.api import Problem, Group, IndepVarComp
         from openmdao.core.tests.test_scaling import ScalingExample1
@@ -3,14 +3,21 @@ Design-of-Experiments Driver.
 """
 from __future__ import print_function
 
+import os
+import re
 import traceback
 import inspect
+from time import time
+
+from six import PY2
 
 from openmdao.core.driver import Driver, RecordingDebugging
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.drivers.doe_generators import DOEGenerator, ListGenerator
 
+from openmdao.utils.concurrent import concurrent_eval_lb
 from openmdao.utils.mpi import MPI
+from openmdao.utils.system_pickle import _pickle_system, _unpickle_system
 
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
 
@@ -29,6 +36,11 @@ class DOEDriver(Driver):
         MPI communicator object.
     _color : int or None
         In MPI, the cached color is used to determine which cases to run on this proc.
+    _lb_comm : MPI.Comm or None
+        With 'load_balance', the communicator between rank 0, which hands out the cases, and
+        the root procs of the models.  None on all other procs.
+    _metadata : dict or None
+        Success flag and message of the current case, or None if it was interrupted.
     """
 
     def __init__(self, generator=None, **kwargs):
@@ -66,6 +78,8 @@ class DOEDriver(Driver):
         self._recorders = []
         self._comm = None
         self._color = None
+        self._lb_comm = None
+        self._metadata = None
 
     def _declare_options(self):
         """
@@ -77,6 +91,29 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc="Set to True to hand out the cases on demand when running in "
+                                  "parallel under MPI, instead of splitting them evenly up "
+                                  "front. Rank 0 then only hands out cases, so one more "
+                                  "processor than a multiple of 'procs_per_model' is needed.")
+        self.options.declare('parallel_backend', default='mpi', values=['mpi', 'processes'],
+                             desc="How cases are executed in parallel when 'run_parallel' is "
+                                  "True. 'mpi' splits the cases among the MPI processes. "
+                                  "'processes' hands them out, one at a time, to a pool of "
+                                  "local worker processes, each running its own copy of the "
+                                  "model.")
+        self.options.declare('num_workers', types=int, default=None, allow_none=True, lower=1,
+                             desc="Number of worker processes when 'parallel_backend' is "
+                                  "'processes'. Defaults to the number of CPUs.")
+        self.options.declare('case_timeout', default=None, allow_none=True, lower=0.,
+                             desc="Time in seconds after which a case running in a worker "
+                                  "process is stopped and recorded as failed. Only used when "
+                                  "'parallel_backend' is 'processes'.")
+        self.options.declare('resume', types=bool, default=False,
+                             desc="Set to True to resume an interrupted run of the same DOE: "
+                                  "the cases recorded as successful in the files of the "
+                                  "attached SqliteRecorders are skipped and the remaining "
+                                  "cases are appended to those files.")
 
     def _setup_comm(self, comm):
         """
@@ -92,7 +129,38 @@ class DOEDriver(Driver):
         MPI.Comm or <FakeComm> or None
             The communicator for the Problem model.
         """
-        if MPI and self.options['run_parallel']:
+        if self._use_local_pool():
+            if comm.size > 1:
+                raise RuntimeError("The 'processes' parallel backend of DOEDriver can't be used "
+                                   "when running under MPI.")
+            self._comm = None
+            self._lb_comm = None
+            model_comm = comm
+        elif MPI and self.options['run_parallel'] and self.options['load_balance']:
+            self._comm = comm
+            procs_per_model = self.options['procs_per_model']
+
+            # rank 0 hands out the cases and the other procs are split among the models
+            full_size = comm.size
+            size = (full_size - 1) // procs_per_model
+            if size == 0 or full_size - 1 != size * procs_per_model:
+                raise RuntimeError("With load balancing, one processor hands out the cases, so "
+                                   "the total number of processors minus one must be a nonzero "
+                                   "multiple of the number of processors per model.\n Provide "
+                                   "%d*n + 1 processors, or specify a number of processors "
+                                   "per model that divides into %d." %
+                                   (procs_per_model, full_size - 1))
+            if comm.rank == 0:
+                color = self._color = 0
+            else:
+                color = self._color = (comm.rank - 1) % size + 1
+
+            model_comm = comm.Split(color)
+
+            # the lowest rank of each color is the root of its model
+            lb_comm = comm.Split(0 if model_comm.rank == 0 else 1)
+            self._lb_comm = lb_comm if model_comm.rank == 0 else None
+        elif MPI and self.options['run_parallel']:
             self._comm = comm
             procs_per_model = self.options['procs_per_model']
 
@@ -107,8 +175,10 @@ class DOEDriver(Driver):
             color = self._color = comm.rank % size
 
             model_comm = comm.Split(color)
+            self._lb_comm = None
         else:
             self._comm = None
+            self._lb_comm = None
             model_comm = comm
 
         return model_comm
@@ -157,28 +227,118 @@ class DOEDriver(Driver):
         # set driver name with current generator
         self._set_name()
 
-        if self._comm:
-            case_gen = self._parallel_generator
+        if self.options['resume']:
+            done = self._get_recorded_cases()
         else:
-            case_gen = self.options['generator']
+            done = set()
+
+        if self._comm and self.options['load_balance']:
+            self._run_cases_lb(done)
+            return False
+
+        cases = self._get_cases(done)
+
+        if self._comm:
+            cases = self._parallel_generator(cases)
 
-        for case in case_gen(self._designvars, self._problem.model):
+        if self._use_local_pool():
+            self._run_cases_in_pool(cases)
+            return False
+
+        for icase, case in cases:
+            self.iter_count = icase
             self._run_case(case)
-            self.iter_count += 1
 
         return False
 
-    def _run_case(self, case):
+    def _get_cases(self, done):
         """
-        Run case, save exception info and mark the metadata if the case fails.
+        Generate the cases that have not been run yet, with their indices in the generated cases.
+
+        The index of a case is its iteration number when it is recorded. Once all cases have
+        been generated, iter_count is set to the number of generated cases.
 
         Parameters
         ----------
-        case : list
+        done : set of int
+            Indices of the cases that are skipped because they have already been run.
+
+        Yields
+        ------
+        int
+            Index of the case in the generated cases.
+        list
             list of name, value tuples for the design variables.
         """
-        metadata = {}
+        generator = self.options['generator']
+
+        ncases = 0
+        for icase, case in enumerate(generator(self._designvars, self._problem.model)):
+            ncases += 1
+            if icase not in done:
+                yield icase, case
+
+        self.iter_count = ncases
+
+    def _get_recorded_cases(self):
+        """
+        Return the indices of the successful cases of this DOE in the attached SqliteRecorders.
 
+        The failed cases of this DOE are removed from the files, since they are run again and
+        their new results are recorded under the same iteration coordinates.
+
+        Returns
+        -------
+        set of int
+            Indices of the cases recorded as successful, on all procs when running in parallel
+            under MPI.
+        """
+        coord_re = re.compile(r'(?:^|:)%s\|(\d+)$' % re.escape(self._name))
+
+        done = set()
+        for recorder in self._recorders:
+            if isinstance(recorder, SqliteRecorder) and recorder.connection:
+                with recorder._lock, recorder.connection as c:
+                    rows = c.execute("SELECT id, iteration_coordinate, success "
+                                     "FROM driver_iterations").fetchall()
+                    for row_id, coord, success in rows:
+                        match = coord_re.search(coord)
+                        if not match:
+                            continue
+                        if success:
+                            done.add(int(match.group(1)))
+                        else:
+                            c.execute("DELETE FROM driver_iterations WHERE id = ?", (row_id,))
+                            c.execute("DELETE FROM global_iterations "
+                                      "WHERE record_type = 'driver' AND rowid = ?", (row_id,))
+                            c.execute("DELETE FROM driver_derivatives "
+                                      "WHERE iteration_coordinate = ?", (coord,))
+
+        if self._comm:
+            done = set().union(*self._comm.allgather(done))
+
+        return done
+
+    def _use_local_pool(self):
+        """
+        Return True if the cases are to be run in a pool of local worker processes.
+
+        Returns
+        -------
+        bool
+            True if the cases are run in the worker pool.
+        """
+        return self.options['run_parallel'] and self.options['parallel_backend'] == 'processes'
+
+    def _set_case(self, case):
+        """
+        Set the design variables to the values of the given case.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
         for dv_name, dv_val in case:
             try:
                 msg = None
@@ -189,6 +349,26 @@ class DOEDriver(Driver):
                 if msg:
                     raise(ValueError(msg))
 
+    def _run_case(self, case):
+        """
+        Run case, save exception info and mark the metadata if the case fails.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
+        metadata = {}
+
+        self._set_case(case)
+
+        # a revisited design point was already recorded, so it isn't recorded again
+        cached = self._load_cached_point()
+        if cached is not None:
+            metadata['success'], metadata['msg'] = cached
+            self._metadata = metadata
+            return
+
         with RecordingDebugging(self._name, self.iter_count, self) as rec:
             try:
                 failure_flag, _, _ = self._problem.model._solve_nonlinear()
@@ -201,34 +381,269 @@ class DOEDriver(Driver):
                 metadata['success'] = 0
                 metadata['msg'] = traceback.format_exc()
                 print(metadata['msg'])
+            except BaseException:
+                # an interrupted case isn't recorded, so that a resumed run runs it again
+                self._metadata = None
+                raise
+
+            self._save_cached_point(metadata['success'], metadata['msg'])
 
             # save reference to metadata for use in record_iteration
             self._metadata = metadata
 
-    def _parallel_generator(self, design_vars, model=None):
+    def _run_cases_lb(self, done):
+        """
+        Run the cases under MPI, handing them out to the models on demand.
+
+        Rank 0 generates the cases and sends each one to the root proc of the next model that
+        is done with its previous case.  The root then passes the case on to the other procs
+        of its model.  Each case keeps its index in the generated cases as its iteration
+        number, so the case files written by the different procs can be combined.
+
+        Parameters
+        ----------
+        done : set of int
+            Indices of the cases that are skipped because they have already been run.
+        """
+        model = self._problem.model
+        model_comm = model.comm
+
+        if model_comm.rank == 0:
+            if self._comm.rank == 0:
+                cases = ((args, None) for args in self._get_cases(done))
+            else:
+                cases = None
+
+            results = concurrent_eval_lb(self._run_lb_case, cases, self._lb_comm)
+
+            # tell the other procs of this model that there are no more cases
+            if model_comm.size > 1:
+                model_comm.bcast(None, root=0)
+
+            if self._comm.rank == 0:
+                for case_err, err in results:
+                    if err is None:
+                        err = case_err
+                    if err is not None:
+                        print('A case failed:')
+                        print(err)
+        else:
+            while True:
+                args = model_comm.bcast(None, root=0)
+                if args is None:
+                    break
+                self._run_lb_case(*args)
+
+        self.iter_count = self._comm.bcast(self.iter_count, root=0)
+
+    def _run_lb_case(self, icase, case):
+        """
+        Run a case handed out under load balancing on all procs of this model.
+
+        Parameters
+        ----------
+        icase : int
+            Index of the case in the generated cases.
+        case : list
+            list of name, value tuples for the design variables.
+
+        Returns
+        -------
+        str or None
+            On the root proc of the model, the tracebacks of the procs of the model that failed
+            to run the case, or None if it ran everywhere.
         """
-        Generate case for this processor when running under MPI.
+        model_comm = self._problem.model.comm
+        if model_comm.rank == 0 and model_comm.size > 1:
+            model_comm.bcast((icase, case), root=0)
+
+        self.iter_count = icase
+
+        # every proc must get through the case, or the others will wait for it forever
+        try:
+            self._run_case(case)
+        except Exception:
+            err = traceback.format_exc()
+        else:
+            err = None
+
+        if model_comm.size > 1:
+            errs = model_comm.gather(err, root=0)
+            if model_comm.rank == 0:
+                errs = ['rank %d:\n%s' % (rank, e) for rank, e in enumerate(errs) if e is not None]
+                err = '\n'.join(errs) if errs else None
+
+        return err
+
+    def _run_cases_in_pool(self, cases):
+        """
+        Run the cases in a pool of local worker processes, recording them as they complete.
+
+        Each worker runs its own copy of the model and is given a new case as soon as it is done
+        with the previous one, so slow cases don't hold up the others.  A worker whose case runs
+        longer than the 'case_timeout' option is stopped and replaced by a new one.
 
         Parameters
         ----------
-        design_vars : dict
-            Dictionary of design variables for which to generate values.
+        cases : iter of (int, list)
+            The cases, each the index of the case and a list of name, value tuples for the
+            design variables.
+        """
+        if PY2:
+            raise RuntimeError("The 'processes' parallel backend of DOEDriver requires Python 3.")
+
+        from multiprocessing import Pipe, Process
+        from multiprocessing.connection import wait
+
+        model = self._problem.model
+        outputs = model._outputs._data
+        inputs = model._inputs._data
+        timeout = self.options['case_timeout']
+
+        num_workers = self.options['num_workers']
+        if num_workers is None:
+            num_workers = os.cpu_count()
+
+        system_pickle = _pickle_system(model)
+
+        def start_worker():
+            conn, child_conn = Pipe()
+            proc = Process(target=_run_cases_in_worker, args=(child_conn, system_pickle))
+            proc.daemon = True
+            proc.start()
+            child_conn.close()
+            return conn, proc
+
+        def replace_worker(conn):
+            proc = workers.pop(conn)[0]
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+            conn.close()
+            new_conn, proc = start_worker()
+            workers[new_conn] = [proc, None]
+            return new_conn
+
+        def record(icase, success, msg):
+            self._save_cached_point(success, msg)
+            with RecordingDebugging(self._name, icase, self):
+                self._metadata = {'success': success, 'msg': msg}
+
+        def record_failed(icase, case, msg):
+            # the model holds the values of the previous case, so the responses are set to NaN
+            # rather than recorded or cached as the values of this one
+            outputs[:] = float('nan')
+            inputs[:] = float('nan')
+            self._set_case(case)
+            with RecordingDebugging(self._name, icase, self):
+                self._metadata = {'success': 0, 'msg': msg}
+
+        # connection -> [process, (case index, case, deadline) or None]
+        workers = {}
+        for i in range(num_workers):
+            conn, proc = start_worker()
+            workers[conn] = [proc, None]
+
+        cases = iter(cases)
+        done = False
+
+        try:
+            while True:
+                # give every idle worker a new case
+                for conn in list(workers):
+                    worker = workers[conn]
+                    while worker[1] is None and not done:
+                        try:
+                            icase, case = next(cases)
+                        except StopIteration:
+                            done = True
+                            break
+
+                        self._set_case(case)
+                        if self._load_cached_point() is not None:
+                            continue
+
+                        try:
+                            conn.send(outputs)
+                        except (IOError, OSError):
+                            # the worker died while idle, so give the case to a new one
+                            conn = replace_worker(conn)
+                            worker = workers[conn]
+                            conn.send(outputs)
+
+                        deadline = None if timeout is None else time() + timeout
+                        worker[1] = (icase, case, deadline)
+
+                busy = [conn for conn, worker in workers.items() if worker[1] is not None]
+                if not busy:
+                    break
+
+                if timeout is None:
+                    wait_time = None
+                else:
+                    wait_time = max(0., min(workers[c][1][2] for c in busy) - time())
+
+                for conn in wait(busy, wait_time):
+                    icase, case, _ = workers[conn][1]
+                    workers[conn][1] = None
+
+                    try:
+                        success, msg, out_data, in_data = conn.recv()
+                    except EOFError:
+                        # the worker died, so replace it
+                        replace_worker(conn)
+                        record_failed(icase, case, "Worker process exited while running the case.")
+                        continue
+
+                    outputs[:] = out_data
+                    inputs[:] = in_data
+                    record(icase, success, msg)
+
+                if timeout is not None:
+                    now = time()
+                    for conn in busy:
+                        if conn in workers and workers[conn][1] is not None and \
+                                workers[conn][1][2] <= now:
+                            icase, case, _ = workers[conn][1]
+                            replace_worker(conn)
+                            record_failed(icase, case,
+                                          "Case timed out after %g seconds." % timeout)
+
+        finally:
+            for conn, (proc, _) in workers.items():
+                try:
+                    conn.send(None)
+                except (IOError, OSError):
+                    pass
+            for conn, (proc, _) in workers.items():
+                proc.join(1.)
+                if proc.is_alive():
+                    proc.terminate()
+                conn.close()
+
+    def _parallel_generator(self, cases):
+        """
+        Select the cases for this processor when running under MPI.
 
-        model : Group
-            The model containing the design variables (used by some generators).
+        Parameters
+        ----------
+        cases : iter of (int, list)
+            The cases, each the index of the case and a list of name, value tuples for the
+            design variables.
 
         Yields
         ------
+        int
+            Index of the case in the generated cases.
         list
             list of name, value tuples for the design variables.
         """
         size = self._comm.size // self.options['procs_per_model']
         color = self._color
 
-        generator = self.options['generator']
-        for i, case in enumerate(generator(design_vars, model)):
+        for i, (icase, case) in enumerate(cases):
             if i % size == color:
-                yield case
+                yield icase, case
 
     def add_recorder(self, recorder):
         """
@@ -258,7 +673,11 @@ class DOEDriver(Driver):
                 # if SqliteRecorder, write cases only on procs up to the number
                 # of parallel DOEs (i.e. on the root procs for the cases)
                 if isinstance(recorder, SqliteRecorder):
-                    if procs_per_model == 1:
+                    if self._comm is not None and self.options['load_balance']:
+                        # model roots only, since rank 0 just hands out the cases
+                        recorder._record_on_proc = (self._lb_comm is not None and
+                                                    self._comm.rank > 0)
+                    elif procs_per_model == 1:
                         recorder._record_on_proc = True
                     else:
                         size = self._comm.size // procs_per_model
@@ -267,13 +686,21 @@ class DOEDriver(Driver):
                         else:
                             recorder._record_on_proc = False
 
+        # when resuming, add the remaining cases to the existing files
+        if self.options['resume']:
+            for recorder in self._recorders:
+                if isinstance(recorder, SqliteRecorder):
+                    recorder._append = True
+
         super(DOEDriver, self)._setup_recording()
 
     def record_iteration(self):
         """
         Record an iteration of the current Driver.
+
+        Nothing is recorded for a case that was interrupted.
         """
-        if not self._rec_mgr._recorders:
+        if not self._rec_mgr._recorders or self._metadata is None:
             return
 
         # Get the data to record (collective calls that get across all ranks)
@@ -326,3 +753,45 @@ class DOEDriver(Driver):
         }
 
         self._rec_mgr.record_iteration(self, data, self._metadata)
+
+
+def _run_cases_in_worker(conn, system_pickle):
+    """
+    Run cases sent by DOEDriver on a worker's own copy of the model, until None is received.
+
+    For each case, the values of the model outputs (including the design variables) are
+    received, and the success flag, message and the resulting outputs and inputs are sent back.
+
+    Parameters
+    ----------
+    conn : Connection
+        The worker's end of the pipe to DOEDriver.
+    system_pickle : bytes
+        The model, pickled by _pickle_system.
+    """
+    model = _unpickle_system(system_pickle)
+    outputs = model._outputs._data
+    inputs = model._inputs._data
+
+    while True:
+        try:
+            data = conn.recv()
+        except EOFError:
+            break
+        if data is None:
+            break
+
+        outputs[:] = data
+        try:
+            failure_flag, _, _ = model._solve_nonlinear()
+            success = not failure_flag
+            msg = ''
+        except AnalysisError:
+            model._clear_iprint()
+            success = 0
+            msg = traceback.format_exc()
+        except Exception:
+            success = 0
+            msg = traceback.format_exc()
+
+        conn.send((success, msg, outputs, inputs))
@@ -10,11 +10,71 @@ from six.moves import range
 import os.path
 import csv
 import re
+from itertools import islice
 
 import pyDOE2
 
 from openmdao.utils.name_maps import prom_name2abs_name
 
+# number of cases generated at a time by the generators that compute their cases in bulk
+_CHUNK_SIZE = 1000
+
+
+def _get_bounds(design_vars):
+    """
+    Return the flattened lower and upper bounds of all design variables.
+
+    Parameters
+    ----------
+    design_vars : dict
+        Dictionary of design variables.
+
+    Returns
+    -------
+    ndarray
+        Lower bounds.
+    ndarray
+        Upper bounds.
+    """
+    lower = []
+    upper = []
+    for name, meta in iteritems(design_vars):
+        size = meta['size']
+        lower.append(np.broadcast_to(meta['lower'], size))
+        upper.append(np.broadcast_to(meta['upper'], size))
+
+    if not lower:
+        return np.zeros(0), np.zeros(0)
+
+    return np.concatenate(lower).astype(float), np.concatenate(upper).astype(float)
+
+
+def _rows_to_cases(design_vars, rows):
+    """
+    Yield a case for each row of design variable values.
+
+    Parameters
+    ----------
+    design_vars : dict
+        Dictionary of design variables.
+    rows : ndarray
+        Values of all design variables, one row per case.
+
+    Yields
+    ------
+    list
+        list of name, value tuples for the design variables.
+    """
+    slices = []
+    start = 0
+    for name, meta in iteritems(design_vars):
+        end = start + meta['size']
+        slices.append((name, start, end))
+        start = end
+
+    for row in rows:
+        yield [(name, row[start:end].copy()) for name, start, end in slices]
+
 
 class DOEGenerator(object):
     """
@@ -196,14 +256,37 @@ class CSVGenerator(DOEGenerator):
                     msg = "Invalid DOE case file, '%s' is not a valid design variable."
                     raise RuntimeError(msg % str(invalid_desvars[0]))
 
-        # read cases from file, parse values into numpy arrays
+        # read cases from file a chunk of rows at a time, parsing each column of a chunk into
+        # numpy arrays at once
         with open(self._filename, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                case = [(name_map[name.strip()],
-                         np.fromstring(re.sub('[\[\]]', '', row[name]), sep=' '))
-                        for name in reader.fieldnames]
-                yield case
+            reader = csv.reader(f)
+            abs_names = [name_map[name.strip()] for name in next(reader)]
+            ncols = len(abs_names)
+
+            while True:
+                chunk = list(islice(reader, _CHUNK_SIZE))
+                if not chunk:
+                    break
+
+                # blank lines come back as empty rows, and are skipped
+                rows = [row for row in chunk if row]
+                if not rows:
+                    continue
+
+                columns = []
+                for j in range(ncols):
+                    texts = [re.sub('[\[\]]', '', row[j]) for row in rows]
+                    sizes = set(len(text.split()) for text in texts)
+                    vals = np.fromstring(' '.join(texts), sep=' ')
+                    if len(sizes) == 1 and vals.size == len(rows) * sizes.pop():
+                        columns.append(vals.reshape((len(rows), -1)))
+                    else:
+                        # rows with values of different sizes are parsed one at a time, so
+                        # each of them is checked against its design variable when it is set
+                        columns.append([np.fromstring(text, sep=' ') for text in texts])
+
+                for i in range(len(rows)):
+                    yield [(abs_names[j], columns[j][i].copy()) for j in range(ncols)]
 
 
 class UniformGenerator(DOEGenerator):
@@ -255,26 +338,15 @@ class UniformGenerator(DOEGenerator):
         if self._seed is not None:
             np.random.seed(self._seed)
 
-        for i in range(self._num_samples):
-            sample = []
-
-            for (name, meta) in iteritems(design_vars):
-                values = []
-
-                for k in range(meta['size']):
-                    lower = meta['lower']
-                    if isinstance(lower, np.ndarray):
-                        lower = lower[k]
+        lower, upper = _get_bounds(design_vars)
 
-                    upper = meta['upper']
-                    if isinstance(upper, np.ndarray):
-                        upper = upper[k]
+        # draw a chunk of samples at a time, in the same order as one sample at a time
+        for start in range(0, self._num_samples, _CHUNK_SIZE):
+            nrows = min(_CHUNK_SIZE, self._num_samples - start)
+            samples = np.random.uniform(lower, upper, size=(nrows, lower.size))
 
-                    values.append(np.random.uniform(lower, upper))
-
-                sample.append((name, np.array(values)))
-
-            yield sample
+            for case in _rows_to_cases(design_vars, samples):
+                yield case
 
 
 class _pyDOE_Generator(DOEGenerator):
@@ -320,45 +392,43 @@ class _pyDOE_Generator(DOEGenerator):
         """
         size = sum([meta['size'] for name, meta in iteritems(design_vars)])
 
-        doe = self._generate_design(size)
-
         # generate values for each level for each design variable
         # over the range of that varable's lower to upper bound
 
         # rows = vars (# rows/var = var size), cols = levels
+        lower, upper = _get_bounds(design_vars)
         values = np.empty((size, self._levels))
+        for row in range(size):
+            values[row][:] = np.linspace(lower[row], upper[row], num=self._levels)
+
+        # columns of the doe giving the level index for each entry of each variable
+        cols = np.concatenate([var + np.arange(meta['size'], dtype=int)
+                               for var, meta in enumerate(design_vars.values())])
+
+        # yield values for doe generated indices, a chunk of cases at a time
+        rows = np.arange(size)
+        for doe in self._generate_design_chunks(size):
+            idxs = doe.astype('int')[:, cols]
+            for case in _rows_to_cases(design_vars, values[rows, idxs]):
+                yield case
 
-        row = 0
-        for name, meta in iteritems(design_vars):
-            size = meta['size']
-
-            for k in range(size):
-                lower = meta['lower']
-                if isinstance(lower, np.ndarray):
-                    lower = lower[k]
-
-                upper = meta['upper']
-                if isinstance(upper, np.ndarray):
-                    upper = upper[k]
-
-                values[row][:] = np.linspace(lower, upper, num=self._levels)
-                row += 1
-
-        # yield values for doe generated indices
-        for idxs in doe.astype('int'):
-            retval = []
-            var = row = 0
-            for name, meta in iteritems(design_vars):
-                size = meta['size']
-                val = np.empty(size)
-                for k in range(size):
-                    idx = idxs[var + k]
-                    val[k] = values[row + k][idx]
-                retval.append((name, val))
-                var += 1
-                row += size
-
-            yield retval
+    def _generate_design_chunks(self, size):
+        """
+        Generate the DOE design in chunks of rows.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+
+        Yields
+        ------
+        ndarray
+            A chunk of rows of the design matrix of level indices, one column per factor.
+        """
+        doe = self._generate_design(size)
+        for start in range(0, len(doe), _CHUNK_SIZE):
+            yield doe[start:start + _CHUNK_SIZE]
 
     def _generate_design(self, size):
         """
@@ -398,6 +468,31 @@ class FullFactorialGenerator(_pyDOE_Generator):
         """
         return pyDOE2.fullfact([self._levels] * size)
 
+    def _generate_design_chunks(self, size):
+        """
+        Generate the full factorial DOE design in chunks of rows, without building all of it.
+
+        The rows are in the same order as the design from pyDOE2, with the first factor varying
+        fastest.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+
+        Yields
+        ------
+        ndarray
+            A chunk of rows of the design matrix of level indices, one column per factor.
+        """
+        levels = self._levels
+        strides = levels ** np.arange(size, dtype=np.int64)
+        ncases = levels ** size
+
+        for start in range(0, ncases, _CHUNK_SIZE):
+            idxs = np.arange(start, min(start + _CHUNK_SIZE, ncases), dtype=np.int64)
+            yield (idxs[:, np.newaxis] // strides) % levels
+
 
 class PlackettBurmanGenerator(_pyDOE_Generator):
     """
@@ -567,29 +662,9 @@ class LatinHypercubeGenerator(DOEGenerator):
                          iterations=self._iterations,
                          random_state=self._seed)
 
-        # yield desvar values for doe samples
-        for row in doe:
-            retval = []
-            col = 0
-            var = 0
-            for name, meta in iteritems(design_vars):
-                size = meta['size']
-                val = np.empty(size)
-                for k in range(size):
-                    sample = row[col + k]
-
-                    lower = meta['lower']
-                    if isinstance(lower, np.ndarray):
-                        lower = lower[k]
-
-                    upper = meta['upper']
-                    if isinstance(upper, np.ndarray):
-                        upper = upper[k]
-
-                    val[k] = lower + sample * (upper - lower)
-
-                retval.append((name, val))
-                var += 1
-                col += size
-
-            yield retval
+        # yield desvar values for doe samples, scaling a chunk of samples at a time
+        lower, upper = _get_bounds(design_vars)
+        for start in range(0, len(doe), _CHUNK_SIZE):
+            values = lower + doe[start:start + _CHUNK_SIZE] * (upper - lower)
+            for case in _rows_to_cases(design_vars, values):
+                yield case
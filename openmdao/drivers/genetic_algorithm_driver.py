@@ -21,10 +21,9 @@ Multidisciplinary Design Optimization Supported by Knowledge Based Engineering.
 John Wiley & Sons, Ltd.
 """
 import os
-import copy
 
 from six import iteritems, itervalues, next
-from six.moves import range, zip
+from six.moves import range
 
 import numpy as np
 from pyDOE2 import lhs
@@ -128,6 +127,11 @@ class SimpleGADriver(Driver):
                              'if not given.')
         self.options.declare('multi_obj_exponent', default=1., lower=0.,
                              desc='Multi-objective weighting exponent.')
+        self.options.declare('vectorized_model', default=False, types=bool,
+                             desc='Set to True if every design var, objective and constraint of '
+                             'the model has a leading dimension of size pop_size, with one row '
+                             'per point. A whole generation is then evaluated in a single run '
+                             'of the model.')
 
     def _setup_driver(self, problem):
         """
@@ -149,7 +153,15 @@ class SimpleGADriver(Driver):
         elif not self.options['run_parallel']:
             comm = None
 
-        self._ga = GeneticAlgorithm(self.objective_callback, comm=comm, model_mpi=model_mpi)
+        pop_objfun = None
+        if self.options['vectorized_model']:
+            if self.options['run_parallel']:
+                raise RuntimeError("The 'vectorized_model' and 'run_parallel' options of "
+                                   "SimpleGADriver cannot both be True.")
+            pop_objfun = self.population_callback
+
+        self._ga = GeneticAlgorithm(self.objective_callback, comm=comm, model_mpi=model_mpi,
+                                    pop_objfun=pop_objfun)
 
     def _setup_comm(self, comm):
         """
@@ -210,11 +222,30 @@ class SimpleGADriver(Driver):
         Pm = self.options['Pm']  # if None, it will be calculated in execute_ga()
         Pc = self.options['Pc']
 
+        # With a vectorized model, every row of a design var belongs to a different point.
+        nrows = 1
+        if self.options['vectorized_model']:
+            nrows = pop_size
+            if pop_size <= 0 or pop_size % 2 == 1:
+                raise ValueError("With 'vectorized_model', pop_size must be set to the (even) "
+                                 "size of the leading dimension of the model variables, but it "
+                                 "is %d." % pop_size)
+
         # Size design variables.
         desvars = self._designvars
+        abs2meta = self._problem.model._var_allprocs_abs2meta
         count = 0
         for name, meta in iteritems(desvars):
             size = meta['size']
+            if nrows > 1:
+                shape = abs2meta[name]['shape']
+                if not shape or shape[0] != nrows:
+                    raise ValueError("Leading dimension of design var '%s' %s is not equal to "
+                                     "pop_size (%d)." % (name, shape, nrows))
+            if size % nrows != 0:
+                raise ValueError("Size of design var '%s' (%d) is not divisible by pop_size "
+                                 "(%d)." % (name, size, nrows))
+            size //= nrows
             self._desvar_idx[name] = (count, count + size)
             count += size
 
@@ -229,9 +260,9 @@ class SimpleGADriver(Driver):
         # Figure out bounds vectors and initial design vars
         for name, meta in iteritems(desvars):
             i, j = self._desvar_idx[name]
-            lower_bound[i:j] = meta['lower']
-            upper_bound[i:j] = meta['upper']
-            x0[i:j] = desvar_vals[name]
+            lower_bound[i:j] = _first_row(meta['lower'], nrows)
+            upper_bound[i:j] = _first_row(meta['upper'], nrows)
+            x0[i:j] = _first_row(desvar_vals[name], nrows)
 
         # Bits of resolution
         abs2prom = model._var_abs2prom['output']
@@ -273,7 +304,7 @@ class SimpleGADriver(Driver):
         # framework is left in the right final state
         for name in desvars:
             i, j = self._desvar_idx[name]
-            val = desvar_new[i:j]
+            val = np.tile(desvar_new[i:j], nrows)
             self.set_design_var(name, val)
 
         with RecordingDebugging('SimpleGA', self.iter_count, self) as rec:
@@ -357,26 +388,16 @@ class SimpleGADriver(Driver):
         model = self._problem.model
         success = 1
 
-        objs = self.get_objective_values()
-        nr_objectives = len(objs)
-
-        # Single objective, if there is nly one objective, which has only one element
-        is_single_objective = (nr_objectives == 1) and (len(next(itervalues(objs))) == 1)
-
-        obj_exponent = self.options['multi_obj_exponent']
-        if self.options['multi_obj_weights']:  # not empty
-            obj_weights = self.options['multi_obj_weights']
-        else:
-            # Same weight for all objectives, if not specified
-            obj_weights = {name: 1. for name in objs.keys()}
-        sum_weights = sum(itervalues(obj_weights))
-
         for name in self._designvars:
             i, j = self._desvar_idx[name]
             self.set_design_var(name, x[i:j])
 
-        # a very large number, but smaller than the result of nan_to_num in Numpy
-        almost_inf = openmdao.INF_BOUND
+        # Elitism and the binary encoding make the GA revisit design points, so reuse their
+        # responses if the evaluation cache is enabled.
+        cached = self._load_cached_point()
+        if cached is not None:
+            self.iter_count += 1
+            return self._get_fitness(1)[0], int(cached[0]), icase
 
         # Execute the model
         with RecordingDebugging('SimpleGA', self.iter_count, self) as rec:
@@ -389,56 +410,183 @@ class SimpleGADriver(Driver):
                 model._clear_iprint()
                 success = 0
 
-            obj_values = self.get_objective_values()
-            if is_single_objective:  # Single objective optimization
-                obj = next(itervalues(obj_values))  # First and only key in the dict
-            else:  # Multi-objective optimization with weighted sums
-                weighted_objectives = np.array([])
-                for name, val in iteritems(obj_values):
-                    # element-wise multiplication with scalar
-                    # takes the average, if an objective is a vector
-                    try:
-                        weighted_obj = val * obj_weights[name] / val.size
-                    except KeyError:
-                        msg = ('Name "{}" in "multi_obj_weights" option '
-                               'is not an absolute name of an objective.')
-                        raise KeyError(msg.format(name))
-                    weighted_objectives = np.hstack((weighted_objectives, weighted_obj))
-
-                obj = sum(weighted_objectives / sum_weights)**obj_exponent
-
-            # Parameters of the penalty method
-            penalty = self.options['penalty_parameter']
-            exponent = self.options['penalty_exponent']
-
-            if penalty == 0:
-                fun = obj
-            else:
-                constraint_violations = np.array([])
-                for name, val in iteritems(self.get_constraint_values()):
-                    con = self._cons[name]
-                    # The not used fields will either None or a very large number
-                    if (con['lower'] is not None) and (con['lower'] > -almost_inf):
-                        diff = val - con['lower']
-                        violation = np.array([0. if d >= 0 else abs(d) for d in diff])
-                    elif (con['upper'] is not None) and (con['upper'] < almost_inf):
-                        diff = val - con['upper']
-                        violation = np.array([0. if d <= 0 else abs(d) for d in diff])
-                    elif (con['equals'] is not None) and (abs(con['equals']) < almost_inf):
-                        diff = val - con['equals']
-                        violation = np.absolute(diff)
-                    constraint_violations = np.hstack((constraint_violations, violation))
-                fun = obj + penalty * sum(np.power(constraint_violations, exponent))
+            self._save_cached_point(bool(success))
+
+            fun = self._get_fitness(1)[0]
+
             # Record after getting obj to assure they have
             # been gathered in MPI.
             rec.abs = 0.0
             rec.rel = 0.0
 
-        # print("Functions calculated")
-        # print(x)
-        # print(obj)
         return fun, success, icase
 
+    def population_callback(self, x_pop):
+        """
+        Evaluate the fitness of a whole generation in a single run of a vectorized model.
+
+        This is used instead of objective_callback when the 'vectorized_model' option is True.
+        Row i of every design var, objective and constraint belongs to point i of the
+        population.  The fitness is computed as described in objective_callback.
+
+        Parameters
+        ----------
+        x_pop : ndarray
+            Value of design variables, one row per point.
+
+        Returns
+        -------
+        ndarray
+            Fitness of each point.
+        ndarray of bool
+            Success flag of each point.
+        """
+        model = self._problem.model
+        npop = x_pop.shape[0]
+        success = True
+
+        for name in self._designvars:
+            i, j = self._desvar_idx[name]
+            self.set_design_var(name, x_pop[:, i:j].ravel())
+
+        with RecordingDebugging('SimpleGA', self.iter_count, self) as rec:
+            self.iter_count += 1
+            try:
+                model._solve_nonlinear()
+
+            except AnalysisError:
+                model._clear_iprint()
+                success = False
+
+            fitness = self._get_fitness(npop)
+
+            rec.abs = 0.0
+            rec.rel = 0.0
+
+        return fitness, np.full(npop, success)
+
+    def _get_fitness(self, npop):
+        """
+        Return the penalized, weighted objective of each point from the current model values.
+
+        Parameters
+        ----------
+        npop : int
+            Number of points that the model was evaluated at.  Every objective and constraint
+            has one row per point.
+
+        Returns
+        -------
+        ndarray
+            Fitness of each point.
+        """
+        objs = self.get_objective_values()
+        nr_objectives = len(objs)
+
+        # Single objective, if there is only one objective, which has only one element per point
+        is_single_objective = (nr_objectives == 1) and (next(itervalues(objs)).size == npop)
+
+        obj_exponent = self.options['multi_obj_exponent']
+        if self.options['multi_obj_weights']:  # not empty
+            obj_weights = self.options['multi_obj_weights']
+        else:
+            # Same weight for all objectives, if not specified
+            obj_weights = {name: 1. for name in objs.keys()}
+        sum_weights = sum(itervalues(obj_weights))
+
+        # a very large number, but smaller than the result of nan_to_num in Numpy
+        almost_inf = openmdao.INF_BOUND
+
+        if is_single_objective:  # Single objective optimization
+            obj = next(itervalues(objs)).reshape(npop)
+        else:  # Multi-objective optimization with weighted sums
+            weighted_objectives = []
+            for name, val in iteritems(objs):
+                val = val.reshape((npop, -1))
+                # element-wise multiplication with scalar
+                # takes the average, if an objective is a vector
+                try:
+                    weighted_objectives.append(val * obj_weights[name] / val.shape[1])
+                except KeyError:
+                    msg = ('Name "{}" in "multi_obj_weights" option '
+                           'is not an absolute name of an objective.')
+                    raise KeyError(msg.format(name))
+
+            obj = np.sum(np.hstack(weighted_objectives) / sum_weights, axis=1)**obj_exponent
+
+        # Parameters of the penalty method
+        penalty = self.options['penalty_parameter']
+        exponent = self.options['penalty_exponent']
+
+        if penalty == 0:
+            return obj
+
+        constraint_violations = []
+        for name, val in iteritems(self.get_constraint_values()):
+            con = self._cons[name]
+            val = val.reshape((npop, -1))
+            # The not used fields will either None or a very large number
+            if (con['lower'] is not None) and np.all(con['lower'] > -almost_inf):
+                violation = np.maximum(_as_rows(con['lower'], val.shape) - val, 0.)
+            elif (con['upper'] is not None) and np.all(con['upper'] < almost_inf):
+                violation = np.maximum(val - _as_rows(con['upper'], val.shape), 0.)
+            elif (con['equals'] is not None) and np.all(np.abs(con['equals']) < almost_inf):
+                violation = np.absolute(val - _as_rows(con['equals'], val.shape))
+            else:
+                continue
+            constraint_violations.append(violation)
+
+        if not constraint_violations:
+            return obj
+
+        return obj + penalty * np.sum(np.power(np.hstack(constraint_violations), exponent),
+                                      axis=1)
+
+
+def _as_rows(bound, shape):
+    """
+    Reshape a constraint bound so that it broadcasts against values with one row per point.
+
+    Parameters
+    ----------
+    bound : float or ndarray
+        Bound of the constraint, either a scalar or one entry per constraint entry.
+    shape : tuple
+        Shape of the constraint values, (npop, size per point).
+
+    Returns
+    -------
+    float or ndarray
+        The bound in a form that broadcasts against the constraint values.
+    """
+    if np.ndim(bound) == 0:
+        return bound
+    bound = np.asarray(bound).ravel()
+    if bound.size == shape[1]:
+        return bound
+    return bound.reshape(shape)
+
+
+def _first_row(val, nrows):
+    """
+    Return the entries of a design var bound or value that belong to the first point.
+
+    Parameters
+    ----------
+    val : float or ndarray
+        The full bound or value.
+    nrows : int
+        Number of points (rows) in the design var.
+
+    Returns
+    -------
+    float or ndarray
+        The entries for the first point.
+    """
+    if np.ndim(val) == 0 or nrows == 1:
+        return val
+    return np.asarray(val).reshape((nrows, -1))[0]
+
 
 class GeneticAlgorithm(object):
     """
@@ -464,9 +612,11 @@ class GeneticAlgorithm(object):
         Population size.
     objfun : function
         Objective function callback.
+    pop_objfun : function or None
+        If not None, callback that evaluates the fitness of a whole population at once.
     """
 
-    def __init__(self, objfun, comm=None, model_mpi=None):
+    def __init__(self, objfun, comm=None, model_mpi=None, pop_objfun=None):
         """
         Initialize genetic algorithm object.
 
@@ -480,8 +630,13 @@ class GeneticAlgorithm(object):
             If the model in objfun is also parallel, then this will contain a tuple with the the
             total number of population points to evaluate concurrently, and the color of the point
             to evaluate on this rank.
+        pop_objfun : function or None
+            If not None, callback that evaluates the fitness of a whole population at once. It
+            takes an array with one row per point and returns the fitness and success flag of
+            each point. This is used instead of objfun for serial evaluation.
         """
         self.objfun = objfun
+        self.pop_objfun = pop_objfun
         self.comm = comm
 
         self.lchrom = 0
@@ -527,7 +682,7 @@ class GeneticAlgorithm(object):
             Number of successful function evaluations.
         """
         comm = self.comm
-        xopt = copy.deepcopy(vlb)
+        xopt = vlb.copy()
         fopt = np.inf
         self.lchrom = int(np.sum(bits))
 
@@ -548,7 +703,7 @@ class GeneticAlgorithm(object):
         # Main Loop
         nfit = 0
         for generation in range(max_gen + 1):
-            old_gen = copy.deepcopy(new_gen)
+            old_gen = new_gen.copy()
             x_pop = self.decode(old_gen, vlb, vub, bits)
 
             # Evaluate points in this generation.
@@ -587,6 +742,16 @@ class GeneticAlgorithm(object):
                         print('A case failed:')
                         print(traceback)
 
+            elif self.pop_objfun is not None:
+                # Whole population in a single evaluation. Points that exceeded the bounds of
+                # over-allocated integer variables are clipped for the evaluation, then discarded.
+                in_bounds = np.all(x_pop - vob <= 0, axis=1)
+                fitness[:], success = self.pop_objfun(np.minimum(x_pop, vob))
+
+                success &= in_bounds
+                fitness[~success] = np.inf
+                nfit += np.count_nonzero(success)
+
             else:
                 # Serial
                 for ii in range(self.npop):
@@ -645,17 +810,16 @@ class GeneticAlgorithm(object):
             New generation with best points.
         """
         new_gen = []
-        idx = np.array(range(0, self.npop - 1, 2))
+        idx = np.arange(0, self.npop - 1, 2)
         for j in range(2):
             old_gen, i_shuffled = self.shuffle(old_gen)
             fitness = fitness[i_shuffled]
 
             # Each point competes with its neighbor; save the best.
-            i_min = np.argmin(np.array([[fitness[idx]], [fitness[idx + 1]]]), axis=0)
-            selected = i_min + idx
+            selected = idx + (fitness[idx + 1] < fitness[idx])
             new_gen.append(old_gen[selected])
 
-        return np.concatenate(np.array(new_gen), axis=1).reshape(old_gen.shape)
+        return np.vstack(new_gen)
 
     def crossover(self, old_gen, Pc):
         """
@@ -676,15 +840,15 @@ class GeneticAlgorithm(object):
         ndarray
             Current generation with crossovers applied.
         """
-        new_gen = copy.deepcopy(old_gen)
+        new_gen = np.empty_like(old_gen)
         num_sites = self.npop // 2
-        sites = np.random.rand(num_sites, self.lchrom)
-        idx, idy = np.where(sites < Pc)
-        for ii, jj in zip(idx, idy):
-            i = 2 * ii
-            j = i + 1
-            new_gen[i][jj] = old_gen[j][jj]
-            new_gen[j][jj] = old_gen[i][jj]
+        sites = np.random.rand(num_sites, self.lchrom) < Pc
+
+        # Swap the selected genes between each pair of neighboring points.
+        even = old_gen[0::2]
+        odd = old_gen[1::2]
+        new_gen[0::2] = np.where(sites, odd, even)
+        new_gen[1::2] = np.where(sites, even, odd)
         return new_gen
 
     def mutate(self, current_gen, Pm):
@@ -706,9 +870,8 @@ class GeneticAlgorithm(object):
         ndarray
             Current generation with mutations applied.
         """
-        temp = np.random.rand(self.npop, self.lchrom)
-        idx, idy = np.where(temp < Pm)
-        current_gen[idx, idy] = 1 - current_gen[idx, idy]
+        mutations = np.random.rand(self.npop, self.lchrom) < Pm
+        current_gen[mutations] = 1 - current_gen[mutations]
         return current_gen
 
     def shuffle(self, old_gen):
@@ -753,18 +916,9 @@ class GeneticAlgorithm(object):
         ndarray
             Decoded design variable values.
         """
-        num_desvar = len(bits)
         interval = (vub - vlb) / (2**bits - 1)
-        x = np.empty((self.npop, num_desvar))
-        sbit = 0
-        ebit = 0
-        for jj in range(num_desvar):
-            exponents = 2**np.array(range(bits[jj] - 1, -1, -1))
-            ebit += bits[jj]
-            fact = exponents * (gen[:, sbit:ebit])
-            x[:, jj] = np.einsum('ij->i', fact) * interval[jj] + vlb[jj]
-            sbit = ebit
-        return x
+        positions, starts = _bit_positions(bits)
+        return np.add.reduceat(gen * 2.0**positions, starts, axis=1) * interval + vlb
 
     def encode(self, x, vlb, vub, bits):
         """
@@ -789,6 +943,32 @@ class GeneticAlgorithm(object):
         interval = (vub - vlb) / (2**bits - 1)
         x = np.maximum(x, vlb)
         x = np.minimum(x, vub)
-        x = np.round((x - vlb) / interval).astype(np.int)
-        byte_str = [("0" * b + bin(i)[2:])[-b:] for i, b in zip(x, bits)]
-        return np.array([int(c) for s in byte_str for c in s])
+        x = np.round((x - vlb) / interval).astype(np.int64)
+
+        # The lowest b bits of each value, most significant bit first.
+        return (np.repeat(x, bits) >> _bit_positions(bits)[0]) & 1
+
+
+def _bit_positions(bits):
+    """
+    Return the binary digit position of every gene in a chromosome.
+
+    Parameters
+    ----------
+    bits : ndarray
+        Number of bits used to encode each design variable.
+
+    Returns
+    -------
+    ndarray
+        Digit position of each gene, most significant bit first within each design variable.
+    ndarray
+        Index of the first gene of each design variable.
+    """
+    bits = np.asarray(bits, dtype=np.int64)
+    starts = np.zeros(bits.size, dtype=np.int64)
+    np.cumsum(bits[:-1], out=starts[1:])
+
+    # position of each gene counted from the last gene of its design variable
+    positions = np.repeat(starts + bits, bits) - np.arange(np.sum(bits)) - 1
+    return positions, starts
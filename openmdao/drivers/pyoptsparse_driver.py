@@ -150,6 +150,16 @@ class pyOptSparseDriver(Driver):
         self.options.declare('dynamic_derivs_repeats', default=3, types=int,
                              desc='Number of compute_totals calls during dynamic computation of '
                                   'simultaneous derivative coloring or derivatives sparsity')
+        self.options.declare('dynamic_derivs_method', default='randomized',
+                             values=['randomized', 'structural'],
+                             desc='How the total derivative sparsity is found during dynamic '
+                                  'coloring. "structural" uses the declared partial sparsity '
+                                  'instead of computing randomized total jacobians')
+        self.options.declare('dynamic_derivs_cache', default=None, types=string_types,
+                             allow_none=True,
+                             desc='Directory where dynamically computed colorings and '
+                                  'sparsities are cached, keyed by a hash of the model '
+                                  'structure. If None, nothing is cached')
 
     def _setup_driver(self, problem):
         """
@@ -6,7 +6,7 @@ from __future__ import print_function
 from collections import OrderedDict
 import sys
 
-from six import itervalues, iteritems, reraise
+from six import itervalues, iteritems, reraise, string_types
 from six.moves import range
 
 import numpy as np
@@ -64,10 +64,20 @@ class ScipyOptimizeDriver(Driver):
         Result returned from scipy.optimize call.
     opt_settings : dict
         Dictionary of solver-specific options. See the scipy.optimize.minimize documentation.
-    _con_cache : OrderedDict
-        Cached result of constraint evaluations because scipy asks for them in a separate function.
-    _con_idx : dict
-        Used for constraint bookkeeping in the presence of 2-sided constraints.
+    _obj_cache : float
+        Value of the objective at _x_cache.
+    _x_cache : ndarray or None
+        Design point at which the model was last run successfully.
+    _grad_x : ndarray or None
+        Design point at which _grad_cache was computed.
+    _cache_stats : dict
+        Number of model runs and total derivative computations done, and skipped because the
+        design point was cached, during the current run.
+    _con_cache : ndarray
+        Cached flat array of constraint values because scipy asks for them in a separate function.
+    _con_rows : dict
+        Maps 'eq' and 'ineq' to the arrays that compute the rows of the scipy constraint of that
+        type, and of its jacobian, from the cached constraint values and derivatives.
     _grad_cache : OrderedDict
         Cached result of nonlinear constraint derivatives because scipy asks for them in a separate
         function.
@@ -108,7 +118,11 @@ class ScipyOptimizeDriver(Driver):
         self.fail = 0
         self._grad_cache = None
         self._con_cache = None
-        self._con_idx = {}
+        self._obj_cache = None
+        self._x_cache = None
+        self._grad_x = None
+        self._cache_stats = {}
+        self._con_rows = {}
         self._obj_and_nlcons = None
         self.fail = False
         self.iter_count = 0
@@ -134,6 +148,16 @@ class ScipyOptimizeDriver(Driver):
         self.options.declare('dynamic_derivs_repeats', default=3, types=int,
                              desc='Number of compute_totals calls during dynamic computation of '
                                   'simultaneous derivative coloring')
+        self.options.declare('dynamic_derivs_method', default='randomized',
+                             values=['randomized', 'structural'],
+                             desc='How the total derivative sparsity is found during dynamic '
+                                  'coloring. "structural" uses the declared partial sparsity '
+                                  'instead of computing randomized total jacobians')
+        self.options.declare('dynamic_derivs_cache', default=None, types=string_types,
+                             allow_none=True,
+                             desc='Directory where dynamically computed colorings and '
+                                  'sparsities are cached, keyed by a hash of the model '
+                                  'structure. If None, nothing is cached')
 
     def _get_name(self):
         """
@@ -178,12 +202,14 @@ class ScipyOptimizeDriver(Driver):
                     d['lower'] = lower
                     d['upper'] = upper
                     d['equals'] = None
-                    d['indices'] = None
-                    d['adder'] = None
-                    d['scaler'] = None
+                    d['indices'] = meta['indices']
+                    d['adder'] = meta['adder']
+                    d['scaler'] = meta['scaler']
                     d['size'] = meta['size']
                     self._cons[name] = d
 
+        self._setup_flat_vois()
+
     def run(self):
         """
         Optimize the problem using selected Scipy optimizer.
@@ -198,11 +224,15 @@ class ScipyOptimizeDriver(Driver):
         model = problem.model
         self.iter_count = 0
         self._total_jac = None
+        self._x_cache = None
+        self._grad_x = None
+        self._cache_stats = {'model_runs': 0, 'model_hits': 0,
+                             'totals_runs': 0, 'totals_hits': 0}
 
         # Initial Run
         model._solve_nonlinear()
 
-        self._con_cache = self.get_constraint_values()
+        self._con_cache = self._get_flat_constraint_values()
         desvar_vals = self.get_design_var_values()
         self._dvlist = list(self._designvars)
 
@@ -254,50 +284,64 @@ class ScipyOptimizeDriver(Driver):
         lincons = []  # list of linear constraints
         self._obj_and_nlcons = list(self._objs)
 
+        self._con_rows = {}
+
         if opt in _constraint_optimizers:
+            # Every index of every constraint is a separate scipy constraint, so compute where
+            # each one comes from once here, and evaluate them all at once in the callbacks.
+            rows = {'eq': [], 'ineq': []}
+            src = 0  # position in the flat array of constraint values
             for name, meta in iteritems(self._cons):
                 size = meta['size']
-                upper = meta['upper']
-                lower = meta['lower']
-                if 'linear' in meta and meta['linear']:
+                linear = 'linear' in meta and meta['linear']
+                if linear:
                     lincons.append(name)
-                    self._con_idx[name] = lin_i
+                    grad_row = lin_i
                     lin_i += size
                 else:
                     self._obj_and_nlcons.append(name)
-                    self._con_idx[name] = i
+                    grad_row = i
                     i += size
 
-                # Loop over every index separately, because scipy calls each constraint by index.
-                for j in range(0, size):
-                    con_dict = {}
-                    if meta['equals'] is not None:
-                        con_dict['type'] = 'eq'
+                equals = np.broadcast_to(meta['equals'], size) \
+                    if meta['equals'] is not None else None
+                upper = np.broadcast_to(meta['upper'], size)
+                lower = np.broadcast_to(meta['lower'], size)
+
+                # Note, scipy defines constraints to be satisfied when positive,
+                # which is the opposite of OpenMDAO.
+                for j in range(size):
+                    row = (src + j, grad_row + j, linear)
+                    if equals is not None:
+                        rows['eq'].append(row + (1.0, -equals[j]))
+                        continue
+
+                    dblcon = (upper[j] < openmdao.INF_BOUND) and \
+                        (lower[j] > -openmdao.INF_BOUND)
+
+                    if dblcon:
+                        # lower bound first, then the extra constraint for the upper bound
+                        rows['ineq'].append(row + (1.0, -lower[j]))
+                        rows['ineq'].append(row + (-1.0, upper[j]))
+                    elif lower[j] <= -openmdao.INF_BOUND:
+                        rows['ineq'].append(row + (-1.0, upper[j]))
                     else:
-                        con_dict['type'] = 'ineq'
-                    con_dict['fun'] = self._confunc
-                    if opt in _constraint_grad_optimizers:
-                        con_dict['jac'] = self._congradfunc
-                    con_dict['args'] = [name, False, j]
-                    constraints.append(con_dict)
+                        rows['ineq'].append(row + (1.0, -lower[j]))
 
-                    if isinstance(upper, np.ndarray):
-                        upper = upper[j]
+                src += size
 
-                    if isinstance(lower, np.ndarray):
-                        lower = lower[j]
+            for con_type, con_rows in iteritems(rows):
+                if not con_rows:
+                    continue
 
-                    dblcon = (upper < openmdao.INF_BOUND) and (lower > -openmdao.INF_BOUND)
+                srcs, grad_rows, linear, signs, offsets = [np.array(a) for a in zip(*con_rows)]
+                self._con_rows[con_type] = (srcs, signs, offsets, grad_rows[~linear],
+                                            grad_rows[linear], linear)
 
-                    # Add extra constraint if double-sided
-                    if dblcon:
-                        dcon_dict = {}
-                        dcon_dict['type'] = 'ineq'
-                        dcon_dict['fun'] = self._confunc
-                        if opt in _constraint_grad_optimizers:
-                            dcon_dict['jac'] = self._congradfunc
-                        dcon_dict['args'] = [name, True, j]
-                        constraints.append(dcon_dict)
+                con_dict = {'type': con_type, 'fun': self._confunc, 'args': [con_type]}
+                if opt in _constraint_grad_optimizers:
+                    con_dict['jac'] = self._congradfunc
+                constraints.append(con_dict)
 
             # precalculate gradients of linear constraints
             if lincons:
@@ -371,88 +415,115 @@ class ScipyOptimizeDriver(Driver):
         float
             Value of the objective function evaluated at the new design point.
         """
-        model = self._problem.model
-
         try:
+            self._run_point(x_new)
 
-            # Pass in new parameters
-            i = 0
-            for name, meta in iteritems(self._designvars):
-                size = meta['size']
-                self.set_design_var(name, x_new[i:i + size])
-                i += size
+        except Exception as msg:
+            self._exc_info = sys.exc_info()
+            return 0
 
-            with RecordingDebugging(self.options['optimizer'], self.iter_count, self) as rec:
-                self.iter_count += 1
-                model._solve_nonlinear()
+        return self._obj_cache
 
-            # Get the objective function evaluations
-            for name, obj in iteritems(self.get_objective_values()):
-                f_new = obj
-                break
+    def _run_point(self, x_new):
+        """
+        Run the model at the given design point, unless it was the last one run.
 
-            self._con_cache = self.get_constraint_values()
+        scipy doesn't guarantee that the objective is evaluated before the constraints or the
+        gradients at a new point, or that a point isn't requested more than once, so every
+        callback goes through here.
 
-        except Exception as msg:
-            self._exc_info = sys.exc_info()
-            return 0
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing parameter values at new design point.
+        """
+        if self._x_cache is not None and np.array_equal(x_new, self._x_cache):
+            self._cache_stats['model_hits'] += 1
+            return
 
-        # print("Functions calculated")
-        # print(x_new)
-        # print(f_new)
+        self._x_cache = None
+        self._grad_x = None
+
+        # Pass in new parameters
+        self._set_flat_design_vars(x_new)
+
+        with RecordingDebugging(self.options['optimizer'], self.iter_count, self) as rec:
+            self.iter_count += 1
+            model = self._problem.model
+            model._solve_nonlinear()
 
-        return f_new
+        self._cache_stats['model_runs'] += 1
 
-    def _confunc(self, x_new, name, dbl, idx):
+        # Get the objective function evaluations
+        for name, obj in iteritems(self.get_objective_values()):
+            self._obj_cache = obj
+            break
+
+        self._con_cache = self._get_flat_constraint_values()
+        self._x_cache = x_new.copy()
+
+    def _compute_point_totals(self, x_new):
         """
-        Return the value of the constraint function requested in args.
+        Compute the derivatives of the objective and nonlinear constraints at the design point.
 
-        Note that this function is called for each constraint, so the model is only run when the
-        objective is evaluated.
+        Nothing is computed if they were already computed at that point.
 
         Parameters
         ----------
         x_new : ndarray
             Array containing parameter values at new design point.
-        name : string
-            Name of the constraint to be evaluated.
-        dbl : bool
-            True if double sided constraint.
-        idx : float
-            Contains index into the constraint array.
+        """
+        self._run_point(x_new)
+
+        if self._grad_x is not None and np.array_equal(x_new, self._grad_x):
+            self._cache_stats['totals_hits'] += 1
+            return
+
+        self._grad_cache = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
+                                                return_format='array')
+        self._cache_stats['totals_runs'] += 1
+        self._grad_x = x_new.copy()
+
+    def get_cache_stats(self):
+        """
+        Return the number of model runs and total derivative computations of the last run.
 
         Returns
         -------
-        float
-            Value of the constraint function.
+        dict
+            Number of model runs ('model_runs') and total derivative computations
+            ('totals_runs') that were done, and the number that were skipped because the
+            optimizer asked for a design point that was already evaluated ('model_hits' and
+            'totals_hits').
         """
-        if self._exc_info is not None:
-            self._reraise()
+        return dict(self._cache_stats)
 
-        cons = self._con_cache
-        meta = self._cons[name]
+    def _confunc(self, x_new, con_type):
+        """
+        Return the values of all constraints of the type requested in args.
 
-        # Equality constraints
-        equals = meta['equals']
-        if equals is not None:
-            if isinstance(equals, np.ndarray):
-                equals = equals[idx]
-            return (cons[name][idx] - equals)
+        The model is only run if it hasn't been run at this design point yet.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing parameter values at new design point.
+        con_type : str
+            'eq' or 'ineq'.
+
+        Returns
+        -------
+        ndarray
+            Values of the constraint functions.
+        """
+        if self._exc_info is not None:
+            self._reraise()
 
-        # Note, scipy defines constraints to be satisfied when positive,
-        # which is the opposite of OpenMDAO.
-        upper = meta['upper']
-        if isinstance(upper, np.ndarray):
-            upper = upper[idx]
+        self._run_point(x_new)
 
-        lower = meta['lower']
-        if isinstance(lower, np.ndarray):
-            lower = lower[idx]
+        srcs, signs, offsets = self._con_rows[con_type][:3]
 
-        if dbl or (lower <= -openmdao.INF_BOUND):
-            return upper - cons[name][idx]
-        else:
-            return cons[name][idx] - lower
+        return signs * self._con_cache[srcs] + offsets
 
     def _gradfunc(self, x_new):
         """
@@ -471,9 +542,8 @@ class ScipyOptimizeDriver(Driver):
             Gradient of objective with respect to parameter array.
         """
         try:
-            grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
-                                        return_format='array')
-            self._grad_cache = grad
+            self._compute_point_totals(x_new)
+            grad = self._grad_cache
 
         except Exception as msg:
             self._exc_info = sys.exc_info()
@@ -485,58 +555,40 @@ class ScipyOptimizeDriver(Driver):
 
         return grad[0, :]
 
-    def _congradfunc(self, x_new, name, dbl, idx):
+    def _congradfunc(self, x_new, con_type):
         """
-        Return the cached gradient of the constraint function.
+        Return the cached gradients of all constraints of the type requested in args.
 
-        Note, scipy calls the constraints one at a time, so the gradient is cached when the
-        objective gradient is called.
+        The gradients are only computed if they haven't been computed at this design point yet.
 
         Parameters
         ----------
         x_new : ndarray
             Array containing parameter values at new design point.
-        name : string
-            Name of the constraint to be evaluated.
-        dbl : bool
-            Denotes if a constraint is double-sided or not.
-        idx : float
-            Contains index into the constraint array.
+        con_type : str
+            'eq' or 'ineq'.
 
         Returns
         -------
-        float
-            Gradient of the constraint function wrt all params.
+        ndarray
+            Gradients of the constraint functions wrt all params.
         """
         if self._exc_info is not None:
             self._reraise()
 
-        meta = self._cons[name]
+        if self._obj_and_nlcons[1:]:
+            self._compute_point_totals(x_new)
 
-        if meta['linear']:
-            grad = self._lincongrad_cache
-        else:
-            grad = self._grad_cache
-        grad_idx = self._con_idx[name] + idx
+        srcs, signs, offsets, nl_rows, lin_rows, linear = self._con_rows[con_type]
 
-        # print("Constraint Gradient returned")
-        # print(x_new)
-        # print(name, idx, grad[grad_idx, :])
+        grad = np.empty((srcs.size, x_new.size))
+        if nl_rows.size:
+            grad[~linear] = self._grad_cache[nl_rows]
+        if lin_rows.size:
+            grad[linear] = self._lincongrad_cache[lin_rows]
+        grad *= signs[:, np.newaxis]
 
-        # Equality constraints
-        if meta['equals'] is not None:
-            return grad[grad_idx, :]
-
-        # Note, scipy defines constraints to be satisfied when positive,
-        # which is the opposite of OpenMDAO.
-        lower = meta['lower']
-        if isinstance(lower, np.ndarray):
-            lower = lower[idx]
-
-        if dbl or (lower <= -openmdao.INF_BOUND):
-            return -grad[grad_idx, :]
-        else:
-            return grad[grad_idx, :]
+        return grad
 
     def _reraise(self):
         """
@@ -12,12 +12,16 @@ import shutil
 import tempfile
 import csv
 import json
+import sqlite3
+import time
 
 import numpy as np
 
 from openmdao.api import Problem, ExplicitComponent, IndepVarComp, ExecComp, \
     SqliteRecorder, CaseReader, PETScVector
 
+from openmdao.core.analysis_error import AnalysisError
+from openmdao.drivers import doe_generators
 from openmdao.drivers.doe_driver import DOEDriver
 from openmdao.drivers.doe_generators import ListGenerator, CSVGenerator, \
     UniformGenerator, FullFactorialGenerator, PlackettBurmanGenerator, \
@@ -54,6 +58,19 @@ class ParaboloidArray(ExplicitComponent):
         outputs['f_xy'] = (x-3.0)**2 + x*y + (y+4.0)**2 - 3.0
 
 
+class ParaboloidWithTrouble(Paraboloid):
+    """
+    Paraboloid that fails for x == 1 and hangs for x == 2.
+    """
+
+    def compute(self, inputs, outputs):
+        if inputs['x'] == 1.:
+            raise AnalysisError("x can't be 1")
+        if inputs['x'] == 2.:
+            time.sleep(60.)
+        super(ParaboloidWithTrouble, self).compute(inputs, outputs)
+
+
 class TestErrors(unittest.TestCase):
 
     def test_generator_check(self):
@@ -301,6 +318,46 @@ class TestDOEDriver(unittest.TestCase):
             self.assertEqual(outputs['y'], expected[n]['y'])
             self.assertEqual(outputs['f_xy'], expected[n]['f_xy'])
 
+    def test_csv_blank_lines(self):
+        prob = Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.setup()
+
+        # blank lines between the cases and at the end of the file are skipped, also when a
+        # whole chunk of rows is blank
+        with open('cases.csv', 'w') as f:
+            f.write('x,y\n1,2\n\n\n\n3,4\n\n')
+
+        chunk_size = doe_generators._CHUNK_SIZE
+        doe_generators._CHUNK_SIZE = 2
+        try:
+            cases = list(CSVGenerator('cases.csv')(model.get_design_vars(recurse=True), model))
+        finally:
+            doe_generators._CHUNK_SIZE = chunk_size
+
+        self.assertEqual(len(cases), 2)
+        for case, (x, y) in zip(cases, [(1., 2.), (3., 4.)]):
+            self.assertEqual([name for name, val in case], ['p1.x', 'p2.y'])
+            assert_rel_error(self, case[0][1], np.array([x]), 1e-15)
+            assert_rel_error(self, case[1][1], np.array([y]), 1e-15)
+
+        prob.driver = DOEDriver(CSVGenerator('cases.csv'))
+        prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(CaseReader("cases.sql").driver_cases.num_cases, 2)
+
     def test_csv_array(self):
         prob = Problem()
         model = prob.model
@@ -454,6 +511,21 @@ class TestDOEDriver(unittest.TestCase):
                              "Error assigning p1.x = [ 0.  0.  0.  0.]: "
                              "could not broadcast input array from shape (4) into shape (1)")
 
+        # test CSV file with values of different sizes in a column, which are checked row by
+        # row even though they would fit an array of the chunk of rows
+        with open('cases.csv', 'w') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerow([np.array([1., 2., 3.]), 0.])
+            writer.writerow([np.array([4.]), 0.])
+
+        with printoptions(**opts):
+            with self.assertRaises(ValueError) as err:
+                prob.run_driver()
+            self.assertEqual(str(err.exception),
+                             "Error assigning p1.x = [ 1.  2.  3.]: "
+                             "could not broadcast input array from shape (3) into shape (1)")
+
     def test_uniform(self):
         prob = Problem()
         model = prob.model
@@ -865,6 +937,330 @@ class TestDOEDriver(unittest.TestCase):
         self.assertEqual(x_buckets_filled, all_buckets)
         self.assertEqual(y_buckets_filled, all_buckets)
 
+    def test_eval_cache(self):
+        def build(cases, **options):
+            prob = Problem()
+            model = prob.model
+
+            model.add_subsystem('p1', IndepVarComp('x', 0.0), promotes=['x'])
+            model.add_subsystem('p2', IndepVarComp('y', 0.0), promotes=['y'])
+            comp = model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy')
+
+            prob.driver = DOEDriver(cases, **options)
+            prob.setup()
+            return prob, comp
+
+        points = [[('x', 0.), ('y', 0.)], [('x', 1.), ('y', 0.)], [('x', 0.), ('y', 1.)]]
+
+        # each point is evaluated, and recorded, once
+        prob, comp = build(points * 3, eval_cache_size=10)
+        prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(comp.iter_count, 3)
+        self.assertEqual(CaseReader("cases.sql").driver_cases.num_cases, 3)
+        self.assertEqual(prob.driver.get_eval_cache_stats(),
+                         {'hits': 6, 'misses': 3, 'size': 3, 'hit_rate': 6 / 9.})
+        # the responses of the last point come from the cache
+        assert_rel_error(self, prob['f_xy'], 31.0, 1e-10)
+
+        # the least recently used point is dropped
+        prob, comp = build(points * 2, eval_cache_size=2)
+        prob.run_driver()
+        self.assertEqual(comp.iter_count, 6)
+
+        # start from the recorded cases
+        prob, comp = build(points + [[('x', .5), ('y', .5)]], eval_cache_size=10,
+                           eval_cache_file='cases.sql')
+        prob.run_driver()
+        self.assertEqual(comp.iter_count, 1)
+        self.assertEqual(prob.driver.get_eval_cache_stats()['hits'], 3)
+
+        # disabled by default
+        prob, comp = build(points * 2)
+        prob.run_driver()
+        self.assertEqual(comp.iter_count, 6)
+        self.assertEqual(prob.driver.get_eval_cache_stats(), None)
+
+    def test_generators_stream_cases(self):
+        from itertools import islice
+
+        prob = Problem()
+        model = prob.model
+
+        model.add_subsystem('p', IndepVarComp('x', np.zeros(10)), promotes=['x'])
+        model.add_design_var('x', lower=0.0, upper=np.arange(1., 11.))
+
+        prob.setup()
+
+        # 10**10 cases, generated as they are needed
+        case_gen = FullFactorialGenerator(levels=10)
+        cases = list(islice(case_gen(model.get_design_vars(recurse=True)), 1001, 1003))
+
+        # the first variable varies fastest, each over 10 levels from 0 to its upper bound
+        assert_rel_error(self, cases[0][0][1], [1./9, 0., 0., 4./9] + [0.] * 6, 1e-10)
+        assert_rel_error(self, cases[1][0][1], [2./9, 0., 0., 4./9] + [0.] * 6, 1e-10)
+
+    def test_resume(self):
+        def build(cases, resume):
+            prob = Problem()
+            model = prob.model
+
+            model.add_subsystem('p1', IndepVarComp('x', 0.0), promotes=['x'])
+            model.add_subsystem('p2', IndepVarComp('y', 0.0), promotes=['y'])
+            comp = model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy')
+
+            prob.driver = DOEDriver(cases, resume=resume)
+            prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+            prob.setup()
+            return prob, comp
+
+        cases = [[('x', float(x)), ('y', float(y))] for x in range(3) for y in range(3)]
+
+        # a run that stopped after 4 cases
+        prob, comp = build(cases[:4], resume=False)
+        prob.run_driver()
+        prob.cleanup()
+        self.assertEqual(comp.iter_count, 4)
+
+        # only the remaining cases are run, and they are added to the file
+        prob, comp = build(cases, resume=True)
+        prob.run_driver()
+        prob.cleanup()
+        self.assertEqual(comp.iter_count, 5)
+        self.assertEqual(prob.driver.iter_count, 9)
+
+        cr = CaseReader("cases.sql").driver_cases
+        self.assertEqual(cr.num_cases, 9)
+        for i in range(cr.num_cases):
+            coord = cr.get_iteration_coordinate(i)
+            self.assertEqual(coord, 'rank0:DOEDriver_List|%d' % i)
+            outputs = cr.get_case(coord).outputs
+            x, y = cases[i][0][1], cases[i][1][1]
+            self.assertEqual(outputs['x'], x)
+            self.assertEqual(outputs['y'], y)
+            assert_rel_error(self, outputs['f_xy'],
+                             (x - 3.)**2 + x * y + (y + 4.)**2 - 3., 1e-10)
+
+        # nothing left to run
+        prob, comp = build(cases, resume=True)
+        prob.run_driver()
+        prob.cleanup()
+        self.assertEqual(comp.iter_count, 0)
+        self.assertEqual(CaseReader("cases.sql").driver_cases.num_cases, 9)
+
+        # without resume, the file is replaced
+        prob, comp = build(cases[:2], resume=False)
+        prob.run_driver()
+        prob.cleanup()
+        self.assertEqual(comp.iter_count, 2)
+        self.assertEqual(CaseReader("cases.sql").driver_cases.num_cases, 2)
+
+    def test_resume_interrupted(self):
+        class InterruptedParaboloid(Paraboloid):
+            def initialize(self):
+                self.interrupt = False
+
+            def compute(self, inputs, outputs):
+                if self.interrupt and inputs['x'] == 1. and inputs['y'] == 1.:
+                    raise KeyboardInterrupt()
+                super(InterruptedParaboloid, self).compute(inputs, outputs)
+
+        def build(cases, resume):
+            prob = Problem()
+            model = prob.model
+
+            model.add_subsystem('p1', IndepVarComp('x', 0.0), promotes=['x'])
+            model.add_subsystem('p2', IndepVarComp('y', 0.0), promotes=['y'])
+            comp = model.add_subsystem('comp', InterruptedParaboloid(),
+                                       promotes=['x', 'y', 'f_xy'])
+
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy')
+
+            prob.driver = DOEDriver(cases, resume=resume)
+            prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+            prob.setup()
+            return prob, comp
+
+        cases = [[('x', float(x)), ('y', float(y))] for x in range(3) for y in range(3)]
+
+        # the run is interrupted during case 4, which isn't recorded
+        prob, comp = build(cases, resume=False)
+        comp.interrupt = True
+        with self.assertRaises(KeyboardInterrupt):
+            prob.run_driver()
+        prob.cleanup()
+        self.assertEqual(CaseReader("cases.sql").driver_cases.num_cases, 4)
+
+        # a case that failed is run again too
+        with sqlite3.connect("cases.sql") as con:
+            con.execute("UPDATE driver_iterations SET success = 0 "
+                        "WHERE iteration_coordinate = 'rank0:DOEDriver_List|2'")
+        con.close()
+
+        prob, comp = build(cases, resume=True)
+        prob.run_driver()
+        prob.cleanup()
+        self.assertEqual(comp.iter_count, 6)
+
+        # the record of the failed case is replaced by the one of its new run
+        cr = CaseReader("cases.sql").driver_cases
+        self.assertEqual(cr.num_cases, 9)
+        coords = [cr.get_iteration_coordinate(i) for i in range(cr.num_cases)]
+        self.assertEqual([int(coord.split('|')[-1]) for coord in coords],
+                         [0, 1, 3, 2, 4, 5, 6, 7, 8])
+
+        case = cr.get_case('rank0:DOEDriver_List|4')
+        self.assertTrue(case.success)
+        assert_rel_error(self, case.outputs['f_xy'], (1. - 3.)**2 + 1. + (1. + 4.)**2 - 3., 1e-10)
+
+    def test_resume_failed(self):
+        class FailingParaboloid(Paraboloid):
+            def initialize(self):
+                self.fail = False
+
+            def compute(self, inputs, outputs):
+                if self.fail and inputs['x'] == 0. and inputs['y'] == 2.:
+                    raise AnalysisError("bad point")
+                super(FailingParaboloid, self).compute(inputs, outputs)
+
+        def build(resume):
+            prob = Problem()
+            model = prob.model
+
+            model.add_subsystem('p1', IndepVarComp('x', 0.0), promotes=['x'])
+            model.add_subsystem('p2', IndepVarComp('y', 0.0), promotes=['y'])
+            comp = model.add_subsystem('comp', FailingParaboloid(), promotes=['x', 'y', 'f_xy'])
+
+            model.add_design_var('x', lower=0.0, upper=2.0)
+            model.add_design_var('y', lower=0.0, upper=2.0)
+            model.add_objective('f_xy')
+
+            prob.driver = DOEDriver(ListGenerator(cases), resume=resume)
+            prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+            prob.setup()
+            return prob, comp
+
+        cases = [[('x', 0.), ('y', float(y))] for y in range(4)]
+
+        # case 2 fails
+        prob, comp = build(resume=False)
+        comp.fail = True
+        prob.run_driver()
+        prob.cleanup()
+
+        case = CaseReader("cases.sql").driver_cases.get_case('rank0:DOEDriver_List|2')
+        self.assertFalse(case.success)
+
+        # only case 2 is run again, and its new results are read back
+        prob, comp = build(resume=True)
+        prob.run_driver()
+        prob.cleanup()
+        self.assertEqual(comp.iter_count, 1)
+
+        cr = CaseReader("cases.sql").driver_cases
+        self.assertEqual(cr.list_cases().count('rank0:DOEDriver_List|2'), 1)
+        self.assertEqual(cr.num_cases, 4)
+
+        case = cr.get_case('rank0:DOEDriver_List|2')
+        self.assertTrue(case.success)
+        self.assertEqual(case.outputs['y'], 2.)
+        assert_rel_error(self, case.outputs['f_xy'], 9. + 36. - 3., 1e-10)
+
+
+@unittest.skipUnless(PY3, "The 'processes' backend requires Python 3.")
+class TestDOEDriverProcesses(unittest.TestCase):
+
+    def setUp(self):
+        self.startdir = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(prefix='TestDOEDriverProcesses-')
+        os.chdir(self.tempdir)
+
+    def tearDown(self):
+        os.chdir(self.startdir)
+        try:
+            shutil.rmtree(self.tempdir)
+        except OSError:
+            pass
+
+    def _run(self, comp_class, cases, **options):
+        prob = Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', comp_class(), promotes=['x', 'y', 'f_xy'])
+
+        model.add_design_var('x', lower=-10.0, upper=10.0)
+        model.add_design_var('y', lower=-10.0, upper=10.0)
+        model.add_objective('f_xy')
+
+        prob.driver = DOEDriver(cases, run_parallel=True, parallel_backend='processes',
+                                **options)
+        prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cases = CaseReader("cases.sql").driver_cases
+        return prob, {int(cases.get_iteration_coordinate(i).split('|')[-1]): cases.get_case(i)
+                      for i in range(cases.num_cases)}
+
+    def test_list(self):
+        cases = [[('x', x), ('y', y)] for x in (-1., 0., 1.) for y in (-1., 0., 1.)]
+
+        prob, recorded = self._run(Paraboloid, cases, num_workers=3)
+
+        self.assertEqual(prob.driver.iter_count, 9)
+        self.assertEqual(sorted(recorded), list(range(9)))
+
+        for icase, case in enumerate(cases):
+            x, y = case[0][1], case[1][1]
+            outputs = recorded[icase].outputs
+            self.assertTrue(recorded[icase].success)
+            assert_rel_error(self, outputs['x'], x, 1e-15)
+            assert_rel_error(self, outputs['y'], y, 1e-15)
+            assert_rel_error(self, outputs['f_xy'],
+                             (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0, 1e-15)
+
+    def test_failure_and_timeout(self):
+        cases = [[('x', x), ('y', 0.)] for x in (0., 1., 2., 3.)]
+
+        start = time.time()
+        prob, recorded = self._run(ParaboloidWithTrouble, cases, num_workers=2, case_timeout=2.)
+        self.assertLess(time.time() - start, 30.)
+
+        self.assertEqual(sorted(recorded), [0, 1, 2, 3])
+
+        self.assertTrue(recorded[0].success)
+        assert_rel_error(self, recorded[0].outputs['f_xy'], 22., 1e-15)
+
+        self.assertFalse(recorded[1].success)
+        self.assertTrue("x can't be 1" in recorded[1].msg)
+
+        self.assertFalse(recorded[2].success)
+        self.assertEqual(recorded[2].msg, "Case timed out after 2 seconds.")
+        assert_rel_error(self, recorded[2].outputs['x'], 2., 1e-15)
+
+        # the responses of the previous case of the worker aren't recorded for this one
+        self.assertTrue(np.all(np.isnan(recorded[2].outputs['f_xy'])))
+
+        # the replacement worker runs the remaining cases
+        self.assertTrue(recorded[3].success)
+        assert_rel_error(self, recorded[3].outputs['f_xy'], 13., 1e-15)
+
 
 @unittest.skipUnless(PETScVector, "PETSc is required.")
 class TestParallelDOE(unittest.TestCase):
@@ -1121,6 +1517,170 @@ class TestParallelDOE(unittest.TestCase):
         self.assertEqual(sum(num_cases), len(expected))
 
 
+@unittest.skipUnless(PETScVector, "PETSc is required.")
+class TestParallelDOELoadBalanced(unittest.TestCase):
+
+    N_PROCS = 5
+
+    def setUp(self):
+        self.startdir = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(prefix='TestDOEDriver-')
+        os.chdir(self.tempdir)
+
+    def tearDown(self):
+        os.chdir(self.startdir)
+        try:
+            shutil.rmtree(self.tempdir)
+        except OSError:
+            pass
+
+    def _get_recorded(self, prob, output, recording):
+        """
+        Return the cases recorded on this proc, keyed by case index, and check the messages.
+        """
+        rank = prob.comm.rank
+        filename = "cases.sql_%d" % rank
+
+        if not recording:
+            self.assertFalse("Cases from rank %d are being written" % rank in output)
+            return {}
+
+        expect_msg = "Cases from rank %d are being written to %s." % (rank, filename)
+        self.assertTrue(expect_msg in output)
+
+        cases = CaseReader(filename).driver_cases
+        return {int(cases.get_iteration_coordinate(i).split('|')[-1]): cases.get_case(i)
+                for i in range(cases.num_cases)}
+
+    def test_indivisible_error(self):
+        prob = Problem()
+
+        prob.driver = DOEDriver(FullFactorialGenerator(levels=3))
+        prob.driver.options['run_parallel'] = True
+        prob.driver.options['load_balance'] = True
+        prob.driver.options['procs_per_model'] = 3
+
+        with self.assertRaises(RuntimeError) as context:
+            prob.setup()
+
+        self.assertEqual(str(context.exception),
+                         "With load balancing, one processor hands out the cases, so the total "
+                         "number of processors minus one must be a nonzero multiple of the "
+                         "number of processors per model.\n Provide 3*n + 1 processors, or "
+                         "specify a number of processors per model that divides into 4.")
+
+    def test_full_factorial(self):
+        prob = Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = DOEDriver(FullFactorialGenerator(levels=3), procs_per_model=1,
+                                run_parallel=True, load_balance=True)
+        prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+
+        prob.setup()
+
+        failed, output = run_driver(prob)
+        self.assertFalse(failed)
+
+        prob.cleanup()
+
+        self.assertEqual(prob.driver.iter_count, 9)
+
+        # rank 0 only hands out the cases
+        recorded = self._get_recorded(prob, output, prob.comm.rank > 0)
+
+        for idx, case in recorded.items():
+            x = .5 * (idx % 3)
+            y = .5 * (idx // 3)
+            outputs = case.outputs
+            self.assertEqual(outputs['x'], x)
+            self.assertEqual(outputs['y'], y)
+            assert_rel_error(self, outputs['f_xy'], (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0,
+                             1e-15)
+
+        # every case is recorded exactly once across all procs
+        all_idxs = sorted(idx for idxs in prob.comm.allgather(list(recorded)) for idx in idxs)
+        self.assertEqual(all_idxs, list(range(9)))
+
+    def test_fan_in_grouped(self):
+        # run 2 cases at a time, each using 2 of our 5 procs
+        prob = Problem(FanInGrouped())
+        model = prob.model
+
+        model.add_design_var('iv.x1', lower=0.0, upper=1.0)
+        model.add_design_var('iv.x2', lower=0.0, upper=1.0)
+
+        model.add_objective('c3.y')
+
+        prob.driver = DOEDriver(FullFactorialGenerator(levels=3), run_parallel=True,
+                                load_balance=True, procs_per_model=2)
+        prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+
+        prob.setup()
+
+        failed, output = run_driver(prob)
+        self.assertFalse(failed)
+
+        prob.cleanup()
+
+        # ranks 1 and 2 are the roots of the two models
+        recorded = self._get_recorded(prob, output, prob.comm.rank in (1, 2))
+
+        for idx, case in recorded.items():
+            x1 = .5 * (idx % 3)
+            x2 = .5 * (idx // 3)
+            outputs = case.outputs
+            self.assertEqual(outputs['iv.x1'], x1)
+            self.assertEqual(outputs['iv.x2'], x2)
+            assert_rel_error(self, outputs['c3.y'], 35. * x2 - 6. * x1, 1e-15)
+
+        all_idxs = sorted(idx for idxs in prob.comm.allgather(list(recorded)) for idx in idxs)
+        self.assertEqual(all_idxs, list(range(9)))
+
+    def test_case_error_on_all_model_procs(self):
+        # a case that can't be set fails on both procs of its model, and the run goes on
+        prob = Problem(FanInGrouped())
+        model = prob.model
+
+        model.add_design_var('iv.x1', lower=0.0, upper=1.0)
+        model.add_design_var('iv.x2', lower=0.0, upper=1.0)
+
+        model.add_objective('c3.y')
+
+        cases = [[('iv.x1', x1), ('iv.x2', 0.5)] for x1 in (0.0, 0.5, 1.0)]
+        cases.insert(1, [('iv.x1', np.ones(2)), ('iv.x2', 0.5)])
+
+        prob.driver = DOEDriver(ListGenerator(cases), run_parallel=True, load_balance=True,
+                                procs_per_model=2)
+        prob.driver.add_recorder(SqliteRecorder("cases.sql"))
+
+        prob.setup()
+
+        failed, output = run_driver(prob)
+        self.assertFalse(failed)
+
+        prob.cleanup()
+
+        if prob.comm.rank == 0:
+            self.assertEqual(output.count('A case failed:'), 1)
+            self.assertTrue('rank 0:' in output)
+            self.assertTrue('rank 1:' in output)
+            self.assertTrue('Error assigning iv.x1' in output)
+
+        recorded = self._get_recorded(prob, output, prob.comm.rank in (1, 2))
+
+        all_idxs = sorted(idx for idxs in prob.comm.allgather(list(recorded)) for idx in idxs)
+        self.assertEqual(all_idxs, [0, 2, 3])
+
+
 class TestDOEDriverFeature(unittest.TestCase):
 
     def setUp(self):
@@ -255,6 +255,46 @@ class TestSimpleGA(unittest.TestCase):
         # prob.run_driver()
         self.assertRaises(ValueError, prob.run_driver)
 
+    def test_eval_cache(self):
+        def build(eval_cache_size):
+            prob = Problem()
+            model = prob.model
+            indeps = model.add_subsystem('indeps', IndepVarComp(), promotes=['*'])
+            indeps.add_output('x', 0.0)
+            indeps.add_output('y', 0.0)
+            model.add_subsystem('comp', ExecComp(['f = (x - 3.)**2 + (y + 1.)**2', 'c = x + y']),
+                                promotes=['*'])
+
+            model.add_design_var('x', lower=-10., upper=10.)
+            model.add_design_var('y', lower=-10., upper=10.)
+            model.add_objective('f')
+            model.add_constraint('c', upper=1.)
+
+            driver = prob.driver = SimpleGADriver(max_gen=20, pop_size=20, bits={'y': 8},
+                                                  eval_cache_size=eval_cache_size)
+            driver._randomstate = 1
+
+            prob.setup(check=False)
+            return prob
+
+        np.random.seed(1)
+        prob = build(0)
+        prob.run_driver()
+
+        np.random.seed(1)
+        cprob = build(1000)
+        cprob.run_driver()
+
+        # revisited points are not evaluated again, but the GA follows the same path
+        assert_rel_error(self, cprob['x'], prob['x'], 1e-15)
+        assert_rel_error(self, cprob['y'], prob['y'], 1e-15)
+        assert_rel_error(self, cprob['f'], prob['f'], 1e-15)
+
+        stats = cprob.driver.get_eval_cache_stats()
+        self.assertEqual(stats['hits'] + stats['misses'] + 1, prob.model.comp.iter_count)
+        self.assertEqual(stats['misses'] + 1, cprob.model.comp.iter_count)
+        self.assertGreater(stats['hits'], 0)
+
     def test_encode_and_decode(self):
         ga = GeneticAlgorithm(None)
         gen = np.array([[0, 0, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 0, 0, 1, 1,
@@ -280,6 +320,83 @@ class TestSimpleGA(unittest.TestCase):
         np.testing.assert_array_almost_equal(gen[1], ga.encode(x[1], vlb, vub, bits))
 
 
+class TestVectorizedSimpleGA(unittest.TestCase):
+
+    def _build(self, pop_size, vectorized):
+        nrows = pop_size if vectorized else 1
+
+        prob = Problem()
+        model = prob.model
+        indeps = model.add_subsystem('indeps', IndepVarComp(), promotes=['*'])
+        indeps.add_output('x', np.zeros(nrows))
+        indeps.add_output('y', np.zeros(nrows))
+        model.add_subsystem('comp', ExecComp(['f = (x - 3.)**2 + (y + 1.)**2', 'c = x + y'],
+                                             vectorize=True, x=np.zeros(nrows),
+                                             y=np.zeros(nrows), f=np.zeros(nrows),
+                                             c=np.zeros(nrows)),
+                            promotes=['*'])
+
+        model.add_design_var('x', lower=-10., upper=10.)
+        model.add_design_var('y', lower=-10., upper=10.)
+        model.add_objective('f')
+        model.add_constraint('c', upper=1.)
+
+        driver = prob.driver = SimpleGADriver()
+        driver._randomstate = 1
+        driver.options['bits'] = {'y': 8}
+        driver.options['max_gen'] = 20
+        driver.options['pop_size'] = pop_size
+        driver.options['vectorized_model'] = vectorized
+
+        prob.setup(check=False)
+        return prob
+
+    def test_vectorized_model(self):
+        np.random.seed(1)
+        prob = self._build(20, False)
+        prob.run_driver()
+
+        np.random.seed(1)
+        vprob = self._build(20, True)
+        vprob.run_driver()
+
+        # the same points are visited, so the results are identical
+        assert_rel_error(self, vprob['x'], np.full(20, prob['x'][0]), 1e-15)
+        assert_rel_error(self, vprob['y'], np.full(20, prob['y'][0]), 1e-15)
+        assert_rel_error(self, vprob['f'], np.full(20, prob['f'][0]), 1e-15)
+
+        # one model execution per generation, plus the final one
+        self.assertEqual(vprob.model.comp.iter_count, 22)
+
+    def test_vectorized_model_bad_pop_size(self):
+        prob = self._build(20, True)
+        prob.driver.options['pop_size'] = 8
+
+        with self.assertRaises(ValueError) as cm:
+            prob.run_driver()
+        self.assertEqual(str(cm.exception),
+                         "Leading dimension of design var 'indeps.x' (20,) is not equal to "
+                         "pop_size (8).")
+
+    def test_vectorized_model_bad_leading_dim(self):
+        # the size is divisible by pop_size, but the rows aren't population members
+        prob = Problem()
+        prob.model.add_subsystem('indeps', IndepVarComp('x', np.zeros((3, 4))), promotes=['*'])
+        prob.model.add_subsystem('comp', ExecComp('f = sum(x**2)', x=np.zeros((3, 4))),
+                                 promotes=['*'])
+        prob.model.add_design_var('x', lower=-10., upper=10.)
+        prob.model.add_objective('f')
+
+        prob.driver = SimpleGADriver(pop_size=4, vectorized_model=True)
+        prob.setup(check=False)
+
+        with self.assertRaises(ValueError) as cm:
+            prob.run_driver()
+        self.assertEqual(str(cm.exception),
+                         "Leading dimension of design var 'indeps.x' (3, 4) is not equal to "
+                         "pop_size (4).")
+
+
 class TestDriverOptionsSimpleGA(unittest.TestCase):
 
     def test_driver_options(self):
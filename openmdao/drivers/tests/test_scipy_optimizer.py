@@ -1086,6 +1086,104 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         prob.driver.run()
         self.assertEqual(len(prob.driver._lincongrad_cache), 1)
 
+    def test_flat_vois_indices_scaling(self):
+        # design vars and constraints with indices and scaling are mapped to flat arrays
+        # correctly, with mixed equality, double-sided and linear constraints.
+        for optimizer in ('SLSQP', 'COBYLA'):
+            prob = Problem()
+            model = prob.model
+
+            ivc = model.add_subsystem('p', IndepVarComp())
+            ivc.add_output('x', np.zeros(4))
+            ivc.add_output('z', np.zeros(2))
+            model.add_subsystem('comp', ExecComp(['f = sum((x - 3.0)**2) + sum((z - 1.0)**2)',
+                                                  'g = 2.0 * x', 'h = z[0] + z[1]',
+                                                  'd = z[0] - z[1]'],
+                                                 x=np.zeros(4), g=np.zeros(4), z=np.zeros(2)))
+            model.connect('p.x', 'comp.x')
+            model.connect('p.z', 'comp.z')
+
+            model.add_design_var('p.x', indices=[0, 1, 3], lower=-10.0, upper=10.0, ref=2.0)
+            model.add_design_var('p.z', lower=-10.0, upper=10.0, adder=1.0)
+            model.add_objective('comp.f')
+            model.add_constraint('comp.g', indices=[3, 0, 1], lower=-2.0, upper=4.0, ref=4.0)
+            if optimizer == 'SLSQP':
+                model.add_constraint('comp.h', equals=4.0)
+            else:
+                model.add_constraint('comp.h', lower=4.0)
+            model.add_constraint('comp.d', upper=0.0, linear=True)
+
+            prob.driver = ScipyOptimizeDriver(optimizer=optimizer, tol=1e-9, disp=False)
+            prob.setup(check=False)
+            prob.run_driver()
+
+            tol = 1e-6 if optimizer == 'SLSQP' else 1e-4
+            assert_rel_error(self, prob['p.x'], [2.0, 2.0, 0.0, 2.0], tol)
+            assert_rel_error(self, prob['p.z'], [2.0, 2.0], tol)
+
+            # the flat array of constraint values matches the individual values
+            driver = prob.driver
+            flat = driver._get_flat_constraint_values()
+            expected = np.concatenate(list(driver.get_constraint_values().values()))
+            assert_rel_error(self, flat, expected, 1e-15)
+
+            # each index of the double-sided constraint gives a lower bound row, then an upper
+            # bound row, as with one scipy constraint per index
+            srcs, signs, offsets = driver._con_rows['ineq'][:3]
+            assert_rel_error(self, signs[:6], [1.0, -1.0] * 3, 1e-15)
+            assert_rel_error(self, offsets[:6], [0.5, 1.0] * 3, 1e-15)
+            self.assertEqual(list(srcs[:6]), [0, 0, 1, 1, 2, 2])
+
+    def test_callback_cache(self):
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('p1', IndepVarComp('x', 50.0), promotes=['*'])
+        model.add_subsystem('p2', IndepVarComp('y', 50.0), promotes=['*'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('con', ExecComp('c = - x + y'), promotes=['*'])
+
+        prob.set_solver_print(level=0)
+
+        prob.driver = ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+
+        model.add_design_var('x', lower=-50.0, upper=50.0)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0)
+
+        prob.setup(check=False)
+
+        failed = prob.run_driver()
+        self.assertFalse(failed, "Optimization failed, result =\n" +
+                                 str(prob.driver.result))
+        assert_rel_error(self, prob['x'], 7.16667, 1e-6)
+        assert_rel_error(self, prob['y'], -7.833334, 1e-6)
+
+        # every model run is a distinct design point, and is recorded as an iteration
+        driver = prob.driver
+        stats = driver.get_cache_stats()
+        self.assertEqual(stats['model_runs'], driver.iter_count)
+        self.assertGreater(stats['model_hits'], 0)
+        self.assertLessEqual(stats['totals_runs'], stats['model_runs'])
+
+        # the gradient is requested before the function at a new point
+        x = np.array([3.0, -2.0])
+        runs = stats['model_runs']
+        totals_runs = stats['totals_runs']
+        grad = driver._gradfunc(x)
+        assert_rel_error(self, grad, [2.0 * (3.0 - 3.0) + (-2.0), 2.0 * (-2.0 + 4.0) + 3.0],
+                         1e-8)
+        assert_rel_error(self, driver._objfunc(x), (3.0 - 3.0)**2 + 3.0 * -2.0 +
+                         (-2.0 + 4.0)**2 - 3.0, 1e-8)
+        assert_rel_error(self, driver._confunc(x, 'ineq'), [-15.0 - (-3.0 - 2.0)], 1e-8)
+        assert_rel_error(self, driver._congradfunc(x, 'ineq'), [[1.0, -1.0]], 1e-8)
+
+        # the point is run and differentiated exactly once
+        stats = driver.get_cache_stats()
+        self.assertEqual(stats['model_runs'], runs + 1)
+        self.assertEqual(stats['totals_runs'], totals_runs + 1)
+
 
 class TestScipyOptimizeDriverFeatures(unittest.TestCase):
 
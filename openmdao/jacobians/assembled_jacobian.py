@@ -55,6 +55,12 @@ class AssembledJacobian(Jacobian):
     _has_overlapping_partials : bool
         If True, this jacobian contains subjacobians that overlap, which happens when a single
         source connects to multiple inputs on the same component.
+    _fold_scaling : tuple or None
+        Factors (row_scale, col_scale) folded into the matrices after each update, so that they
+        hold the derivatives of the normalized residuals with respect to the normalized outputs.
+        None if the matrices hold the physical derivatives.
+    _fold_scaling_sq : tuple or None
+        Squares of the folded row and column factors, used by reverse products and solves.
     """
 
     def __init__(self, matrix_class, system):
@@ -82,8 +88,10 @@ class AssembledJacobian(Jacobian):
         self._in_ranges = None
         self._out_ranges = None
         self._has_overlapping_partials = False
+        self._fold_scaling = None
+        self._fold_scaling_sq = None
 
-        self._subjac_iters = defaultdict(lambda: None)
+        self._subjac_iters = {}
         self._init_ranges(system)
 
     def _init_ranges(self, system):
@@ -200,6 +208,36 @@ class AssembledJacobian(Jacobian):
 
         self._ext_mtx[system.pathname] = ext_mtx
 
+        if system.options['fold_scaling']:
+            self._init_fold_scaling(system)
+
+    def _init_fold_scaling(self, system):
+        """
+        Compute the factors that fold the output and residual scaling into the matrices.
+
+        In fwd mode, the normalized residuals change by the product of the folded matrix with
+        the normalized outputs. The rows are multiplied by the 'norm' factors of the residuals
+        and the columns by the 'phys' factors of the outputs. Inputs are not scaled in the
+        matrix-vector products, so the columns of the external matrices are left unscaled.
+
+        Parameters
+        ----------
+        system : System
+            Parent system to this jacobian.
+        """
+        row_scale = col_scale = None
+        if system._has_resid_scaling:
+            row_scale = system._vectors['residual']['linear']._scaling['norm'][1]
+        if system._has_output_scaling:
+            col_scale = system._vectors['output']['linear']._scaling['phys'][1]
+
+        if row_scale is None and col_scale is None:
+            return
+
+        self._fold_scaling = (row_scale, col_scale)
+        self._fold_scaling_sq = tuple(None if scale is None else scale * scale
+                                      for scale in self._fold_scaling)
+
     def _init_view(self, system):
         """
         Determine the _ext_mtx for a sub-view of the assembled jacobian.
@@ -274,7 +312,7 @@ class AssembledJacobian(Jacobian):
     def _get_subjac_iters(self, system):
         global _empty_dict
 
-        subjac_iters = self._subjac_iters[system.pathname]
+        subjac_iters = self._subjac_iters.get(system.pathname)
         if subjac_iters is None:
             keymap = self._keymap
             int_mtx = self._int_mtx
@@ -363,10 +401,63 @@ class AssembledJacobian(Jacobian):
             for key in iters_in_ext:
                 ext_mtx._update_submat(key, subjacs[key]['value'])
 
+        if self._fold_scaling is not None:
+            row_scale, col_scale = self._fold_scaling
+            int_mtx._scale(row_scale, col_scale)
+            if ext_mtx is not None:
+                ext_mtx._scale(row_scale, None)
+
     def _apply(self, system, d_inputs, d_outputs, d_residuals, mode):
         """
         Compute matrix-vector product.
 
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        d_inputs : Vector
+            inputs linear vector.
+        d_outputs : Vector
+            outputs linear vector.
+        d_residuals : Vector
+            residuals linear vector.
+        mode : str
+            'fwd' or 'rev'.
+        """
+        if self._fold_scaling is None:
+            # the matrices hold physical derivatives
+            with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+                self._apply_matrices(system, d_inputs, d_outputs, d_residuals, mode)
+        else:
+            self._apply_matrices(system, d_inputs, d_outputs, d_residuals, mode)
+
+    def _get_rev_scaling(self, ncol):
+        """
+        Return the squares of the folded row and column factors, shaped for the linear vectors.
+
+        In rev mode, the normalized residuals are divided by the squared row factors before the
+        product with the transposed folded matrix, and the product is divided by the squared
+        column factors. A reverse solve multiplies by them instead.
+
+        Parameters
+        ----------
+        ncol : int
+            Number of columns of the linear vectors.
+
+        Returns
+        -------
+        tuple of (ndarray or None, ndarray or None)
+            Squared row and column factors, or None where there is no scaling.
+        """
+        if ncol == 1:
+            return self._fold_scaling_sq
+        return tuple(None if scale is None else scale[:, np.newaxis]
+                     for scale in self._fold_scaling_sq)
+
+    def _apply_matrices(self, system, d_inputs, d_outputs, d_residuals, mode):
+        """
+        Compute the matrix-vector product with the vectors in the state the matrices expect.
+
         Parameters
         ----------
         system : System
@@ -386,41 +477,45 @@ class AssembledJacobian(Jacobian):
         ranges = self._view_ranges[system.pathname]
         int_ranges = (ranges[0], ranges[1], ranges[0], ranges[1])
 
-        # TODO: remove the _unscaled_context call here (and in DictionaryJacobian)
-        # and do it outside so that we can avoid an unnecessary extra unscaling/rescaling
-        # in _apply_linear
-        with system._unscaled_context(
-                outputs=[d_outputs], residuals=[d_residuals]):
-            if mode == 'fwd':
-                if d_outputs._names and d_residuals._names:
-                    d_residuals._data += int_mtx._prod(d_outputs._data, mode, int_ranges)
-
-                if ext_mtx is not None and d_inputs._names and d_residuals._names:
-
-                    # Masking
-                    try:
-                        mask = self._mask_caches[d_inputs._names]
-                    except KeyError:
-                        mask = ext_mtx._create_mask_cache(d_inputs)
-                        self._mask_caches[d_inputs._names] = mask
-
-                    d_residuals._data += ext_mtx._prod(d_inputs._data, mode, None, mask=mask)
-
-            else:  # rev
-                dresids = d_residuals._data
-                if d_outputs._names and d_residuals._names:
+        if mode == 'fwd':
+            if d_outputs._names and d_residuals._names:
+                d_residuals._data += int_mtx._prod(d_outputs._data, mode, int_ranges)
+
+            if ext_mtx is not None and d_inputs._names and d_residuals._names:
+
+                # Masking
+                try:
+                    mask = self._mask_caches[d_inputs._names]
+                except KeyError:
+                    mask = ext_mtx._create_mask_cache(d_inputs)
+                    self._mask_caches[d_inputs._names] = mask
+
+                d_residuals._data += ext_mtx._prod(d_inputs._data, mode, None, mask=mask)
+
+        else:  # rev
+            dresids = d_residuals._data
+            row_sq = col_sq = None
+            if self._fold_scaling is not None:
+                row_sq, col_sq = self._get_rev_scaling(d_residuals._ncol)
+                if row_sq is not None:
+                    dresids = dresids / row_sq
+
+            if d_outputs._names and d_residuals._names:
+                if col_sq is None:
                     d_outputs._data += int_mtx._prod(dresids, mode, int_ranges)
+                else:
+                    d_outputs._data += int_mtx._prod(dresids, mode, int_ranges) / col_sq
 
-                if ext_mtx is not None and d_inputs._names and d_residuals._names:
+            if ext_mtx is not None and d_inputs._names and d_residuals._names:
 
-                    # Masking
-                    try:
-                        mask = self._mask_caches[d_inputs._names]
-                    except KeyError:
-                        mask = ext_mtx._create_mask_cache(d_inputs)
-                        self._mask_caches[d_inputs._names] = mask
+                # Masking
+                try:
+                    mask = self._mask_caches[d_inputs._names]
+                except KeyError:
+                    mask = ext_mtx._create_mask_cache(d_inputs)
+                    self._mask_caches[d_inputs._names] = mask
 
-                    d_inputs._data += ext_mtx._prod(dresids, mode, None, mask=mask)
+                d_inputs._data += ext_mtx._prod(dresids, mode, None, mask=mask)
 
 
 class DenseJacobian(AssembledJacobian):
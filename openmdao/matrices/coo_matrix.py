@@ -23,6 +23,9 @@ class COOMatrix(Matrix):
     _mat_range_cache : dict
         Dictionary of cached CSC matrices needed for solving on a sub-range of the
         parent CSC matrix.
+    _scale_factors : ndarray or None
+        Combined row and column factor of each entry of the data array, computed on the first
+        call to _scale.
     """
 
     def __init__(self, comm):
@@ -36,6 +39,7 @@ class COOMatrix(Matrix):
         """
         super(COOMatrix, self).__init__(comm)
         self._mat_range_cache = {}
+        self._scale_factors = None
 
     def _build_sparse(self, num_rows, num_cols):
         """
@@ -78,7 +82,17 @@ class COOMatrix(Matrix):
 
             if loc in locations:
                 ind1, ind2, otherkey = locations[loc]
-                if not (src_indices is None and (ind2 - ind1) == delta == full_size):
+                other_info, _, other_src_indices = submats[otherkey][:3]
+
+                # keys can share a range if they are both dense or both have the same sparsity
+                if src_indices is None and other_src_indices is None and rows is not None and \
+                        other_info['rows'] is not None:
+                    shared = (np.array_equal(rows, other_info['rows']) and
+                              np.array_equal(info['cols'], other_info['cols']))
+                else:
+                    shared = src_indices is None and (ind2 - ind1) == delta == full_size
+
+                if not shared:
                     raise RuntimeError("Keys %s map to the same sub-jacobian of a CSC or "
                                        "CSR partial jacobian and at least one of them is either "
                                        "not dense or uses src_indices.  This can occur when "
@@ -230,6 +244,29 @@ class COOMatrix(Matrix):
 
         self._matrix.data[idxs] += val
 
+    def _scale(self, row_scale, col_scale):
+        """
+        Multiply the rows and the columns of the matrix by the given factors, in place.
+
+        Parameters
+        ----------
+        row_scale : ndarray or None
+            factors multiplying the rows, or None to leave the rows unscaled.
+        col_scale : ndarray or None
+            factors multiplying the columns, or None to leave the columns unscaled.
+        """
+        if self._scale_factors is None:
+            # the coo form of a csc or csr matrix keeps the order of the data array
+            coo = self._matrix.tocoo()
+            factors = np.ones(coo.data.size)
+            if row_scale is not None:
+                factors *= row_scale[coo.row]
+            if col_scale is not None:
+                factors *= col_scale[coo.col]
+            self._scale_factors = factors
+
+        self._matrix.data *= self._scale_factors
+
     def _prod(self, in_vec, mode, ranges, mask=None):
         """
         Perform a matrix vector product.
@@ -128,6 +128,22 @@ class DenseMatrix(Matrix):
         else:
             self._matrix[irows, icols] += val
 
+    def _scale(self, row_scale, col_scale):
+        """
+        Multiply the rows and the columns of the matrix by the given factors, in place.
+
+        Parameters
+        ----------
+        row_scale : ndarray or None
+            factors multiplying the rows, or None to leave the rows unscaled.
+        col_scale : ndarray or None
+            factors multiplying the columns, or None to leave the columns unscaled.
+        """
+        if row_scale is not None:
+            self._matrix *= row_scale[:, np.newaxis]
+        if col_scale is not None:
+            self._matrix *= col_scale
+
     def _prod(self, in_vec, mode, ranges, mask=None):
         """
         Perform a matrix vector product.
@@ -95,6 +95,19 @@ class Matrix(object):
         """
         pass
 
+    def _scale(self, row_scale, col_scale):
+        """
+        Multiply the rows and the columns of the matrix by the given factors, in place.
+
+        Parameters
+        ----------
+        row_scale : ndarray or None
+            factors multiplying the rows, or None to leave the rows unscaled.
+        col_scale : ndarray or None
+            factors multiplying the columns, or None to leave the columns unscaled.
+        """
+        pass
+
     def _prod(self, vec, mode, ranges):
         """
         Perform a matrix vector product.
@@ -24,11 +24,14 @@ class BaseCases(object):
         Dictionary mapping promoted names to absolute names.
     _cases : dict
         Dictionary mapping iteration coordinates to cases that have already been loaded.
+    _var_layouts : dict or None
+        Dictionary mapping layout ids to numpy dtypes, for format versions that store variable
+        values as binary buffers.
     """
 
     __metaclass__ = ABCMeta
 
-    def __init__(self, filename, format_version, abs2prom, abs2meta, prom2abs):
+    def __init__(self, filename, format_version, abs2prom, abs2meta, prom2abs, var_layouts=None):
         """
         Initialize.
 
@@ -44,6 +47,8 @@ class BaseCases(object):
             Dictionary mapping absolute variable names to variable metadata.
         prom2abs : {'input': dict, 'output': dict}
             Dictionary mapping promoted names to absolute names.
+        var_layouts : dict or None
+            Dictionary mapping layout ids to numpy dtypes.
         """
         self._case_keys = ()
         self.num_cases = 0
@@ -53,6 +58,7 @@ class BaseCases(object):
         self._abs2meta = abs2meta
         self._prom2abs = prom2abs
         self._cases = {}
+        self._var_layouts = var_layouts
 
     @abstractmethod
     def get_case(self, case_id, scaled=False):
@@ -8,9 +8,9 @@ import os
 import re
 import sys
 import sqlite3
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
-from six import PY2, PY3, reraise
+from six import PY2, PY3, iteritems, reraise, string_types
 from six.moves import range
 
 import numpy as np
@@ -19,7 +19,8 @@ from openmdao.recorders.base_case_reader import BaseCaseReader
 from openmdao.recorders.case import DriverCase, SystemCase, SolverCase, ProblemCase, \
     PromotedToAbsoluteMap, DriverDerivativesCase
 from openmdao.recorders.cases import BaseCases
-from openmdao.utils.record_util import is_valid_sqlite3_db, json_to_np_array, convert_to_np_array
+from openmdao.utils.record_util import is_valid_sqlite3_db, json_to_np_array, \
+    convert_to_np_array, blob_to_np_array, layout_to_dtype
 from openmdao.recorders.sqlite_recorder import blob_to_array, format_version
 from openmdao.utils.write_outputs import write_outputs
 
@@ -34,6 +35,39 @@ elif PY3:
 _DEFAULT_OUT_STREAM = object()
 
 
+def _vars_to_array(val, format_version, abs2meta, var_layouts):
+    """
+    Convert the recorded values of a set of variables to a numpy named array.
+
+    Parameters
+    ----------
+    val : str or bytes or None
+        The value of a recorded inputs, outputs or residuals column.
+    format_version : int
+        The version of the format of the recorded file.
+    abs2meta : dict
+        Dictionary mapping absolute variable names to variable metadata.
+    var_layouts : dict or None
+        Dictionary mapping layout ids to numpy dtypes.
+
+    Returns
+    -------
+    array: numpy named array or None
+        Named array containing the recorded values.
+    """
+    if format_version >= 5:
+        if val is None:
+            return None
+        # non-numeric values are still recorded as JSON
+        if not isinstance(val, string_types):
+            return blob_to_np_array(val, var_layouts)
+        return json_to_np_array(val, abs2meta)
+    elif format_version >= 3:
+        return json_to_np_array(val, abs2meta)
+    else:
+        return blob_to_array(val)
+
+
 class SqliteCaseReader(BaseCaseReader):
     """
     A CaseReader specific to files created with SqliteRecorder.
@@ -61,6 +95,8 @@ class SqliteCaseReader(BaseCaseReader):
         Regular expression used for splitting iteration coordinates.
     _var_settings : dict
         Dictionary mapping absolute variable names to variable settings.
+    _var_layouts : dict or None
+        Dictionary mapping layout ids to numpy dtypes of the recorded binary buffers.
     """
 
     def __init__(self, filename):
@@ -103,6 +139,11 @@ class SqliteCaseReader(BaseCaseReader):
             self._prom2abs = None
             self._abs2meta = None
             self._var_settings = None
+            self._var_layouts = None
+
+            if self.format_version >= 5:
+                cur.execute("SELECT id, layout FROM var_layouts")
+                self._var_layouts = {row[0]: layout_to_dtype(json_loads(row[1])) for row in cur}
 
             if self.format_version >= 4:
                 self._var_settings = json_loads(row[4])
@@ -160,56 +201,38 @@ class SqliteCaseReader(BaseCaseReader):
         the individual cases/iterations from the recorded file.
         """
         self.driver_cases = DriverCases(self.filename, self.format_version, self._abs2prom,
-                                        self._abs2meta, self._prom2abs, self._var_settings)
+                                        self._abs2meta, self._prom2abs, self._var_settings,
+                                        self._var_layouts)
         self.driver_derivative_cases = DriverDerivativeCases(self.filename, self.format_version,
                                                              self._abs2prom, self._abs2meta,
                                                              self._prom2abs)
         self.system_cases = SystemCases(self.filename, self.format_version, self._abs2prom,
-                                        self._abs2meta, self._prom2abs)
+                                        self._abs2meta, self._prom2abs, self._var_layouts)
         self.solver_cases = SolverCases(self.filename, self.format_version, self._abs2prom,
-                                        self._abs2meta, self._prom2abs)
+                                        self._abs2meta, self._prom2abs, self._var_layouts)
         self.problem_cases = ProblemCases(self.filename, self.format_version, self._abs2prom,
-                                          self._abs2meta, self._prom2abs)
+                                          self._abs2meta, self._prom2abs, self._var_layouts)
 
         if self.format_version in range(1, format_version + 1):
             with sqlite3.connect(self.filename) as con:
 
-                # Read in iterations from Drivers, Systems, Problems, and Solvers
+                # Count iterations from Drivers, Systems, Problems, and Solvers. The iteration
+                # coordinates themselves are only queried when needed.
                 cur = con.cursor()
-                cur.execute("SELECT iteration_coordinate FROM driver_iterations ORDER BY id ASC")
-                rows = cur.fetchall()
-                self.driver_cases._case_keys = [coord[0] for coord in rows]
-                self.driver_cases.num_cases = len(self.driver_cases._case_keys)
+                self.driver_cases._count_cases(cur)
 
                 try:
-                    cur.execute("SELECT iteration_coordinate FROM driver_derivatives "
-                                "ORDER BY id ASC")
-                    rows = cur.fetchall()
-                    dcase = self.driver_derivative_cases
-                    dcase._case_keys = [coord[0] for coord in rows]
-                    dcase.num_cases = len(dcase._case_keys)
-
+                    self.driver_derivative_cases._count_cases(cur)
                 except sqlite3.OperationalError:
                     # Cases recorded in version 1 won't have a 'derivatives' table.
                     if self.format_version >= 2:
                         reraise(*sys.exc_info())
 
-                cur.execute("SELECT iteration_coordinate FROM system_iterations ORDER BY id ASC")
-                rows = cur.fetchall()
-                self.system_cases._case_keys = [coord[0] for coord in rows]
-                self.system_cases.num_cases = len(self.system_cases._case_keys)
-
-                cur.execute("SELECT iteration_coordinate FROM solver_iterations ORDER BY id ASC")
-                rows = cur.fetchall()
-                self.solver_cases._case_keys = [coord[0] for coord in rows]
-                self.solver_cases.num_cases = len(self.solver_cases._case_keys)
+                self.system_cases._count_cases(cur)
+                self.solver_cases._count_cases(cur)
 
                 try:
-                    cur.execute("SELECT case_name FROM problem_cases ORDER BY id ASC")
-                    rows = cur.fetchall()
-                    self.problem_cases._case_keys = [coord[0] for coord in rows]
-                    self.problem_cases.num_cases = len(self.problem_cases._case_keys)
-
+                    self.problem_cases._count_cases(cur)
                 except sqlite3.OperationalError:
                     # Cases recorded in some early iterations of version 1 won't have
                     # the 'problem_cases' table.
@@ -674,7 +697,7 @@ class SqliteCaseReader(BaseCaseReader):
             dictionary of global variable names to their values. None if no system iterations
             were recorded.
         """
-        coords = self.system_cases._case_keys
+        coords = self.system_cases.list_cases()
 
         # store the iteration coordinates without iteration numbers.
         # coord_map intializes each iter_key to False, indicating we haven't
@@ -694,7 +717,7 @@ class SqliteCaseReader(BaseCaseReader):
         # iterate over cases from end to start, unless we've grabbed values from
         # every system
         while not self._has_all_values(coord_map):
-            iteration = self.system_cases._case_keys[iteration_num]
+            iteration = coords[iteration_num]
             iteration_num -= 1
             split_iter = self._split_coordinate(iteration)
             iter_key = ':'.join(split_iter)
@@ -789,7 +812,316 @@ class SqliteCaseReader(BaseCaseReader):
                       'model', allprocs_abs_names)
 
 
-class DriverCases(BaseCases):
+class SqliteCases(BaseCases):
+    """
+    Cases stored in a table of a sqlite database, queried lazily.
+
+    Attributes
+    ----------
+    _first_id : int or None
+        The id of the first row of the table.
+    _contiguous : bool
+        True if the row ids of the table are contiguous, so the row of a case can be found
+        directly from its index.
+    """
+
+    _table = None
+    _key_column = 'iteration_coordinate'
+    _value_columns = ()
+
+    def __init__(self, filename, format_version, abs2prom, abs2meta, prom2abs, var_layouts=None):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the recording file from which to instantiate the case reader.
+        format_version : int
+            The version of the format assumed when loading the file.
+        abs2prom : {'input': dict, 'output': dict}
+            Dictionary mapping absolute names to promoted names.
+        abs2meta : dict
+            Dictionary mapping absolute variable names to variable metadata.
+        prom2abs : {'input': dict, 'output': dict}
+            Dictionary mapping promoted names to absolute names.
+        var_layouts : dict or None
+            Dictionary mapping layout ids to numpy dtypes.
+        """
+        super(SqliteCases, self).__init__(filename, format_version, abs2prom, abs2meta, prom2abs,
+                                          var_layouts)
+        self._first_id = None
+        self._contiguous = False
+
+    def _count_cases(self, cur):
+        """
+        Count the cases in the table without reading them.
+
+        Parameters
+        ----------
+        cur : sqlite3 cursor
+            Cursor used to query the database.
+        """
+        cur.execute("SELECT COUNT(*), MIN(id), MAX(id) FROM %s" % self._table)
+        count, first_id, last_id = cur.fetchone()
+
+        self.num_cases = count
+        self._first_id = first_id
+        self._contiguous = count > 0 and last_id - first_id + 1 == count
+
+    def list_cases(self):
+        """
+        Return a list of the case string identifiers available in this instance of the CaseReader.
+
+        Returns
+        -------
+        list
+            The case string identifiers.
+        """
+        if self.num_cases == 0:
+            return []
+
+        with sqlite3.connect(self.filename) as con:
+            cur = con.cursor()
+            cur.execute("SELECT %s FROM %s ORDER BY id ASC" % (self._key_column, self._table))
+            keys = [row[0] for row in cur]
+        con.close()
+
+        return keys
+
+    def get_iteration_coordinate(self, case_id):
+        """
+        Return the iteration coordinate.
+
+        Parameters
+        ----------
+        case_id : int or str
+            The integer index or string-identifier of the case.
+
+        Returns
+        -------
+        iteration_coordinate : str
+            The iteration coordinate.
+        """
+        if not isinstance(case_id, int):
+            # assume we were given the case string identifier
+            return case_id
+
+        # handle negative indices
+        index = case_id + self.num_cases if case_id < 0 else case_id
+        if index < 0 or index >= self.num_cases:
+            raise IndexError("case index %d is out of range for %d cases." %
+                             (case_id, self.num_cases))
+
+        with sqlite3.connect(self.filename) as con:
+            cur = con.cursor()
+            if self._contiguous:
+                cur.execute("SELECT %s FROM %s WHERE id=?" % (self._key_column, self._table),
+                            (self._first_id + index,))
+            else:
+                cur.execute("SELECT %s FROM %s ORDER BY id ASC LIMIT 1 OFFSET ?" %
+                            (self._key_column, self._table), (index,))
+            row = cur.fetchone()
+        con.close()
+
+        return row[0]
+
+    def iter_cases(self, batch_size=1000):
+        """
+        Iterate over all cases in the table, without keeping them in memory.
+
+        Parameters
+        ----------
+        batch_size : int
+            Number of rows fetched from the database at a time.
+
+        Yields
+        ------
+        Case
+            The next case, in recording order.
+        """
+        if self.num_cases == 0:
+            return
+
+        con = sqlite3.connect(self.filename)
+        try:
+            cur = con.cursor()
+            cur.execute("SELECT * FROM %s ORDER BY id ASC" % self._table)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._extract_case_from_row(row)
+        finally:
+            con.close()
+
+    def get_values(self, names, cases=None):
+        """
+        Get the values of the given variables across many cases, without creating Case objects.
+
+        All of the requested cases are read in a single scan of the table.
+
+        Parameters
+        ----------
+        names : str or list of str
+            Promoted or absolute names of the variables.
+        cases : None or int or slice or list of int
+            Indices of the cases to read. If None, all cases are read.
+
+        Returns
+        -------
+        OrderedDict
+            Dictionary mapping each name to an array of shape (n_cases,) + variable shape.
+            Entries for cases in which the variable was not recorded are NaN.
+        """
+        if isinstance(names, string_types):
+            names = [names]
+
+        indices = np.arange(self.num_cases)
+        if cases is not None:
+            indices = np.atleast_1d(indices[cases])
+
+        values = OrderedDict((name, None) for name in names)
+        if indices.size == 0:
+            for name in names:
+                values[name] = np.empty(0)
+            return values
+
+        # read every needed row once, in recording order
+        uniq, inverse = np.unique(indices, return_inverse=True)
+        rows = self._get_value_rows(uniq)
+        nrows = len(rows)
+
+        found = dict((name, np.zeros(nrows, dtype=bool)) for name in names)
+        field_maps = {}
+
+        def store(name, row_nums, vals):
+            if values[name] is None:
+                values[name] = np.full((nrows,) + vals.shape[1:], np.nan)
+            # a variable found in an earlier column (e.g. outputs) takes precedence
+            new = ~found[name][row_nums]
+            values[name][row_nums[new]] = vals[new]
+            found[name][row_nums[new]] = True
+
+        for col in range(len(self._value_columns)):
+            # binary rows sharing a layout are converted together
+            groups = defaultdict(list)
+            for i, row in enumerate(rows):
+                val = row[col]
+                if val is None:
+                    continue
+                if self.format_version >= 5 and not isinstance(val, string_types):
+                    layout_id = int(np.frombuffer(val, dtype=np.int64, count=1)[0])
+                    groups[layout_id].append(i)
+                else:
+                    arr = _vars_to_array(val, self.format_version, self._abs2meta,
+                                         self._var_layouts)
+                    if arr is None:
+                        continue
+                    for name, field in iteritems(self._match_fields(names, arr.dtype,
+                                                                    field_maps)):
+                        store(name, np.array([i]), arr[field])
+
+            for layout_id, row_nums in iteritems(groups):
+                dtype = self._var_layouts[layout_id]
+                fields = dtype.fields
+                # each row holds the layout id in front of the values
+                row_dtype = np.dtype({'names': dtype.names,
+                                      'formats': [fields[n][0] for n in dtype.names],
+                                      'offsets': [fields[n][1] + 8 for n in dtype.names],
+                                      'itemsize': dtype.itemsize + 8})
+                arr = np.frombuffer(b''.join([bytes(rows[i][col]) for i in row_nums]),
+                                    dtype=row_dtype)
+                for name, field in iteritems(self._match_fields(names, dtype, field_maps)):
+                    store(name, np.array(row_nums), arr[field])
+
+        for name in names:
+            if values[name] is None:
+                raise KeyError("Variable '%s' was not found in the recorded cases." % name)
+            values[name] = values[name][inverse]
+
+        return values
+
+    def _get_value_rows(self, indices):
+        """
+        Query the value columns of the cases with the given sorted indices.
+
+        Parameters
+        ----------
+        indices : ndarray of int
+            Sorted, unique indices of the cases.
+
+        Returns
+        -------
+        list
+            The value columns of each of the cases.
+        """
+        lo, hi = int(indices[0]), int(indices[-1])
+        columns = ', '.join(self._value_columns) or 'NULL'
+
+        with sqlite3.connect(self.filename) as con:
+            cur = con.cursor()
+            if self._contiguous:
+                cur.execute("SELECT %s FROM %s WHERE id BETWEEN ? AND ? ORDER BY id ASC" %
+                            (columns, self._table), (self._first_id + lo, self._first_id + hi))
+            else:
+                cur.execute("SELECT %s FROM %s ORDER BY id ASC LIMIT ? OFFSET ?" %
+                            (columns, self._table), (hi - lo + 1, lo))
+
+            rows = []
+            wanted = iter(indices)
+            next_idx = next(wanted)
+            for pos, row in enumerate(cur, lo):
+                if pos == next_idx:
+                    rows.append(row)
+                    next_idx = next(wanted, None)
+                    if next_idx is None:
+                        break
+        con.close()
+
+        return rows
+
+    def _match_fields(self, names, dtype, field_maps):
+        """
+        Find the fields of a recorded array that hold the given variables.
+
+        Parameters
+        ----------
+        names : list of str
+            Promoted or absolute names of the variables.
+        dtype : numpy.dtype
+            Structured dtype of the recorded array, with absolute names as fields.
+        field_maps : dict
+            Cache of previous results, keyed on the dtype.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each of the names present in the array to its field.
+        """
+        try:
+            return field_maps[dtype]
+        except KeyError:
+            pass
+
+        fields = dtype.names
+        field_map = {}
+        for name in names:
+            if name in fields:
+                field_map[name] = name
+                continue
+            for io in ('output', 'input'):
+                match = [n for n in self._prom2abs[io].get(name, ()) if n in fields]
+                if match:
+                    field_map[name] = match[0]
+                    break
+
+        field_maps[dtype] = field_map
+        return field_map
+
+
+class DriverCases(SqliteCases):
     """
     Case specific to the entries that might be recorded in a Driver iteration.
 
@@ -799,7 +1131,11 @@ class DriverCases(BaseCases):
         Dictionary mapping absolute variable names to variable settings.
     """
 
-    def __init__(self, filename, format_version, abs2prom, abs2meta, prom2abs, var_settings):
+    _table = 'driver_iterations'
+    _value_columns = ('outputs', 'inputs')
+
+    def __init__(self, filename, format_version, abs2prom, abs2meta, prom2abs, var_settings,
+                 var_layouts=None):
         """
         Initialize.
 
@@ -817,8 +1153,11 @@ class DriverCases(BaseCases):
             Dictionary mapping promoted names to absolute names.
         var_settings : dict
             Dictionary mapping absolute variable names to variable settings.
+        var_layouts : dict or None
+            Dictionary mapping layout ids to numpy dtypes.
         """
-        super(DriverCases, self).__init__(filename, format_version, abs2prom, abs2meta, prom2abs)
+        super(DriverCases, self).__init__(filename, format_version, abs2prom, abs2meta, prom2abs,
+                                          var_layouts)
         self._var_settings = var_settings
 
     def _extract_case_from_row(self, row):
@@ -838,12 +1177,10 @@ class DriverCases(BaseCases):
         idx, counter, iteration_coordinate, timestamp, success, msg, inputs_text, \
             outputs_text, = row
 
-        if self.format_version >= 3:
-            inputs_array = json_to_np_array(inputs_text, self._abs2meta)
-            outputs_array = json_to_np_array(outputs_text, self._abs2meta)
-        elif self.format_version in (1, 2):
-            inputs_array = blob_to_array(inputs_text)
-            outputs_array = blob_to_array(outputs_text)
+        inputs_array = _vars_to_array(inputs_text, self.format_version, self._abs2meta,
+                                      self._var_layouts)
+        outputs_array = _vars_to_array(outputs_text, self.format_version, self._abs2meta,
+                                       self._var_layouts)
 
         case = DriverCase(self.filename, counter, iteration_coordinate, timestamp,
                           success, msg, inputs_array, outputs_array,
@@ -907,11 +1244,13 @@ class DriverCases(BaseCases):
         return case
 
 
-class DriverDerivativeCases(BaseCases):
+class DriverDerivativeCases(SqliteCases):
     """
     Case specific to the entries that might be recorded in a Driver derivatives computation.
     """
 
+    _table = 'driver_derivatives'
+
     def _extract_case_from_row(self, row):
         """
         Pull data out of a queried SQLite row.
@@ -982,11 +1321,15 @@ class DriverDerivativeCases(BaseCases):
         return case
 
 
-class ProblemCases(BaseCases):
+class ProblemCases(SqliteCases):
     """
     Case specific to the entries that might be recorded in a Driver iteration.
     """
 
+    _table = 'problem_cases'
+    _value_columns = ('outputs',)
+    _key_column = 'case_name'
+
     def _extract_case_from_row(self, row):
         """
         Pull data out of a queried SQLite row.
@@ -1004,10 +1347,8 @@ class ProblemCases(BaseCases):
         idx, counter, case_name, timestamp, success, msg, \
             outputs_text, = row
 
-        if self.format_version >= 3:
-            outputs_array = json_to_np_array(outputs_text, self._abs2meta)
-        elif self.format_version in (1, 2):
-            outputs_array = blob_to_array(outputs_text)
+        outputs_array = _vars_to_array(outputs_text, self.format_version, self._abs2meta,
+                                       self._var_layouts)
 
         case = ProblemCase(self.filename, counter, case_name, timestamp,
                            success, msg, outputs_array, self._prom2abs,
@@ -1060,11 +1401,14 @@ class ProblemCases(BaseCases):
         return case
 
 
-class SystemCases(BaseCases):
+class SystemCases(SqliteCases):
     """
     Case specific to the entries that might be recorded in a System iteration.
     """
 
+    _table = 'system_iterations'
+    _value_columns = ('outputs', 'inputs')
+
     def _extract_case_from_row(self, row):
         """
         Pull data out of a queried SQLite row.
@@ -1082,14 +1426,12 @@ class SystemCases(BaseCases):
         idx, counter, iteration_coordinate, timestamp, success, msg, inputs_text,\
             outputs_text, residuals_text = row
 
-        if self.format_version >= 3:
-            inputs_array = json_to_np_array(inputs_text, self._abs2meta)
-            outputs_array = json_to_np_array(outputs_text, self._abs2meta)
-            residuals_array = json_to_np_array(residuals_text, self._abs2meta)
-        elif self.format_version in (1, 2):
-            inputs_array = blob_to_array(inputs_text)
-            outputs_array = blob_to_array(outputs_text)
-            residuals_array = blob_to_array(residuals_text)
+        inputs_array = _vars_to_array(inputs_text, self.format_version, self._abs2meta,
+                                      self._var_layouts)
+        outputs_array = _vars_to_array(outputs_text, self.format_version, self._abs2meta,
+                                       self._var_layouts)
+        residuals_array = _vars_to_array(residuals_text, self.format_version, self._abs2meta,
+                                         self._var_layouts)
 
         case = SystemCase(self.filename, counter, iteration_coordinate, timestamp,
                           success, msg, inputs_array, outputs_array, residuals_array,
@@ -1143,11 +1485,14 @@ class SystemCases(BaseCases):
         return case
 
 
-class SolverCases(BaseCases):
+class SolverCases(SqliteCases):
     """
     Case specific to the entries that might be recorded in a Solver iteration.
     """
 
+    _table = 'solver_iterations'
+    _value_columns = ('solver_output', 'solver_inputs')
+
     def _extract_case_from_row(self, row):
         """
         Pull data out of a queried SQLite row.
@@ -1166,14 +1511,12 @@ class SolverCases(BaseCases):
         idx, counter, iteration_coordinate, timestamp, success, msg, abs_err, rel_err, \
             input_text, output_text, residuals_text = row
 
-        if self.format_version >= 3:
-            input_array = json_to_np_array(input_text, self._abs2meta)
-            output_array = json_to_np_array(output_text, self._abs2meta)
-            residuals_array = json_to_np_array(residuals_text, self._abs2meta)
-        elif self.format_version in (1, 2):
-            input_array = blob_to_array(input_text)
-            output_array = blob_to_array(output_text)
-            residuals_array = blob_to_array(residuals_text)
+        input_array = _vars_to_array(input_text, self.format_version, self._abs2meta,
+                                     self._var_layouts)
+        output_array = _vars_to_array(output_text, self.format_version, self._abs2meta,
+                                      self._var_layouts)
+        residuals_array = _vars_to_array(residuals_text, self.format_version, self._abs2meta,
+                                         self._var_layouts)
 
         case = SolverCase(self.filename, counter, iteration_coordinate, timestamp,
                           success, msg, abs_err, rel_err, input_array, output_array,
@@ -2,8 +2,10 @@
 Class definition for SqliteRecorder, which provides dictionary backed by SQLite.
 """
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from io import BytesIO
+from threading import Thread, Event, RLock
+from time import time
 
 import os
 import sqlite3
@@ -13,6 +15,7 @@ import json
 import numpy as np
 
 from six.moves import cPickle as pickle
+from six.moves import queue
 
 from openmdao.recorders.base_recorder import BaseRecorder
 from openmdao.utils.mpi import MPI
@@ -28,6 +31,9 @@ from openmdao.solvers.solver import Solver
 """
 SQL case output format version history.
 ---------------------------------------
+5 -- OpenMDAO 2.5
+    Storing variable values of each case as a single binary float64 buffer, with the layout
+    of the buffer (variable names, offsets and shapes) stored once in the var_layouts table.
 4 -- OpenMDAO 2.4
     Added variable settings metadata that contains scaling info.
 3 -- OpenMDAO 2.4
@@ -37,7 +43,39 @@ SQL case output format version history.
 1 -- Through OpenMDAO 2.3
     Original implementation.
 """
-format_version = 4
+format_version = 5
+
+# For each kind of case: the INSERT statement, the indices of the parameters that hold
+# variable dicts to be stored as binary buffers, and whether the case is tracked in
+# global_iterations.
+_case_inserts = {
+    'driver': ("INSERT INTO driver_iterations(counter, iteration_coordinate, "
+               "timestamp, success, msg, inputs, outputs) VALUES(?,?,?,?,?,?,?)",
+               (5, 6), True),
+    'problem': ("INSERT INTO problem_cases(counter, case_name, "
+                "timestamp, success, msg, outputs) VALUES(?,?,?,?,?,?)",
+                (5,), False),
+    'system': ("INSERT INTO system_iterations(counter, iteration_coordinate, "
+               "timestamp, success, msg, inputs , outputs , residuals ) "
+               "VALUES(?,?,?,?,?,?,?,?)",
+               (5, 6, 7), True),
+    'solver': ("INSERT INTO solver_iterations(counter, iteration_coordinate, "
+               "timestamp, success, msg, abs_err, rel_err, "
+               "solver_inputs, solver_output, solver_residuals) "
+               "VALUES(?,?,?,?,?,?,?,?,?,?)",
+               (7, 8, 9), True),
+    'derivatives': ("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
+                    "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
+                    (), False),
+}
+
+# tables of the cases, each numbered by the recorder's counter
+_counter_tables = ('driver_iterations', 'driver_derivatives', 'problem_cases',
+                   'system_iterations', 'solver_iterations')
+
+# control messages for the writer thread of a buffered recorder
+_FLUSH = 'flush'
+_STOP = 'stop'
 
 
 def array_to_blob(array):
@@ -109,6 +147,59 @@ def convert_to_list(vals):
         return vals
 
 
+def _vars_to_json(vals):
+    """
+    Convert a dict of variable values to a JSON string.
+
+    Parameters
+    ----------
+    vals : dict or None
+        Dictionary mapping variable names to values.
+
+    Returns
+    -------
+    str :
+        The JSON string.
+    """
+    if vals is not None:
+        # convert to list so this can be dumped as JSON
+        for var in vals:
+            vals[var] = convert_to_list(vals[var])
+
+    return json.dumps(vals)
+
+
+_layout_id_dtype = np.dtype(np.int64)
+
+
+def _snapshot_vars(vals):
+    """
+    Copy a dict of variable values so it can be serialized later on another thread.
+
+    Parameters
+    ----------
+    vals : dict or None
+        Dictionary mapping variable names to values.
+
+    Returns
+    -------
+    dict or None :
+        Copy of the dictionary, with its own copies of any arrays.
+    """
+    if vals is None:
+        return None
+
+    snapshot = copy(vals)
+    for var in snapshot:
+        val = snapshot[var]
+        if isinstance(val, np.ndarray):
+            snapshot[var] = val.copy()
+        else:
+            snapshot[var] = convert_to_list(val)
+
+    return snapshot
+
+
 class SqliteRecorder(BaseRecorder):
     """
     Recorder that saves cases in a sqlite db.
@@ -119,6 +210,8 @@ class SqliteRecorder(BaseRecorder):
         Dict that holds the data needed to generate N2 diagram.
     connection : sqlite connection object
         Connection to the sqlite3 database.
+    _append : bool
+        If True, cases are appended to an existing recording file instead of replacing it.
     _abs2prom : {'input': dict, 'output': dict}
         Dictionary mapping absolute names to promoted names.
     _prom2abs : {'input': dict, 'output': dict}
@@ -134,9 +227,29 @@ class SqliteRecorder(BaseRecorder):
         Flag indicating whether or not the database has been initialized.
     _record_on_proc : bool
         Flag indicating whether to record on this processor when running in parallel.
+    _buffer_size : int
+        Number of cases committed together in one transaction by the writer thread.
+        If 0, cases are written synchronously, one transaction per case.
+    _flush_interval : float or None
+        Maximum number of seconds a case may wait in the buffer before it is committed.
+    _queue : Queue or None
+        Queue of cases waiting to be written by the writer thread.
+    _writer : Thread or None
+        Background thread that writes buffered cases to the database.
+    _writer_error : Exception or None
+        First exception raised in the writer thread, re-raised in the calling thread.
+    _lock : RLock
+        Lock serializing access to the connection between threads.
+    _var_layouts : dict
+        Dictionary mapping each tuple of (name, shape) pairs seen in a case to the id of its
+        layout in the var_layouts table.
+    _counter_start : int
+        Highest counter of the cases already in the file when appending, so that the counters
+        of the new cases continue from it.  0 for a new file.
     """
 
-    def __init__(self, filepath, append=False, pickle_version=2):
+    def __init__(self, filepath, append=False, pickle_version=2, buffer_size=0,
+                 flush_interval=None):
         """
         Initialize the SqliteRecorder.
 
@@ -145,15 +258,31 @@ class SqliteRecorder(BaseRecorder):
         filepath : str
             Path to the recorder file.
         append : bool
-            Optional. If True, append to an existing case recorder file.
+            Optional. If True, append to an existing case recorder file. The file must have been
+            written by a SqliteRecorder using the current file format. If it does not exist yet,
+            a new one is created.
         pickle_version : int
             Optional. The pickle protocol version to use when pickling metadata.
+        buffer_size : int
+            Optional. If greater than 0, cases are queued to a background writer thread that
+            commits them in batches of up to this many cases. Buffered cases are guaranteed to
+            be written when flush() or shutdown() is called.
+        flush_interval : float or None
+            Optional. When buffering, the maximum number of seconds a case may wait in the
+            buffer before it is committed. If None, cases are only committed when the buffer
+            is full or the recorder is flushed.
         """
-        if append:
-            raise NotImplementedError("Append feature not implemented for SqliteRecorder")
+        if buffer_size < 0:
+            raise ValueError("SqliteRecorder buffer_size must be >= 0, but %s was given." %
+                             buffer_size)
+
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("SqliteRecorder flush_interval must be > 0, but %s was given." %
+                             flush_interval)
 
         self.connection = None
         self.model_viewer_data = None
+        self._append = append
 
         self._abs2prom = {'input': {}, 'output': {}}
         self._prom2abs = {'input': {}, 'output': {}}
@@ -165,6 +294,15 @@ class SqliteRecorder(BaseRecorder):
         # default to record on all procs when running in parallel
         self._record_on_proc = True
 
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+        self._lock = RLock()
+        self._var_layouts = {}
+        self._counter_start = 0
+
         super(SqliteRecorder, self).__init__()
 
     def _initialize_database(self):
@@ -186,50 +324,311 @@ class SqliteRecorder(BaseRecorder):
             filepath = self._filepath
 
         if filepath:
-            try:
-                os.remove(filepath)
-            except OSError:
-                pass
-
-            self.connection = sqlite3.connect(filepath)
-            with self.connection as c:
-                c.execute("CREATE TABLE metadata( format_version INT, "
-                          "abs2prom TEXT, prom2abs TEXT, abs2meta TEXT, var_settings TEXT)")
-                c.execute("INSERT INTO metadata(format_version, abs2prom, prom2abs) "
-                          "VALUES(?,?,?)", (format_version, None, None))
-
-                # used to keep track of the order of the case records across all three tables
-                c.execute("CREATE TABLE global_iterations(id INTEGER PRIMARY KEY, "
-                          "record_type TEXT, rowid INT)")
-                c.execute("CREATE TABLE driver_iterations(id INTEGER PRIMARY KEY, "
-                          "counter INT, iteration_coordinate TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, inputs TEXT, outputs TEXT)")
-                c.execute("CREATE TABLE driver_derivatives(id INTEGER PRIMARY KEY, "
-                          "counter INT, iteration_coordinate TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, derivatives BLOB)")
-                c.execute("CREATE INDEX driv_iter_ind on driver_iterations(iteration_coordinate)")
-                c.execute("CREATE TABLE problem_cases(id INTEGER PRIMARY KEY, "
-                          "counter INT, case_name TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, outputs TEXT)")
-                c.execute("CREATE INDEX prob_name_ind on problem_cases(case_name)")
-                c.execute("CREATE TABLE system_iterations(id INTEGER PRIMARY KEY, "
-                          "counter INT, iteration_coordinate TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
-                c.execute("CREATE INDEX sys_iter_ind on system_iterations(iteration_coordinate)")
-                c.execute("CREATE TABLE solver_iterations(id INTEGER PRIMARY KEY, "
-                          "counter INT, iteration_coordinate TEXT, timestamp REAL, "
-                          "success INT, msg TEXT, abs_err REAL, rel_err REAL, "
-                          "solver_inputs TEXT, solver_output TEXT, solver_residuals TEXT)")
-                c.execute("CREATE INDEX solv_iter_ind on solver_iterations(iteration_coordinate)")
-                c.execute("CREATE TABLE driver_metadata(id TEXT PRIMARY KEY, "
-                          "model_viewer_data TEXT)")
-                c.execute("CREATE TABLE system_metadata(id TEXT PRIMARY KEY, "
-                          "scaling_factors BLOB, component_metadata BLOB)")
-                c.execute("CREATE TABLE solver_metadata(id TEXT PRIMARY KEY, "
-                          "solver_options BLOB, solver_class TEXT)")
+            append = self._append and os.path.exists(filepath)
+
+            if not append:
+                for fname in (filepath, filepath + '-wal', filepath + '-shm'):
+                    try:
+                        os.remove(fname)
+                    except OSError:
+                        pass
+
+            if self._buffer_size > 0:
+                # the writer thread shares the connection, guarded by self._lock
+                self.connection = sqlite3.connect(filepath, check_same_thread=False)
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                self.connection.execute("PRAGMA synchronous=NORMAL")
+            else:
+                self.connection = sqlite3.connect(filepath)
+
+            if append:
+                self._load_database(filepath)
+            else:
+                self._create_tables()
+
+            if self._buffer_size > 0:
+                self._queue = queue.Queue(maxsize=2 * self._buffer_size)
+                self._writer = Thread(target=self._write_loop, name='SqliteRecorder writer')
+                self._writer.daemon = True
+                self._writer.start()
 
         self._database_initialized = True
 
+    def _create_tables(self):
+        """
+        Create the tables of a new database.
+        """
+        with self.connection as c:
+            c.execute("CREATE TABLE metadata( format_version INT, "
+                      "abs2prom TEXT, prom2abs TEXT, abs2meta TEXT, var_settings TEXT)")
+            c.execute("INSERT INTO metadata(format_version, abs2prom, prom2abs) "
+                      "VALUES(?,?,?)", (format_version, None, None))
+
+            # used to keep track of the order of the case records across all three tables
+            c.execute("CREATE TABLE global_iterations(id INTEGER PRIMARY KEY, "
+                      "record_type TEXT, rowid INT)")
+            c.execute("CREATE TABLE driver_iterations(id INTEGER PRIMARY KEY, "
+                      "counter INT, iteration_coordinate TEXT, timestamp REAL, "
+                      "success INT, msg TEXT, inputs TEXT, outputs TEXT)")
+            c.execute("CREATE TABLE driver_derivatives(id INTEGER PRIMARY KEY, "
+                      "counter INT, iteration_coordinate TEXT, timestamp REAL, "
+                      "success INT, msg TEXT, derivatives BLOB)")
+            c.execute("CREATE INDEX driv_iter_ind on driver_iterations(iteration_coordinate)")
+            c.execute("CREATE INDEX driv_count_ind on driver_iterations(counter)")
+            c.execute("CREATE INDEX deriv_iter_ind on driver_derivatives(iteration_coordinate)")
+            c.execute("CREATE INDEX deriv_count_ind on driver_derivatives(counter)")
+            c.execute("CREATE TABLE problem_cases(id INTEGER PRIMARY KEY, "
+                      "counter INT, case_name TEXT, timestamp REAL, "
+                      "success INT, msg TEXT, outputs TEXT)")
+            c.execute("CREATE INDEX prob_name_ind on problem_cases(case_name)")
+            c.execute("CREATE TABLE system_iterations(id INTEGER PRIMARY KEY, "
+                      "counter INT, iteration_coordinate TEXT, timestamp REAL, "
+                      "success INT, msg TEXT, inputs TEXT, outputs TEXT, residuals TEXT)")
+            c.execute("CREATE INDEX sys_iter_ind on system_iterations(iteration_coordinate)")
+            c.execute("CREATE INDEX sys_count_ind on system_iterations(counter)")
+            c.execute("CREATE TABLE solver_iterations(id INTEGER PRIMARY KEY, "
+                      "counter INT, iteration_coordinate TEXT, timestamp REAL, "
+                      "success INT, msg TEXT, abs_err REAL, rel_err REAL, "
+                      "solver_inputs TEXT, solver_output TEXT, solver_residuals TEXT)")
+            c.execute("CREATE INDEX solv_iter_ind on solver_iterations(iteration_coordinate)")
+            c.execute("CREATE INDEX solv_count_ind on solver_iterations(counter)")
+            c.execute("CREATE TABLE driver_metadata(id TEXT PRIMARY KEY, "
+                      "model_viewer_data TEXT)")
+            c.execute("CREATE TABLE system_metadata(id TEXT PRIMARY KEY, "
+                      "scaling_factors BLOB, component_metadata BLOB)")
+            c.execute("CREATE TABLE solver_metadata(id TEXT PRIMARY KEY, "
+                      "solver_options BLOB, solver_class TEXT)")
+            c.execute("CREATE TABLE var_layouts(id INTEGER PRIMARY KEY, layout TEXT)")
+
+    def _load_database(self, filepath):
+        """
+        Load the metadata and variable layouts of an existing database so cases can be appended.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the existing database.
+        """
+        with self._lock, self.connection as c:
+            try:
+                row = c.execute("SELECT format_version, abs2prom, prom2abs, abs2meta "
+                                "FROM metadata").fetchone()
+            except sqlite3.DatabaseError:
+                row = None
+
+            if row is None or row[0] != format_version:
+                raise RuntimeError("Can't append to '%s' because it was not written by a "
+                                   "SqliteRecorder using the current file format (version %d)."
+                                   % (filepath, format_version))
+
+            for text, dct in zip(row[1:], (self._abs2prom, self._prom2abs, self._abs2meta)):
+                if text:
+                    dct.update(json.loads(text))
+
+            for layout_id, layout in c.execute("SELECT id, layout FROM var_layouts"):
+                key = tuple((name, tuple(shape)) for name, offset, shape in json.loads(layout))
+                self._var_layouts[key] = layout_id
+
+            # continue numbering the cases after the ones already in the file
+            self._counter_start = max(c.execute("SELECT MAX(counter) FROM %s" %
+                                                table).fetchone()[0] or 0
+                                      for table in _counter_tables)
+
+    def _insert_case(self, cursor, kind, params):
+        """
+        Insert a single case into the database.
+
+        Parameters
+        ----------
+        cursor : sqlite3 cursor
+            Cursor used to execute the inserts.
+        kind : str
+            The kind of case, one of the keys of _case_inserts.
+        params : tuple
+            The values of the columns of the case table.
+        """
+        sql, blob_cols, is_global = _case_inserts[kind]
+
+        if blob_cols:
+            params = list(params)
+            for i in blob_cols:
+                params[i] = self._vars_to_blob(cursor, params[i])
+
+        cursor.execute(sql, params)
+
+        if is_global:
+            cursor.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
+                           (kind, cursor.lastrowid))
+
+    def _get_shape(self, name, val):
+        """
+        Return the shape under which the value of the named variable is recorded.
+
+        Values are sometimes provided flattened, so use the shape from the variable metadata
+        when it is consistent with the size of the value.
+
+        Parameters
+        ----------
+        name : str
+            Absolute name of the variable.
+        val : ndarray
+            Value of the variable.
+
+        Returns
+        -------
+        tuple :
+            The shape of the variable.
+        """
+        if name in self._abs2meta and 'shape' in self._abs2meta[name]:
+            shape = tuple(self._abs2meta[name]['shape'])
+            if int(np.prod(shape)) == val.size:
+                return shape
+
+        return val.shape
+
+    def _vars_to_blob(self, cursor, vals):
+        """
+        Convert a dict of variable values to a binary buffer.
+
+        The buffer starts with the id of its layout in the var_layouts table, followed by the
+        flattened values of all variables as float64.  A new layout is added to the
+        var_layouts table the first time a given set of variables is seen.
+
+        Parameters
+        ----------
+        cursor : sqlite3 cursor
+            Cursor used to add a new layout, if needed.
+        vals : dict or None
+            Dictionary mapping variable names to values.
+
+        Returns
+        -------
+        sqlite3.Binary or str or None :
+            The binary buffer, or a JSON string if any of the values is not numeric,
+            or None if there are no values.
+        """
+        if not vals:
+            return None
+
+        try:
+            arrays = [np.asarray(val, dtype=np.float64) for val in vals.values()]
+        except (TypeError, ValueError):
+            return _vars_to_json(vals)
+
+        key = tuple((name, self._get_shape(name, val)) for name, val in zip(vals, arrays))
+        try:
+            layout_id = self._var_layouts[key]
+        except KeyError:
+            layout = []
+            offset = 0
+            for name, shape in key:
+                layout.append((name, offset, shape))
+                offset += int(np.prod(shape))
+            cursor.execute("INSERT INTO var_layouts(layout) VALUES(?)", (json.dumps(layout),))
+            layout_id = self._var_layouts[key] = cursor.lastrowid
+
+        header = np.array([layout_id], dtype=_layout_id_dtype).view(np.float64)
+        data = np.concatenate([header] + [a.ravel() for a in arrays])
+
+        return sqlite3.Binary(data.tobytes())
+
+    def _write_case(self, kind, params):
+        """
+        Write a case to the database, or queue it for the writer thread if buffering.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of case, one of the keys of _case_inserts.
+        params : tuple
+            The values of the columns of the case table.
+        """
+        if self._queue is None:
+            with self._lock, self.connection as c:
+                self._insert_case(c.cursor(), kind, params)  # need a real cursor for lastrowid
+        else:
+            self._check_writer()
+
+            # take copies now, the caller is free to change the data once we return
+            params = list(params)
+            for i in _case_inserts[kind][1]:
+                params[i] = _snapshot_vars(params[i])
+
+            self._queue.put((kind, params))
+
+    def _write_loop(self):
+        """
+        Commit queued cases in batches until told to stop.
+
+        This runs in the writer thread of a buffered recorder.
+        """
+        buffer_size = self._buffer_size
+        flush_interval = self._flush_interval
+        batch = []
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(deadline - time(), 0.)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # flush_interval has elapsed
+
+            if item is not None and item[0] not in (_FLUSH, _STOP):
+                batch.append(item)
+                if deadline is None and flush_interval is not None:
+                    deadline = time() + flush_interval
+                if len(batch) < buffer_size:
+                    continue
+
+            if batch:
+                try:
+                    with self._lock, self.connection as c:
+                        cursor = c.cursor()
+                        for kind, params in batch:
+                            self._insert_case(cursor, kind, params)
+                except Exception as err:
+                    if self._writer_error is None:
+                        self._writer_error = err
+                batch = []
+            deadline = None
+
+            if item is not None and item[0] in (_FLUSH, _STOP):
+                item[1].set()
+                if item[0] == _STOP:
+                    break
+
+    def _check_writer(self):
+        """
+        Raise any error that occurred in the writer thread.
+        """
+        if self._writer_error is not None:
+            err = self._writer_error
+            self._writer_error = None
+            raise RuntimeError("SqliteRecorder failed to write buffered cases to '%s': %s" %
+                               (self._filepath, err))
+
+    def _send_to_writer(self, msg):
+        """
+        Send a control message to the writer thread and wait for it to be handled.
+
+        Parameters
+        ----------
+        msg : str
+            Either _FLUSH or _STOP.
+        """
+        done = Event()
+        self._queue.put((msg, done))
+        done.wait()
+
+    def flush(self):
+        """
+        Write any buffered cases to the database.
+        """
+        if self._queue is not None:
+            self._send_to_writer(_FLUSH)
+            self._check_writer()
+
     def _cleanup_abs2meta(self):
         """
         Convert all abs2meta variable properties to a form that can be dumped as JSON.
@@ -290,6 +689,8 @@ class SqliteRecorder(BaseRecorder):
         if not self._database_initialized:
             self._initialize_database()
 
+        self._counter = self._counter_start
+
         # grab the system
         if isinstance(recording_requester, Driver):
             system = recording_requester._problem.model
@@ -361,7 +762,7 @@ class SqliteRecorder(BaseRecorder):
             var_settings = self._cleanup_var_settings(var_settings)
             var_settings_json = json.dumps(var_settings)
 
-            with self.connection as c:
+            with self._lock, self.connection as c:
                 c.execute("UPDATE metadata SET abs2prom=?, prom2abs=?, abs2meta=?, var_settings=?",
                           (abs2prom, prom2abs, abs2meta, var_settings_json))
 
@@ -379,30 +780,9 @@ class SqliteRecorder(BaseRecorder):
             Dictionary containing execution metadata.
         """
         if self.connection:
-            outputs = data['out']
-            inputs = data['in']
-
-            # convert to list so this can be dumped as JSON
-            for in_out in (inputs, outputs):
-                if in_out is None:
-                    continue
-                for var in in_out:
-                    in_out[var] = convert_to_list(in_out[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs, outputs) VALUES(?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                          ('driver', c.lastrowid))
+            self._write_case('driver', (self._counter, self._iteration_coordinate,
+                                        metadata['timestamp'], metadata['success'],
+                                        metadata['msg'], data['in'], data['out']))
 
     def record_iteration_problem(self, recording_requester, data, metadata):
         """
@@ -418,23 +798,9 @@ class SqliteRecorder(BaseRecorder):
             Dictionary containing execution metadata.
         """
         if self.connection:
-            outputs = data['out']
-
-            # convert to list so this can be dumped as JSON
-            if outputs is not None:
-                for var in outputs:
-                    outputs[var] = convert_to_list(outputs[var])
-
-            outputs_text = json.dumps(outputs)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO problem_cases(counter, case_name, "
-                          "timestamp, success, msg, outputs) VALUES(?,?,?,?,?,?)",
-                          (self._counter, metadata['name'],
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           outputs_text))
+            self._write_case('problem', (self._counter, metadata['name'],
+                                         metadata['timestamp'], metadata['success'],
+                                         metadata['msg'], data['out']))
 
     def record_iteration_system(self, recording_requester, data, metadata):
         """
@@ -450,33 +816,9 @@ class SqliteRecorder(BaseRecorder):
             Dictionary containing execution metadata.
         """
         if self.connection:
-            inputs = data['i']
-            outputs = data['o']
-            residuals = data['r']
-
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                if i_o_r is None:
-                    continue
-                for var in i_o_r:
-                    i_o_r[var] = convert_to_list(i_o_r[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, inputs , outputs , residuals ) "
-                          "VALUES(?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           inputs_text, outputs_text, residuals_text))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                          ('system', c.lastrowid))
+            self._write_case('system', (self._counter, self._iteration_coordinate,
+                                        metadata['timestamp'], metadata['success'],
+                                        metadata['msg'], data['i'], data['o'], data['r']))
 
     def record_iteration_solver(self, recording_requester, data, metadata):
         """
@@ -492,36 +834,10 @@ class SqliteRecorder(BaseRecorder):
             Dictionary containing execution metadata.
         """
         if self.connection:
-            abs = data['abs']
-            rel = data['rel']
-            inputs = data['i']
-            outputs = data['o']
-            residuals = data['r']
-
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                if i_o_r is None:
-                    continue
-                for var in i_o_r:
-                    i_o_r[var] = convert_to_list(i_o_r[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
-
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                          "timestamp, success, msg, abs_err, rel_err, "
-                          "solver_inputs, solver_output, solver_residuals) "
-                          "VALUES(?,?,?,?,?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           abs, rel, inputs_text, outputs_text, residuals_text))
-
-                c.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                          ('solver', c.lastrowid))
+            self._write_case('solver', (self._counter, self._iteration_coordinate,
+                                        metadata['timestamp'], metadata['success'],
+                                        metadata['msg'], data['abs'], data['rel'],
+                                        data['i'], data['o'], data['r']))
 
     def record_metadata_driver(self, recording_requester):
         """
@@ -537,11 +853,13 @@ class SqliteRecorder(BaseRecorder):
             model_viewer_data = json.dumps(recording_requester._model_viewer_data)
 
             try:
-                with self.connection as c:
+                with self._lock, self.connection as c:
                     c.execute("INSERT INTO driver_metadata(id, model_viewer_data) "
                               "VALUES(?,?)", (driver_class, model_viewer_data))
             except sqlite3.IntegrityError:
-                print("Metadata has already been recorded for %s." % driver_class)
+                # when appending, the metadata from the earlier run is kept
+                if not self._append:
+                    print("Metadata has already been recorded for %s." % driver_class)
 
     def record_metadata_system(self, recording_requester):
         """
@@ -579,7 +897,7 @@ class SqliteRecorder(BaseRecorder):
             scaling_factors = sqlite3.Binary(scaling_factors)
             pickled_metadata = sqlite3.Binary(pickled_metadata)
 
-            with self.connection as c:
+            with self._lock, self.connection as c:
                 # Because we can have a recorder attached to multiple Systems,
                 #   and because we are now recording System metadata recursively,
                 #   we can store System metadata multiple times. Need to ignore when that happens
@@ -606,8 +924,11 @@ class SqliteRecorder(BaseRecorder):
 
             solver_options = pickle.dumps(recording_requester.options, self._pickle_version)
 
-            with self.connection as c:
-                c.execute("INSERT INTO solver_metadata(id, solver_options, solver_class) "
+            # when appending, the metadata from the earlier run is kept
+            insert = "INSERT OR IGNORE" if self._append else "INSERT"
+
+            with self._lock, self.connection as c:
+                c.execute(insert + " INTO solver_metadata(id, solver_options, solver_class) "
                           "VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
 
     def record_derivatives_driver(self, recording_requester, data, metadata):
@@ -628,19 +949,23 @@ class SqliteRecorder(BaseRecorder):
             data_array = values_to_array(data)
             data_blob = array_to_blob(data_array)
 
-            with self.connection as c:
-                c = c.cursor()  # need a real cursor for lastrowid
-
-                c.execute("INSERT INTO driver_derivatives(counter, iteration_coordinate, "
-                          "timestamp, success, msg, derivatives) VALUES(?,?,?,?,?,?)",
-                          (self._counter, self._iteration_coordinate,
-                           metadata['timestamp'], metadata['success'], metadata['msg'],
-                           data_blob))
+            self._write_case('derivatives', (self._counter, self._iteration_coordinate,
+                                             metadata['timestamp'], metadata['success'],
+                                             metadata['msg'], data_blob))
 
     def shutdown(self):
         """
         Shut down the recorder.
         """
+        # make sure all buffered cases are written before closing the connection
+        if self._writer is not None:
+            self._send_to_writer(_STOP)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+
         # close database connection
         if self.connection:
             self.connection.close()
+
+        self._check_writer()
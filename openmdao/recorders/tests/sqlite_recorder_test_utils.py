@@ -6,9 +6,10 @@ import json
 
 from contextlib import contextmanager
 
-from openmdao.utils.record_util import format_iteration_coordinate, json_to_np_array
+from openmdao.utils.record_util import format_iteration_coordinate, layout_to_dtype
 from openmdao.utils.assert_utils import assert_rel_error
 from openmdao.recorders.sqlite_recorder import blob_to_array, format_version
+from openmdao.recorders.sqlite_reader import _vars_to_array
 
 if PY2:
     import cPickle as pickle
@@ -55,12 +56,24 @@ def get_format_version_abs2meta(db_cur):
     return f_version, abs2meta
 
 
+def get_var_layouts(db_cur, f_version):
+    """
+        Return the dict of var layout dtypes for files that store values as binary buffers.
+    """
+    if f_version < 5:
+        return None
+
+    db_cur.execute("SELECT id, layout FROM var_layouts")
+    return {row[0]: layout_to_dtype(json.loads(row[1])) for row in db_cur.fetchall()}
+
+
 def assertDriverIterDataRecorded(test, expected, tolerance, prefix=None):
     """
     Expected can be from multiple cases.
     """
     with database_cursor(test.filename) as db_cur:
         f_version, abs2meta = get_format_version_abs2meta(db_cur)
+        var_layouts = get_var_layouts(db_cur, f_version)
 
         # iterate through the cases
         for coord, (t0, t1), outputs_expected, inputs_expected in expected:
@@ -78,12 +91,8 @@ def assertDriverIterDataRecorded(test, expected, tolerance, prefix=None):
             counter, global_counter, iteration_coordinate, timestamp, success, msg,\
                 inputs_text, outputs_text = row_actual
 
-            if f_version >= 3:
-                inputs_actual = json_to_np_array(inputs_text, abs2meta)
-                outputs_actual = json_to_np_array(outputs_text, abs2meta)
-            elif f_version in (1, 2):
-                inputs_actual = blob_to_array(inputs_text)
-                outputs_actual = blob_to_array(outputs_text)
+            inputs_actual = _vars_to_array(inputs_text, f_version, abs2meta, var_layouts)
+            outputs_actual = _vars_to_array(outputs_text, f_version, abs2meta, var_layouts)
 
             # Does the timestamp make sense?
             test.assertTrue(t0 <= timestamp and timestamp <= t1)
@@ -172,6 +181,7 @@ def assertSystemIterDataRecorded(test, expected, tolerance, prefix=None):
     """
     with database_cursor(test.filename) as db_cur:
         f_version, abs2meta = get_format_version_abs2meta(db_cur)
+        var_layouts = get_var_layouts(db_cur, f_version)
 
         # iterate through the cases
         for coord, (t0, t1), inputs_expected, outputs_expected, residuals_expected in expected:
@@ -188,14 +198,9 @@ def assertSystemIterDataRecorded(test, expected, tolerance, prefix=None):
             counter, global_counter, iteration_coordinate, timestamp, success, msg, inputs_text, \
                 outputs_text, residuals_text = row_actual
 
-            if f_version >= 3:
-                inputs_actual = json_to_np_array(inputs_text, abs2meta)
-                outputs_actual = json_to_np_array(outputs_text, abs2meta)
-                residuals_actual = json_to_np_array(residuals_text, abs2meta)
-            elif f_version in (1, 2):
-                inputs_actual = blob_to_array(inputs_text)
-                outputs_actual = blob_to_array(outputs_text)
-                residuals_actual = blob_to_array(residuals_text)
+            inputs_actual = _vars_to_array(inputs_text, f_version, abs2meta, var_layouts)
+            outputs_actual = _vars_to_array(outputs_text, f_version, abs2meta, var_layouts)
+            residuals_actual = _vars_to_array(residuals_text, f_version, abs2meta, var_layouts)
 
             # Does the timestamp make sense?
             test.assertTrue(t0 <= timestamp and timestamp <= t1)
@@ -232,6 +237,7 @@ def assertSolverIterDataRecorded(test, expected, tolerance, prefix=None):
     """
     with database_cursor(test.filename) as db_cur:
         f_version, abs2meta = get_format_version_abs2meta(db_cur)
+        var_layouts = get_var_layouts(db_cur, f_version)
 
         # iterate through the cases
         for coord, (t0, t1), expected_abs_error, expected_rel_error, expected_output, \
@@ -250,12 +256,8 @@ def assertSolverIterDataRecorded(test, expected, tolerance, prefix=None):
             counter, global_counter, iteration_coordinate, timestamp, success, msg, \
                 abs_err, rel_err, input_blob, output_text, residuals_text = row_actual
 
-            if f_version >= 3:
-                output_actual = json_to_np_array(output_text, abs2meta)
-                residuals_actual = json_to_np_array(residuals_text, abs2meta)
-            elif f_version in (1, 2):
-                output_actual = blob_to_array(output_text)
-                residuals_actual = blob_to_array(residuals_text)
+            output_actual = _vars_to_array(output_text, f_version, abs2meta, var_layouts)
+            residuals_actual = _vars_to_array(residuals_text, f_version, abs2meta, var_layouts)
 
             # Does the timestamp make sense?
             test.assertTrue(t0 <= timestamp and timestamp <= t1,
@@ -3,6 +3,7 @@ from __future__ import print_function
 
 import errno
 import os
+import sqlite3
 import unittest
 import warnings
 from shutil import rmtree
@@ -81,6 +82,112 @@ class TestSqliteCaseReader(unittest.TestCase):
         self.assertEqual(cr.format_version, format_version,
                          msg='format version not read correctly')
 
+    def test_binary_values(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('px', IndepVarComp('x', np.arange(6.).reshape((2, 3))))
+        model.add_subsystem('comp', ExecComp('y = 2.0*x', x=np.ones((2, 3)), y=np.ones((2, 3))))
+        model.connect('px.x', 'comp.x')
+        model.comp.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_model()
+        prob.cleanup()
+
+        # values are stored as binary buffers, outputs and residuals share a layout
+        with sqlite3.connect(self.filename) as con:
+            types = con.execute("SELECT typeof(inputs), typeof(outputs), typeof(residuals) "
+                                "FROM system_iterations").fetchall()
+            self.assertEqual(types, [('blob', 'blob', 'blob')])
+            self.assertEqual(con.execute("SELECT COUNT(*) FROM var_layouts").fetchone(), (2,))
+        con.close()
+
+        cr = CaseReader(self.filename)
+        self.assertEqual(cr.system_cases.num_cases, 1)
+
+        case = cr.system_cases.get_case(0)
+        expected = np.arange(6.).reshape((2, 3))
+        self.assertEqual(case.inputs['comp.x'].shape, (2, 3))
+        assert_rel_error(self, case.inputs['comp.x'], expected, 1e-15)
+        assert_rel_error(self, case.outputs['comp.y'], 2. * expected, 1e-15)
+        assert_rel_error(self, case.residuals['comp.y'], np.zeros((2, 3)), 1e-15)
+
+    def test_lazy_cases(self):
+        prob = SellarProblem(SellarDerivativesGrouped)
+        driver = prob.driver = ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        driver.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = CaseReader(self.filename)
+        cases = cr.driver_cases
+
+        with sqlite3.connect(self.filename) as con:
+            coords = [row[0] for row in con.execute("SELECT iteration_coordinate "
+                                                    "FROM driver_iterations ORDER BY id")]
+        con.close()
+
+        self.assertEqual(cases.num_cases, len(coords))
+        self.assertEqual(cases.list_cases(), coords)
+
+        # indexing, including negative indices
+        self.assertEqual(cases.get_iteration_coordinate(0), coords[0])
+        self.assertEqual(cases.get_iteration_coordinate(-1), coords[-1])
+        self.assertEqual(cases.get_case(-1).iteration_coordinate, coords[-1])
+        self.assertEqual(cases.get_case(coords[1]).iteration_coordinate, coords[1])
+
+        with self.assertRaises(IndexError):
+            cases.get_case(len(coords))
+
+        # streaming all of the cases, in small batches
+        streamed = list(cases.iter_cases(batch_size=2))
+        self.assertEqual([case.iteration_coordinate for case in streamed], coords)
+        assert_rel_error(self, streamed[-1].outputs['z'], cases.get_case(-1).outputs['z'], 0.)
+
+        # tables without cases
+        self.assertEqual(cr.solver_cases.num_cases, 0)
+        self.assertEqual(cr.solver_cases.list_cases(), [])
+        self.assertEqual(list(cr.solver_cases.iter_cases()), [])
+
+    def test_get_values(self):
+        prob = SellarProblem(SellarDerivativesGrouped)
+        driver = prob.driver = ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        driver.recording_options['record_inputs'] = True
+        driver.recording_options['includes'] = ['*']
+        driver.add_recorder(self.recorder)
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cases = CaseReader(self.filename).driver_cases
+        num_cases = cases.num_cases
+
+        vals = cases.get_values(['z', 'pz.z', 'obj', 'mda.d1.x'])
+        self.assertEqual(list(vals.keys()), ['z', 'pz.z', 'obj', 'mda.d1.x'])
+        self.assertEqual(vals['z'].shape, (num_cases, 2))
+        self.assertEqual(vals['obj'].shape, (num_cases, 1))
+
+        for i in range(num_cases):
+            case = cases.get_case(i)
+            assert_rel_error(self, vals['z'][i], case.outputs['z'], 0.)
+            assert_rel_error(self, vals['pz.z'][i], case.outputs['z'], 0.)
+            assert_rel_error(self, vals['obj'][i], case.outputs['obj'], 0.)
+            assert_rel_error(self, vals['mda.d1.x'][i], case.inputs['mda.d1.x'], 0.)
+
+        # a subset of the cases, in any order
+        vals = cases.get_values('obj', cases=slice(1, None, 2))
+        assert_rel_error(self, vals['obj'],
+                         [cases.get_case(i).outputs['obj'] for i in range(1, num_cases, 2)], 0.)
+
+        vals = cases.get_values('obj', cases=[-1, 0, -1])
+        assert_rel_error(self, vals['obj'],
+                         [cases.get_case(i).outputs['obj'] for i in (-1, 0, -1)], 0.)
+
+        self.assertEqual(cases.get_values('obj', cases=[])['obj'].size, 0)
+
+        with assertRaisesRegex(self, KeyError, "Variable 'foo' was not found"):
+            cases.get_values(['obj', 'foo'])
+
     def test_reader_instantiates(self):
         """ Test that CaseReader returns an SqliteCaseReader. """
         prob = SellarProblem()
@@ -1419,6 +1526,80 @@ class TestSqliteCaseReaderLegacy(unittest.TestCase):
             if e.errno not in (errno.ENOENT, errno.EACCES, errno.EPERM):
                 raise e
 
+    def test_driver_v4(self):
+        """
+        Backwards compatibility version 4.
+        Legacy case recording file generated using code from test_record_driver_system_solver
+        test in test_sqlite_recorder.py
+        """
+        prob = SellarProblem(SellarDerivativesGrouped)
+
+        prob.driver = ScipyOptimizeDriver()
+        prob.driver.options['optimizer'] = 'SLSQP'
+        prob.driver.options['tol'] = 1e-9
+        prob.driver.options['disp'] = False
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        filename = os.path.join(os.path.dirname(__file__), 'legacy_sql')
+        filename = os.path.join(filename, 'case_driver_solver_system_04.sql')
+        cr = CaseReader(filename)
+
+        # Test to see if we got the correct number of cases
+        self.assertEqual(cr.driver_cases.num_cases, 6)
+
+        # Test to see if the access by case keys works:
+        seventh_slsqp_iteration_case = cr.driver_cases.get_case('rank0:SLSQP|5')
+        np.testing.assert_almost_equal(seventh_slsqp_iteration_case.outputs['z'],
+                                       [1.97846296, -2.21388305e-13],
+                                       decimal=2,
+                                       err_msg='Case reader gives '
+                                       'incorrect Parameter value'
+                                       ' for {0}'.format('pz.z'))
+
+        # Test values from one case, the last case
+        last_case = cr.driver_cases.get_case(-1)
+        np.testing.assert_almost_equal(last_case.outputs['z'], prob['z'],
+                                       err_msg='Case reader gives '
+                                       'incorrect Parameter value'
+                                       ' for {0}'.format('pz.z'))
+        np.testing.assert_almost_equal(last_case.outputs['x'], [-0.00309521],
+                                       decimal=2,
+                                       err_msg='Case reader gives '
+                                       'incorrect Parameter value'
+                                       ' for {0}'.format('px.x'))
+
+        # Test to see if the case keys (iteration coords) come back correctly
+        case_keys = cr.driver_cases.list_cases()
+        for i, iter_coord in enumerate(case_keys):
+            self.assertEqual(iter_coord, 'rank0:SLSQP|{}'.format(i))
+
+        # Test bulk extraction of values from JSON recorded cases
+        vals = cr.driver_cases.get_values(['z', 'x'])
+        np.testing.assert_almost_equal(vals['z'][5], seventh_slsqp_iteration_case.outputs['z'])
+        np.testing.assert_almost_equal(vals['x'][-1], last_case.outputs['x'])
+
+        # Test driver metadata
+        self.assertIsNotNone(cr.driver_metadata)
+        self.assertTrue('tree' in cr.driver_metadata)
+        self.assertTrue('connections_list' in cr.driver_metadata)
+
+        # While we are here, make sure we can load this case.
+
+        # Add one to all the inputs just to change the model
+        #   so we can see if loading the case values really changes the model
+        for name in prob.model._inputs:
+            prob.model._inputs[name] += 1.0
+        for name in prob.model._outputs:
+            prob.model._outputs[name] += 1.0
+
+        # Now load in the case we recorded
+        prob.load_case(seventh_slsqp_iteration_case)
+
+        _assert_model_matches_case(seventh_slsqp_iteration_case, prob.model)
+
     def test_driver_v3(self):
         """
         Backwards compatibility version 3.
@@ -1,6 +1,7 @@
 """ Unit test for the SqliteRecorder. """
 import errno
 import os
+import time
 import unittest
 import numpy as np
 
@@ -24,7 +25,7 @@ from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.recorders.tests.sqlite_recorder_test_utils import assertMetadataRecorded, \
     assertDriverIterDataRecorded, assertSystemIterDataRecorded, assertSolverIterDataRecorded, \
     assertDriverMetadataRecorded, assertSystemMetadataIdsRecorded, assertSystemIterCoordsRecorded, \
-    assertDriverDerivDataRecorded
+    assertDriverDerivDataRecorded, database_cursor
 
 from openmdao.recorders.tests.recorder_test_utils import run_driver
 from openmdao.utils.assert_utils import assert_rel_error
@@ -1860,6 +1861,178 @@ class TestSqliteRecorder(unittest.TestCase):
         self.assertFalse(system._rec_mgr.has_recorders())
         self.assertFalse(solver._rec_mgr.has_recorders())
 
+    def _run_sellar_recording(self, recorder):
+        prob = SellarProblem()
+        prob.driver.add_recorder(recorder)
+        prob.model.add_recorder(recorder)
+        prob.model.nonlinear_solver = NonlinearBlockGS()
+        prob.model.nonlinear_solver.add_recorder(recorder)
+
+        prob.setup()
+        prob.run_driver()
+        prob.run_driver()
+        prob.cleanup()
+
+    def test_buffered_recording(self):
+        self._run_sellar_recording(SqliteRecorder('unbuffered.sql'))
+        self._run_sellar_recording(SqliteRecorder('buffered.sql', buffer_size=4))
+
+        unbuffered = CaseReader('unbuffered.sql')
+        buffered = CaseReader('buffered.sql')
+
+        for cases in ('driver_cases', 'system_cases', 'solver_cases'):
+            expected = getattr(unbuffered, cases)
+            actual = getattr(buffered, cases)
+
+            self.assertEqual(actual.num_cases, expected.num_cases)
+            self.assertEqual(actual.list_cases(), expected.list_cases())
+
+            for i in range(expected.num_cases):
+                expected_case = expected.get_case(i)
+                actual_case = actual.get_case(i)
+                self.assertEqual(actual_case.counter, expected_case.counter)
+                for name in ('z', 'x', 'obj'):
+                    assert_rel_error(self, actual_case.outputs[name],
+                                     expected_case.outputs[name], 1e-15)
+
+        # global ordering of the cases across tables must also be preserved
+        query = "SELECT record_type, rowid FROM global_iterations ORDER BY id"
+        with database_cursor('unbuffered.sql') as cur:
+            cur.execute(query)
+            expected = cur.fetchall()
+        with database_cursor('buffered.sql') as cur:
+            cur.execute(query)
+            actual = cur.fetchall()
+
+        self.assertEqual(actual, expected)
+
+    def test_buffered_flush(self):
+        recorder = SqliteRecorder('cases.sql', buffer_size=1000)
+
+        prob = SellarProblem()
+        prob.model.add_recorder(recorder)
+        prob.setup()
+        prob.run_model()
+
+        # nothing is committed until the buffer is flushed
+        with sqlite3.connect('cases.sql') as con:
+            self.assertEqual(con.execute("SELECT COUNT(*) FROM system_iterations").fetchone(),
+                             (0,))
+
+        recorder.flush()
+
+        with sqlite3.connect('cases.sql') as con:
+            self.assertEqual(con.execute("SELECT COUNT(*) FROM system_iterations").fetchone(),
+                             (1,))
+
+        prob.run_model()
+        prob.cleanup()
+
+        with sqlite3.connect('cases.sql') as con:
+            self.assertEqual(con.execute("SELECT COUNT(*) FROM system_iterations").fetchone(),
+                             (2,))
+            self.assertEqual(con.execute("PRAGMA journal_mode").fetchone(), ('wal',))
+
+    def test_buffered_flush_interval(self):
+        recorder = SqliteRecorder('cases.sql', buffer_size=1000, flush_interval=0.01)
+
+        prob = SellarProblem()
+        prob.model.add_recorder(recorder)
+        prob.setup()
+        prob.run_model()
+
+        # the case should be committed by the writer thread once the interval has elapsed
+        for i in range(500):
+            with sqlite3.connect('cases.sql') as con:
+                count = con.execute("SELECT COUNT(*) FROM system_iterations").fetchone()[0]
+            if count == 1:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(count, 1)
+        prob.cleanup()
+
+    def test_buffered_bad_args(self):
+        with self.assertRaises(ValueError) as cm:
+            SqliteRecorder('cases.sql', buffer_size=-1)
+
+        self.assertEqual(str(cm.exception),
+                         "SqliteRecorder buffer_size must be >= 0, but -1 was given.")
+
+        with self.assertRaises(ValueError) as cm:
+            SqliteRecorder('cases.sql', buffer_size=10, flush_interval=0.)
+
+        self.assertEqual(str(cm.exception),
+                         "SqliteRecorder flush_interval must be > 0, but 0.0 was given.")
+
+    def test_append(self):
+        tables = ('driver_iterations', 'system_iterations', 'solver_iterations')
+
+        def get_counters():
+            counters = {}
+            with database_cursor('cases.sql') as cur:
+                for table in tables:
+                    cur.execute("SELECT counter FROM %s ORDER BY id" % table)
+                    counters[table] = [row[0] for row in cur.fetchall()]
+            return counters
+
+        self._run_sellar_recording(SqliteRecorder('cases.sql'))
+        old_counters = get_counters()
+
+        cr = CaseReader('cases.sql')
+        expected = {}
+        for kind in ('driver_cases', 'system_cases', 'solver_cases'):
+            cases = getattr(cr, kind)
+            expected[kind] = (cases.list_cases(),
+                              [cases.get_case(i).outputs['obj'] for i in range(cases.num_cases)])
+
+        self._run_sellar_recording(SqliteRecorder('cases.sql', append=True))
+        cr = CaseReader('cases.sql')
+
+        # the appended cases are numbered after the ones already in the file
+        counters = get_counters()
+        old_max = max(max(old_counters[table] or [0]) for table in tables)
+        new_counters = [c for table in tables for c in counters[table][len(old_counters[table]):]]
+        self.assertTrue(new_counters)
+        self.assertTrue(min(new_counters) > old_max)
+
+        for kind in ('driver_cases', 'system_cases', 'solver_cases'):
+            coords, objs = expected[kind]
+            actual = getattr(cr, kind)
+
+            self.assertEqual(actual.list_cases(), 2 * coords)
+            for i, obj in enumerate(2 * objs):
+                assert_rel_error(self, actual.get_case(i).outputs['obj'], obj, 1e-15)
+
+        # the variable layouts of the earlier runs are reused
+        with database_cursor('cases.sql') as cur:
+            cur.execute("SELECT COUNT(*) FROM var_layouts")
+            nlayouts = cur.fetchone()[0]
+
+        self._run_sellar_recording(SqliteRecorder('cases.sql', append=True, buffer_size=4))
+
+        with database_cursor('cases.sql') as cur:
+            cur.execute("SELECT COUNT(*) FROM var_layouts")
+            self.assertEqual(cur.fetchone()[0], nlayouts)
+
+        self.assertEqual(CaseReader('cases.sql').driver_cases.list_cases(),
+                         3 * expected['driver_cases'][0])
+
+    def test_append_bad_file(self):
+        with open('cases.sql', 'w') as f:
+            f.write('not a case recording')
+
+        prob = SellarProblem()
+        prob.driver.add_recorder(SqliteRecorder('cases.sql', append=True))
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "Can't append to 'cases.sql' because it was not written by a "
+                         "SqliteRecorder using the current file format (version 5).")
+
 
 class TestFeatureSqliteRecorder(unittest.TestCase):
     def setUp(self):
@@ -10,6 +10,7 @@ from six.moves import range
 import numpy as np
 import scipy.linalg
 import scipy.sparse.linalg
+from scipy.sparse import csc_matrix
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.coo_matrix import COOMatrix
@@ -17,6 +18,10 @@ from openmdao.matrices.csr_matrix import CSRMatrix
 from openmdao.matrices.csc_matrix import CSCMatrix
 from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.recorders.recording_iteration_stack import Recording
+from openmdao.utils.coloring import _computing_coloring_context, _get_full_disjoint_cols
+
+# matrices built by DirectSolver._build_mtx with a larger fraction of nonzeros are kept dense
+_DENSE_FILL = 0.25
 
 
 def format_singular_error(err, system, mtx):
@@ -149,10 +154,40 @@ def format_nan_error(system, matrix):
 class DirectSolver(LinearSolver):
     """
     LinearSolver that uses linalg.solve or LU factor/solve.
+
+    Attributes
+    ----------
+    _lup : tuple or None
+        Dense LU factorization, from scipy.linalg.lu_factor.
+    _lu : SuperLU or None
+        Sparse LU factorization, from scipy.sparse.linalg.splu.
+    _factored_mtx : ndarray or sparse matrix or None
+        Copy of the matrix that was last factored, used to skip the factorization when the
+        matrix hasn't changed since the previous linearization.
+    _mtx_coloring : tuple or None
+        (colors, rows, cols, sparse) used by _build_mtx, where colors is a list of (seed, start,
+        end) giving the columns to seed together and the range of their nonzeros in rows and
+        cols. If rows is None, each column is seeded on its own and kept dense.
     """
 
     SOLVER = 'LN: Direct'
 
+    def __init__(self, **kwargs):
+        """
+        Declare the solver options.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            dictionary of options set by the instantiating class/script.
+        """
+        super(DirectSolver, self).__init__(**kwargs)
+
+        self._lup = None
+        self._lu = None
+        self._factored_mtx = None
+        self._mtx_coloring = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -169,6 +204,22 @@ class DirectSolver(LinearSolver):
         self.options.undeclare("atol")
         self.options.undeclare("rtol")
 
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super(DirectSolver, self)._setup_solvers(system, depth)
+
+        self._factored_mtx = None
+        self._mtx_coloring = None
+
     def _linearize_children(self):
         """
         Return a flag that is True when we need to call linearize on our subsystems' solvers.
@@ -182,45 +233,149 @@ class DirectSolver(LinearSolver):
 
     def _build_mtx(self):
         """
-        Assemble a Jacobian matrix by matrix-vector-product with columns of identity.
+        Assemble a Jacobian matrix by matrix-vector-products with seeds of colored columns.
 
         Returns
         -------
-        ndarray
+        ndarray or csc_matrix
             Jacobian matrix.
         """
         system = self._system
         bvec = system._vectors['residual']['linear']
         xvec = system._vectors['output']['linear']
 
+        if self._mtx_coloring is None:
+            self._mtx_coloring = self._compute_mtx_coloring()
+        colors, rows, cols, sparse = self._mtx_coloring
+
         # First make a backup of the vectors
         b_data = bvec._data.copy()
         x_data = xvec._data.copy()
 
         nmtx = x_data.size
-        eye = np.eye(nmtx)
-        mtx = np.empty((nmtx, nmtx), dtype=b_data.dtype)
+        if sparse:
+            data = np.empty(rows.size, dtype=b_data.dtype)
+        else:
+            mtx = np.zeros((nmtx, nmtx), dtype=b_data.dtype)
         scope_out, scope_in = system._get_scope()
         vnames = ['linear']
 
-        # Assemble the Jacobian by running the identity matrix through apply_linear
-        for i in range(nmtx):
-            # set value of x vector to provided value
-            xvec._data[:] = eye[:, i]
+        # Assemble the Jacobian by running the seed of each color through apply_linear
+        for seed, start, end in colors:
+            # set value of x vector to the seed of the color
+            xvec._data[:] = 0.
+            xvec._data[seed] = 1.
 
             # apply linear
             system._apply_linear(self._assembled_jac, vnames, self._rel_systems, 'fwd',
                                  scope_out, scope_in)
 
-            # put new value in out_vec
-            mtx[:, i] = bvec._data
+            # put the nonzeros of the seeded columns in the matrix
+            if rows is None:
+                mtx[:, seed] = bvec._data
+            elif sparse:
+                data[start:end] = bvec._data[rows[start:end]]
+            else:
+                mtx[rows[start:end], cols[start:end]] = bvec._data[rows[start:end]]
 
         # Restore the backed-up vectors
         bvec._data[:] = b_data
         xvec._data[:] = x_data
 
+        if sparse:
+            return csc_matrix((data, (rows, cols)), shape=(nmtx, nmtx))
+
         return mtx
 
+    def _compute_mtx_coloring(self):
+        """
+        Compute the column coloring of the Jacobian assembled by _build_mtx.
+
+        The nonzero structure of the Jacobian is probed once, with randomized subjacs, so
+        columns that don't share a nonzero row can be computed by the same matrix-vector product.
+        Matrix free systems, and subsystems with assembled jacobians, can't be probed, so their
+        Jacobian is computed one column at a time.
+
+        Returns
+        -------
+        tuple
+            (colors, rows, cols, sparse), as described for _mtx_coloring.
+        """
+        system = self._system
+        nmtx = system._vectors['output']['linear']._data.size
+
+        if system.matrix_free or any(s._assembled_jac is not None for s in
+                                     system.system_iter(recurse=True)):
+            return [(i, None, None) for i in range(nmtx)], None, None, False
+
+        bvec = system._vectors['residual']['linear']
+        xvec = system._vectors['output']['linear']
+        b_data = bvec._data.copy()
+        x_data = xvec._data.copy()
+        scope_out, scope_in = system._get_scope()
+
+        # the randomized subjacs shouldn't change the user's random number sequence
+        rand_state = np.random.get_state()
+
+        nz_rows = []
+        with _computing_coloring_context(system):
+            for i in range(nmtx):
+                xvec._data[:] = 0.
+                xvec._data[i] = 1.
+                system._apply_linear(self._assembled_jac, ['linear'], self._rel_systems, 'fwd',
+                                     scope_out, scope_in)
+                nz_rows.append(np.nonzero(bvec._data)[0])
+
+        np.random.set_state(rand_state)
+        bvec._data[:] = b_data
+        xvec._data[:] = x_data
+
+        nz_cols = [np.full(r.size, i, dtype=int) for i, r in enumerate(nz_rows)]
+        J = csc_matrix((np.ones(sum(r.size for r in nz_rows), dtype=int),
+                        (np.concatenate(nz_rows), np.concatenate(nz_cols))), shape=(nmtx, nmtx))
+
+        colors = []
+        rows = []
+        cols = []
+        start = 0
+
+        # two columns can't be seeded together if they have a nonzero in the same row
+        for col_group in _get_full_disjoint_cols(J):
+            col_group = np.sort(col_group)
+            rows.extend(nz_rows[c] for c in col_group)
+            cols.extend(nz_cols[c] for c in col_group)
+            end = start + sum(nz_rows[c].size for c in col_group)
+            colors.append((col_group, start, end))
+            start = end
+
+        return colors, np.concatenate(rows), np.concatenate(cols), J.nnz < _DENSE_FILL * nmtx ** 2
+
+    def _is_factored(self, matrix):
+        """
+        Return True if the given matrix is the same as the one that was last factored.
+
+        Parameters
+        ----------
+        matrix : ndarray or sparse matrix
+            Matrix to be factored.
+
+        Returns
+        -------
+        bool
+            True if the previous factorization can be reused.
+        """
+        prev = self._factored_mtx
+        if prev is None or prev.shape != matrix.shape or prev.dtype != matrix.dtype:
+            return False
+
+        if isinstance(matrix, np.ndarray):
+            return np.array_equal(prev, matrix)
+
+        # the sparsity pattern is fixed by the assembled jacobian, but compare it anyway
+        return (np.array_equal(prev.indptr, matrix.indptr) and
+                np.array_equal(prev.indices, matrix.indices) and
+                np.array_equal(prev.data, matrix.data))
+
     def _linearize(self):
         """
         Perform factorization.
@@ -233,6 +388,12 @@ class DirectSolver(LinearSolver):
             ranges = self._assembled_jac._view_ranges[system.pathname]
             matrix = mtx._matrix[ranges[0]:ranges[1], ranges[0]:ranges[1]]
 
+            # Skip the factorization if the matrix hasn't changed, e.g. when all of the
+            # subjacs are constant.
+            if self._is_factored(matrix):
+                return
+            self._factored_mtx = None
+
             # Perform dense or sparse lu factorization
             if isinstance(mtx, DenseMatrix):
                 # During LU decomposition, detect singularities and warn user.
@@ -266,24 +427,41 @@ class DirectSolver(LinearSolver):
                 raise RuntimeError("Direct solver not implemented for matrix type %s"
                                    " in system '%s'." % (type(mtx), system.pathname))
 
+            self._factored_mtx = matrix.copy()
+
         else:
             mtx = self._build_mtx()
 
-            # During LU decomposition, detect singularities and warn user.
-            with warnings.catch_warnings():
-
-                if self.options['err_on_singular']:
-                    warnings.simplefilter('error', RuntimeWarning)
+            if self._is_factored(mtx):
+                return
+            self._factored_mtx = None
 
+            if isinstance(mtx, csc_matrix):
                 try:
-                    self._lup = scipy.linalg.lu_factor(mtx)
+                    self._lu = scipy.sparse.linalg.splu(mtx)
+                except RuntimeError as err:
+                    if 'exactly singular' in str(err):
+                        raise RuntimeError(format_singular_csc_error(system, mtx))
+                    else:
+                        reraise(*sys.exc_info())
+            else:
+                # During LU decomposition, detect singularities and warn user.
+                with warnings.catch_warnings():
 
-                except RuntimeWarning as err:
-                    raise RuntimeError(format_singular_error(err, system, mtx))
+                    if self.options['err_on_singular']:
+                        warnings.simplefilter('error', RuntimeWarning)
 
-                # NaN in matrix.
-                except ValueError as err:
-                    raise RuntimeError(format_nan_error(system, mtx))
+                    try:
+                        self._lup = scipy.linalg.lu_factor(mtx)
+
+                    except RuntimeWarning as err:
+                        raise RuntimeError(format_singular_error(err, system, mtx))
+
+                    # NaN in matrix.
+                    except ValueError as err:
+                        raise RuntimeError(format_nan_error(system, mtx))
+
+            self._factored_mtx = mtx
 
     def _inverse(self):
         """
@@ -332,8 +510,24 @@ class DirectSolver(LinearSolver):
                 raise RuntimeError("Direct solver not implemented for matrix type %s"
                                    " in system '%s'." % (type(mtx), system.pathname))
 
+            # return the inverse of the physical jacobian if the scaling is folded into it
+            if self._assembled_jac._fold_scaling is not None:
+                row_scale, col_scale = self._assembled_jac._fold_scaling
+                if isinstance(mtx, DenseMatrix):
+                    if col_scale is not None:
+                        inv_jac *= col_scale[:, np.newaxis]
+                    if row_scale is not None:
+                        inv_jac *= row_scale
+                else:
+                    if col_scale is not None:
+                        inv_jac = scipy.sparse.diags(col_scale).dot(inv_jac)
+                    if row_scale is not None:
+                        inv_jac = inv_jac.dot(scipy.sparse.diags(row_scale))
+
         else:
             mtx = self._build_mtx()
+            if isinstance(mtx, csc_matrix):
+                mtx = mtx.toarray()
 
             # During inversion detect singularities and warn user.
             with warnings.catch_warnings():
@@ -353,6 +547,28 @@ class DirectSolver(LinearSolver):
 
         return inv_jac
 
+    def _solve_assembled(self, b_data, trans_lu, trans_splu):
+        """
+        Solve with the factorization of the assembled jacobian.
+
+        Parameters
+        ----------
+        b_data : ndarray
+            Right hand side.
+        trans_lu : int
+            Transpose flag for the dense factorization.
+        trans_splu : str
+            Transpose flag for the sparse factorization.
+
+        Returns
+        -------
+        ndarray
+            Solution.
+        """
+        if isinstance(self._assembled_jac._int_mtx, (COOMatrix, CSRMatrix, CSCMatrix)):
+            return self._lu.solve(b_data, trans_splu)
+        return scipy.linalg.lu_solve(self._lup, b_data, trans=trans_lu)
+
     def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
@@ -402,17 +618,25 @@ class DirectSolver(LinearSolver):
                     trans_lu = 1
                     trans_splu = 'T'
 
-                # AssembledJacobians are unscaled.
+                # AssembledJacobians are unscaled, unless the scaling is folded into them.
                 if self._assembled_jac is not None:
-                    with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
-                        if (isinstance(self._assembled_jac._int_mtx,
-                                       (COOMatrix, CSRMatrix, CSCMatrix))):
-                            x_vec._data[:] = self._lu.solve(b_vec._data, trans_splu)
-                        else:
-                            x_vec._data[:] = scipy.linalg.lu_solve(self._lup, b_vec._data,
-                                                                   trans=trans_lu)
+                    if self._assembled_jac._fold_scaling is None:
+                        with system._unscaled_context(outputs=[d_outputs],
+                                                      residuals=[d_residuals]):
+                            x_vec._data[:] = self._solve_assembled(b_vec._data, trans_lu,
+                                                                   trans_splu)
+                    elif mode == 'fwd':
+                        x_vec._data[:] = self._solve_assembled(b_vec._data, trans_lu, trans_splu)
+                    else:  # rev
+                        row_sq, col_sq = self._assembled_jac._get_rev_scaling(b_vec._ncol)
+                        b_data = b_vec._data if col_sq is None else b_vec._data * col_sq
+                        x_vec._data[:] = self._solve_assembled(b_data, trans_lu, trans_splu)
+                        if row_sq is not None:
+                            x_vec._data *= row_sq
 
                 # MVP-generated jacobians are scaled.
+                elif isinstance(self._factored_mtx, csc_matrix):
+                    x_vec._data[:] = self._lu.solve(b_vec._data, trans_splu)
                 else:
                     x_vec._data[:] = scipy.linalg.lu_solve(self._lup, b_vec._data, trans=trans_lu)
 
@@ -78,6 +78,26 @@ class DupPartialsComp(ExplicitComponent):
     def compute_partials(self, inputs, partials):
         pass
 
+class ElementwiseComp(ExplicitComponent):
+    def initialize(self):
+        self.options.declare('size', types=int)
+        self.options.declare('a', types=float)
+        self.options.declare('n', types=int)
+
+    def setup(self):
+        size = self.options['size']
+        self.add_input('x', np.zeros(size))
+        self.add_output('y', np.zeros(size))
+        self.declare_partials('y', 'x', rows=np.arange(size), cols=np.arange(size))
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = self.options['a'] * inputs['x'] ** self.options['n']
+
+    def compute_partials(self, inputs, partials):
+        n = self.options['n']
+        partials['y', 'x'] = n * self.options['a'] * inputs['x'] ** (n - 1)
+
+
 class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
 
     linear_solver_class = DirectSolver
@@ -519,6 +539,94 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
 
         self.assertEqual(expected_msg, str(cm.exception))
 
+    def test_reuse_factorization(self):
+        for jac_type in ('csc', 'dense', None):
+            prob = Problem(model=Group())
+            model = prob.model
+
+            model.add_subsystem('p', IndepVarComp('x', np.arange(3, dtype=float) + 1.0))
+            model.add_subsystem('c1', ExecComp('y = 4.0*x', x=np.zeros(3), y=np.zeros(3)))
+            model.add_subsystem('c2', ExecComp('y = x**2', x=np.zeros(3), y=np.zeros(3)))
+            model.connect('p.x', 'c1.x')
+            model.connect('c1.y', 'c2.x')
+
+            if jac_type is None:
+                model.linear_solver = DirectSolver()
+                # the ExecComp partials are diagonal, so the matrix is built sparse
+                factor_attr = '_lu'
+            else:
+                model.linear_solver = DirectSolver(assemble_jac=True)
+                model.options['assembled_jac_type'] = jac_type
+                factor_attr = '_lu' if jac_type == 'csc' else '_lup'
+
+            prob.setup()
+            prob.run_model()
+
+            J = prob.compute_totals(of=['c2.y'], wrt=['p.x'], return_format='array')
+            assert_rel_error(self, J, np.diag(32. * prob['p.x']), 1e-12)
+            factorization = getattr(model.linear_solver, factor_attr)
+
+            # same point, so the jacobian is unchanged and the factorization is reused
+            prob.run_model()
+            J = prob.compute_totals(of=['c2.y'], wrt=['p.x'], return_format='array')
+            assert_rel_error(self, J, np.diag(32. * prob['p.x']), 1e-12)
+            self.assertIs(getattr(model.linear_solver, factor_attr), factorization)
+
+            # new point, so the jacobian has to be factored again
+            prob['p.x'] = np.arange(3, dtype=float) + 5.0
+            prob.run_model()
+            J = prob.compute_totals(of=['c2.y'], wrt=['p.x'], return_format='array')
+            assert_rel_error(self, J, np.diag(32. * prob['p.x']), 1e-12)
+            self.assertIsNot(getattr(model.linear_solver, factor_attr), factorization)
+
+    def test_colored_build_mtx(self):
+        size = 30
+        prob = Problem(model=Group())
+        model = prob.model
+
+        model.add_subsystem('p', IndepVarComp('x', np.arange(size, dtype=float) + 1.0))
+        model.add_subsystem('c1', ElementwiseComp(size=size, a=4.0, n=1))
+        model.add_subsystem('c2', ElementwiseComp(size=size, a=1.0, n=2))
+        model.add_subsystem('c3', ElementwiseComp(size=size, a=3.0, n=1))
+        model.connect('p.x', 'c1.x')
+        model.connect('c1.y', 'c2.x')
+        model.connect('c2.y', 'c3.x')
+
+        model.linear_solver = DirectSolver()
+
+        prob.setup()
+        prob.run_model()
+
+        J = prob.compute_totals(of=['c3.y'], wrt=['p.x'], return_format='array')
+        assert_rel_error(self, J, np.diag(96. * prob['p.x']), 1e-12)
+
+        # all of the variables are elementwise, so the matrix is built from a few products
+        colors, _, _, sparse = model.linear_solver._mtx_coloring
+        self.assertEqual(len(colors), 2)
+        self.assertTrue(sparse)
+
+        mtx = model.linear_solver._build_mtx()
+        expected = -np.eye(4 * size)
+        for i in range(size):
+            expected[size + i, i] = 4.0
+            expected[2 * size + i, size + i] = 8.0 * prob['p.x'][i]
+            expected[3 * size + i, 2 * size + i] = 3.0
+        assert_rel_error(self, mtx.toarray(), expected, 1e-12)
+
+    def test_colored_build_mtx_dense(self):
+        prob = Problem(model=SellarDerivatives(nonlinear_solver=NewtonSolver,
+                                               linear_solver=DirectSolver))
+
+        prob.setup()
+        prob.run_model()
+
+        # the sellar jacobian is nearly full, so it is kept dense
+        mtx = prob.model.linear_solver._build_mtx()
+        self.assertIsInstance(mtx, np.ndarray)
+
+        J = prob.compute_totals(of=['obj'], wrt=['z'], return_format='array')
+        assert_rel_error(self, J, [[9.61001056, 1.78448534]], .00001)
+
 
 class TestDirectSolverFeature(unittest.TestCase):
 
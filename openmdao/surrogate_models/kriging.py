@@ -3,12 +3,45 @@
 import numpy as np
 import scipy.linalg as linalg
 from scipy.optimize import minimize
-from six.moves import zip, range
+from six.moves import range
 
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
 
 MACHINE_EPSILON = np.finfo(np.double).eps
 
+# the surrogate being trained in a worker process of a multi-start hyperparameter optimization
+_worker_surrogate = None
+
+
+def _init_start_worker(surrogate):
+    """
+    Store the surrogate being trained in a worker process.
+
+    Parameters
+    ----------
+    surrogate : KrigingSurrogate
+        The surrogate being trained, holding the normalized training data.
+    """
+    global _worker_surrogate
+    _worker_surrogate = surrogate
+
+
+def _optimize_thetas_in_worker(x0):
+    """
+    Run one start of the hyperparameter optimization in a worker process.
+
+    Parameters
+    ----------
+    x0 : ndarray
+        Initial guess of the log of the hyperparameters.
+
+    Returns
+    -------
+    OptimizeResult
+        The result of the optimization.
+    """
+    return _worker_surrogate._optimize_thetas(x0)
+
 
 class KrigingSurrogate(SurrogateModel):
     """
@@ -24,7 +57,10 @@ class KrigingSurrogate(SurrogateModel):
     eval_rmse : bool
         When true, calculate the root mean square prediction error.
     L : ndarray
-        Reduced likelihood parameter: L
+        Reduced likelihood parameter: L, the Cholesky factor of the correlation matrix when
+        method is 'cholesky'.
+    method : str
+        How the correlation matrix is factored, 'svd' or 'cholesky'.
     n_dims : int
         Number of independents in the surrogate
     n_samples : int
@@ -33,6 +69,10 @@ class KrigingSurrogate(SurrogateModel):
         Nugget smoothing parameter for smoothing noisy data. Represents the variance
         of the input values. If nugget is an ndarray, it must be of the same length
         as the number of training points. Default: 10. * Machine Epsilon
+    num_starts : int
+        Number of starting points of the hyperparameter optimization.
+    num_workers : int
+        Number of processes that run the starts of the hyperparameter optimization.
     sigma2 : ndarray
         Reduced likelihood parameter: sigma squared
     thetas : ndarray
@@ -49,9 +89,14 @@ class KrigingSurrogate(SurrogateModel):
         Mean of training model response values, normalized.
     Y_std : ndarray
         Standard deviation of training model response values, normalized.
+    _sq_distances : ndarray
+        Squared distances between each pair of normalized training points along each dimension,
+        with shape (n_dims, n_pairs). The pairs are ordered as the upper triangle of the
+        correlation matrix.
     """
 
-    def __init__(self, nugget=10. * MACHINE_EPSILON, eval_rmse=False):
+    def __init__(self, nugget=10. * MACHINE_EPSILON, eval_rmse=False, method='svd',
+                 num_starts=1, num_workers=1):
         """
         Initialize all attributes.
 
@@ -65,9 +110,25 @@ class KrigingSurrogate(SurrogateModel):
         eval_rmse : bool
             Flag indicating whether the Root Mean Squared Error (RMSE) should be computed.
             Set to False by default.
+        method : str
+            How the correlation matrix is factored when training. 'svd' uses a regularized
+            pseudo-inverse and finite difference gradients of the likelihood. 'cholesky' uses a
+            Cholesky factorization and analytic gradients, which is much faster, but requires a
+            nugget large enough to keep the correlation matrix positive definite.
+        num_starts : int
+            Number of starting points of the hyperparameter optimization. The first one is the
+            default initial guess, the others are drawn at random (reproducibly) within the
+            bounds. The hyperparameters with the best likelihood are kept.
+        num_workers : int
+            Number of processes that run the starts of the hyperparameter optimization
+            concurrently.
         """
         super(KrigingSurrogate, self).__init__()
 
+        if method not in ('svd', 'cholesky'):
+            raise ValueError("KrigingSurrogate: method must be 'svd' or 'cholesky', "
+                             "but '%s' was given." % method)
+
         self.n_dims = 0                 # number of independent
         self.n_samples = 0              # number of training points
         self.thetas = np.zeros(0)
@@ -89,6 +150,11 @@ class KrigingSurrogate(SurrogateModel):
 
         self.eval_rmse = eval_rmse
 
+        self.method = method
+        self.num_starts = num_starts
+        self.num_workers = num_workers
+        self._sq_distances = np.zeros(0)
+
     def train(self, x, y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -126,28 +192,141 @@ class KrigingSurrogate(SurrogateModel):
         self.X_mean, self.X_std = X_mean, X_std
         self.Y_mean, self.Y_std = Y_mean, Y_std
 
+        # squared distances between the training points, for all correlation matrices
+        rows, cols = np.triu_indices(self.n_samples, 1)
+        self._sq_distances = np.square(X[rows] - X[cols]).T
+
+        # the first start is the default initial guess, others are spread over the bounds
+        lower, upper = np.log(1e-5), np.log(1e5)
+        x0s = [1e-1 * np.ones(self.n_dims)]
+        if self.num_starts > 1:
+            rand = np.random.RandomState(0)
+            x0s.extend(rand.uniform(lower, upper, (self.num_starts - 1, self.n_dims)))
+
+        if self.num_workers > 1 and len(x0s) > 1:
+            from multiprocessing import Pool
+
+            pool = Pool(min(self.num_workers, len(x0s)), _init_start_worker, (self,))
+            try:
+                results = pool.map(_optimize_thetas_in_worker, x0s)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [self._optimize_thetas(x0) for x0 in x0s]
+
+        successes = [result for result in results if result.success]
+        if not successes:
+            raise ValueError(
+                'Kriging Hyper-parameter optimization failed: {0}'.format(results[0].message))
+
+        optResult = min(successes, key=lambda result: result.fun)
+
+        self.thetas = np.exp(optResult.x)
+        _, params = self._calculate_reduced_likelihood_params()
+        self.alpha = params['alpha']
+        self.sigma2 = params['sigma2']
+        if self.method == 'cholesky':
+            self.L = params['L']
+        else:
+            self.U = params['U']
+            self.S_inv = params['S_inv']
+            self.Vh = params['Vh']
+
+    def _optimize_thetas(self, x0):
+        """
+        Find the hyperparameters that maximize the likelihood, starting from the given point.
+
+        Parameters
+        ----------
+        x0 : ndarray
+            Initial guess of the log of the hyperparameters.
+
+        Returns
+        -------
+        OptimizeResult
+            The result of the optimization, in terms of the log of the hyperparameters.
+        """
+        bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
+
+        if self.method == 'cholesky':
+            def _calcll(log_thetas):
+                """Calculate loglike and its gradient (callback function)."""
+                thetas = np.exp(log_thetas)
+                loglike, grad = self._calculate_reduced_likelihood_grad(thetas)
+                return -loglike, -grad * thetas
+
+            return minimize(_calcll, x0, method='slsqp', jac=True, bounds=bounds)
+
         def _calcll(thetas):
             """Calculate loglike (callback function)."""
             loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
             return -loglike
 
-        bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
+        return minimize(_calcll, x0, method='slsqp', options={'eps': 1e-3}, bounds=bounds)
 
-        optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method='slsqp',
-                             options={'eps': 1e-3},
-                             bounds=bounds)
+    def _correlation_matrix(self, thetas):
+        """
+        Calculate the correlation matrix of the training points.
 
-        if not optResult.success:
-            raise ValueError(
-                'Kriging Hyper-parameter optimization failed: {0}'.format(optResult.message))
+        Parameters
+        ----------
+        thetas : ndarray
+            Correlation coefficients.
 
-        self.thetas = np.exp(optResult.x)
-        _, params = self._calculate_reduced_likelihood_params()
-        self.alpha = params['alpha']
-        self.U = params['U']
-        self.S_inv = params['S_inv']
-        self.Vh = params['Vh']
-        self.sigma2 = params['sigma2']
+        Returns
+        -------
+        ndarray
+            The correlation matrix.
+        """
+        n = self.n_samples
+        rows, cols = np.triu_indices(n, 1)
+
+        R = np.empty((n, n))
+        R[rows, cols] = R[cols, rows] = np.exp(-thetas.dot(self._sq_distances))
+        R[np.diag_indices_from(R)] = 1. + self.nugget
+
+        return R
+
+    def _calculate_reduced_likelihood_grad(self, thetas):
+        """
+        Calculate the reduced likelihood and its gradient using a Cholesky factorization.
+
+        Parameters
+        ----------
+        thetas : ndarray
+            Correlation coefficients.
+
+        Returns
+        -------
+        float
+            Calculated reduced_likelihood, or -inf if the correlation matrix is not positive
+            definite.
+        ndarray
+            Gradient of the reduced likelihood wrt thetas.
+        """
+        n = self.n_samples
+        R = self._correlation_matrix(thetas)
+
+        try:
+            L = linalg.cholesky(R, lower=True)
+        except linalg.LinAlgError:
+            return -np.inf, np.zeros(self.n_dims)
+
+        # sum(sigma2) = y.R^-1.y / n, with y the sum of the columns of Y
+        a = linalg.cho_solve((L, True), self.Y.sum(axis=1))
+        sigma2_sum = self.Y.sum(axis=1).dot(a) / n
+        logdet = 2. * np.sum(np.log(np.diag(L)))
+        reduced_likelihood = -(np.log(sigma2_sum) + logdet / n)
+
+        # dR/dthetas[k] = -D[k] * R, so the derivative of the reduced likelihood wrt thetas[k]
+        # is the sum of D[k] * R * (R^-1 - a.a^T / sum(sigma2)) / n over both triangles
+        Rinv = linalg.cho_solve((L, True), np.eye(n))
+        M = R * (Rinv - np.outer(a, a) / sigma2_sum)
+        rows, cols = np.triu_indices(n, 1)
+        grad = 2. * self._sq_distances.dot(M[rows, cols]) / n
+
+        return reduced_likelihood, grad
 
     def _calculate_reduced_likelihood_params(self, thetas=None):
         """
@@ -169,17 +348,25 @@ class KrigingSurrogate(SurrogateModel):
         if thetas is None:
             thetas = self.thetas
 
-        X, Y = self.X, self.Y
+        Y = self.Y
         params = {}
 
         # Correlation Matrix
-        distances = np.zeros((self.n_samples, self.n_dims, self.n_samples))
-        for i in range(self.n_samples):
-            distances[i, :, i + 1:] = np.abs(X[i, ...] - X[i + 1:, ...]).T
-            distances[i + 1:, :, i] = distances[i, :, i + 1:].T
+        R = self._correlation_matrix(thetas)
 
-        R = np.exp(-thetas.dot(np.square(distances)))
-        R[np.diag_indices_from(R)] = 1. + self.nugget
+        if self.method == 'cholesky':
+            L = linalg.cholesky(R, lower=True)
+            alpha = linalg.cho_solve((L, True), Y)
+            logdet = 2. * np.sum(np.log(np.diag(L)))
+            sigma2 = np.dot(Y.T, alpha).sum(axis=0) / self.n_samples
+            reduced_likelihood = -(np.log(np.sum(sigma2)) +
+                                   logdet / self.n_samples)
+
+            params['alpha'] = alpha
+            params['sigma2'] = sigma2 * np.square(self.Y_std)
+            params['L'] = L
+
+            return reduced_likelihood, params
 
         [U, S, Vh] = linalg.svd(R)
 
@@ -212,7 +399,7 @@ class KrigingSurrogate(SurrogateModel):
         Parameters
         ----------
         x : array-like
-            Point at which the surrogate is evaluated.
+            Point(s) at which the surrogate is evaluated.
 
         Returns
         -------
@@ -223,18 +410,11 @@ class KrigingSurrogate(SurrogateModel):
         """
         super(KrigingSurrogate, self).predict(x)
 
-        thetas = self.thetas
         if isinstance(x, list):
             x = np.array(x)
         x = np.atleast_2d(x)
-        n_eval = x.shape[0]
 
-        # Normalize input
-        x_n = (x - self.X_mean) / self.X_std
-
-        r = np.zeros((n_eval, self.n_samples), dtype=x.dtype)
-        for r_i, x_i in zip(r, x_n):
-            r_i[:] = np.exp(-thetas.dot(np.square((x_i - self.X).T)))
+        r = self._correlation(x)
 
         # Scaled Predictor
         y_t = np.dot(r, self.alpha)
@@ -243,8 +423,14 @@ class KrigingSurrogate(SurrogateModel):
         y = self.Y_mean + self.Y_std * y_t
 
         if self.eval_rmse:
-            mse = (1. - np.dot(np.dot(r, self.Vh.T),
-                               np.einsum('j,kj,lk->jl', self.S_inv, self.U, r))) * self.sigma2
+            # diagonal of r.R^-1.r^T, one entry per point
+            if self.method == 'cholesky':
+                r_t = linalg.solve_triangular(self.L, r.T, lower=True)
+                rRr = np.sum(np.square(r_t), axis=0)
+            else:
+                rRr = np.einsum('ij,j,ij->i', np.dot(r, self.Vh.T), self.S_inv,
+                                np.dot(r, self.U))
+            mse = (1. - rRr)[:, np.newaxis] * self.sigma2
 
             # Forcing negative RMSE to zero if negative due to machine precision
             mse[mse < 0.] = 0.
@@ -252,6 +438,48 @@ class KrigingSurrogate(SurrogateModel):
 
         return y
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response based on the current trained model.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate is evaluated, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Kriging predictions, with shape (n_points, n_outputs).
+        ndarray, optional (if eval_rmse is True)
+            Root mean square of the prediction errors, with shape (n_points, n_outputs).
+        """
+        return KrigingSurrogate.predict(self, x)
+
+    def _correlation(self, x):
+        """
+        Calculate the correlation between points and the training points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Correlations, with shape (n_points, n_samples).
+        """
+        # Normalize input
+        x_n = (x - self.X_mean) / self.X_std
+
+        # sum over the (few) dimensions to keep the temporaries at n_points x n_samples
+        dist = np.zeros((x.shape[0], self.n_samples), dtype=x_n.dtype)
+        for k, theta in enumerate(self.thetas):
+            dist += theta * np.square(x_n[:, k, np.newaxis] - self.X[:, k])
+
+        return np.exp(-dist)
+
     def linearize(self, x):
         """
         Calculate the jacobian of the Kriging surface at the requested point.
@@ -266,20 +494,38 @@ class KrigingSurrogate(SurrogateModel):
         ndarray
             Jacobian of surrogate output wrt inputs.
         """
-        thetas = self.thetas
+        return self.vectorized_linearize(np.atleast_2d(x))[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the Kriging surface at the requested points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate Jacobian is evaluated, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Jacobians of surrogate outputs wrt inputs, with shape (n_points, n_outputs, n_dims).
+        """
+        r = self._correlation(x)
 
         # Normalize Input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.exp(-thetas.dot(np.square((x_n - self.X).T)))
+        n_points = x.shape[0]
+        n_outputs = self.alpha.shape[1]
+
+        # d r[p, s] / d x_n[p, k] = -2 * thetas[k] * (x_n[p, k] - X[s, k]) * r[p, s], so
+        # d y_t[p, o] / d x_n[p, k] = -2 * thetas[k] * (x_n[p, k] * (r.alpha)[p, o] -
+        #                                               sum_s(r[p, s] * alpha[s, o] * X[s, k]))
+        alpha_X = np.einsum('so,sk->sok', self.alpha, self.X).reshape(self.n_samples, -1)
+        gradr = x_n[:, np.newaxis, :] * np.dot(r, self.alpha)[:, :, np.newaxis] - \
+            np.dot(r, alpha_X).reshape(n_points, n_outputs, self.n_dims)
 
-        # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-        # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-        # i.e., Z[i,j] = X[i]*Y[i,j]
-        gradr = r * -2 * np.einsum('i,ij->ij', thetas, (x_n - self.X).T)
-        jac = np.einsum('i,j,ij->ij', self.Y_std, 1. /
-                        self.X_std, gradr.dot(self.alpha).T)
-        return jac
+        return gradr * (-2. * self.thetas / self.X_std) * self.Y_std[:, np.newaxis]
 
 
 class FloatKrigingSurrogate(KrigingSurrogate):
@@ -305,3 +551,22 @@ class FloatKrigingSurrogate(KrigingSurrogate):
         """
         dist = super(FloatKrigingSurrogate, self).predict(x)
         return dist[0]  # mean value
+
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response based on the current trained model.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate is evaluated, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Mean values of kriging predictions, with shape (n_points, n_outputs).
+        """
+        dist = super(FloatKrigingSurrogate, self).vectorized_predict(x)
+        if self.eval_rmse:
+            return dist[0]
+        return dist
@@ -971,6 +971,26 @@ class MultiFiCoKrigingSurrogate(MultiFiSurrogateModel):
         Y_pred, MSE = self.model.predict([new_x])
         return Y_pred, np.sqrt(np.abs(MSE))
 
+    def vectorized_predict(self, new_x):
+        """
+        Calculate predicted values of the response based on the current trained model.
+
+        Parameters
+        ----------
+        new_x : ndarray
+            An array with shape (n_eval, n_features) giving the points at
+            which the predictions should be made.
+
+        Returns
+        -------
+        array_like
+            An array with shape (n_eval, 1) with the Best Linear Unbiased Prediction at X.
+        array_like
+            An array with shape (n_eval, 1) with the square root of the Mean Squared Error at X.
+        """
+        Y_pred, MSE = self.model.predict(new_x)
+        return Y_pred, np.sqrt(np.abs(MSE))
+
     def train_multifi(self, X, Y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -1042,7 +1062,25 @@ class FloatMultiFiCoKrigingSurrogate(MultiFiCoKrigingSurrogate):
             New predicted value.
         """
         dist = super(FloatMultiFiCoKrigingSurrogate, self).predict(new_x)
-        return dist.mu
+        return dist[0]
+
+    def vectorized_predict(self, new_x):
+        """
+        Calculate predicted values of the response based on the current trained model.
+
+        Parameters
+        ----------
+        new_x : ndarray
+            An array with shape (n_eval, n_features) giving the points at
+            which the predictions should be made.
+
+        Returns
+        -------
+        ndarray
+            New predicted values, with shape (n_eval, 1).
+        """
+        dist = super(FloatMultiFiCoKrigingSurrogate, self).vectorized_predict(new_x)
+        return dist[0]
 
 
 if __name__ == "__main__":
@@ -92,6 +92,25 @@ class NearestNeighbor(SurrogateModel):
         super(NearestNeighbor, self).predict(x)
         return self.interpolant(x, **kwargs)
 
+    def vectorized_predict(self, x, **kwargs):
+        """
+        Calculate predicted values of the response based on the current trained model.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate is evaluated, with shape (n_points, n_dims).
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Predicted values, with shape (n_points, n_outputs).
+        """
+        super(NearestNeighbor, self).predict(x)
+        return self.interpolant(x, **kwargs)
+
     def linearize(self, x, **kwargs):
         """
         Calculate the jacobian of the interpolant at the requested point.
@@ -112,3 +131,21 @@ class NearestNeighbor(SurrogateModel):
         if jac.shape[0] == 1 and len(jac.shape) > 2:
             return jac[0, ...]
         return jac
+
+    def vectorized_linearize(self, x, **kwargs):
+        """
+        Calculate the jacobians of the interpolant at the requested points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate Jacobian is evaluated, with shape (n_points, n_dims).
+        **kwargs : dict
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            Jacobians of surrogate outputs wrt inputs, with shape (n_points, n_outputs, n_dims).
+        """
+        return self.interpolant.gradient(x, **kwargs)
@@ -3,7 +3,7 @@
 Surrogate Model based on second order response surface equations.
 """
 
-from numpy import zeros, einsum
+from numpy import zeros, einsum, atleast_2d, newaxis
 from numpy.dual import lstsq
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
 from six.moves import range
@@ -47,8 +47,31 @@ class ResponseSurface(SurrogateModel):
         """
         super(ResponseSurface, self).train(x, y)
 
-        m = self.m = x.shape[0]
-        n = self.n = x.shape[1]
+        self.m = x.shape[0]
+        self.n = x.shape[1]
+
+        X = self._terms(x)
+
+        # Determine response surface equation coefficients (betas) using least
+        # squares
+        self.betas, rs, r, s = lstsq(X, y)
+
+    def _terms(self, x):
+        """
+        Calculate the terms of the response surface equation at a set of points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points, with shape (n_points, n).
+
+        Returns
+        -------
+        ndarray
+            Constant, linear, squared and cross terms at each point.
+        """
+        m = x.shape[0]
+        n = self.n
 
         X = zeros((m, ((n + 1) * (n + 2)) // 2))
 
@@ -69,9 +92,7 @@ class ResponseSurface(SurrogateModel):
             X_offset[:, :n - i] = einsum('i,ij->ij', x[:, i], x[:, i:])
             X_offset = X_offset[:, n - i:]
 
-        # Determine response surface equation coefficients (betas) using least
-        # squares
-        self.betas, rs, r, s = lstsq(X, y)
+        return X
 
     def predict(self, x):
         """
@@ -110,6 +131,24 @@ class ResponseSurface(SurrogateModel):
         # Predict new_y using X and betas
         return X.dot(self.betas)
 
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of response based on the current response surface model.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate is evaluated, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Predicted responses, with shape (n_points, n_outputs).
+        """
+        super(ResponseSurface, self).predict(x)
+
+        return self._terms(atleast_2d(x)).dot(self.betas)
+
     def linearize(self, x):
         """
         Calculate the jacobian of the Kriging surface at the requested point.
@@ -137,3 +176,32 @@ class ResponseSurface(SurrogateModel):
             beta_offset = beta_offset[n - i:, :]
 
         return jac.T
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the response surface at the requested points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate Jacobian is evaluated, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Jacobians of surrogate outputs wrt inputs, with shape (n_points, n_outputs, n_dims).
+        """
+        n = self.n
+        betas = self.betas
+
+        x = atleast_2d(x)
+
+        jac = zeros((x.shape[0], n, betas.shape[1]))
+        jac[:] = betas[1:n + 1, :]
+        beta_offset = betas[n + 1:, :]
+        for i in range(n):
+            jac[:, i, :] += x[:, i:].dot(beta_offset[:n - i, :])
+            jac[:, i:, :] += x[:, i, newaxis, newaxis] * beta_offset[:n - i, :]
+            beta_offset = beta_offset[n - i:, :]
+
+        return jac.transpose(0, 2, 1)
@@ -52,8 +52,8 @@ class SurrogateModel(object):
 
         Parameters
         ----------
-        x : array-like
-            Vectorized point(s) at which the surrogate is evaluated.
+        x : ndarray
+            Points at which the surrogate is evaluated, with shape (n_points, n_dims).
         """
         pass
 
@@ -68,6 +68,17 @@ class SurrogateModel(object):
         """
         pass
 
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the interpolant at the requested points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points at which the surrogate Jacobian is evaluated, with shape (n_points, n_dims).
+        """
+        pass
+
 
 class MultiFiSurrogateModel(SurrogateModel):
     """
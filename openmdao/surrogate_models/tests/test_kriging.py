@@ -149,5 +149,78 @@ class TestKrigingSurrogate(unittest.TestCase):
         jac = surrogate.linearize(np.array([[0.5, 0.5]]))
         assert_rel_error(self, jac, np.array([[1, 1], [1, -1], [1, 2]]), 5e-4)
 
+    def test_cholesky(self):
+        x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
+                      [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
+                      [10., 12.], [7., 13.5], [2.5, 15.]])
+        y = np.array([[branin(case)] for case in x])
+
+        surrogate = KrigingSurrogate(nugget=1e-10, eval_rmse=True, method='cholesky')
+        surrogate.train(x, y)
+
+        for x0, y0 in zip(x, y):
+            mu, sigma = surrogate.predict(x0)
+            assert_rel_error(self, mu, [y0], 1e-6)
+            assert_rel_error(self, sigma, [[0]], 1e-2)
+
+        # same hyperparameters and predictions as the svd based training
+        expected = KrigingSurrogate(nugget=1e-10, eval_rmse=True)
+        expected.train(x, y)
+
+        assert_rel_error(self, surrogate.thetas, expected.thetas, 1e-3)
+
+        mu, sigma = surrogate.predict([5., 5.])
+        expected_mu, expected_sigma = expected.predict([5., 5.])
+        assert_rel_error(self, mu, expected_mu, 1e-3)
+        assert_rel_error(self, sigma, expected_sigma, 1e-2)
+
+    def test_cholesky_likelihood_gradient(self):
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(0, 1, 6), repeat=2)])
+        y = np.array([[np.sin(3 * a) + b * b, a - b] for a, b in x])
+
+        surrogate = KrigingSurrogate(nugget=1e-6, method='cholesky')
+        surrogate.train(x, y)
+
+        thetas = np.array([.7, 2.])
+        loglike, grad = surrogate._calculate_reduced_likelihood_grad(thetas)
+
+        assert_rel_error(self, loglike,
+                         surrogate._calculate_reduced_likelihood_params(thetas)[0], 1e-12)
+
+        h = 1e-6
+        fd = [(surrogate._calculate_reduced_likelihood_grad(thetas + h * e)[0] -
+               surrogate._calculate_reduced_likelihood_grad(thetas - h * e)[0]) / (2 * h)
+              for e in np.eye(2)]
+        assert_rel_error(self, grad, fd, 1e-6)
+
+    def test_multistart(self):
+        x = np.array([[a, b] for a, b in
+                      itertools.product(np.linspace(0, 1, 6), repeat=2)])
+        y = np.array([[np.sin(3 * a) + b * b] for a, b in x])
+
+        single = KrigingSurrogate(nugget=1e-6, method='cholesky')
+        single.train(x, y)
+
+        serial = KrigingSurrogate(nugget=1e-6, method='cholesky', num_starts=3)
+        serial.train(x, y)
+
+        parallel = KrigingSurrogate(nugget=1e-6, method='cholesky', num_starts=3, num_workers=2)
+        parallel.train(x, y)
+
+        # the best of the starts is at least as likely as the single start
+        self.assertTrue(serial._calculate_reduced_likelihood_params()[0] >=
+                        single._calculate_reduced_likelihood_params()[0] - 1e-10)
+
+        # running the starts in worker processes doesn't change the result
+        assert_rel_error(self, parallel.thetas, serial.thetas, 1e-12)
+
+    def test_bad_method(self):
+        with self.assertRaises(ValueError) as cm:
+            KrigingSurrogate(method='qr')
+
+        self.assertEqual(str(cm.exception),
+                         "KrigingSurrogate: method must be 'svd' or 'cholesky', but 'qr' was given.")
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,25 +3,28 @@ Routines to compute coloring for use with simultaneous derivatives.
 """
 from __future__ import division, print_function
 
+import hashlib
+import json
 import os
+import shutil
 import sys
 import time
 import warnings
 from collections import OrderedDict, defaultdict
-from itertools import combinations
-from distutils.version import LooseVersion
+from heapq import heapify, heappop, heappush
 from contextlib import contextmanager
+from itertools import product
 
 from six import iteritems
 from six.moves import range
 
 import numpy as np
 from scipy.sparse.compressed import get_index_dtype
-from scipy.sparse import coo_matrix
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix, issparse
 
 from openmdao.jacobians.jacobian import Jacobian
 from openmdao.matrices.matrix import sparse_types
-from openmdao.utils.array_utils import array_viz
+from openmdao.utils.array_utils import array_viz, convert_neg
 from openmdao.utils.general_utils import simple_warning
 from openmdao.utils.mpi import MPI
 
@@ -32,24 +35,72 @@ from openmdao.utils.mpi import MPI
 _use_sparsity = True
 
 
-# numpy versions before 1.12 don't use the 'axis' arg passed to count_nonzero and always
-# return an int instead of an array of ints, so create our own function for those versions.
-if LooseVersion(np.__version__) >= LooseVersion("1.12"):
-    _count_nonzeros = np.count_nonzero
-else:
-    def _count_nonzeros(arr, axis=None):
-        if axis == 1:  # rows
-            count = np.empty(arr.shape[0], dtype=int)
-            for row in range(arr.shape[0]):
-                count[row] = np.count_nonzero(arr[row])
-        elif axis == 0:  # cols
-            count = np.empty(arr.shape[1], dtype=int)
-            for col in range(arr.shape[1]):
-                count[col] = np.count_nonzero(arr[:, col])
-        else:
-            return np.count_nonzero(arr)
+def _bool_csc(J):
+    """
+    Return the nonzero pattern of a dense or sparse matrix as a boolean CSC matrix.
+
+    Parameters
+    ----------
+    J : ndarray or sparse matrix
+        Matrix whose nonzero entries are wanted.
+
+    Returns
+    -------
+    csc_matrix
+        Boolean matrix with sorted indices and no explicitly stored zeros.
+    """
+    J = csc_matrix(J, dtype=bool)
+    J.eliminate_zeros()
+    J.sort_indices()
+    return J
 
-        return count
+
+def _bool_csr(J):
+    """
+    Return the nonzero pattern of a dense or sparse matrix as a boolean CSR matrix.
+
+    Parameters
+    ----------
+    J : ndarray or sparse matrix
+        Matrix whose nonzero entries are wanted.
+
+    Returns
+    -------
+    csr_matrix
+        Boolean matrix with sorted indices and no explicitly stored zeros.
+    """
+    J = csr_matrix(J, dtype=bool)
+    J.eliminate_zeros()
+    J.sort_indices()
+    return J
+
+
+def _col_adjacency(A, B):
+    """
+    Return the boolean adjacency of columns col1 and col2 having A[r, col1] and B[r, col2].
+
+    The result is symmetric and has no diagonal entries.
+
+    Parameters
+    ----------
+    A : sparse matrix
+        Boolean sparsity matrix.
+    B : sparse matrix
+        Boolean sparsity matrix of the same shape as A.
+
+    Returns
+    -------
+    csr_matrix
+        Column adjacency matrix.
+    """
+    A = A.astype(np.int32)
+    B = B.astype(np.int32)
+    adj = A.T.dot(B)
+    adj = (adj + adj.T).tocoo()
+    keep = adj.row != adj.col
+    ncols = A.shape[1]
+    return _bool_csr(coo_matrix((np.ones(np.count_nonzero(keep), dtype=bool),
+                                 (adj.row[keep], adj.col[keep])), shape=(ncols, ncols)))
 
 
 def _order_by_ID(col_matrix):
@@ -60,7 +111,7 @@ def _order_by_ID(col_matrix):
 
     Parameters
     ----------
-    col_matrix : ndarray
+    col_matrix : ndarray or sparse matrix
         Boolean array of column dependencies.
 
     Yields
@@ -68,7 +119,11 @@ def _order_by_ID(col_matrix):
     int
         Column index.
     """
-    degrees = _count_nonzeros(col_matrix, axis=0)
+    col_matrix = _bool_csr(col_matrix)
+    indptr = col_matrix.indptr
+    indices = col_matrix.indices
+
+    degrees = np.diff(indptr)
     ncols = degrees.size
 
     if ncols == 0:
@@ -77,18 +132,30 @@ def _order_by_ID(col_matrix):
     # use max degree column as a starting point instead of just choosing a random column
     # since all have incidence degree of 0 when we start.
     start = degrees.argmax()
-    yield start
 
-    colored_degrees = np.zeros(degrees.size, dtype=get_index_dtype(maxval=degrees[start]))
-    colored_degrees[col_matrix[start]] += 1
-    colored_degrees[start] = -ncols  # ensure that this col will never have max degree again
+    colored_degrees = np.zeros(ncols, dtype=int)
+    colored = np.zeros(ncols, dtype=bool)
+
+    # priority queue of (-ID, col), where entries are left in place when the ID of their
+    # column changes and are skipped when they come up.
+    heap = [(0, c) for c in range(ncols)]
+    col = start
+
+    for i in range(ncols):
+        if i > 0:
+            while True:
+                neg_degree, col = heappop(heap)
+                if not colored[col] and -neg_degree == colored_degrees[col]:
+                    break
 
-    for i in range(ncols - 1):
-        col = colored_degrees.argmax()
-        colored_degrees[col_matrix[col]] += 1
-        colored_degrees[col] = -ncols  # ensure that this col will never have max degree again
         yield col
 
+        colored[col] = True
+        for nbr in indices[indptr[col]:indptr[col + 1]]:
+            if not colored[nbr]:
+                colored_degrees[nbr] += 1
+                heappush(heap, (-colored_degrees[nbr], nbr))
+
 
 def _J2col_matrix(J):
     """
@@ -96,28 +163,16 @@ def _J2col_matrix(J):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         Boolean jacobian sparsity matrix.
 
     Returns
     -------
-    ndarray
+    csr_matrix
         Column adjacency matrix.
     """
-    nrows, ncols = J.shape
-
-    col_matrix = np.zeros((ncols, ncols), dtype=bool)
-
-    # mark col_matrix entries as True when nonzero row entries make them dependent
-    for row in range(nrows):
-        nzro = np.nonzero(J[row])[0]
-        for col in nzro:
-            col_matrix[col, nzro] = True
-
-    # zero out diagonal (column is not adjacent to itself)
-    np.fill_diagonal(col_matrix, False)
-
-    return col_matrix
+    J = _bool_csc(J)
+    return _col_adjacency(J, J)
 
 
 def _Jc2col_matrix_direct(J, Jc):
@@ -131,36 +186,29 @@ def _Jc2col_matrix_direct(J, Jc):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         Boolean jacobian sparsity matrix.
-    Jc : ndarray
+    Jc : ndarray or sparse matrix
         Boolean sparsity matrix of a partition of J.
 
     Returns
     -------
-    ndarray
+    csr_matrix
         Column adjacency matrix.
     """
     assert J.shape == Jc.shape
 
-    nrows, ncols = J.shape
+    J = _bool_csc(J)
+    Jc = _bool_csc(Jc)
 
-    col_matrix = np.zeros((ncols, ncols), dtype=bool)
+    # only the columns having nonzeros in the partition are kept
+    col_keep = np.diff(Jc.indptr) > 0
+    J = J.dot(csc_matrix((col_keep, (np.arange(col_keep.size), np.arange(col_keep.size))),
+                         shape=(col_keep.size, col_keep.size)))
 
-    col_keep = _count_nonzeros(Jc, axis=0) > 0
-
-    # mark col_matrix[col1, col2] as True when Jc[row, col1] is True OR Jc[row, col2] is True
-    for row in range(nrows):
-        nzro = np.nonzero(J[row] & col_keep)[0]
-        for col1, col2 in combinations(nzro, 2):
-            if Jc[row, col1] or Jc[row, col2]:
-                col_matrix[col1, col2] = True
-                col_matrix[col2, col1] = True
-
-    # zero out diagonal (column is not adjacent to itself)
-    np.fill_diagonal(col_matrix, False)
-
-    return col_matrix
+    # col1 and col2 are adjacent when they share a row in J, and at least one of them is in Jc
+    # for that row.
+    return _col_adjacency(Jc, J)
 
 
 def _get_full_disjoint_cols(J):
@@ -169,7 +217,7 @@ def _get_full_disjoint_cols(J):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         The total jacobian.
 
     Returns
@@ -186,7 +234,7 @@ def _get_full_disjoint_col_matrix_cols(col_matrix):
 
     Parameters
     ----------
-    col_matrix : ndarray
+    col_matrix : ndarray or sparse matrix
         Column intersection matrix
 
     Returns
@@ -197,18 +245,25 @@ def _get_full_disjoint_col_matrix_cols(col_matrix):
     color_groups = []
     _, ncols = col_matrix.shape
 
+    col_matrix = _bool_csr(col_matrix)
+    indptr = col_matrix.indptr
+    indices = col_matrix.indices
+
     # -1 indicates that a column has not been colored
     colors = np.full(ncols, -1, dtype=get_index_dtype(maxval=ncols))
 
     for col in _order_by_ID(col_matrix):
-        neighbor_colors = set(colors[col_matrix[col]])
-        for color, grp in enumerate(color_groups):
-            if color not in neighbor_colors:
-                grp.append(col)
-                colors[col] = color
-                break
+        neighbor_colors = set(colors[indices[indptr[col]:indptr[col + 1]]])
+
+        # lowest color not used by any neighbor
+        color = 0
+        while color in neighbor_colors:
+            color += 1
+
+        colors[col] = color
+        if color < len(color_groups):
+            color_groups[color].append(col)
         else:
-            colors[col] = len(color_groups)
             color_groups.append([col])
 
     return color_groups
@@ -222,9 +277,9 @@ def _color_partition(J, Jpart):
 
     Parameters
     ----------
-    J : ndarray
-        Dense jacobian sparsity matrix
-    Jpart : ndarray
+    J : ndarray or sparse matrix
+        Jacobian sparsity matrix
+    Jpart : ndarray or sparse matrix
         Partition of the jacobian sparsity matrix.
 
     Returns
@@ -234,11 +289,9 @@ def _color_partition(J, Jpart):
     list
         List of nonzero rows for each column.
     """
+    Jpart = _bool_csc(Jpart)
     ncols = Jpart.shape[1]
-    col_nonzeros = _count_nonzeros(Jpart, axis=0)
-    row_nonzeros = _count_nonzeros(Jpart, axis=1)
-    col_keep = col_nonzeros > 0
-    row_keep = row_nonzeros > 0
+    col_keep = np.diff(Jpart.indptr) > 0
 
     # use this to map indices back to the full J indices.
     idxmap = np.arange(ncols, dtype=int)[col_keep]
@@ -250,12 +303,12 @@ def _color_partition(J, Jpart):
     col_groups = _get_full_disjoint_col_matrix_cols(intersection_mat)
 
     for i, group in enumerate(col_groups):
-        col_groups[i] = sorted([idxmap[c] for c in group if col_keep[idxmap[c]]])
+        col_groups[i] = sorted([idxmap[c] for c in group])
     col_groups = _split_groups(col_groups)
 
     col2row = [None] * ncols
     for col in idxmap:
-        col2row[col] = [r for r in np.nonzero(Jpart[:, col])[0] if row_keep[r]]
+        col2row[col] = [int(r) for r in Jpart.indices[Jpart.indptr[col]:Jpart.indptr[col + 1]]]
 
     return [col_groups, col2row]
 
@@ -270,8 +323,8 @@ def MNCO_bidir(J):
 
     Parameters
     ----------
-    J : ndarray
-        Dense Jacobian sparsity matrix
+    J : ndarray or sparse matrix
+        Jacobian sparsity matrix
 
     Returns
     -------
@@ -285,15 +338,32 @@ def MNCO_bidir(J):
                 col_maps is a list of nonzero cols for each row, or None for uncolored rows.
             dict['sparsity'] = a nested dict specifying subjac sparsity for each total derivative.
     """
+    J = _bool_csc(J)
+    J_csr = J.tocsr()
     nrows, ncols = J.shape
 
-    M_col_nonzeros = _count_nonzeros(J, axis=0)
-    M_row_nonzeros = _count_nonzeros(J, axis=1)
-
-    M = coo_matrix(J)
-    M_rows = M.row
-    M_cols = M.col
-    M = None  # we don't need sparse matrix data array, so clean up memory
+    # nonzeros of each row and column of M, the part of J that hasn't been partitioned yet
+    M_col_nonzeros = np.diff(J.indptr)
+    M_row_nonzeros = np.diff(J_csr.indptr)
+    M_nnz = J.nnz
+
+    row_active = np.ones(nrows, dtype=bool)
+    col_active = np.ones(ncols, dtype=bool)
+
+    # priority queues of (nonzeros, index), where entries are left in place when the nonzeros of
+    # their row or column change and are skipped when they come up.
+    row_heap = [(nz, i) for i, nz in enumerate(M_row_nonzeros)]
+    col_heap = [(nz, i) for i, nz in enumerate(M_col_nonzeros)]
+    heapify(row_heap)
+    heapify(col_heap)
+
+    def _min_nonzeros(heap, nonzeros, active):
+        while heap:
+            nz, i = heap[0]
+            if active[i] and nz == nonzeros[i]:
+                return i, nz
+            heappop(heap)
+        return None, None
 
     Jc_rows = [None] * nrows
     Jr_cols = [None] * ncols
@@ -302,74 +372,71 @@ def MNCO_bidir(J):
 
     # partition J into Jc and Jr
     # We build Jc from bottom up and Jr from right to left.
-    r = M_row_nonzeros.argmin()
-    c = M_col_nonzeros.argmin()
-
-    nnz_r = M_row_nonzeros[r]
-    nnz_c = M_col_nonzeros[c]
+    r, nnz_r = _min_nonzeros(row_heap, M_row_nonzeros, row_active)
+    c, nnz_c = _min_nonzeros(col_heap, M_col_nonzeros, col_active)
 
     Jc_nz_max = 0   # max row nonzeros in Jc
     Jr_nz_max = 0   # max col nonzeros in Jr
 
-    while M_rows.size + M_cols.size > 0:
+    while M_nnz > 0:
         if Jr_nz_max + max(Jc_nz_max, nnz_r) < (Jc_nz_max + max(Jr_nz_max, nnz_c)):
-            Jc_rows[r] = M_cols[M_rows == r]
+            cols = J_csr.indices[J_csr.indptr[r]:J_csr.indptr[r + 1]]
+            Jc_rows[r] = cols = cols[col_active[cols]]
             Jc_nz_max = max(nnz_r, Jc_nz_max)
 
-            keep = M_rows != r
-            M_rows = M_rows[keep]
-            M_cols = M_cols[keep]
-
-            M_row_nonzeros[r] = ncols + 1  # make sure we don't pick this one again
-            M_col_nonzeros[Jc_rows[r]] -= 1
+            row_active[r] = False
+            M_nnz -= cols.size
+            M_col_nonzeros[cols] -= 1
+            for col in cols:
+                heappush(col_heap, (M_col_nonzeros[col], col))
 
-            r = M_row_nonzeros.argmin()
-            nnz_r = M_row_nonzeros[r]
+            r, nnz_r = _min_nonzeros(row_heap, M_row_nonzeros, row_active)
 
             row_i += 1
         else:
-            Jr_cols[c] = M_rows[M_cols == c]
+            rows = J.indices[J.indptr[c]:J.indptr[c + 1]]
+            Jr_cols[c] = rows = rows[row_active[rows]]
             Jr_nz_max = max(nnz_c, Jr_nz_max)
 
-            keep = M_cols != c
-            M_rows = M_rows[keep]
-            M_cols = M_cols[keep]
+            col_active[c] = False
+            M_nnz -= rows.size
+            M_row_nonzeros[rows] -= 1
+            for row in rows:
+                heappush(row_heap, (M_row_nonzeros[row], row))
 
-            M_col_nonzeros[c] = nrows + 1  # make sure we don't pick this one again
-            M_row_nonzeros[Jr_cols[c]] -= 1
-
-            c = M_col_nonzeros.argmin()
-            nnz_c = M_col_nonzeros[c]
+            c, nnz_c = _min_nonzeros(col_heap, M_col_nonzeros, col_active)
 
             col_i += 1
 
     coloring = {}
 
     nnz_Jc = nnz_Jr = 0
-    jac = np.zeros(J.shape, dtype=bool)
 
     if row_i > 0:
-        Jc = jac
         # build Jc and do fwd coloring on it
-        for i, cols in enumerate(Jc_rows):
-            if cols is not None:
-                Jc[i][cols] = True
-                nnz_Jc += len(cols)
+        rows = [np.full(len(cols), i, dtype=int) for i, cols in enumerate(Jc_rows)
+                if cols is not None]
+        cols = [cols for cols in Jc_rows if cols is not None]
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=int)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=int)
+        nnz_Jc = rows.size
+        Jc = coo_matrix((np.ones(nnz_Jc, dtype=bool), (rows, cols)), shape=J.shape)
 
         coloring['fwd'] = _color_partition(J, Jc)
-        jac[:] = False
 
     if col_i > 0:
-        Jr = jac
         # build Jr and do rev coloring
-        for i, rows in enumerate(Jr_cols):
-            if rows is not None:
-                Jr[rows, i] = True
-                nnz_Jr += len(rows)
+        cols = [np.full(len(rows), i, dtype=int) for i, rows in enumerate(Jr_cols)
+                if rows is not None]
+        rows = [rows for rows in Jr_cols if rows is not None]
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=int)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=int)
+        nnz_Jr = rows.size
+        Jr = coo_matrix((np.ones(nnz_Jr, dtype=bool), (rows, cols)), shape=J.shape)
 
         coloring['rev'] = _color_partition(J.T, Jr.T)
 
-    if np.count_nonzero(J) != nnz_Jc + nnz_Jr:
+    if J.nnz != nnz_Jc + nnz_Jr:
         raise RuntimeError("Nonzero mismatch for J vs. Jc and Jr")
 
     # _check_coloring(J, coloring)
@@ -386,8 +453,8 @@ def _tol_sweep(arr, tol=1e-15, orders=5):
 
     Parameters
     ----------
-    arr : ndarray
-        The array requiring computation of nonzero values.
+    arr : ndarray or sparse matrix
+        The array requiring computation of nonzero values. Its entries must be non-negative.
     tol : float
         Tolerance.  We'll sweep above and below this by 'orders' of magnitude.
     orders : int
@@ -404,13 +471,22 @@ def _tol_sweep(arr, tol=1e-15, orders=5):
     int
         Number of zero entries at chosen tolerance.
     """
+    # count the entries below each tolerance using the sorted positive entries
+    if issparse(arr):
+        vals = arr.data
+        num_exact_zero = arr.shape[0] * arr.shape[1] - vals.size
+    else:
+        vals = arr.ravel()
+        num_exact_zero = 0
+    vals = np.sort(vals)
+
     nzeros = defaultdict(list)
     itol = tol * 10.**orders
     smallest = tol / 10.**orders
     n_tested = 0
     while itol >= smallest:
         if itol < 1.:
-            num_zero = arr[arr <= itol].size
+            num_zero = num_exact_zero + np.searchsorted(vals, itol, side='right')
             nzeros[num_zero].append(itol)
             n_tested += 1
         itol /= 10.
@@ -483,7 +559,7 @@ def _get_bool_jac(prob, repeats=3, tol=1e-15, orders=5, setup=False, run_model=F
 
     Returns
     -------
-    ndarray
+    csc_matrix
         A boolean composite of 'repeats' total jacobians.
     """
     # clear out any old simul coloring info
@@ -510,25 +586,29 @@ def _get_bool_jac(prob, repeats=3, tol=1e-15, orders=5, setup=False, run_model=F
         fullJ = None
         for i in range(repeats):
             J = prob.driver._compute_totals(return_format='array', of=of, wrt=wrt)
+
+            # only the nonzeros are kept, so a single dense jacobian is held at a time
+            J = csc_matrix(np.abs(J, out=J))
             if fullJ is None:
-                fullJ = np.abs(J)
+                fullJ = J
             else:
-                fullJ += np.abs(J)
+                fullJ = fullJ + J
         elapsed = time.time() - start_time
 
     # normalize the full J by dividing by the max value
-    fullJ /= np.max(fullJ)
+    if fullJ.nnz > 0:
+        fullJ.data /= np.max(fullJ.data)
 
     good_tol, nz_matches, n_tested, zero_entries = _tol_sweep(fullJ, tol, orders)
 
     print("\nUsing tolerance: %g" % good_tol)
     print("Most common number of zero entries (%d of %d) repeated %d times out of %d tolerances "
-          "tested.\n" % (zero_entries, fullJ.size, nz_matches, n_tested))
+          "tested.\n" % (zero_entries, fullJ.shape[0] * fullJ.shape[1], nz_matches, n_tested))
     print("Full total jacobian was computed %d times, taking %f seconds." % (repeats, elapsed))
     print("Total jacobian shape:", fullJ.shape, "\n")
 
-    boolJ = np.zeros(fullJ.shape, dtype=bool)
-    boolJ[fullJ > good_tol] = True
+    fullJ.data = fullJ.data > good_tol
+    boolJ = _bool_csc(fullJ)
 
     # with open("array_viz%d.out" % system.comm.rank, "w") as f:
     #     array_viz(boolJ, prob=prob, stream=f)
@@ -536,13 +616,366 @@ def _get_bool_jac(prob, repeats=3, tol=1e-15, orders=5, setup=False, run_model=F
     return boolJ
 
 
+def _flat_src_indices(meta_in, meta_out):
+    """
+    Return the flat indices into the connected output for each entry of an input.
+
+    Parameters
+    ----------
+    meta_in : dict
+        Metadata of the input.
+    meta_out : dict
+        Metadata of the connected output.
+
+    Returns
+    -------
+    ndarray of int
+        Index into the flattened output for each entry of the flattened input.
+    """
+    src_indices = meta_in['src_indices']
+    if src_indices is None:
+        return np.arange(meta_in['size'])
+
+    shape_in = meta_in['shape']
+    shape_out = meta_out['shape']
+    if src_indices.ndim == 1:
+        return convert_neg(src_indices, meta_out['global_size'])
+    if len(shape_out) == 1 or shape_in == src_indices.shape:
+        return convert_neg(src_indices.flatten(), meta_out['global_size'])
+
+    entries = [list(range(x)) for x in shape_in]
+    cols = np.vstack(src_indices[i] for i in product(*entries))
+    dimidxs = [convert_neg(cols[:, i], shape_out[i]) for i in range(cols.shape[1])]
+    return np.ravel_multi_index(dimidxs, shape_out)
+
+
+def _structural_jac_owners(system):
+    """
+    Yield the systems whose declared subjacs describe the partial derivatives of the model.
+
+    Groups that approximate their own jacobian stand in for all of their descendants.
+
+    Parameters
+    ----------
+    system : System
+        Top of the system hierarchy being searched.
+
+    Yields
+    ------
+    System
+        A Component, or a Group that owns an approximated jacobian.
+    """
+    if system._owns_approx_jac or not system._subsystems_myproc:
+        yield system
+    else:
+        for subsys in system._subsystems_myproc:
+            for s in _structural_jac_owners(subsys):
+                yield s
+
+
+def _get_partials_pattern(model):
+    """
+    Return the boolean pattern of d(residuals)/d(outputs) for the whole model.
+
+    Inputs are replaced by the output entries they are connected to, so the result is square
+    and indexed by the global (serial) ordering of the model's outputs.  Subjacs declared
+    with rows/cols or as a sparse matrix contribute only their nonzeros.  All other declared
+    subjacs, and all subjacs of matrix free components, are treated as dense.
+
+    Parameters
+    ----------
+    model : System
+        The top level System.
+
+    Returns
+    -------
+    csr_matrix
+        The square boolean partial jacobian pattern.
+    dict
+        Global offset of each output, keyed by absolute name.
+    """
+    abs2meta = model._var_allprocs_abs2meta
+    local_meta = model._var_abs2meta
+    conns = model._conn_global_abs_in2out
+
+    offsets = {}
+    size = 0
+    for name in model._var_allprocs_abs_names['output']:
+        offsets[name] = size
+        size += abs2meta[name]['size']
+
+    # global output index of each entry of each connected input
+    in_idxs = {}
+    for abs_in, abs_out in iteritems(conns):
+        in_idxs[abs_in] = offsets[abs_out] + _flat_src_indices(local_meta[abs_in],
+                                                               abs2meta[abs_out])
+
+    from openmdao.core.indepvarcomp import IndepVarComp
+
+    rows = []
+    cols = []
+    for system in _structural_jac_owners(model):
+        if system.matrix_free:
+            outs = system._var_abs_names['output']
+            keys = product(outs, [n for n in system._var_abs_names['input'] if n in conns] + outs)
+            subjacs = ((key, None) for key in keys)
+        else:
+            subjacs = iteritems(system._subjacs_info)
+
+        if system._subsystems_myproc:
+            # An approximated group behaves like an explicit component whose outputs depend
+            # only on its inputs and on any indep var outputs it contains.
+            outs = set(system._var_abs_names['output'])
+            ivc = set(n for s in system.system_iter(recurse=True, typ=IndepVarComp)
+                      for n in s._var_abs_names['output'])
+            subjacs = ((key, meta) for key, meta in subjacs
+                       if key[0] not in ivc and (key[1] not in outs or key[1] in ivc))
+
+        for (of, wrt), meta in subjacs:
+            if wrt in offsets:
+                wrt_idxs = offsets[wrt] + np.arange(abs2meta[wrt]['size'])
+            elif wrt in in_idxs:
+                wrt_idxs = in_idxs[wrt]
+            else:  # unconnected input, which can't depend on anything
+                continue
+
+            of_off = offsets[of]
+            if meta is not None and meta['rows'] is not None:
+                r = meta['rows']
+                c = meta['cols']
+            elif meta is not None and issparse(meta['value']):
+                r, c = meta['value'].nonzero()
+            else:
+                r = np.repeat(np.arange(abs2meta[of]['size']), wrt_idxs.size)
+                c = np.tile(np.arange(wrt_idxs.size), abs2meta[of]['size'])
+
+            rows.append(r + of_off)
+            cols.append(wrt_idxs[c])
+
+    if rows:
+        rows = np.hstack(rows)
+        cols = np.hstack(cols)
+    else:
+        rows = cols = np.zeros(0, dtype=int)
+
+    A = coo_matrix((np.ones(rows.size), (rows, cols)), shape=(size, size)).tocsr()
+    A.data[:] = 1.0
+
+    return A, offsets
+
+
+def _reachable(A, seeds):
+    """
+    Return the pattern of everything reachable from each seed column through A.
+
+    Entry (i, j) of the result is nonzero if there is a path from seed j to row i, where a
+    nonzero A[k, l] is an edge from l to k.  Only newly reached entries are propagated on
+    each pass, so cycles (coupled systems) terminate.
+
+    Parameters
+    ----------
+    A : csr_matrix
+        Square pattern of edges.
+    seeds : csc_matrix
+        One column per seed, with a nonzero at the starting row of that seed.
+
+    Returns
+    -------
+    csc_matrix
+        The reachability pattern, with the same shape as seeds.
+    """
+    reached = frontier = seeds
+    while frontier.nnz > 0:
+        step = csc_matrix(A.dot(frontier))
+        step.data[:] = 1.0
+        frontier = step - step.multiply(reached)
+        frontier.eliminate_zeros()
+        reached = reached + frontier
+
+    return reached
+
+
+def _voi_idxs(vois, names, offsets):
+    """
+    Return the global output indices of the given variables of interest, in order.
+
+    Parameters
+    ----------
+    vois : dict
+        Metadata of the design vars or responses.
+    names : list of str
+        Names of the variables of interest in order.
+    offsets : dict
+        Global offset of each output, keyed by absolute name.
+
+    Returns
+    -------
+    ndarray of int
+        The global output index of each entry.
+    """
+    idxs = []
+    for name in names:
+        meta = vois[name]
+        if meta['indices'] is None:
+            idxs.append(offsets[name] + np.arange(meta['size']))
+        else:
+            idxs.append(offsets[name] + np.asarray(meta['indices']))
+    return np.hstack(idxs) if idxs else np.zeros(0, dtype=int)
+
+
+def _get_structural_bool_jac(prob, setup=False):
+    """
+    Return a boolean total jacobian computed from the declared partial sparsity.
+
+    The sparsity patterns of the declared partials are assembled into a single boolean partial
+    jacobian and propagated through the connection graph, so no linear solves are performed.
+    The result is an upper bound on the true sparsity, since any numerical cancellation in the
+    total derivatives is ignored.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    setup : bool
+        If True, run setup before computing the sparsity.
+
+    Returns
+    -------
+    csc_matrix
+        The boolean total jacobian.
+    """
+    # clear out any old simul coloring info
+    prob.driver._simul_coloring_info = None
+    prob.driver._res_jacs = {}
+
+    if setup:
+        prob.setup(mode=prob._mode)
+
+    model = prob.model
+    if model.comm.size > 1:
+        raise RuntimeError("Structural sparsity is not supported under MPI.")
+
+    if prob._setup_status < 2:
+        prob.final_setup()
+
+    driver = prob.driver
+    wrt = list(driver._designvars)
+    of = driver._get_ordered_nl_responses()
+
+    if not of or not wrt:
+        raise RuntimeError("Sparsity structure cannot be computed without declaration of design "
+                           "variables and responses.")
+
+    start_time = time.time()
+
+    A, offsets = _get_partials_pattern(model)
+    size = A.shape[0]
+
+    dv_idxs = _voi_idxs(driver._designvars, wrt, offsets)
+    res_idxs = _voi_idxs(driver._responses, of, offsets)
+
+    # propagate from whichever side has fewer entries
+    if dv_idxs.size <= res_idxs.size:
+        seeds = csc_matrix((np.ones(dv_idxs.size), (dv_idxs, np.arange(dv_idxs.size))),
+                           shape=(size, dv_idxs.size))
+        J = _reachable(A, seeds)[res_idxs, :]
+    else:
+        seeds = csc_matrix((np.ones(res_idxs.size), (res_idxs, np.arange(res_idxs.size))),
+                           shape=(size, res_idxs.size))
+        J = _reachable(csr_matrix(A.T), seeds)[dv_idxs, :].T
+
+    J = _bool_csc(J)
+    elapsed = time.time() - start_time
+
+    print("\nStructural total jacobian sparsity was computed in %f seconds." % elapsed)
+    print("Total jacobian shape:", J.shape, "\n")
+
+    return J
+
+
+def _verify_structural_jac(prob, J, repeats=3, tol=1e-15, run_model=False):
+    """
+    Check a structural sparsity pattern against a randomized total jacobian.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    J : csc_matrix
+        The boolean total jacobian computed from the declared partials.
+    repeats : int
+        Number of times to repeat total jacobian computation.
+    tol : float
+        Starting tolerance on values in the randomized jacobian.
+    run_model : bool
+        If True, run run_model before calling compute_totals.
+    """
+    randJ = _get_bool_jac(prob, repeats=repeats, tol=tol, run_model=run_model)
+
+    missing = randJ - randJ.multiply(J)
+    missing.eliminate_zeros()
+    if missing.nnz > 0:
+        driver = prob.driver
+        sparsity = _sparsity_from_jac(missing, driver._get_ordered_nl_responses(),
+                                      list(driver._designvars), driver)
+        bad = ["('%s', '%s')" % (res, dv) for res, subs in iteritems(sparsity)
+               for dv, (rows, cols, shape) in iteritems(subs) if rows]
+        raise RuntimeError("Structural sparsity is missing %d nonzero total derivative "
+                           "entries, probably due to undeclared partials. Affected total "
+                           "derivatives: %s" % (missing.nnz, ', '.join(bad)))
+
+    print("Structural sparsity verified. It has %d nonzeros, %d of which were zero in the "
+          "randomized total jacobian.\n" % (J.nnz, J.nnz - randJ.nnz))
+
+
+def _compute_bool_jac(prob, method='randomized', verify=False, repeats=3, tol=1e-15,
+                      setup=False, run_model=False):
+    """
+    Return a boolean total jacobian, computed using the given method.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    method : str
+        Either 'randomized', which computes the total jacobian with randomized subjacs, or
+        'structural', which propagates the declared partial sparsity without any linear solves.
+    verify : bool
+        If True and method is 'structural', check the result against a randomized jacobian.
+    repeats : int
+        Number of times to repeat total jacobian computation.
+    tol : float
+        Tolerance used to determine if an array entry is nonzero.
+    setup : bool
+        If True, run setup first.
+    run_model : bool
+        If True, run run_model before calling compute_totals.  This is only needed
+        for the 'randomized' method or for verification.
+
+    Returns
+    -------
+    csc_matrix
+        The boolean total jacobian.
+    """
+    if method == 'structural':
+        J = _get_structural_bool_jac(prob, setup=setup)
+        if verify:
+            _verify_structural_jac(prob, J, repeats=repeats, tol=tol, run_model=run_model)
+        return J
+    elif method == 'randomized':
+        return _get_bool_jac(prob, repeats=repeats, tol=tol, setup=setup, run_model=run_model)
+
+    raise ValueError("Sparsity method must be 'randomized' or 'structural', but '%s' was "
+                     "given." % method)
+
+
 def _sparsity_from_jac(J, of, wrt, driver):
     """
     Given a boolean total jacobian and a driver, compute subjac sparsity.
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         Boolean total jacobian.
     of : list of str
         List of responses.
@@ -556,6 +989,9 @@ def _sparsity_from_jac(J, of, wrt, driver):
     OrderedDict
         Nested OrderedDict of form sparsity[response][desvar] = (rows, cols, shape)
     """
+    if issparse(J):
+        J = _bool_csr(J)
+
     sparsity = OrderedDict()
     row_start = row_end = 0
     res_meta = driver._responses
@@ -571,7 +1007,7 @@ def _sparsity_from_jac(J, of, wrt, driver):
             col_end += dv_size
 
             # save sparsity structure as  (rows, cols, shape)
-            irows, icols = np.nonzero(J[row_start:row_end, col_start:col_end])
+            irows, icols = J[row_start:row_end, col_start:col_end].nonzero()
 
             # convert to make JSON serializable
             irows = [int(i) for i in irows]
@@ -675,11 +1111,11 @@ def _write_coloring(modes, color_info, stream):
         stream.write("],\n[\n")
         last_idx = len(nonzero_entries) - 1
         for i, nonzeros in enumerate(nonzero_entries):
-            if isinstance(nonzeros, np.ndarray):
-                # convert to list to make json serializable
-                stream.write("   %s" % list(nonzeros))
-            else:  # a full slice
+            if nonzeros is None or isinstance(nonzeros, slice):  # a full slice
                 stream.write("   %s" % none)
+            else:
+                # convert to list to make json serializable
+                stream.write("   %s" % [int(i) for i in nonzeros])
 
             if i < last_idx:
                 stream.write(",")
@@ -726,7 +1162,8 @@ def _json2coloring(coloring):
 
 
 def get_sparsity(problem, mode='fwd', repeats=1, tol=1.e-15, show_jac=False,
-                 setup=False, run_model=False, stream=sys.stdout):
+                 setup=False, run_model=False, stream=sys.stdout, method='randomized',
+                 verify=False):
     """
     Compute derivative sparsity for the given problem.
 
@@ -748,6 +1185,11 @@ def get_sparsity(problem, mode='fwd', repeats=1, tol=1.e-15, show_jac=False,
         If True, run setup before calling compute_totals.
     run_model : bool
         If True, run run_model before calling compute_totals.
+    method : str
+        How the sparsity is found. 'randomized' computes total jacobians with randomized
+        subjacs and 'structural' propagates the declared partial sparsity through the model.
+    verify : bool
+        If True and method is 'structural', check the result against a randomized jacobian.
 
     Returns
     -------
@@ -756,8 +1198,8 @@ def get_sparsity(problem, mode='fwd', repeats=1, tol=1.e-15, show_jac=False,
     """
     driver = problem.driver
 
-    J = _get_bool_jac(problem, repeats=repeats, tol=tol, setup=setup,
-                      run_model=run_model)
+    J = _compute_bool_jac(problem, method=method, verify=verify, repeats=repeats, tol=tol,
+                          setup=setup, run_model=run_model)
 
     of = driver._get_ordered_nl_responses()
     wrt = list(driver._designvars)
@@ -772,7 +1214,7 @@ def get_sparsity(problem, mode='fwd', repeats=1, tol=1.e-15, show_jac=False,
 
         if show_jac and stream is not None:
             stream.write("\n\n")
-            array_viz(J, problem, of, wrt, stream)
+            array_viz(J.toarray(), problem, of, wrt, stream)
 
     return sparsity
 
@@ -895,7 +1337,7 @@ def _compute_coloring(J, mode):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         The boolean total jacobian.
     mode : str
         The direction for solving for total derivatives.  If 'auto', use bidirectional coloring.
@@ -921,20 +1363,21 @@ def _compute_coloring(J, mode):
 
     if rev:
         J = J.T
+    J = _bool_csc(J)
     col_groups = _split_groups(_get_full_disjoint_cols(J))
 
     full_slice = slice(None)
     col2rows = [full_slice] * J.shape[1]  # will contain list of nonzero rows for each column
     for lst in col_groups:
         for col in lst:
-            col2rows[col] = np.nonzero(J[:, col])[0]
+            col2rows[col] = J.indices[J.indptr[col]:J.indptr[col + 1]].astype(int)
 
     return {mode: [col_groups, col2rows]}
 
 
 def get_simul_meta(problem, mode=None, repeats=1, tol=1.e-15, show_jac=False,
                    include_sparsity=True, setup=False, run_model=False, bool_jac=None,
-                   stream=sys.stdout):
+                   stream=sys.stdout, method='randomized', verify=False):
     """
     Compute simultaneous derivative colorings for the given problem.
 
@@ -957,10 +1400,15 @@ def get_simul_meta(problem, mode=None, repeats=1, tol=1.e-15, show_jac=False,
         If True, run setup before calling compute_totals.
     run_model : bool
         If True, run run_model before calling compute_totals.
-    bool_jac : ndarray
+    bool_jac : ndarray or sparse matrix
         If problem is not supplied, a previously computed boolean jacobian can be used.
     stream : file-like or None
         Stream where output coloring info will be written.
+    method : str
+        How the sparsity is found. 'randomized' computes total jacobians with randomized
+        subjacs and 'structural' propagates the declared partial sparsity through the model.
+    verify : bool
+        If True and method is 'structural', check the result against a randomized jacobian.
 
     Returns
     -------
@@ -985,8 +1433,8 @@ def get_simul_meta(problem, mode=None, repeats=1, tol=1.e-15, show_jac=False,
             raise RuntimeError("given mode (%s) does not agree with Problem mode (%s)" %
                                (mode, problem._mode))
         start_time = time.time()
-        J = _get_bool_jac(problem, repeats=repeats, tol=tol, setup=setup,
-                          run_model=run_model)
+        J = _compute_bool_jac(problem, method=method, verify=verify, repeats=repeats, tol=tol,
+                              setup=setup, run_model=run_model)
         time_sparsity = time.time() - start_time
 
         if include_sparsity or (show_jac and stream is not None):
@@ -1030,7 +1478,8 @@ def get_simul_meta(problem, mode=None, repeats=1, tol=1.e-15, show_jac=False,
         if show_jac:
             s = stream if stream.isatty() else sys.stdout
             s.write("\n\n")
-            colored_array_viz(J, coloring, prob=problem, of=of, wrt=wrt, stream=s)
+            colored_array_viz(J.toarray() if issparse(J) else J, coloring, prob=problem, of=of,
+                              wrt=wrt, stream=s)
 
     return coloring
 
@@ -1066,6 +1515,186 @@ def simul_coloring_summary(color_info, stream=sys.stdout):
                      (tot_colors, tot_size, pct))
 
 
+def _get_structure_hash(problem, *settings):
+    """
+    Return a hash of everything about the model that can affect its total jacobian sparsity.
+
+    This covers the variable names and shapes, the connections, the declared partial
+    sparsity, the design vars and responses and any extra settings given.  Numerical values
+    are ignored, so the hash only changes when the structure of the problem changes.
+
+    Parameters
+    ----------
+    problem : Problem
+        The Problem being analyzed.
+    *settings : str
+        Any other settings that affect the result, e.g. the derivative mode.
+
+    Returns
+    -------
+    str
+        Hex digest of the structure hash.
+    """
+    model = problem.model
+    driver = problem.driver
+    hsh = hashlib.sha1()
+
+    def _update(*args):
+        for arg in args:
+            if isinstance(arg, np.ndarray):
+                hsh.update(np.ascontiguousarray(arg, dtype=np.int64).tobytes())
+            else:
+                hsh.update(str(arg).encode('utf-8'))
+            hsh.update(b'|')
+
+    _update(*settings)
+
+    abs2meta = model._var_allprocs_abs2meta
+    for type_ in ('input', 'output'):
+        for name in model._var_allprocs_abs_names[type_]:
+            _update(name, abs2meta[name]['shape'])
+
+    for abs_in, abs_out in sorted(iteritems(model._conn_global_abs_in2out)):
+        _update(abs_in, abs_out)
+        if abs_in in model._var_abs2meta:
+            src_indices = model._var_abs2meta[abs_in]['src_indices']
+            if src_indices is not None:
+                _update(src_indices)
+
+    for system in _structural_jac_owners(model):
+        _update(system.pathname, type(system).__name__, system.matrix_free)
+        for key, meta in sorted(iteritems(system._subjacs_info), key=lambda x: x[0]):
+            _update(*key)
+            if meta['rows'] is not None:
+                _update(meta['rows'], meta['cols'])
+            elif issparse(meta['value']):
+                _update(*meta['value'].nonzero())
+
+    for vois, names in ((driver._designvars, list(driver._designvars)),
+                        (driver._responses, driver._get_ordered_nl_responses())):
+        for name in names:
+            meta = vois[name]
+            _update(name, meta['size'])
+            if meta['indices'] is not None:
+                _update(np.asarray(meta['indices']))
+
+    digest = hsh.hexdigest()
+
+    # local subjac info can differ between procs, so combine all of them
+    if model.comm.size > 1:
+        digest = hashlib.sha1(''.join(model.comm.allgather(digest)).encode('utf-8')).hexdigest()
+
+    return digest
+
+
+def _get_cache_file(driver, kind, *settings):
+    """
+    Return the cache file name for a coloring or sparsity, or None if caching is off.
+
+    Parameters
+    ----------
+    driver : <Driver>
+        The driver performing the optimization.
+    kind : str
+        Either 'coloring' or 'sparsity'.
+    *settings : str
+        Any other settings that affect the result.
+
+    Returns
+    -------
+    str or None
+        Name of the cache file for the current model structure.
+    """
+    cache_dir = driver.options['dynamic_derivs_cache']
+    if cache_dir is None:
+        return None
+
+    problem = driver._problem
+    digest = _get_structure_hash(problem, kind, problem._orig_mode, *settings)
+    return os.path.join(cache_dir, '%s_%s.json' % (kind, digest))
+
+
+def _in_cache(fname, comm):
+    """
+    Return True if the given cache file exists, as seen by the root proc.
+
+    Parameters
+    ----------
+    fname : str or None
+        Name of the cache file.
+    comm : MPI.Comm or <FakeComm>
+        The communicator of the model.
+
+    Returns
+    -------
+    bool
+        True if the file exists.
+    """
+    if fname is None:
+        return False
+    found = os.path.isfile(fname) if comm.rank == 0 else None
+    if comm.size > 1:
+        found = comm.bcast(found, root=0)
+    return found
+
+
+def _load_from_cache(fname, comm):
+    """
+    Read a cache file on the root proc and broadcast its contents to the other procs.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the cache file.
+    comm : MPI.Comm or <FakeComm>
+        The communicator of the model.
+
+    Returns
+    -------
+    dict
+        The contents of the file.
+    """
+    if comm.rank == 0:
+        with open(fname, 'r') as f:
+            data = json.load(f)
+    else:
+        data = None
+    if comm.size > 1:
+        data = comm.bcast(data, root=0)
+    return data
+
+
+def _store_in_cache(src, fname, comm):
+    """
+    Copy a freshly computed coloring or sparsity file into the cache.
+
+    The copy is written to a temporary file first and then renamed, so concurrent runs never
+    see a partially written cache file.
+
+    Parameters
+    ----------
+    src : str
+        Name of the file to copy.
+    fname : str or None
+        Name of the cache file.
+    comm : MPI.Comm or <FakeComm>
+        The communicator of the model.
+    """
+    if fname is None or comm.rank != 0:
+        return
+
+    cache_dir = os.path.dirname(fname)
+    if cache_dir and not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError:  # created by somebody else in the meantime
+            pass
+
+    tmp = '%s.%d.tmp' % (fname, os.getpid())
+    shutil.copyfile(src, tmp)
+    os.rename(tmp, fname)
+
+
 def dynamic_sparsity(driver):
     """
     Compute deriv sparsity during runtime.
@@ -1082,10 +1711,22 @@ def dynamic_sparsity(driver):
 
     driver._total_jac = None
     repeats = driver.options['dynamic_derivs_repeats']
+    method = driver.options['dynamic_derivs_method']
+    comm = problem.model.comm
+
+    cache_file = _get_cache_file(driver, 'sparsity', method, repeats)
+    if _in_cache(cache_file, comm):
+        print("Using cached sparsity from %s" % cache_file)
+        driver.set_total_jac_sparsity(_load_from_cache(cache_file, comm))
+        driver._setup_tot_jac_sparsity()
+        return
 
     # save the sparsity.json file for later inspection
     with open("sparsity.json", "w") as f:
-        sparsity = get_sparsity(problem, mode=problem._mode, repeats=repeats, stream=f)
+        sparsity = get_sparsity(problem, mode=problem._mode, repeats=repeats, stream=f,
+                                method=method)
+
+    _store_in_cache("sparsity.json", cache_file, comm)
 
     driver.set_total_jac_sparsity(sparsity)
     driver._setup_tot_jac_sparsity()
@@ -1112,13 +1753,29 @@ def dynamic_simul_coloring(driver, run_model=True, do_sparsity=False, show_jac=F
         return
 
     driver._total_jac = None
+    repeats = driver.options['dynamic_derivs_repeats']
+    method = driver.options['dynamic_derivs_method']
+    comm = problem.model.comm
+
+    cache_file = _get_cache_file(driver, 'coloring', method, repeats, do_sparsity)
+    if _in_cache(cache_file, comm):
+        print("Using cached coloring from %s" % cache_file)
+        driver._res_jacs = {}
+        driver.set_simul_deriv_color(_json2coloring(_load_from_cache(cache_file, comm)))
+        driver._setup_simul_coloring()
+        if do_sparsity:
+            driver._setup_tot_jac_sparsity()
+        return
 
     # save the coloring.json file for later inspection
     with open("coloring.json", "w") as f:
-        coloring = get_simul_meta(problem,
-                                  repeats=driver.options['dynamic_derivs_repeats'],
+        coloring = get_simul_meta(problem, repeats=repeats,
                                   tol=1.e-15, include_sparsity=do_sparsity,
-                                  setup=False, run_model=run_model, show_jac=show_jac, stream=f)
+                                  setup=False, run_model=run_model, show_jac=show_jac, stream=f,
+                                  method=method)
+
+    _store_in_cache("coloring.json", cache_file, comm)
+
     driver.set_simul_deriv_color(coloring)
     driver._setup_simul_coloring()
     if do_sparsity:
@@ -1149,6 +1806,28 @@ def _simul_coloring_setup_parser(parser):
                         help="Exclude the sparsity structure from the coloring data structure.")
     parser.add_argument('-p', '--profile', action='store_true', dest='profile',
                         help="Do profiling on the coloring process.")
+    parser.add_argument('-s', '--structural', action='store_true', dest='structural',
+                        help="Compute the sparsity from the declared partials instead of from "
+                        "randomized total jacobians.")
+    parser.add_argument('--verify', action='store_true', dest='verify',
+                        help="Check a structural sparsity against randomized total jacobians.")
+
+
+def _sparsity_method(options):
+    """
+    Return the sparsity method selected on the command line.
+
+    Parameters
+    ----------
+    options : argparse Namespace
+        Command line options.
+
+    Returns
+    -------
+    str
+        Either 'structural' or 'randomized'.
+    """
+    return 'structural' if options.structural else 'randomized'
 
 
 def _simul_coloring_cmd(options):
@@ -1187,7 +1866,9 @@ def _simul_coloring_cmd(options):
                                             show_jac=options.show_jac,
                                             include_sparsity=not options.no_sparsity,
                                             setup=False, run_model=True,
-                                            stream=outfile)
+                                            stream=outfile,
+                                            method=_sparsity_method(options),
+                                            verify=options.verify)
 
             if sys.stdout.isatty():
                 simul_coloring_summary(color_info, stream=sys.stdout)
@@ -1215,6 +1896,11 @@ def _sparsity_setup_parser(parser):
     parser.add_argument('-j', '--jac', action='store_true', dest='show_jac',
                         help="Display a visualization of the final total jacobian used to "
                         "compute the sparsity.")
+    parser.add_argument('-s', '--structural', action='store_true', dest='structural',
+                        help="Compute the sparsity from the declared partials instead of from "
+                        "randomized total jacobians.")
+    parser.add_argument('--verify', action='store_true', dest='verify',
+                        help="Check a structural sparsity against randomized total jacobians.")
 
 
 def _sparsity_cmd(options):
@@ -1243,7 +1929,8 @@ def _sparsity_cmd(options):
             outfile = open(options.outfile, 'w')
         Problem._post_setup_func = None  # avoid recursive loop
         get_sparsity(prob, repeats=options.num_jacs, tol=options.tolerance, mode=prob._mode,
-                     show_jac=options.show_jac, setup=True, run_model=True, stream=outfile)
+                     show_jac=options.show_jac, setup=True, run_model=True, stream=outfile,
+                     method=_sparsity_method(options), verify=options.verify)
         exit()
     return _sparsity
 
@@ -1254,11 +1941,14 @@ def _check_coloring(J, coloring):
 
     Parameters
     ----------
-    J : ndarray
+    J : ndarray or sparse matrix
         Jacobian sparsity matrix.
     coloring : dict
         Metadata required for coloring.
     """
+    if issparse(J):
+        J = J.toarray()
+
     # check for any overlapping nonzeros
     fwd_coloring = coloring.get('fwd')
     rev_coloring = coloring.get('rev')
@@ -0,0 +1,169 @@
+"""
+A bounded cache of model evaluations, keyed on the exact values of the design variables.
+"""
+from collections import OrderedDict
+
+from six import iteritems
+
+import numpy as np
+
+
+class EvalCache(object):
+    """
+    Least recently used cache of the responses of a model at individual design points.
+
+    Entries are keyed on the bytes of the flattened design variable vector, so only an exact
+    repeat of a design point is a hit.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that found a cached design point.
+    misses : int
+        Number of lookups that did not find a cached design point.
+    _maxsize : int
+        Maximum number of entries.  The least recently used entry is dropped when it is exceeded.
+    _entries : OrderedDict
+        Maps design point keys to (values, success, msg), least recently used first.
+    """
+
+    def __init__(self, maxsize):
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of design points to keep.
+        """
+        self.hits = 0
+        self.misses = 0
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        """
+        Return the number of cached design points.
+
+        Returns
+        -------
+        int
+            Number of cached design points.
+        """
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(values):
+        """
+        Return the cache key for the given design variable values.
+
+        Parameters
+        ----------
+        values : list of ndarray
+            Design variable values, always in the same order.
+
+        Returns
+        -------
+        bytes
+            The cache key.
+        """
+        return np.concatenate([np.atleast_1d(v).ravel() for v in values]).astype(float).tobytes()
+
+    def get(self, key):
+        """
+        Return the entry for the given key and mark it as most recently used.
+
+        Parameters
+        ----------
+        key : bytes
+            Key returned by make_key.
+
+        Returns
+        -------
+        tuple or None
+            (values, success, msg) if the design point is cached, else None.
+        """
+        try:
+            entry = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._entries[key] = entry
+        self.hits += 1
+        return entry
+
+    def add(self, key, values, success=True, msg=''):
+        """
+        Store the responses of a design point, dropping the least recently used if full.
+
+        Parameters
+        ----------
+        key : bytes
+            Key returned by make_key.
+        values : dict
+            Values of the responses, keyed by absolute name.
+        success : bool
+            Success flag of the evaluation.
+        msg : str
+            Message associated with the evaluation.
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = ({n: np.array(v, copy=True) for n, v in iteritems(values)},
+                              success, msg)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def load_cases(self, filename, dv_names, resp_names):
+        """
+        Fill the cache from the driver cases in a case recording file.
+
+        Only cases that contain all of the design variables and responses are used.
+
+        Parameters
+        ----------
+        filename : str
+            Name of a case file written by SqliteRecorder.
+        dv_names : list of str
+            Absolute names of the design variables, in key order.
+        resp_names : list of str
+            Absolute names of the responses to cache.
+
+        Returns
+        -------
+        int
+            Number of cases that were loaded.
+        """
+        from openmdao.recorders.case_reader import CaseReader
+
+        count = 0
+        for case in CaseReader(filename).driver_cases.iter_cases():
+            outputs = case.outputs
+            if outputs is None:
+                continue
+            try:
+                key = self.make_key([outputs[n] for n in dv_names])
+                values = {n: outputs[n] for n in resp_names}
+            except KeyError:
+                continue
+            self.add(key, values, bool(case.success), case.msg)
+            count += 1
+
+        return count
+
+    def get_stats(self):
+        """
+        Return the usage statistics of the cache.
+
+        Returns
+        -------
+        dict
+            Number of 'hits', 'misses' and cached design points ('size'), and the 'hit_rate'.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'hit_rate': self.hits / float(lookups) if lookups else 0.,
+        }
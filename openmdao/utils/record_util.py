@@ -161,6 +161,56 @@ def json_to_np_array(vals, abs2meta):
     return values_to_array(json_vals)
 
 
+def layout_to_dtype(layout):
+    """
+    Convert a recorded variable layout to a numpy structured dtype.
+
+    Parameters
+    ----------
+    layout : list
+        List of (name, offset, shape) for each variable, with offsets in number of float64
+        entries from the start of the data.
+
+    Returns
+    -------
+    numpy.dtype :
+        Structured dtype with one float64 field of the given shape per variable.
+    """
+    names = []
+    formats = []
+    offsets = []
+    size = 0
+    for name, offset, shape in layout:
+        shape = tuple(shape)
+        names.append(str(name))
+        formats.append((np.float64, shape))
+        offsets.append(8 * offset)
+        size = max(size, offset + int(np.prod(shape)))
+
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                     'itemsize': 8 * size})
+
+
+def blob_to_np_array(blob, var_layouts):
+    """
+    Convert a binary buffer of variable values to a numpy named array without copying.
+
+    Parameters
+    ----------
+    blob : bytes
+        Buffer holding a layout id as int64 followed by the float64 values.
+    var_layouts : dict
+        Dictionary mapping layout ids to numpy structured dtypes.
+
+    Returns
+    -------
+    array: numpy named array
+        Read-only named array viewing the values in the buffer.
+    """
+    layout_id = int(np.frombuffer(blob, dtype=np.int64, count=1)[0])
+    return np.frombuffer(blob, dtype=var_layouts[layout_id], count=1, offset=8)
+
+
 def convert_to_np_array(val, varname, abs2meta):
     """
     Convert list to numpy array.
@@ -0,0 +1,108 @@
+"""
+Pickling of systems that have been set up, so that they can be run in other processes.
+"""
+from io import BytesIO
+
+from six.moves import copyreg, cPickle as pickle
+
+from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.utils.mpi import FakeComm
+
+
+def _new_instance(cls):
+    return cls.__new__(cls)
+
+
+def _empty_recording_manager():
+    return RecordingManager()
+
+
+def _pickle_system(system):
+    """
+    Pickle a system that has been set up, so that it can be run in another process.
+
+    Its vectors keep their reference to their system, unless that system is outside of the ones
+    being pickled. Recorders, worker pools and MPI communicators are left behind.
+
+    Parameters
+    ----------
+    system : System
+        The system to pickle.
+
+    Returns
+    -------
+    bytes
+        The pickled system.
+    """
+    systems = list(system.system_iter(include_self=True, recurse=True))
+    pathnames = set(s.pathname for s in systems)
+
+    def reduce_vector(vec):
+        state = vec.__dict__.copy()
+        if vec._system is None or vec._system.pathname not in pathnames:
+            del state['_system']
+        return _new_instance, (type(vec),), state
+
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[RecordingManager] = lambda mgr: (_empty_recording_manager, ())
+    if not isinstance(system.comm, FakeComm):
+        dispatch_table[type(system.comm)] = lambda comm: (FakeComm, ())
+    for s in systems:
+        for vec in _iter_vectors(s):
+            dispatch_table[type(vec)] = reduce_vector
+
+    buf = BytesIO()
+    pickler = pickle.Pickler(buf, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = dispatch_table
+    pickler.dump(system)
+
+    return buf.getvalue()
+
+
+def _unpickle_system(system_pickle):
+    """
+    Unpickle a system pickled by _pickle_system, making its vectors share their data again.
+
+    Parameters
+    ----------
+    system_pickle : bytes
+        The pickled system.
+
+    Returns
+    -------
+    System
+        The unpickled system.
+    """
+    system = pickle.loads(system_pickle)
+
+    # the views into the root vectors don't survive pickling, so they are rebuilt top down
+    for s in system.system_iter(include_self=True, recurse=True):
+        for vec in _iter_vectors(s):
+            vec._system = s
+            if vec._root_vector is not vec:
+                vec._data, vec._cplx_data, vec._scaling = vec._extract_data()
+            vec._initialize_views()
+
+    return system
+
+
+def _iter_vectors(system):
+    """
+    Iterate over the vectors owned by a system.
+
+    Parameters
+    ----------
+    system : System
+        The system that owns the vectors.
+
+    Yields
+    ------
+    Vector
+        The vectors of the system.
+    """
+    for vecs in system._vectors.values():
+        for vec in vecs.values():
+            yield vec
+    for vec in (system._lower_bounds, system._upper_bounds):
+        if vec is not None:
+            yield vec
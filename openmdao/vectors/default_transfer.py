@@ -18,8 +18,41 @@ _empty_idx_array = np.array([], dtype=INT_DTYPE)
 class DefaultTransfer(Transfer):
     """
     Default NumPy transfer.
+
+    Attributes
+    ----------
+    _rev_in_inds : int ndarray
+        input indices for the rev transfer, sorted by their target output index.
+    _rev_out_inds : int ndarray
+        unique output indices for the rev transfer.
+    _rev_starts : int ndarray or None
+        start of each segment of _rev_in_inds that sums into the same output index, or None
+        if no output index is repeated.
     """
 
+    def __init__(self, in_vec, out_vec, in_inds, out_inds, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        in_inds : int ndarray
+            input indices for the transfer.
+        out_inds : int ndarray
+            output indices for the transfer.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the system that owns this transfer.
+        """
+        self._rev_in_inds = None
+        self._rev_out_inds = None
+        self._rev_starts = None
+
+        super(DefaultTransfer, self).__init__(in_vec, out_vec, in_inds, out_inds, comm)
+
     @staticmethod
     def _setup_transfers(group, recurse=True):
         """
@@ -199,7 +232,10 @@ class DefaultTransfer(Transfer):
         """
         Set up the transfer; do any necessary pre-computation.
 
-        Optionally implemented by the subclass.
+        In rev mode, contributions from several inputs connected to the same output must be
+        summed.  Rather than using the slow, unbuffered np.add.at at runtime, we precompute a
+        segmented reduction plan here: the input indices are sorted by their target output
+        index so that the summation can be done with a single np.add.reduceat call.
 
         Parameters
         ----------
@@ -208,7 +244,21 @@ class DefaultTransfer(Transfer):
         out_vec : <Vector>
             reference to the output vector.
         """
-        pass
+        out_inds = self._out_inds
+
+        # defaults for the case where no output index is repeated, so a simple
+        # fancy-indexed add is safe.
+        self._rev_in_inds = self._in_inds
+        self._rev_out_inds = out_inds
+
+        if out_inds.size > 1:
+            order = np.argsort(out_inds, kind='mergesort')
+            sorted_out = out_inds[order]
+            uniq, starts = np.unique(sorted_out, return_index=True)
+            if uniq.size < out_inds.size:
+                self._rev_in_inds = self._in_inds[order]
+                self._rev_out_inds = uniq
+                self._rev_starts = starts
 
     def transfer(self, in_vec, out_vec, mode='fwd'):
         """
@@ -233,4 +283,9 @@ class DefaultTransfer(Transfer):
             in_vec._data[in_inds] = out_vec._data[out_inds]
 
         else:  # rev
-            np.add.at(out_vec._data, out_inds, in_vec._data[in_inds])
+            starts = self._rev_starts
+            if starts is None:
+                out_vec._data[self._rev_out_inds] += in_vec._data[self._rev_in_inds]
+            else:
+                out_vec._data[self._rev_out_inds] += np.add.reduceat(
+                    in_vec._data[self._rev_in_inds], starts)
@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp
+from openmdao.utils.assert_utils import assert_rel_error
+
+
+def _build_fan_out_model(mode):
+    # several inputs (and repeated src_indices) all pull from the same output, so the
+    # rev mode transfer must sum contributions into repeated output indices.
+    prob = Problem()
+    model = prob.model
+    model.add_subsystem('px', IndepVarComp('x', np.array([1., 2., 3.])))
+    model.add_subsystem('c1', ExecComp('y = 2.0*x', x=np.zeros(4), y=np.zeros(4)))
+    model.add_subsystem('c2', ExecComp('y = 3.0*x**2', x=np.zeros(2), y=np.zeros(2)))
+    model.add_subsystem('obj', ExecComp('f = sum(a) + sum(b)', a=np.zeros(4), b=np.zeros(2)))
+
+    model.connect('px.x', 'c1.x', src_indices=[0, 0, 2, 0])
+    model.connect('px.x', 'c2.x', src_indices=[2, 2])
+    model.connect('c1.y', 'obj.a')
+    model.connect('c2.y', 'obj.b')
+
+    model.add_design_var('px.x')
+    model.add_objective('obj.f')
+
+    prob.setup(mode=mode)
+    prob.run_model()
+    return prob
+
+
+class TestDefaultTransfer(unittest.TestCase):
+
+    def test_rev_repeated_src_indices(self):
+        fwd = _build_fan_out_model('fwd')
+        rev = _build_fan_out_model('rev')
+
+        J_fwd = fwd.compute_totals(of=['obj.f'], wrt=['px.x'], return_format='array')
+        J_rev = rev.compute_totals(of=['obj.f'], wrt=['px.x'], return_format='array')
+
+        expected = np.array([[6., 0., 2. + 2 * 6. * 3.]])
+        assert_rel_error(self, J_fwd, expected, 1e-10)
+        assert_rel_error(self, J_rev, expected, 1e-10)
+
+    def test_rev_plan(self):
+        prob = _build_fan_out_model('rev')
+
+        xfer = prob.model._transfers['linear']['rev', None]
+        self.assertIsNotNone(xfer._rev_starts)
+        np.testing.assert_array_equal(xfer._rev_out_inds, np.unique(xfer._out_inds))
+
+        # compare against a brute force np.add.at
+        in_vec = prob.model._vectors['input']['linear']
+        out_vec = prob.model._vectors['output']['linear']
+        in_vec._data[:] = np.arange(in_vec._data.size) + 1.
+        out_vec._data[:] = 0.
+        expected = out_vec._data.copy()
+        np.add.at(expected, xfer._out_inds, in_vec._data[xfer._in_inds])
+
+        xfer.transfer(in_vec, out_vec, mode='rev')
+        assert_rel_error(self, out_vec._data, expected, 1e-15)
+
+    def test_rev_no_duplicates(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('px', IndepVarComp('x', np.array([1., 2., 3.])))
+        model.add_subsystem('c1', ExecComp('y = 2.0*x', x=np.zeros(3), y=np.zeros(3)))
+        model.connect('px.x', 'c1.x')
+        prob.setup(mode='rev')
+        prob.final_setup()
+
+        xfer = prob.model._transfers['linear']['rev', None]
+        self.assertIsNone(xfer._rev_starts)
+
+        J = prob.compute_totals(of=['c1.y'], wrt=['px.x'], return_format='array')
+        assert_rel_error(self, J, 2.0 * np.eye(3), 1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()